@@ -0,0 +1,70 @@
+"""
+Benchmark de carga: agregar_mueble uno por uno vs agregar_muebles.
+
+Uso:
+    python benchmarks/bench_agregar_muebles.py [--cantidad 100000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from models.concretos.armario import Armario  # noqa: E402
+from models.concretos.mesa import Mesa  # noqa: E402
+from models.concretos.silla import Silla  # noqa: E402
+from models.concretos.sofacama import SofaCama  # noqa: E402
+from services.motor_precios import MotorPrecios  # noqa: E402
+from services.tienda import TiendaMuebles  # noqa: E402
+
+FABRICAS = (
+    lambda i: Silla(f"Silla {i}", "Madera", "Negro", 50 + i % 100),
+    lambda i: Mesa(f"Mesa {i}", "Roble", "Natural", 300 + i % 200),
+    lambda i: SofaCama(f"SofaCama {i}", "Tela", "Gris", 900 + i % 50),
+    lambda i: Armario(f"Armario {i}", "Pino", "Blanco", 400 + i % 80),
+)
+
+
+def _catalogo(cantidad: int) -> list:
+    """Muebles nuevos (sin precios en caché) de varios tipos."""
+    return [FABRICAS[i % len(FABRICAS)](i) for i in range(cantidad)]
+
+
+def main() -> None:
+    """Carga el mismo catálogo de tres formas e imprime los tiempos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cantidad", type=int, default=100_000)
+    args = parser.parse_args()
+
+    muebles = _catalogo(args.cantidad)
+    tienda = TiendaMuebles()
+    inicio = time.perf_counter()
+    for mueble in muebles:
+        tienda.agregar_mueble(mueble)
+    uno_por_uno = time.perf_counter() - inicio
+
+    muebles = _catalogo(args.cantidad)
+    tienda = TiendaMuebles()
+    inicio = time.perf_counter()
+    resumen = tienda.agregar_muebles(muebles)
+    lote = time.perf_counter() - inicio
+    assert resumen["agregados"] == args.cantidad
+
+    muebles = _catalogo(args.cantidad)
+    precios = MotorPrecios.desde_muebles(muebles).calcular_precios()
+    tienda = TiendaMuebles()
+    inicio = time.perf_counter()
+    tienda.agregar_muebles(muebles, precios)
+    con_precios = time.perf_counter() - inicio
+
+    print(f"{args.cantidad} muebles")
+    print(f"agregar_mueble uno por uno:             {uno_por_uno:7.2f} s")
+    print(f"agregar_muebles:                        {lote:7.2f} s")
+    print(f"agregar_muebles con precios del motor:  {con_precios:7.2f} s")
+    print(f"aceleración: x{uno_por_uno / lote:.1f}")
+
+
+if __name__ == "__main__":
+    main()
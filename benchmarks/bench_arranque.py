@@ -0,0 +1,92 @@
+"""
+Benchmark de arranque: tiempo de importación medido con -X importtime.
+
+Importa cada módulo de entrada en un intérprete nuevo, toma el tiempo
+acumulado que informa -X importtime (el mejor de varias repeticiones) y
+falla si supera el umbral o si se cargaron módulos que deberían ser
+perezosos (rich, la interfaz y los modelos concretos).
+
+Uso:
+    python benchmarks/bench_arranque.py [--repeticiones 5] [--umbral-ms 120]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+# Módulo de entrada -> prefijos que no debe importar
+ENTRADAS = {
+    "main": ("rich", "ui", "models.concretos.", "services.tienda"),
+    "cli": ("rich", "ui", "models.concretos."),
+}
+
+
+def medir(modulo: str) -> tuple:
+    """
+    Importa el módulo en un intérprete nuevo.
+
+    Returns:
+        tuple: (microsegundos acumulados del módulo, módulos importados)
+    """
+    resultado = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    acumulado = None
+    importados = []
+    for linea in resultado.stderr.splitlines():
+        if not linea.startswith("import time:") or "|" not in linea:
+            continue
+        _, propio_acumulado, nombre = linea.split("|")
+        nombre = nombre.strip()
+        if not propio_acumulado.strip().isdigit():
+            continue
+        importados.append(nombre)
+        if nombre == modulo:
+            acumulado = int(propio_acumulado)
+    return acumulado, importados
+
+
+def main() -> int:
+    """Mide cada entrada, imprime los tiempos y retorna 1 si hay regresión."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument(
+        "--umbral-ms",
+        type=float,
+        default=120.0,
+        help="Tiempo de importación máximo aceptado por entrada",
+    )
+    args = parser.parse_args()
+
+    regresion = False
+    for modulo, prohibidos in ENTRADAS.items():
+        mediciones = [medir(modulo) for _ in range(max(args.repeticiones, 1))]
+        mejor = min(tiempo for tiempo, _ in mediciones) / 1000
+        cargados = sorted(
+            nombre
+            for nombre in mediciones[0][1]
+            if any(
+                nombre == prefijo.rstrip(".") or nombre.startswith(prefijo)
+                for prefijo in prohibidos
+            )
+        )
+        estado = "ok"
+        if mejor > args.umbral_ms:
+            estado = f"REGRESIÓN (umbral {args.umbral_ms:.0f} ms)"
+            regresion = True
+        if cargados:
+            estado = f"REGRESIÓN: importa {', '.join(cargados)}"
+            regresion = True
+        print(f"import {modulo:<6} {mejor:7.1f} ms  {estado}")
+    return 1 if regresion else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Benchmark de exportación: filas por segundo en CSV y en formato columnar.
+
+Arma un inventario y un historial de ventas (volcado a disco), exporta
+ambos en los dos formatos y lee de vuelta el archivo columnar.
+
+Uso:
+    python benchmarks/bench_exportador.py [--inventario 200000] [--ventas 500000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from models.concretos.armario import Armario  # noqa: E402
+from models.concretos.mesa import Mesa  # noqa: E402
+from models.concretos.silla import Silla  # noqa: E402
+from models.concretos.sofacama import SofaCama  # noqa: E402
+from services import exportador  # noqa: E402
+from services.tienda import TiendaMuebles  # noqa: E402
+from services.ventas import RegistroVentas  # noqa: E402
+
+FABRICAS = (
+    lambda i: Silla(f"Silla {i}", "Madera", "Negro", 50 + i % 100),
+    lambda i: Mesa(f"Mesa {i}", "Roble", "Natural", 300 + i % 200),
+    lambda i: SofaCama(f"SofaCama {i}", "Tela", "Gris", 900 + i % 50),
+    lambda i: Armario(f"Armario {i}", "Pino", "Blanco", 400 + i % 80),
+)
+
+
+def _medir(etiqueta: str, funcion, ruta: str) -> None:
+    """Ejecuta una exportación e imprime filas/s y MB/s."""
+    inicio = time.perf_counter()
+    filas = funcion()
+    duracion = time.perf_counter() - inicio
+    tamaño = os.path.getsize(ruta) / 1e6
+    print(
+        f"{etiqueta:<22} {duracion:6.2f} s  {filas / duracion:>11,.0f} filas/s"
+        f"  {tamaño / duracion:6.1f} MB/s  ({tamaño:.1f} MB)"
+    )
+
+
+def main() -> None:
+    """Arma los datos, exporta en cada formato e imprime los resultados."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--inventario", type=int, default=200_000)
+    parser.add_argument("--ventas", type=int, default=500_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        registro = RegistroVentas(os.path.join(directorio, "ventas.bin"))
+        tienda = TiendaMuebles(registro_ventas=registro)
+        tienda.agregar_muebles(
+            FABRICAS[i % len(FABRICAS)](i) for i in range(args.inventario)
+        )
+        for i in range(args.ventas):
+            registro.registrar(f"Silla {i}", f"Cliente {i % 1000}", 100.0, 0.1, 90.0)
+        registro.volcar()
+        print(f"{args.inventario} muebles, {args.ventas} ventas")
+
+        for formato in exportador.FORMATOS:
+            ruta = os.path.join(directorio, f"inventario.{formato}")
+            _medir(
+                f"inventario {formato}",
+                lambda: tienda.exportar_inventario(ruta, formato),
+                ruta,
+            )
+            ruta = os.path.join(directorio, f"ventas.{formato}")
+            _medir(
+                f"ventas {formato}",
+                lambda: tienda.exportar_ventas(ruta, formato),
+                ruta,
+            )
+
+        ruta = os.path.join(directorio, "ventas.columnar")
+        inicio = time.perf_counter()
+        with open(ruta, "rb") as archivo:
+            leidas = sum(
+                len(grupo["precio_final"])
+                for grupo in exportador.leer_columnar(archivo, ["precio_final"])
+            )
+        duracion = time.perf_counter() - inicio
+        print(
+            f"{'lectura 1 columna':<22} {duracion:6.2f} s  "
+            f"{leidas / duracion:>11,.0f} filas/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
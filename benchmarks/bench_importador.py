@@ -0,0 +1,113 @@
+"""
+Benchmark de importación: filas por segundo al importar un catálogo CSV.
+
+Genera un archivo con filas de todos los tipos (y algunas inválidas), lo
+importa con services.importador e imprime el tiempo y la memoria máxima
+del proceso.
+
+Uso:
+    python benchmarks/bench_importador.py [--cantidad 1000000] [--formato csv]
+"""
+
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from services import importador  # noqa: E402
+from services.tienda import TiendaMuebles  # noqa: E402
+
+COLUMNAS = (
+    "tipo",
+    "nombre",
+    "material",
+    "color",
+    "precio_base",
+    "tiene_ruedas",
+    "capacidad_personas",
+)
+
+TIPOS = (
+    ("silla", {"tiene_ruedas": "true"}),
+    ("mesa", {"capacidad_personas": "6"}),
+    ("sofa", {}),
+    ("sofacama", {}),
+    ("cama", {}),
+    ("armario", {}),
+    ("escritorio", {}),
+    ("cajonera", {}),
+    ("sillon", {}),
+)
+
+# Una de cada INVALIDAS filas tiene un tipo inexistente
+INVALIDAS = 1000
+
+
+def fila(i: int) -> dict:
+    """Fila i del catálogo generado."""
+    tipo, extra = TIPOS[i % len(TIPOS)]
+    if i % INVALIDAS == INVALIDAS - 1:
+        tipo = "lampara"
+    datos = {
+        "tipo": tipo,
+        "nombre": f"{tipo.capitalize()} {i}",
+        "material": ("Madera", "Metal", "Pino", "Roble")[i % 4],
+        "color": ("Negro", "Blanco", "Nogal")[i % 3],
+        "precio_base": str(50 + i % 500),
+    }
+    datos.update(extra)
+    return datos
+
+
+def generar(ruta: str, cantidad: int, formato: str) -> None:
+    """Escribe el catálogo de a una fila."""
+    with open(ruta, "w", encoding="utf-8", newline="") as archivo:
+        if formato == "csv":
+            archivo.write(",".join(COLUMNAS) + "\n")
+            for i in range(cantidad):
+                datos = fila(i)
+                archivo.write(",".join(datos.get(c, "") for c in COLUMNAS) + "\n")
+        else:
+            for i in range(cantidad):
+                archivo.write(json.dumps(fila(i)) + "\n")
+
+
+def main() -> None:
+    """Genera el catálogo, lo importa e imprime los resultados."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cantidad", type=int, default=1_000_000)
+    parser.add_argument("--formato", choices=importador.FORMATOS, default="csv")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, f"catalogo.{args.formato}")
+        generar(ruta, args.cantidad, args.formato)
+        tamaño = os.path.getsize(ruta)
+
+        tienda = TiendaMuebles()
+        inicio = time.perf_counter()
+        rechazos = os.path.join(directorio, "rechazos.jsonl")
+        with (
+            open(ruta, encoding="utf-8", newline="") as archivo,
+            open(rechazos, "w", encoding="utf-8") as salida_rechazos,
+        ):
+            resultado = importador.importar(
+                archivo, tienda, args.formato, salida_rechazos
+            )
+        duracion = time.perf_counter() - inicio
+
+    memoria = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{args.cantidad} filas {args.formato}, archivo de {tamaño / 1e6:.1f} MB")
+    print(f"importados: {resultado['importados']}")
+    print(f"rechazados: {resultado['total_rechazados']}")
+    print(f"tiempo:     {duracion:7.2f} s ({args.cantidad / duracion:,.0f} filas/s)")
+    print(f"memoria máxima del proceso: {memoria:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark de instantáneas: tiempo de guardado y carga de un catálogo grande.
+
+La carga restaura el inventario por columnas y no crea los muebles: mide
+además lo que ve el menú al arrancar (estadísticas y primera página por
+precio) y el primer recorrido completo, que crea todos los muebles. Falla
+si la carga (la mejor de varias repeticiones) supera el umbral.
+
+Uso:
+    python benchmarks/bench_instantanea.py [--cantidad 1000000]
+        [--repeticiones 3] [--umbral-s 1.0]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from models.concretos.armario import Armario  # noqa: E402
+from models.concretos.mesa import Mesa  # noqa: E402
+from models.concretos.silla import Silla  # noqa: E402
+from models.concretos.sofacama import SofaCama  # noqa: E402
+from services.tienda import TiendaMuebles  # noqa: E402
+
+FABRICAS = (
+    lambda i: Silla(
+        f"Silla {i}", "Madera", "Negro", 50 + i % 100, material_tapizado="tela"
+    ),
+    lambda i: Mesa(
+        f"Mesa {i}", "Roble", "Natural", 300 + i % 200, capacidad_personas=6
+    ),
+    lambda i: SofaCama(f"SofaCama {i}", "Tela", "Gris", 900 + i % 50),
+    lambda i: Armario(f"Armario {i}", "Pino", "Blanco", 400 + i % 80),
+)
+
+
+def main() -> int:
+    """Guarda y carga un catálogo, imprime los tiempos y retorna 1 si es lento."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cantidad", type=int, default=1_000_000)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument(
+        "--umbral-s",
+        type=float,
+        default=1.0,
+        help="Tiempo de carga máximo aceptado",
+    )
+    args = parser.parse_args()
+
+    tienda = TiendaMuebles()
+    tienda.agregar_muebles(
+        [FABRICAS[i % len(FABRICAS)](i) for i in range(args.cantidad)]
+    )
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "tienda.snap")
+        inicio = time.perf_counter()
+        tienda.guardar_instantanea(ruta)
+        guardado = time.perf_counter() - inicio
+        tamaño = os.path.getsize(ruta)
+        # Los muebles y el inventario forman ciclos (observadores): se
+        # liberan ahora y no en una recolección durante las mediciones
+        del tienda
+        gc.collect()
+
+        carga = float("inf")
+        for _ in range(max(args.repeticiones, 1)):
+            # Libera la carga anterior antes de medir la siguiente
+            cargada = None
+            gc.collect()
+            inicio = time.perf_counter()
+            cargada = TiendaMuebles.desde_instantanea(ruta)
+            carga = min(carga, time.perf_counter() - inicio)
+
+    inicio = time.perf_counter()
+    cargada.obtener_estadisticas()
+    cargada.filtrar_por_precio_paginado(0, float("inf"), pagina=1)
+    arranque = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    assert len(cargada.listar_inventario()) == args.cantidad
+    recorrido = time.perf_counter() - inicio
+
+    estado = "ok" if carga <= args.umbral_s else f"LENTA (umbral {args.umbral_s} s)"
+    print(f"{args.cantidad} muebles, instantánea de {tamaño / 1e6:.1f} MB")
+    print(f"guardar_instantanea:             {guardado:7.2f} s")
+    print(f"desde_instantanea:               {carga:7.2f} s  {estado}")
+    print(f"estadísticas y primera página:   {arranque * 1000:7.1f} ms")
+    print(f"primer recorrido completo:       {recorrido:7.2f} s")
+    return 0 if carga <= args.umbral_s else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Benchmark de memoria por mueble: representación con __slots__ vs __dict__.
+
+Para cada clase concreta crea N instancias y mide con tracemalloc los bytes
+por ítem. La columna "antes" reproduce la representación anterior (los
+mismos atributos guardados en un __dict__ por instancia) y la columna
+"después" mide las clases actuales con __slots__.
+
+Uso:
+    python benchmarks/bench_memoria.py [--cantidad 100000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from models.concretos.armario import Armario  # noqa: E402
+from models.concretos.cajonera import Cajonera  # noqa: E402
+from models.concretos.cama import Cama  # noqa: E402
+from models.concretos.escritorio import Escritorio  # noqa: E402
+from models.concretos.mesa import Mesa  # noqa: E402
+from models.concretos.silla import Silla  # noqa: E402
+from models.concretos.sillon import Sillon  # noqa: E402
+from models.concretos.sofa import Sofa  # noqa: E402
+from models.concretos.sofacama import SofaCama  # noqa: E402
+
+FABRICAS = {
+    "Silla": lambda: Silla("Silla", "Madera", "Café", 150.0, material_tapizado="tela"),
+    "Mesa": lambda: Mesa("Mesa", "Madera", "Roble", 500.0, capacidad_personas=6),
+    "Sofa": lambda: Sofa("Sofá", "Tela", "Gris", 1200.0, material_tapizado="tela"),
+    "SofaCama": lambda: SofaCama("SofaCama", "Tela", "Beige", 1500.0),
+    "Cama": lambda: Cama("Cama", "Madera", "Nogal", 1000.0, tamaño="king"),
+    "Armario": lambda: Armario("Armario", "Madera", "Blanco", 600, num_puertas=4),
+    "Escritorio": lambda: Escritorio("Escritorio", "Metal", "Negro", 500),
+    "Cajonera": lambda: Cajonera("Cajonera", "Metal", "Gris", 180),
+    "Sillon": lambda: Sillon("Sillón", "Cuero", "Marrón", 800),
+}
+
+
+class _ConDict:
+    """Objeto genérico con __dict__, equivalente al layout anterior."""
+
+
+def _atributos(mueble) -> dict:
+    """Lee los valores de todos los slots del objeto."""
+    valores = {}
+    for clase in type(mueble).__mro__:
+        for nombre in getattr(clase, "__slots__", ()):
+            if hasattr(mueble, nombre):
+                valores[nombre] = getattr(mueble, nombre)
+    return valores
+
+
+def _con_dict(mueble):
+    """Copia los atributos del mueble en un objeto con __dict__."""
+    copia = _ConDict()
+    for nombre, valor in _atributos(mueble).items():
+        setattr(copia, nombre, valor)
+    return copia
+
+
+def medir(fabrica, cantidad: int) -> float:
+    """
+    Mide los bytes promedio por objeto creado por la fábrica.
+    El costo de la lista contenedora se descuenta.
+    """
+    gc.collect()
+    tracemalloc.start()
+    objetos = [None] * cantidad
+    base, _ = tracemalloc.get_traced_memory()
+    for i in range(cantidad):
+        objetos[i] = fabrica()
+    fin, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objetos
+    return (fin - base) / cantidad
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime una tabla de resultados."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cantidad", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'Clase':<12}{'antes (B)':>12}{'después (B)':>14}{'ahorro':>10}")
+    for nombre, fabrica in FABRICAS.items():
+        modelo = fabrica()
+        antes = medir(lambda: _con_dict(modelo), args.cantidad)
+        despues = medir(fabrica, args.cantidad)
+        ahorro = 1 - despues / antes
+        print(f"{nombre:<12}{antes:>12.1f}{despues:>14.1f}{ahorro:>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
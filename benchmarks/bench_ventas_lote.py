@@ -0,0 +1,62 @@
+"""
+Benchmark de ventas: realizar_venta uno por uno vs realizar_ventas_lote.
+
+Uso:
+    python benchmarks/bench_ventas_lote.py [--inventario 20000] [--lineas 10000]
+        [--repeticiones 5]
+
+Cada variante se mide sobre una tienda nueva en cada repetición y se informa
+el mejor tiempo.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from models.concretos.silla import Silla  # noqa: E402
+from services.tienda import TiendaMuebles  # noqa: E402
+
+
+def _tienda(cantidad: int):
+    """Crea una tienda con sillas de precios variados y un descuento activo."""
+    tienda = TiendaMuebles()
+    sillas = [
+        Silla(f"Silla {i}", "Madera", "Negro", 50 + i % 100) for i in range(cantidad)
+    ]
+    for silla in sillas:
+        tienda.agregar_mueble(silla)
+    tienda.aplicar_descuento("sillas", 10)
+    return tienda, sillas
+
+
+def main() -> None:
+    """Ejecuta el benchmark e imprime los tiempos."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--inventario", type=int, default=20_000)
+    parser.add_argument("--lineas", type=int, default=10_000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    individual = lote = float("inf")
+    for _ in range(max(args.repeticiones, 1)):
+        tienda, sillas = _tienda(args.inventario)
+        inicio = time.perf_counter()
+        for silla in sillas[: args.lineas]:
+            tienda.realizar_venta(silla)
+        individual = min(individual, time.perf_counter() - inicio)
+
+        tienda, sillas = _tienda(args.inventario)
+        inicio = time.perf_counter()
+        tienda.realizar_ventas_lote(sillas[: args.lineas])
+        lote = min(lote, time.perf_counter() - inicio)
+
+    print(f"{args.lineas} líneas sobre {args.inventario} muebles")
+    print(f"realizar_venta (uno por uno): {individual * 1000:9.1f} ms")
+    print(f"realizar_ventas_lote:         {lote * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,436 @@
+"""
+Modo de línea de comandos de la tienda.
+Importa catálogos, consulta, vende y emite estadísticas o el reporte sin la
+interfaz interactiva: lee de archivos o de la entrada estándar y escribe
+JSON o CSV en la salida estándar.
+
+Ejemplos:
+    python src/main.py --tienda tienda.snap importar catalogo.csv --rechazos rechazos.jsonl
+    python src/main.py --tienda tienda.snap consultar --tipo silla --precio-max 200
+    python src/main.py --tienda tienda.snap --salida csv vender --ids 3 7
+    cat ventas.jsonl | python src/main.py --tienda tienda.snap vender - --formato jsonl
+    python src/main.py --tienda tienda.snap exportar ventas ventas.col --formato columnar
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from contextlib import nullcontext
+from typing import Dict, List, Optional, TextIO
+
+from services import exportador, importador
+from services.importador import FilaInvalida
+from services.tienda import TiendaMuebles
+from services.ventas import RegistroVentas
+
+SALIDAS = ("json", "csv")
+
+# Libro de ventas de una instantánea cuando no se indica --ventas
+SUFIJO_VENTAS = ".ventas"
+
+# Subcomandos que modifican la tienda (se guarda la instantánea al terminar)
+_MODIFICAN = ("importar", "vender")
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """
+    Construye el parser de argumentos con sus subcomandos.
+
+    Returns:
+        argparse.ArgumentParser: Parser configurado
+    """
+    parser = argparse.ArgumentParser(
+        prog="tienda",
+        description="Tienda de muebles en modo no interactivo",
+    )
+    parser.add_argument(
+        "--tienda",
+        metavar="RUTA",
+        help="Instantánea de la tienda: se carga si existe y se guarda "
+        "después de importar o vender. Su libro de ventas es RUTA"
+        f"{SUFIJO_VENTAS} salvo que se indique --ventas",
+    )
+    parser.add_argument(
+        "--catalogo",
+        metavar="ARCHIVO",
+        action="append",
+        default=[],
+        help="Catálogo CSV/JSONL a importar antes del comando (repetible)",
+    )
+    parser.add_argument(
+        "--ventas",
+        metavar="RUTA",
+        help="Archivo del libro de ventas (se continúa; por defecto el de --tienda)",
+    )
+    parser.add_argument(
+        "--nombre-tienda", default="Mueblería OOP", help="Nombre de una tienda nueva"
+    )
+    parser.add_argument(
+        "--salida", choices=SALIDAS, default="json", help="Formato de salida"
+    )
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    importar = subcomandos.add_parser("importar", help="Importa un catálogo")
+    importar.add_argument("archivo", help="Archivo CSV/JSONL ('-' = entrada estándar)")
+    _agregar_formato(importar)
+    importar.add_argument(
+        "--rechazos",
+        metavar="RUTA",
+        help="Archivo JSONL donde escribir las filas rechazadas",
+    )
+
+    consultar = subcomandos.add_parser("consultar", help="Consulta el inventario")
+    consultar.add_argument("--tipo", help="Tipo de mueble (ej: silla, sofacama)")
+    consultar.add_argument("--material")
+    consultar.add_argument("--color")
+    consultar.add_argument("--nombre", help="Texto contenido en el nombre")
+    consultar.add_argument("--precio-min", type=float, default=0)
+    consultar.add_argument("--precio-max", type=float, default=float("inf"))
+    consultar.add_argument("--capacidad-min", type=int)
+    consultar.add_argument("--capacidad-max", type=int)
+    consultar.add_argument("--area-min", type=float)
+    consultar.add_argument("--area-max", type=float)
+    consultar.add_argument(
+        "--con",
+        metavar="ATRIBUTO=VALOR",
+        action="append",
+        default=[],
+        help="Atributo con un valor exacto (ej: tiene_ruedas=true)",
+    )
+    consultar.add_argument(
+        "--explicar", action="store_true", help="Emite el plan en lugar de ejecutarlo"
+    )
+
+    vender = subcomandos.add_parser("vender", help="Vende muebles por id")
+    vender.add_argument(
+        "archivo",
+        nargs="?",
+        help="Archivo CSV/JSONL con columnas id, cliente y cantidad "
+        "('-' = entrada estándar)",
+    )
+    vender.add_argument("--ids", type=int, nargs="+", default=[], metavar="ID")
+    vender.add_argument("--cliente", default="Cliente Anónimo")
+    vender.add_argument(
+        "--cantidad", type=int, default=1, help="Unidades a vender de cada id"
+    )
+    _agregar_formato(vender)
+
+    exportar = subcomandos.add_parser(
+        "exportar", help="Exporta el inventario o las ventas a un archivo"
+    )
+    exportar.add_argument("datos", choices=("inventario", "ventas"))
+    exportar.add_argument("archivo", help="Archivo de destino (se sobrescribe)")
+    exportar.add_argument(
+        "--formato",
+        choices=exportador.FORMATOS,
+        default="csv",
+        help="Formato del archivo (csv o binario columnar)",
+    )
+
+    subcomandos.add_parser("estadisticas", help="Emite las estadísticas")
+    subcomandos.add_parser("reporte", help="Emite el reporte de inventario")
+    return parser
+
+
+def main(
+    argv: Optional[List[str]] = None,
+    entrada: Optional[TextIO] = None,
+    salida: Optional[TextIO] = None,
+) -> int:
+    """
+    Ejecuta un subcomando.
+
+    Args:
+        argv: Argumentos (None = sys.argv[1:])
+        entrada: Entrada para los archivos '-' (None = sys.stdin)
+        salida: Destino de la salida (None = sys.stdout)
+    Returns:
+        int: Código de salida (1 si hubo filas rechazadas o ventas fallidas)
+    """
+    args = crear_parser().parse_args(argv)
+    entrada = sys.stdin if entrada is None else entrada
+    salida = sys.stdout if salida is None else salida
+
+    ruta_ventas = _ruta_ventas(args)
+    registro = RegistroVentas(ruta_ventas) if ruta_ventas else None
+    tienda = _abrir_tienda(args, registro)
+    codigo = 0
+    try:
+        for ruta in args.catalogo:
+            with _abrir(ruta, entrada) as archivo:
+                resultado = importador.importar(
+                    archivo, tienda, _formato_de(ruta, None)
+                )
+            for rechazo in resultado["rechazados"]:
+                print(
+                    f"{ruta}: fila {rechazo['fila']}: {rechazo['error']}",
+                    file=sys.stderr,
+                )
+            if resultado["total_rechazados"]:
+                codigo = 1
+
+        datos, fallo = _COMANDOS[args.comando](tienda, args, entrada)
+        if fallo:
+            codigo = 1
+        if args.comando == "reporte" and args.salida != "json":
+            salida.write(datos["reporte"] + "\n")
+        else:
+            emitir(datos, args.salida, salida)
+
+        if args.tienda and (args.catalogo or args.comando in _MODIFICAN):
+            tienda.guardar_instantanea(args.tienda)
+    finally:
+        if registro is not None:
+            registro.volcar()
+    return codigo
+
+
+def emitir(datos, formato: str, salida: TextIO) -> None:
+    """
+    Escribe datos en JSON o CSV.
+
+    En CSV una lista de diccionarios se escribe como tabla (una columna por
+    clave) y un diccionario como pares clave/valor; los valores anidados se
+    escriben como JSON.
+
+    Args:
+        datos: Diccionario o lista de diccionarios
+        formato: 'json' o 'csv'
+        salida: Destino
+    """
+    if formato == "json":
+        json.dump(datos, salida, ensure_ascii=False, indent=2, default=str)
+        salida.write("\n")
+        return
+    if isinstance(datos, dict):
+        filas = [{"clave": k, "valor": v} for k, v in datos.items()]
+    else:
+        filas = list(datos)
+    columnas: Dict[str, None] = {}
+    for fila in filas:
+        columnas.update(dict.fromkeys(fila))
+    escritor = csv.DictWriter(salida, fieldnames=list(columnas), lineterminator="\n")
+    escritor.writeheader()
+    for fila in filas:
+        escritor.writerow({k: _celda(v) for k, v in fila.items()})
+
+
+def _agregar_formato(subparser: argparse.ArgumentParser) -> None:
+    """Agrega la opción del formato de entrada."""
+    subparser.add_argument(
+        "--formato",
+        choices=importador.FORMATOS,
+        help="Formato de entrada (por defecto según la extensión; csv para '-')",
+    )
+
+
+def _ruta_ventas(args) -> Optional[str]:
+    """
+    Libro de ventas a usar: el de --ventas o, con --tienda, uno junto a la
+    instantánea. Así las ventas de 'vender' quedan disponibles para
+    'exportar ventas' en las ejecuciones siguientes.
+    """
+    if args.ventas:
+        return args.ventas
+    if args.tienda:
+        return args.tienda + SUFIJO_VENTAS
+    return None
+
+
+def _abrir_tienda(args, registro: Optional[RegistroVentas]) -> TiendaMuebles:
+    """Carga la instantánea indicada o crea una tienda nueva."""
+    if args.tienda and os.path.exists(args.tienda):
+        return TiendaMuebles.desde_instantanea(args.tienda, registro_ventas=registro)
+    return TiendaMuebles(args.nombre_tienda, registro_ventas=registro)
+
+
+def _abrir(ruta: str, entrada: TextIO):
+    """Abre un archivo de texto, o retorna la entrada estándar para '-'."""
+    if ruta == "-":
+        return _SinCerrar(entrada)
+    return open(ruta, encoding="utf-8", newline="")
+
+
+def _formato_de(ruta: str, formato: Optional[str]) -> str:
+    """Formato explícito o deducido de la extensión."""
+    if formato:
+        return formato
+    if ruta.endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    return "csv"
+
+
+def _fila_mueble(tienda: TiendaMuebles, mueble) -> Dict:
+    """Fila de salida de un mueble del inventario."""
+    try:
+        precio = round(mueble.calcular_precio(), 2)
+    except Exception:
+        precio = None
+    return {
+        "id": tienda.obtener_id_mueble(mueble),
+        "tipo": type(mueble).__name__,
+        "nombre": getattr(mueble, "nombre", None),
+        "material": getattr(mueble, "material", None),
+        "color": getattr(mueble, "color", None),
+        "precio": precio,
+    }
+
+
+def _valor(texto: str):
+    """Convierte el valor de --con: true/false, números o texto."""
+    try:
+        return json.loads(texto)
+    except ValueError:
+        return texto
+
+
+def _comando_importar(tienda: TiendaMuebles, args, entrada: TextIO):
+    """Importa el archivo indicado."""
+    rechazos = (
+        open(args.rechazos, "w", encoding="utf-8") if args.rechazos else nullcontext()
+    )
+    with rechazos as salida_rechazos, _abrir(args.archivo, entrada) as archivo:
+        resultado = importador.importar(
+            archivo,
+            tienda,
+            _formato_de(args.archivo, args.formato),
+            salida_rechazos,
+        )
+    resultado["total_inventario"] = len(tienda.listar_inventario())
+    return resultado, bool(resultado["total_rechazados"])
+
+
+def _comando_consultar(tienda: TiendaMuebles, args, entrada: TextIO):
+    """Arma la consulta con los criterios indicados y la ejecuta o la explica."""
+    consulta = tienda.consultar()
+    try:
+        if args.tipo:
+            consulta.tipo(importador.resolver_tipo(args.tipo))
+    except FilaInvalida as e:
+        return {"error": str(e)}, True
+    if args.material:
+        consulta.material(args.material)
+    if args.color:
+        consulta.color(args.color)
+    if args.nombre:
+        consulta.nombre(args.nombre)
+    if args.precio_min > 0 or args.precio_max != float("inf"):
+        consulta.precio(args.precio_min, args.precio_max)
+    if args.capacidad_min is not None or args.capacidad_max is not None:
+        consulta.capacidad(args.capacidad_min, args.capacidad_max)
+    if args.area_min is not None or args.area_max is not None:
+        consulta.area(args.area_min, args.area_max)
+    for criterio in args.con:
+        atributo, separador, valor = criterio.partition("=")
+        if not separador or not atributo:
+            return {"error": f"Criterio inválido: {criterio!r}"}, True
+        consulta.con(**{atributo: _valor(valor)})
+    if args.explicar:
+        return consulta.plan(), False
+    return [_fila_mueble(tienda, mueble) for mueble in consulta.ejecutar()], False
+
+
+def _comando_vender(tienda: TiendaMuebles, args, entrada: TextIO):
+    """Vende cada id indicado; cada línea informa su venta o su error."""
+    pedidos = [(id_mueble, args.cliente, args.cantidad) for id_mueble in args.ids]
+    resultados: List[Dict] = []
+    if args.archivo:
+        with _abrir(args.archivo, entrada) as archivo:
+            filas = importador.leer_filas(
+                archivo, _formato_de(args.archivo, args.formato)
+            )
+            for numero, fila in enumerate(filas, 1):
+                try:
+                    id_mueble = int(fila.get("id"))
+                except (TypeError, ValueError):
+                    resultados.append({"fila": numero, "error": "Id inválido"})
+                    continue
+                try:
+                    cantidad = int(fila.get("cantidad") or args.cantidad)
+                except (TypeError, ValueError):
+                    resultados.append({"fila": numero, "error": "Cantidad inválida"})
+                    continue
+                pedidos.append(
+                    (id_mueble, fila.get("cliente") or args.cliente, cantidad)
+                )
+
+    for id_mueble, cliente, cantidad in pedidos:
+        mueble = tienda.obtener_mueble_por_id(id_mueble)
+        if mueble is None:
+            resultados.append({"id": id_mueble, "error": "Id inexistente"})
+            continue
+        resultados.append(
+            {"id": id_mueble, **tienda.realizar_venta(mueble, cliente, cantidad)}
+        )
+    return resultados, any("error" in r for r in resultados)
+
+
+def _comando_exportar(tienda: TiendaMuebles, args, entrada: TextIO):
+    """
+    Exporta el inventario o el historial de ventas.
+    Falla si la instantánea cuenta ventas que no están en el libro (por
+    ejemplo, si se guardó con otro --ventas): la exportación quedaría
+    incompleta.
+    """
+    if args.datos == "inventario":
+        exportados = tienda.exportar_inventario(args.archivo, args.formato)
+        return {"exportados": exportados, "archivo": args.archivo}, False
+    exportados = tienda.exportar_ventas(args.archivo, args.formato)
+    resultado = {"exportados": exportados, "archivo": args.archivo}
+    faltantes = tienda.ventas_fuera_del_libro
+    if faltantes:
+        resultado["ventas_fuera_del_libro"] = faltantes
+        print(
+            f"Advertencia: {faltantes} ventas de la instantánea no están en el "
+            "libro de ventas y no se exportaron",
+            file=sys.stderr,
+        )
+    return resultado, bool(faltantes)
+
+
+def _comando_estadisticas(tienda: TiendaMuebles, args, entrada: TextIO):
+    """Estadísticas de la tienda."""
+    return tienda.obtener_estadisticas(), False
+
+
+def _comando_reporte(tienda: TiendaMuebles, args, entrada: TextIO):
+    """Reporte de inventario en texto."""
+    return {"reporte": tienda.generar_reporte_inventario()}, False
+
+
+_COMANDOS = {
+    "importar": _comando_importar,
+    "consultar": _comando_consultar,
+    "vender": _comando_vender,
+    "exportar": _comando_exportar,
+    "estadisticas": _comando_estadisticas,
+    "reporte": _comando_reporte,
+}
+
+
+def _celda(valor):
+    """Valor de una celda CSV (las estructuras se escriben como JSON)."""
+    if isinstance(valor, (dict, list, tuple)):
+        return json.dumps(valor, ensure_ascii=False)
+    return valor
+
+
+class _SinCerrar:
+    """Envuelve la entrada estándar para usarla en un with sin cerrarla."""
+
+    def __init__(self, archivo: TextIO):
+        """Constructor sobre el archivo a envolver."""
+        self._archivo = archivo
+
+    def __enter__(self) -> TextIO:
+        """Retorna el archivo envuelto."""
+        return self._archivo
+
+    def __exit__(self, *excepcion) -> None:
+        """No cierra el archivo."""
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,19 +4,14 @@ Punto de entrada principal para la aplicación Tienda de Muebles.
 Este archivo inicializa la aplicación y proporciona datos de ejemplo.
 """
 
-from services.tienda import TiendaMuebles
-from ui.menu import MenuTienda
+import os
+import sys
+from typing import TYPE_CHECKING
 
-from models.concretos.silla import Silla
-from models.concretos.sillon import Sillon
-from models.concretos.sofa import Sofa
-from models.concretos.mesa import Mesa
-from models.concretos.armario import Armario
-from models.concretos.cama import Cama
-from models.concretos.escritorio import Escritorio
-from models.concretos.cajonera import Cajonera
-from models.concretos.sofacama import SofaCama
-from models.composicion.comedor import Comedor
+# Los modelos concretos, la tienda y la interfaz (rich) se importan dentro
+# de las funciones que los usan: el modo de línea de comandos no los carga.
+if TYPE_CHECKING:
+    from services.tienda import TiendaMuebles
 
 
 def crear_catalogo_inicial(tienda: "TiendaMuebles") -> None:
@@ -27,6 +22,18 @@ def crear_catalogo_inicial(tienda: "TiendaMuebles") -> None:
     Args:
         tienda: Instancia de TiendaMuebles donde agregar los muebles
     """
+    from models.concretos import (
+        Armario,
+        Cajonera,
+        Cama,
+        Escritorio,
+        Mesa,
+        Silla,
+        Sillon,
+        Sofa,
+        SofaCama,
+    )
+
     print("🔨 Creando catálogo inicial de muebles...")
 
     sillas = [
@@ -221,6 +228,10 @@ def crear_comedores_ejemplo(tienda: "TiendaMuebles") -> None:
     Args:
         tienda: Instancia de TiendaMuebles donde agregar los comedores
     """
+    from models.composicion.comedor import Comedor
+    from models.concretos import Mesa, Silla
+    from models.especificacion import especificacion
+
     print("\n🍽️ Creando comedores de ejemplo...")
 
     mesa_familiar = Mesa(
@@ -232,20 +243,22 @@ def crear_comedores_ejemplo(tienda: "TiendaMuebles") -> None:
         capacidad_personas=8,
     )
 
-    sillas_familiares = []
-    for i in range(1, 7):  # 6 sillas
-        silla = Silla(
-            nombre=f"Silla Familiar {i}",
-            material="Madera",
-            color="Roble",
-            precio_base=120.0,
-            tiene_respaldo=True,
-            material_tapizado="tela",
-        )
-        sillas_familiares.append(silla)
+    # Las sillas de un juego son unidades de un mismo modelo: comparten
+    # la especificación (atributos y precio)
+    silla_familiar = especificacion(
+        Silla,
+        nombre="Silla Familiar",
+        material="Madera",
+        color="Roble",
+        precio_base=120.0,
+        tiene_respaldo=True,
+        material_tapizado="tela",
+    )
 
     comedor_familiar = Comedor(
-        nombre="Comedor Familiar Completo", mesa=mesa_familiar, sillas=sillas_familiares
+        nombre="Comedor Familiar Completo",
+        mesa=mesa_familiar,
+        sillas=silla_familiar.crear_unidades(6),
     )
 
     mesa_moderna = Mesa(
@@ -257,20 +270,20 @@ def crear_comedores_ejemplo(tienda: "TiendaMuebles") -> None:
         capacidad_personas=4,
     )
 
-    sillas_modernas = []
-    for i in range(1, 5):  # 4 sillas
-        silla = Silla(
-            nombre=f"Silla Moderna {i}",
-            material="Metal",
-            color="Negro",
-            precio_base=150.0,
-            tiene_respaldo=True,
-            material_tapizado="cuero",
-        )
-        sillas_modernas.append(silla)
+    silla_moderna = especificacion(
+        Silla,
+        nombre="Silla Moderna",
+        material="Metal",
+        color="Negro",
+        precio_base=150.0,
+        tiene_respaldo=True,
+        material_tapizado="cuero",
+    )
 
     comedor_moderno = Comedor(
-        nombre="Comedor Moderno Premium", mesa=mesa_moderna, sillas=sillas_modernas
+        nombre="Comedor Moderno Premium",
+        mesa=mesa_moderna,
+        sillas=silla_moderna.crear_unidades(4),
     )
 
     comedores = [comedor_familiar, comedor_moderno]
@@ -316,6 +329,10 @@ def mostrar_estadisticas_iniciales(tienda: "TiendaMuebles") -> None:
     print(f"  📦 Total de muebles: {stats.get('total_muebles', 0)}")
     print(f"  🍽️ Total de comedores: {stats.get('total_comedores', 0)}")
     print(f"  💰 Valor del inventario: ${stats.get('valor_inventario', 0):,.2f}")
+    print(
+        "  🏷️ Valor con descuentos: "
+        f"${stats.get('valor_inventario_con_descuentos', 0):,.2f}"
+    )
     print(f"  🏷️ Descuentos activos: {stats.get('descuentos_activos', {})}")
     print(f"  🛒 Ventas realizadas: {stats.get('ventas_realizadas', 0)}")
     print(
@@ -340,6 +357,9 @@ def main():
     - Herencia múltiple con el sofá-cama
     - Encapsulación y abstracción en toda la jerarquía
     """
+    from services.tienda import TiendaMuebles
+    from ui.menu import MenuTienda
+
     try:
         print("🏠 Bienvenido a la Tienda de Muebles - Taller OOP 🏠")
         print("=" * 50)
@@ -356,7 +376,10 @@ def main():
         mostrar_estadisticas_iniciales(tienda)
 
         print("\n🎯 Iniciando interfaz de usuario...")
-        menu = MenuTienda(tienda)
+        # TIENDA_LATENCIAS=1 muestra la duración de cada acción del menú
+        menu = MenuTienda(
+            tienda, mostrar_latencias=os.environ.get("TIENDA_LATENCIAS") == "1"
+        )
 
         input("\nPresiona Enter para iniciar el menú interactivo...")
 
@@ -375,5 +398,10 @@ def main():
 
 
 if __name__ == "__main__":
-    # Punto de entrada de la aplicación
+    # Punto de entrada de la aplicación: con argumentos se usa el modo de
+    # línea de comandos (sin la interfaz interactiva)
+    if len(sys.argv) > 1:
+        import cli
+
+        sys.exit(cli.main())
     main()
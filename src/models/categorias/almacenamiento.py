@@ -16,6 +16,8 @@ class Almacenamiento(Mueble, ABC):
     - Abstracción: Define características comunes de almacenamiento
     """
 
+    __slots__ = ("_num_compartimentos", "_capacidad_litros")
+
     def __init__(
         self,
         nombre: str,
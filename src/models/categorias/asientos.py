@@ -5,6 +5,11 @@ Esta clase agrupa las características comunes de sillas, sillones y sofás.
 
 from abc import ABC, abstractmethod
 from models.mueble import Mueble
+from models.vocabulario import TAPIZADOS
+
+# Claves de los tapizados que modifican la comodidad
+_CUERO = TAPIZADOS.clave_de("cuero")
+_TELA = TAPIZADOS.clave_de("tela")
 
 
 class Asiento(Mueble, ABC):
@@ -20,6 +25,10 @@ class Asiento(Mueble, ABC):
     - Polimorfismo: Permite diferentes implementaciones del cálculo de comodidad
     """
 
+    __slots__ = ("_capacidad_personas", "_tiene_respaldo", "_material_tapizado")
+
+    _vocabularios = {**Mueble._vocabularios, "_material_tapizado": TAPIZADOS}
+
     def __init__(
         self,
         nombre: str,
@@ -43,7 +52,7 @@ class Asiento(Mueble, ABC):
 
         self._capacidad_personas = capacidad_personas
         self._tiene_respaldo = tiene_respaldo
-        self._material_tapizado = material_tapizado
+        self._material_tapizado = TAPIZADOS.codigo(material_tapizado)
 
     @property
     def capacidad_personas(self) -> int:
@@ -56,6 +65,7 @@ class Asiento(Mueble, ABC):
         if value <= 0:
             raise ValueError("La capacidad debe ser mayor a 0")
         self._capacidad_personas = value
+        self._notificar_cambio("capacidad_personas")
 
     @property
     def tiene_respaldo(self) -> bool:
@@ -66,16 +76,18 @@ class Asiento(Mueble, ABC):
     def tiene_respaldo(self, value: bool) -> None:
         """Setter para respaldo."""
         self._tiene_respaldo = value
+        self._notificar_cambio("tiene_respaldo")
 
     @property
     def material_tapizado(self) -> str:
         """Getter para el material de tapizado."""
-        return self._material_tapizado
+        return TAPIZADOS.texto(self._material_tapizado)
 
     @material_tapizado.setter
     def material_tapizado(self, value: str) -> None:
         """Setter para material de tapizado."""
-        self._material_tapizado = value
+        self._material_tapizado = TAPIZADOS.codigo(value)
+        self._notificar_cambio("material_tapizado")
 
     def calcular_factor_comodidad(self) -> float:
         """
@@ -90,11 +102,11 @@ class Asiento(Mueble, ABC):
         if self.tiene_respaldo:
             factor += 0.1
 
-        if self.material_tapizado:
-            if self.material_tapizado.lower() == "cuero":
-                factor += 0.2
-            elif self.material_tapizado.lower() == "tela":
-                factor += 0.1
+        clave_tapizado = TAPIZADOS.clave(self._material_tapizado)
+        if clave_tapizado == _CUERO:
+            factor += 0.2
+        elif clave_tapizado == _TELA:
+            factor += 0.1
 
         # Factor adicional por capacidad
         factor += (self.capacidad_personas - 1) * 0.05
@@ -4,7 +4,7 @@ Un comedor está compuesto por una mesa y varias sillas.
 """
 
 # Importar List para anotaciones de tipo
-from typing import List
+from typing import List, Optional, Tuple
 # from ..concretos.mesa import Mesa
 # from ..concretos.silla import Silla
 
@@ -22,6 +22,12 @@ class Comedor:
     - Agregación: Los objetos contenidos pueden existir independientemente
     - Encapsulación: Controla el acceso a los componentes internos
     - Abstracción: Simplifica la gestión de múltiples muebles
+
+    Los precios de la mesa y de las sillas se calculan una vez y se guardan
+    hasta que cambia la composición o un componente avisa un cambio (los
+    muebles de la jerarquía Mueble lo hacen mediante observadores). Para
+    componentes que no heredan de Mueble se debe llamar a
+    invalidar_precios() después de modificarlos.
     """
 
     def __init__(self, nombre: str, mesa: "Mesa", sillas: List["Silla"] = None):
@@ -34,7 +40,11 @@ class Comedor:
         """
         self._nombre = nombre
         self._mesa = mesa
-        self._sillas = sillas if sillas is not None else []
+        self._sillas = list(sillas) if sillas is not None else []
+        # (precio de la mesa, suma de precios de las sillas) o None
+        self._totales: Optional[Tuple[float, float]] = None
+        for componente in [mesa] + self._sillas:
+            self._observar(componente)
 
     @property
     def nombre(self) -> str:
@@ -68,6 +78,8 @@ class Comedor:
                 f"No se pueden agregar más sillas. Capacidad máxima: {capacidad_maxima}"
             )
         self._sillas.append(silla)
+        self._observar(silla)
+        self._totales = None
         return f"Silla {getattr(silla, 'nombre', str(silla))} agregada exitosamente al comedor"
 
     def quitar_silla(self, indice: int = -1) -> str:
@@ -84,10 +96,16 @@ class Comedor:
             return "No hay sillas para quitar"
         try:
             silla_removida = self._sillas.pop(indice)
+            self._dejar_de_observar(silla_removida)
+            self._totales = None
             return f"Silla {getattr(silla_removida, 'nombre', str(silla_removida))} removida del comedor"
         except IndexError:
             return "Índice de silla inválido"
 
+    def invalidar_precios(self) -> None:
+        """Descarta los precios guardados (se recalculan en la próxima consulta)."""
+        self._totales = None
+
     def calcular_precio_total(self) -> float:
         """
         Calcula el precio total del comedor sumando todos sus componentes.
@@ -95,9 +113,8 @@ class Comedor:
         Returns:
             float: Precio total del set de comedor
         """
-        precio_total = self._mesa.calcular_precio()
-        for silla in self._sillas:
-            precio_total += silla.calcular_precio()
+        precio_mesa, precio_sillas = self._calcular_totales()
+        precio_total = precio_mesa + precio_sillas
         if len(self._sillas) >= 4:
             precio_total *= 0.95  # 5% de descuento
         return round(precio_total, 2)
@@ -130,17 +147,48 @@ class Comedor:
         Returns:
             dict: Diccionario con información resumida
         """
+        precio_mesa, precio_sillas = self._calcular_totales()
         resumen = {
             "nombre": self.nombre,
             "total_muebles": 1 + len(self._sillas),  # mesa + sillas
-            "precio_mesa": self._mesa.calcular_precio(),
-            "precio_sillas": sum(silla.calcular_precio() for silla in self._sillas),
+            "precio_mesa": precio_mesa,
+            "precio_sillas": precio_sillas,
             "precio_total": self.calcular_precio_total(),
             "capacidad_personas": len(self._sillas),
             "materiales_utilizados": self._obtener_materiales_unicos(),
         }
         return resumen
 
+    def _calcular_totales(self) -> Tuple[float, float]:
+        """
+        Retorna el precio de la mesa y la suma de las sillas, calculándolos
+        solo si no están guardados.
+        Método privado auxiliar.
+        """
+        if self._totales is None:
+            self._totales = (
+                self._mesa.calcular_precio(),
+                sum(silla.calcular_precio() for silla in self._sillas),
+            )
+        return self._totales
+
+    def _observar(self, componente) -> None:
+        """Registra el observador de precios en un componente (si lo admite)."""
+        agregar_observador = getattr(componente, "agregar_observador", None)
+        if callable(agregar_observador):
+            agregar_observador(self._al_cambiar_componente)
+
+    def _dejar_de_observar(self, componente) -> None:
+        """Quita el observador de precios de un componente (si lo admite)."""
+        quitar_observador = getattr(componente, "quitar_observador", None)
+        if callable(quitar_observador):
+            quitar_observador(self._al_cambiar_componente)
+
+    def _al_cambiar_componente(self, componente, campo: str) -> None:
+        """Observador registrado en la mesa y las sillas."""
+        if campo != "nombre":
+            self._totales = None
+
     def _obtener_materiales_unicos(self) -> list:
         """
         Obtiene una lista de materiales únicos usados en el comedor.
@@ -1,2 +1,11 @@
 # necesario para que Python trate el directorio tests como un paquete
 
+from models import registro
+
+
+def __getattr__(nombre: str):
+    """Carga a demanda las clases registradas (ej: models.concretos.Silla)."""
+    try:
+        return registro.obtener(nombre)
+    except KeyError:
+        raise AttributeError(nombre) from None
@@ -11,6 +11,16 @@ class Armario:
     Clase concreta que representa un armario.
     """
 
+    __slots__ = (
+        "nombre",
+        "material",
+        "color",
+        "precio_base",
+        "num_puertas",
+        "num_cajones",
+        "tiene_espejos",
+    )
+
     def __init__(
         self,
         nombre: str,
@@ -11,6 +11,15 @@ class Cajonera:
     Clase concreta que representa una cajonera.
     """
 
+    __slots__ = (
+        "nombre",
+        "material",
+        "color",
+        "precio_base",
+        "num_cajones",
+        "tiene_ruedas",
+    )
+
     def __init__(
         self,
         nombre: str,
@@ -3,28 +3,19 @@ Clase concreta Cama.
 Representa una cama genérica.
 """
 
-from ..mueble import Mueble
+from ..mueble import Mueble, precio_cacheado
 
 
-class Cama(Mueble):
+class CamaBase(Mueble):
     """
-    Clase concreta que representa una cama.
+    Comportamiento común de las camas, sin atributos de instancia propios.
+
+    Cama y SofaCama comparten estos métodos. CamaBase no declara slots
+    para que SofaCama pueda heredar a la vez de Sofa y de esta clase:
+    dos bases con slots propios tienen layouts de memoria incompatibles.
     """
 
-    def __init__(
-        self,
-        nombre: str,
-        material: str,
-        color: str,
-        precio_base: float,
-        tamaño: str = "individual",
-        incluye_colchon: bool = False,
-        tiene_cabecera: bool = False,
-    ):
-        super().__init__(nombre, material, color, precio_base)
-        self._tamaño = tamaño
-        self._incluye_colchon = incluye_colchon
-        self._tiene_cabecera = tiene_cabecera
+    __slots__ = ()
 
     @property
     def tamaño(self) -> str:
@@ -38,6 +29,7 @@ class Cama(Mueble):
         if value not in tamaños_validos:
             raise ValueError(f"Tamaño debe ser uno de: {tamaños_validos}")
         self._tamaño = value
+        self._notificar_cambio("tamaño")
 
     @property
     def incluye_colchon(self) -> bool:
@@ -49,6 +41,7 @@ class Cama(Mueble):
         """Getter para cabecera."""
         return self._tiene_cabecera
 
+    @precio_cacheado
     def calcular_precio(self) -> float:
         """Calcula el precio final de la cama."""
         precio = self.precio_base
@@ -81,3 +74,26 @@ class Cama(Mueble):
         desc += f"  Cabecera: {'Sí' if self.tiene_cabecera else 'No'}\n"
         desc += f"  Precio final: ${self.calcular_precio()}"
         return desc
+
+
+class Cama(CamaBase):
+    """
+    Clase concreta que representa una cama.
+    """
+
+    __slots__ = ("_tamaño", "_incluye_colchon", "_tiene_cabecera")
+
+    def __init__(
+        self,
+        nombre: str,
+        material: str,
+        color: str,
+        precio_base: float,
+        tamaño: str = "individual",
+        incluye_colchon: bool = False,
+        tiene_cabecera: bool = False,
+    ):
+        super().__init__(nombre, material, color, precio_base)
+        self._tamaño = tamaño
+        self._incluye_colchon = incluye_colchon
+        self._tiene_cabecera = tiene_cabecera
@@ -11,6 +11,18 @@ class Escritorio:
     Clase concreta que representa un escritorio.
     """
 
+    __slots__ = (
+        "nombre",
+        "material",
+        "color",
+        "precio_base",
+        "forma",
+        "tiene_cajones",
+        "num_cajones",
+        "largo",
+        "tiene_iluminacion",
+    )
+
     def __init__(
         self,
         nombre: str,
@@ -12,6 +12,19 @@ class Sillon:
     Hereda de Asiento y añade características específicas.
     """
 
+    __slots__ = (
+        "nombre",
+        "material",
+        "color",
+        "precio_base",
+        "capacidad_personas",
+        "tiene_respaldo",
+        "material_tapizado",
+        "tiene_brazos",
+        "es_reclinable",
+        "tiene_reposapiés",
+    )
+
     def __init__(
         self,
         nombre: str,
@@ -4,10 +4,11 @@ Esta clase hereda tanto de Sofa como de Cama.
 """
 
 from .sofa import Sofa
-from .cama import Cama
+from .cama import Cama, CamaBase
+from ..mueble import precio_cacheado
 
 
-class SofaCama(Sofa, Cama):
+class SofaCama(Sofa, CamaBase):
     """
     Clase que implementa herencia múltiple heredando de Sofa y Cama.
 
@@ -19,8 +20,17 @@ class SofaCama(Sofa, Cama):
     - Resolución MRO: Maneja el orden de resolución de métodos
     - Polimorfismo: Implementa comportamientos únicos combinando funcionalidades
     - Super(): Usa super() para resolver conflictos de herencia
+
+    Hereda el comportamiento de cama de CamaBase (sin slots) y se registra
+    como subclase virtual de Cama, de modo que isinstance(x, Cama) se
+    mantiene aunque Sofa y Cama declaren slots propios.
     """
 
+    __slots__ = ("_tamaño", "_incluye_colchon", "_mecanismo_conversion", "_modo_actual")
+
+    # El modo (sofá o cama) es de cada unidad, no del modelo
+    _campos_unidad = ("_modo_actual",)
+
     def __init__(
         self,
         nombre: str,
@@ -58,6 +68,7 @@ class SofaCama(Sofa, Cama):
         self._mecanismo_conversion = mecanismo_conversion
         self._modo_actual = "sofa"
 
+    @precio_cacheado
     def calcular_precio(self) -> float:
         """
         Calcula el precio final del sofá cama.
@@ -182,3 +193,6 @@ class SofaCama(Sofa, Cama):
         Sobrescribe el método heredado para mostrar información específica.
         """
         return f"Sofá-cama {self.nombre} (modo: {self.modo_actual})"
+
+
+Cama.register(SofaCama)
@@ -0,0 +1,272 @@
+"""
+Especificaciones compartidas (flyweight) para unidades idénticas.
+Las unidades de un mismo modelo solo difieren en su identidad y en un poco
+de estado propio (ej: el modo de un sofá-cama). La especificación guarda
+una vez la clase, los atributos y el precio calculado; cada Unidad guarda
+solo una referencia a ella y su estado propio.
+"""
+
+from functools import lru_cache
+from types import MemberDescriptorType
+from typing import Dict, List
+
+from models.mueble import Mueble
+
+# Métodos especiales de la clase del mueble que también usan las unidades
+_ESPECIALES = ("__str__", "__repr__")
+
+# Especificaciones ya creadas: por argumentos del constructor y por estado
+_por_argumentos: Dict[tuple, "EspecificacionMueble"] = {}
+_por_estado: Dict[tuple, "EspecificacionMueble"] = {}
+
+
+class EspecificacionMueble:
+    """
+    Especificación inmutable de un modelo de mueble.
+
+    Guarda un prototipo privado del mueble (nunca expuesto, así no se puede
+    modificar) y su precio, calculado una sola vez. Se obtiene a través de
+    especificacion() o desde_mueble(), que reutilizan la misma instancia
+    para los mismos atributos.
+    """
+
+    __slots__ = ("_prototipo", "_precio")
+
+    def __init__(self, prototipo: Mueble):
+        """
+        Constructor de uso interno (ver especificacion() y desde_mueble()).
+
+        Args:
+            prototipo: Mueble con los atributos del modelo, sin observadores
+        """
+        self._prototipo = prototipo
+        self._precio = prototipo.calcular_precio()
+
+    @classmethod
+    def desde_mueble(cls, mueble: Mueble) -> "EspecificacionMueble":
+        """
+        Obtiene la especificación con los atributos de un mueble.
+        El mueble se copia: modificarlo después no afecta la especificación.
+
+        Args:
+            mueble: Mueble de la jerarquía Mueble (no una Unidad)
+        Returns:
+            EspecificacionMueble: Especificación compartida
+        Raises:
+            TypeError: Si el objeto no es un Mueble
+        """
+        if isinstance(mueble, Unidad):
+            return mueble.especificacion
+        if not isinstance(mueble, Mueble):
+            raise TypeError(f"Solo se pueden especificar muebles: {mueble!r}")
+        clase = type(mueble)
+        estado = mueble.__getstate__()
+        clave = (clase, _compartido(clase, estado))
+        especificacion = _por_estado.get(clave)
+        if especificacion is None:
+            prototipo = clase.__new__(clase)
+            prototipo.__setstate__(estado)
+            especificacion = _por_estado[clave] = cls(prototipo)
+        return especificacion
+
+    @property
+    def clase(self) -> type:
+        """Clase concreta del modelo."""
+        return type(self._prototipo)
+
+    @property
+    def precio(self) -> float:
+        """Precio de cada unidad, calculado una vez."""
+        return self._precio
+
+    @property
+    def atributos(self) -> Dict[str, object]:
+        """Atributos del modelo, en el orden de Mueble.campos_estado()."""
+        return dict(zip(self.clase.campos_estado(), self._prototipo.__getstate__()))
+
+    def crear_unidad(self) -> "Unidad":
+        """
+        Crea una unidad nueva del modelo.
+
+        Returns:
+            Unidad: Unidad con el estado propio inicial del modelo
+        """
+        unidad = object.__new__(_clase_unidad(self.clase))
+        unidad._especificacion = self
+        for campo in self.clase._campos_unidad:
+            setattr(unidad, campo, getattr(self._prototipo, campo))
+        return unidad
+
+    def crear_unidades(self, cantidad: int) -> List["Unidad"]:
+        """Crea varias unidades del modelo."""
+        return [self.crear_unidad() for _ in range(cantidad)]
+
+    def __reduce__(self):
+        """Se serializa como el prototipo y vuelve a pasar por el caché."""
+        return (EspecificacionMueble.desde_mueble, (self._prototipo,))
+
+    def __repr__(self) -> str:
+        """Representación técnica de la especificación."""
+        return f"EspecificacionMueble({self._prototipo!r}, precio={self._precio})"
+
+
+class Unidad:
+    """
+    Unidad física de un modelo: una referencia a su especificación más el
+    estado propio que declare la clase en _campos_unidad.
+
+    Se comporta como un mueble de la clase especificada (isinstance, type()
+    .__name__, propiedades y métodos), pero los atributos compartidos son de
+    solo lectura: cambiar un atributo del modelo es crear otra
+    especificación. Cada clase de mueble tiene su subclase de Unidad,
+    creada una vez y registrada como subclase virtual de la clase.
+    """
+
+    __slots__ = ("_especificacion",)
+
+    @property
+    def __class__(self):
+        """La clase del modelo (para isinstance y super() en sus métodos)."""
+        return self._especificacion.clase
+
+    @property
+    def especificacion(self) -> EspecificacionMueble:
+        """Especificación compartida de la unidad."""
+        return self._especificacion
+
+    def calcular_precio(self) -> float:
+        """Retorna el precio de la especificación (sin recalcularlo)."""
+        return self._especificacion.precio
+
+    def agregar_observador(self, observador) -> None:
+        """Sin efecto: los atributos que afectan índices y precio no cambian."""
+
+    def quitar_observador(self, observador) -> None:
+        """Sin efecto (ver agregar_observador)."""
+
+    def __reduce__(self):
+        """Se serializa como especificación más estado propio."""
+        campos = self._especificacion.clase._campos_unidad
+        return (
+            restaurar_unidad,
+            (self._especificacion, tuple(getattr(self, campo) for campo in campos)),
+        )
+
+
+def especificacion(clase: type, *args, **kwargs) -> EspecificacionMueble:
+    """
+    Obtiene la especificación de un modelo a partir de los argumentos de su
+    constructor. Los mismos argumentos (o los mismos atributos resultantes)
+    devuelven la misma especificación.
+
+    Ejemplo:
+        sillas = especificacion(Silla, "Silla", "Pino", "Rojo", 50).crear_unidades(6)
+
+    Args:
+        clase: Clase concreta de la jerarquía Mueble
+        *args, **kwargs: Argumentos del constructor
+    Returns:
+        EspecificacionMueble: Especificación compartida
+    """
+    try:
+        clave = (clase, args, tuple(sorted(kwargs.items())))
+        especificacion = _por_argumentos.get(clave)
+    except TypeError:  # argumentos no hashables
+        return EspecificacionMueble.desde_mueble(clase(*args, **kwargs))
+    if especificacion is None:
+        especificacion = EspecificacionMueble.desde_mueble(clase(*args, **kwargs))
+        _por_argumentos[clave] = especificacion
+    return especificacion
+
+
+def crear_unidades(clase: type, cantidad: int, *args, **kwargs) -> List[Unidad]:
+    """Crea unidades de un modelo (ver especificacion())."""
+    return especificacion(clase, *args, **kwargs).crear_unidades(cantidad)
+
+
+def limpiar_cache() -> None:
+    """Olvida las especificaciones creadas (las unidades existentes siguen válidas)."""
+    _por_argumentos.clear()
+    _por_estado.clear()
+
+
+def restaurar_unidad(especificacion: EspecificacionMueble, estado: tuple) -> Unidad:
+    """
+    Recrea una unidad con su estado propio (al deserializar).
+
+    Args:
+        especificacion: Especificación de la unidad
+        estado: Valores de los _campos_unidad de la clase, en orden
+    Returns:
+        Unidad: Unidad nueva
+    """
+    unidad = especificacion.crear_unidad()
+    for campo, valor in zip(especificacion.clase._campos_unidad, estado):
+        setattr(unidad, campo, valor)
+    return unidad
+
+
+def clase_unidad(clase: type) -> type:
+    """
+    Retorna la subclase de Unidad de una clase de mueble: la que devuelve
+    type() para sus unidades (y la que usan los índices por tipo).
+    """
+    return _clase_unidad(clase)
+
+
+def _compartido(clase: type, estado: tuple) -> tuple:
+    """Estado sin los campos propios de cada unidad."""
+    campos = clase.campos_estado()
+    return tuple(
+        valor
+        for campo, valor in zip(campos, estado)
+        if campo not in clase._campos_unidad
+    )
+
+
+@lru_cache(maxsize=None)
+def _clase_unidad(clase: type) -> type:
+    """
+    Crea la subclase de Unidad para una clase de mueble.
+
+    Copia los métodos y propiedades de la clase (y sus bases); los slots
+    compartidos se reemplazan por propiedades de solo lectura que leen el
+    prototipo, y los de _campos_unidad quedan como slots propios.
+    """
+    espacio = {}
+    for base in reversed(clase.__mro__):
+        for nombre, valor in base.__dict__.items():
+            if nombre in Unidad.__dict__ or nombre.startswith("_abc"):
+                continue
+            if nombre.startswith("__") and nombre not in _ESPECIALES:
+                continue
+            if isinstance(valor, MemberDescriptorType):
+                if nombre not in clase._campos_unidad:
+                    espacio[nombre] = _lectura(nombre)
+            elif isinstance(valor, classmethod):
+                # Ligado a la clase del mueble, no a la subclase de Unidad
+                espacio[nombre] = staticmethod(getattr(clase, nombre))
+            else:
+                espacio[nombre] = valor
+    for nombre in clase._campos_unidad:
+        espacio.pop(nombre, None)
+    espacio["__slots__"] = tuple(clase._campos_unidad)
+    espacio["__module__"] = __name__
+    espacio["__qualname__"] = f"Unidad[{clase.__qualname__}]"
+    subclase = type(clase.__name__, (Unidad,), espacio)
+    clase.register(subclase)
+    return subclase
+
+
+def _lectura(campo: str) -> property:
+    """Propiedad de solo lectura que lee un slot del prototipo."""
+
+    def leer(unidad):
+        return getattr(unidad._especificacion._prototipo, campo)
+
+    def escribir(unidad, valor):
+        raise AttributeError(
+            f"{campo} es parte de la especificación compartida y no se modifica"
+        )
+
+    return property(leer, escribir)
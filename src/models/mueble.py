@@ -4,6 +4,36 @@ Este es el punto de partida de nuestra jerarquía de clases.
 """
 
 from abc import ABC, abstractmethod
+from functools import wraps
+from typing import Optional
+
+from models.vocabulario import COLORES, MATERIALES
+
+
+def precio_cacheado(calcular_precio):
+    """
+    Decorador que memoriza el resultado de calcular_precio por instancia.
+
+    El valor se guarda en el atributo _precio_cache y se invalida cada vez
+    que un setter llama a _notificar_cambio(). Solo se cachea la
+    implementación de la clase concreta del objeto: cuando una subclase
+    llama a super().calcular_precio(), el resultado parcial no se guarda.
+    """
+
+    @wraps(calcular_precio)
+    def envoltura(self):
+        if type(self).calcular_precio is not envoltura:
+            return calcular_precio(self)
+        precio = self._precio_cache
+        if precio is not None:
+            Mueble._cache_aciertos += 1
+            return precio
+        Mueble._cache_fallos += 1
+        precio = calcular_precio(self)
+        self._precio_cache = precio
+        return precio
+
+    return envoltura
 
 
 class Mueble(ABC):
@@ -16,8 +46,34 @@ class Mueble(ABC):
     Conceptos OOP aplicados:
     - Abstracción: Define una interfaz común sin implementación específica
     - Encapsulación: Usa atributos privados con getters/setters
+
+    El material y el color se guardan como códigos de los vocabularios
+    internados (ver models.vocabulario); las propiedades devuelven el
+    texto original.
     """
 
+    __slots__ = (
+        "_nombre",
+        "_material",
+        "_color",
+        "_precio_base",
+        "_observadores",
+        "_precio_cache",
+    )
+
+    # Contadores globales del caché de precios (ver precio_cacheado)
+    _cache_aciertos = 0
+    _cache_fallos = 0
+
+    # Slots que guardan códigos de vocabulario, con su vocabulario
+    _vocabularios = {"_material": MATERIALES, "_color": COLORES}
+    # Slots de estado transitorio que no se serializan
+    _transitorios = frozenset(("_observadores", "_precio_cache"))
+    # Slots propios de cada unidad física, que no forman parte de la
+    # especificación compartida (ver models.especificacion); no deben
+    # afectar el precio
+    _campos_unidad: tuple = ()
+
     def __init__(self, nombre: str, material: str, color: str, precio_base: float):
         """
         Constructor de la clase Mueble.
@@ -29,9 +85,11 @@ class Mueble(ABC):
             precio_base: Precio base antes de aplicar modificadores
         """
         self._nombre = nombre
-        self._material = material
-        self._color = color
+        self._material = MATERIALES.codigo(material)
+        self._color = COLORES.codigo(color)
         self._precio_base = precio_base
+        self._observadores = None
+        self._precio_cache = None
 
     @property
     def nombre(self) -> str:
@@ -44,30 +102,43 @@ class Mueble(ABC):
         if not value or not value.strip():
             raise ValueError("El nombre no puede estar vacío")
         self._nombre = value.strip()
+        self._notificar_cambio("nombre")
 
     @property
     def material(self) -> str:
         """Getter para el material del mueble."""
-        return self._material
+        return MATERIALES.texto(self._material)
 
     @material.setter
     def material(self, value: str) -> None:
         """Setter para el material con validación."""
         if not value or not value.strip():
             raise ValueError("El material no puede estar vacío")
-        self._material = value.strip()
+        self._material = MATERIALES.codigo(value.strip())
+        self._notificar_cambio("material")
 
     @property
     def color(self) -> str:
         """Getter para el color del mueble."""
-        return self._color
+        return COLORES.texto(self._color)
 
     @color.setter
     def color(self, value: str) -> None:
         """Setter para el color con validación."""
         if not value or not value.strip():
             raise ValueError("El color no puede estar vacío")
-        self._color = value.strip()
+        self._color = COLORES.codigo(value.strip())
+        self._notificar_cambio("color")
+
+    @property
+    def clave_material(self) -> Optional[int]:
+        """Clave entera del material normalizado (para filtros e índices)."""
+        return MATERIALES.clave(self._material)
+
+    @property
+    def clave_color(self) -> Optional[int]:
+        """Clave entera del color normalizado (para filtros e índices)."""
+        return COLORES.clave(self._color)
 
     @property
     def precio_base(self) -> float:
@@ -80,6 +151,118 @@ class Mueble(ABC):
         if value < 0:
             raise ValueError("El precio base no puede ser negativo")
         self._precio_base = value
+        self._notificar_cambio("precio_base")
+
+    def agregar_observador(self, observador) -> None:
+        """
+        Registra una función que será llamada cuando cambie un atributo.
+
+        Args:
+            observador: Función con firma observador(mueble, campo)
+        """
+        if self._observadores is None:
+            self._observadores = []
+        self._observadores.append(observador)
+
+    def quitar_observador(self, observador) -> None:
+        """Elimina un observador previamente registrado (si existe)."""
+        if self._observadores and observador in self._observadores:
+            self._observadores.remove(observador)
+
+    def _notificar_cambio(self, campo: str) -> None:
+        """
+        Avisa a los observadores que un atributo cambió.
+        Método protegido usado por los setters de la jerarquía.
+
+        Args:
+            campo: Nombre de la propiedad modificada
+        """
+        self._precio_cache = None
+        if self._observadores:
+            for observador in list(self._observadores):
+                observador(self, campo)
+
+    @classmethod
+    def estadisticas_cache_precio(cls) -> dict:
+        """
+        Retorna los aciertos y fallos acumulados del caché de precios.
+
+        Returns:
+            dict: Aciertos, fallos y tasa de aciertos (0-1)
+        """
+        total = Mueble._cache_aciertos + Mueble._cache_fallos
+        return {
+            "aciertos": Mueble._cache_aciertos,
+            "fallos": Mueble._cache_fallos,
+            "tasa_aciertos": Mueble._cache_aciertos / total if total else 0.0,
+        }
+
+    @classmethod
+    def reiniciar_estadisticas_cache_precio(cls) -> None:
+        """Pone en cero los contadores del caché de precios."""
+        Mueble._cache_aciertos = 0
+        Mueble._cache_fallos = 0
+
+    @classmethod
+    def campos_estado(cls) -> tuple:
+        """
+        Retorna los slots persistentes de la clase, de la base a la hija.
+
+        Returns:
+            tuple: Nombres de los slots que forman el estado del mueble
+        """
+        return cls._plan_estado()[0]
+
+    @classmethod
+    def _plan_estado(cls) -> tuple:
+        """
+        Calcula (una vez por clase) los campos del estado y las posiciones
+        que guardan códigos de vocabulario.
+
+        Returns:
+            tuple: (campos, [(posición, vocabulario), ...])
+        """
+        plan = cls.__dict__.get("_plan_estado_cache")
+        if plan is None:
+            campos = tuple(
+                nombre
+                for clase in reversed(cls.__mro__)
+                for nombre in clase.__dict__.get("__slots__", ())
+                if nombre not in cls._transitorios
+            )
+            codificados = [
+                (posicion, cls._vocabularios[campo])
+                for posicion, campo in enumerate(campos)
+                if campo in cls._vocabularios
+            ]
+            plan = cls._plan_estado_cache = (campos, codificados)
+        return plan
+
+    def __getstate__(self) -> tuple:
+        """
+        Estado serializable del mueble: los valores de sus slots en orden.
+        Los códigos de vocabulario se reemplazan por su texto, porque los
+        códigos solo valen dentro del proceso que los asignó.
+        """
+        campos, codificados = self._plan_estado()
+        estado = [getattr(self, campo) for campo in campos]
+        for posicion, vocabulario in codificados:
+            estado[posicion] = vocabulario.texto(estado[posicion])
+        return tuple(estado)
+
+    def __setstate__(self, estado: tuple) -> None:
+        """
+        Restaura el estado producido por __getstate__ sin pasar por el
+        constructor ni los setters (no se vuelve a validar).
+        """
+        campos, codificados = self._plan_estado()
+        estado = list(estado)
+        for posicion, vocabulario in codificados:
+            estado[posicion] = vocabulario.codigo(estado[posicion])
+        for campo, valor in zip(campos, estado):
+            setattr(self, campo, valor)
+        self._observadores = None
+        self._precio_cache = None
 
     @abstractmethod
     def calcular_precio(self) -> float:
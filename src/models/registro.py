@@ -0,0 +1,65 @@
+"""
+Registro perezoso de las clases concretas de muebles.
+Cada clase se importa la primera vez que se pide, así arrancar la
+aplicación (o un comando que no crea muebles) no carga todos los módulos
+de models.concretos.
+"""
+
+import importlib
+from typing import Dict, List
+
+# Nombre de la clase -> módulo que la define
+_MODULOS: Dict[str, str] = {
+    "Armario": "models.concretos.armario",
+    "Cajonera": "models.concretos.cajonera",
+    "Cama": "models.concretos.cama",
+    "Escritorio": "models.concretos.escritorio",
+    "Mesa": "models.concretos.mesa",
+    "Silla": "models.concretos.silla",
+    "Sillon": "models.concretos.sillon",
+    "Sofa": "models.concretos.sofa",
+    "SofaCama": "models.concretos.sofacama",
+}
+
+# Clases ya importadas
+_clases: Dict[str, type] = {}
+
+
+def nombres() -> List[str]:
+    """Retorna los nombres de las clases registradas (sin importarlas)."""
+    return list(_MODULOS)
+
+
+def registrar(nombre: str, modulo: str) -> None:
+    """
+    Registra una clase concreta para cargarla a demanda.
+
+    Args:
+        nombre: Nombre de la clase
+        modulo: Módulo que la define (ej: 'models.concretos.silla')
+    """
+    _MODULOS[nombre] = modulo
+    _clases.pop(nombre, None)
+
+
+def obtener(nombre: str) -> type:
+    """
+    Obtiene una clase registrada, importando su módulo la primera vez.
+
+    Args:
+        nombre: Nombre de la clase (ej: 'Silla')
+    Returns:
+        type: La clase
+    Raises:
+        KeyError: Si el nombre no está registrado
+    """
+    clase = _clases.get(nombre)
+    if clase is None:
+        modulo = importlib.import_module(_MODULOS[nombre])
+        clase = _clases[nombre] = getattr(modulo, nombre)
+    return clase
+
+
+def cargadas() -> List[str]:
+    """Retorna los nombres de las clases ya importadas."""
+    return list(_clases)
@@ -0,0 +1,143 @@
+"""
+Vocabularios internados para materiales, colores y tapizados.
+Cada texto se registra una sola vez y los muebles guardan un código entero,
+de modo que los filtros comparan enteros en lugar de normalizar cadenas.
+"""
+
+from typing import Dict, List, Optional
+
+
+def normalizar_texto(valor) -> str:
+    """
+    Normaliza un texto para usarlo como clave de índice.
+
+    Args:
+        valor: Texto a normalizar (se aceptan valores no textuales)
+
+    Returns:
+        str: Texto en minúsculas y sin espacios extremos ("" si no es texto)
+    """
+    if not isinstance(valor, str):
+        return ""
+    return valor.lower().strip()
+
+
+class Vocabulario:
+    """
+    Registro que asigna códigos enteros pequeños a valores de texto.
+
+    Maneja dos tipos de códigos:
+    - Código de escritura: uno por cada grafía original ("Madera", "MADERA").
+      Es lo que guarda cada mueble y permite mostrar el texto tal como se
+      ingresó.
+    - Clave: una por cada valor normalizado ("madera"). Varias grafías
+      comparten la misma clave, que es lo que usan los filtros e índices.
+
+    Los registros solo crecen; los textos de un catálogo son pocos y se
+    repiten mucho, así que cada grafía se guarda una única vez.
+    """
+
+    __slots__ = (
+        "nombre",
+        "_codigos",
+        "_textos",
+        "_clave_de_codigo",
+        "_claves",
+        "_normalizados",
+    )
+
+    def __init__(self, nombre: str):
+        """
+        Constructor del vocabulario vacío.
+
+        Args:
+            nombre: Nombre descriptivo (ej: "materiales")
+        """
+        self.nombre = nombre
+        self._codigos: Dict[object, int] = {}
+        self._textos: List[object] = []
+        self._clave_de_codigo: List[Optional[int]] = []
+        self._claves: Dict[str, int] = {}
+        self._normalizados: List[str] = []
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de grafías registradas."""
+        return len(self._textos)
+
+    def codigo(self, texto) -> Optional[int]:
+        """
+        Obtiene (registrándolo si hace falta) el código de una grafía.
+
+        Args:
+            texto: Texto original; None se conserva como None
+
+        Returns:
+            Optional[int]: Código de escritura del texto
+        """
+        if texto is None:
+            return None
+        codigo = self._codigos.get(texto)
+        if codigo is None:
+            codigo = len(self._textos)
+            self._codigos[texto] = codigo
+            self._textos.append(texto)
+            normalizado = normalizar_texto(texto)
+            self._clave_de_codigo.append(
+                self._registrar_clave(normalizado) if normalizado else None
+            )
+        return codigo
+
+    def texto(self, codigo: Optional[int]):
+        """Retorna la grafía original de un código (None para None)."""
+        if codigo is None:
+            return None
+        return self._textos[codigo]
+
+    def clave(self, codigo: Optional[int]) -> Optional[int]:
+        """Retorna la clave normalizada de un código de escritura."""
+        if codigo is None:
+            return None
+        return self._clave_de_codigo[codigo]
+
+    def clave_de(self, texto) -> Optional[int]:
+        """
+        Obtiene (registrándola si hace falta) la clave de un texto.
+
+        Returns:
+            Optional[int]: Clave normalizada o None si el texto es vacío
+        """
+        return self.clave(self.codigo(texto))
+
+    def buscar_clave(self, texto) -> Optional[int]:
+        """
+        Busca la clave de un texto sin registrarlo.
+        Útil para consultas: un valor nunca visto no tiene resultados.
+
+        Returns:
+            Optional[int]: Clave normalizada o None si no está registrada
+        """
+        codigo = self._codigos.get(texto) if texto is not None else None
+        if codigo is not None:
+            return self._clave_de_codigo[codigo]
+        return self._claves.get(normalizar_texto(texto))
+
+    def normalizado(self, clave: Optional[int]) -> str:
+        """Retorna el texto normalizado de una clave ("" para None)."""
+        if clave is None:
+            return ""
+        return self._normalizados[clave]
+
+    def _registrar_clave(self, normalizado: str) -> int:
+        """Obtiene o crea la clave de un texto ya normalizado."""
+        clave = self._claves.get(normalizado)
+        if clave is None:
+            clave = len(self._normalizados)
+            self._claves[normalizado] = clave
+            self._normalizados.append(normalizado)
+        return clave
+
+
+# Vocabularios compartidos por toda la jerarquía de muebles
+MATERIALES = Vocabulario("materiales")
+COLORES = Vocabulario("colores")
+TAPIZADOS = Vocabulario("tapizados")
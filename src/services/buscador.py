@@ -0,0 +1,276 @@
+"""
+Motor de búsqueda difusa y ordenada por relevancia sobre el catálogo.
+Normaliza acentos una sola vez al indexar y puntúa coincidencias exactas,
+por prefijo y por distancia de edición en nombre, material, color y tipo.
+"""
+
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+# Peso de cada campo en el puntaje
+PESOS_CAMPOS = {"nombre": 3.0, "tipo": 2.0, "material": 1.5, "color": 1.0}
+
+# Puntaje por tipo de coincidencia de un término
+PUNTAJE_EXACTO = 1.0
+PUNTAJE_PREFIJO = 0.6
+PUNTAJE_DISTANCIA = {1: 0.5, 2: 0.3}
+# Bonificación si el nombre empieza con la consulta completa
+BONO_PREFIJO_NOMBRE = 1.0
+
+_SEPARADOR = re.compile(r"[^\w]+")
+_CAMEL = re.compile(r"(?<=[a-z])(?=[A-Z])")
+
+
+@lru_cache(maxsize=4096)
+def _normalizar_cacheado(texto: str) -> str:
+    """Normalización con caché: materiales, colores y tipos se repiten mucho."""
+    descompuesto = unicodedata.normalize("NFKD", texto)
+    sin_acentos = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return " ".join(sin_acentos.lower().split())
+
+
+def normalizar_busqueda(texto) -> str:
+    """
+    Normaliza un texto para buscar: sin acentos, en minúsculas y con los
+    espacios colapsados ("Sillón  Rojo" -> "sillon rojo").
+
+    Args:
+        texto: Texto a normalizar (los valores no textuales dan "")
+    Returns:
+        str: Texto normalizado
+    """
+    if not isinstance(texto, str):
+        return ""
+    if texto.isascii():
+        # Sin acentos que quitar: no hace falta NFKD ni ocupar la caché
+        return " ".join(texto.lower().split())
+    return _normalizar_cacheado(texto)
+
+
+def tokenizar(texto: str) -> List[str]:
+    """Divide un texto ya normalizado en palabras."""
+    return [token for token in _SEPARADOR.split(texto) if token]
+
+
+def distancia_edicion(a: str, b: str, maximo: int) -> int:
+    """
+    Distancia de edición (con transposiciones) acotada.
+
+    Args:
+        a: Primer texto
+        b: Segundo texto
+        maximo: Distancia a partir de la cual se deja de calcular
+    Returns:
+        int: Distancia, o maximo + 1 si la supera
+    """
+    if abs(len(a) - len(b)) > maximo:
+        return maximo + 1
+    anterior_previa: Optional[List[int]] = None
+    anterior = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        actual = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            costo = 0 if a[i - 1] == b[j - 1] else 1
+            actual[j] = min(anterior[j] + 1, actual[j - 1] + 1, anterior[j - 1] + costo)
+            if (
+                anterior_previa is not None
+                and j > 1
+                and a[i - 1] == b[j - 2]
+                and a[i - 2] == b[j - 1]
+            ):
+                actual[j] = min(actual[j], anterior_previa[j - 2] + 1)
+        if min(actual) > maximo:
+            return maximo + 1
+        anterior_previa, anterior = anterior, actual
+    return anterior[-1] if anterior[-1] <= maximo else maximo + 1
+
+
+def _distancia_permitida(token: str) -> int:
+    """Errores tolerados según el largo del término."""
+    if len(token) >= 8:
+        return 2
+    if len(token) >= 4:
+        return 1
+    return 0
+
+
+class MotorBusqueda:
+    """
+    Índice invertido de palabras normalizadas con puntaje por relevancia.
+
+    Cada documento (un id del inventario) se tokeniza una vez al indexarlo:
+    las palabras de nombre, material, color y tipo se guardan sin acentos,
+    con el peso del campo más importante en que aparecen. Al buscar, cada
+    término de la consulta se compara con el vocabulario:
+    - Coincidencia exacta: búsqueda directa en el índice
+    - Prefijo: búsqueda binaria sobre el vocabulario ordenado (se ordena
+      al buscar, solo si cambió desde la última búsqueda)
+    - Distancia de edición: solo contra palabras con la misma inicial y un
+      largo parecido (los errores en la primera letra no se toleran)
+
+    Un documento debe coincidir con todos los términos. Los k mejores se
+    eligen con un heap, sin ordenar todas las coincidencias.
+    """
+
+    def __init__(self):
+        """Constructor del motor vacío."""
+        self._documentos: Dict[int, Dict[str, float]] = {}
+        self._nombres: Dict[int, str] = {}
+        self._postings: Dict[str, Set[int]] = {}
+        self._vocabulario: Optional[List[str]] = []
+        self._por_inicial: Dict[Tuple[str, int], Set[str]] = {}
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de documentos indexados."""
+        return len(self._documentos)
+
+    def agregar(self, id_documento: int, mueble) -> None:
+        """
+        Indexa (o reindexa) un mueble.
+
+        Args:
+            id_documento: Id del mueble en el inventario
+            mueble: Mueble a indexar
+        """
+        if id_documento in self._documentos:
+            self.quitar(id_documento)
+        nombre = normalizar_busqueda(getattr(mueble, "nombre", None))
+        self._nombres[id_documento] = nombre
+        tokens: Dict[str, float] = {}
+        for campo, palabras in _campos(mueble, nombre):
+            peso = PESOS_CAMPOS[campo]
+            for token in palabras:
+                if tokens.get(token, 0.0) < peso:
+                    tokens[token] = peso
+        self._documentos[id_documento] = tokens
+        for token in tokens:
+            ids = self._postings.get(token)
+            if ids is None:
+                ids = self._postings[token] = set()
+                self._vocabulario = None
+                self._por_inicial.setdefault((token[0], len(token)), set()).add(token)
+            ids.add(id_documento)
+
+    def quitar(self, id_documento: int) -> bool:
+        """
+        Quita un documento del índice.
+
+        Returns:
+            bool: True si el documento estaba indexado
+        """
+        tokens = self._documentos.pop(id_documento, None)
+        if tokens is None:
+            return False
+        del self._nombres[id_documento]
+        for token in tokens:
+            ids = self._postings[token]
+            ids.discard(id_documento)
+            if not ids:
+                del self._postings[token]
+                self._vocabulario = None
+                clave = (token[0], len(token))
+                self._por_inicial[clave].discard(token)
+                if not self._por_inicial[clave]:
+                    del self._por_inicial[clave]
+        return True
+
+    def buscar(self, consulta: str, limite: int = 10) -> List[Tuple[int, float]]:
+        """
+        Busca los documentos más relevantes para la consulta.
+
+        Args:
+            consulta: Texto libre (se ignoran acentos y mayúsculas)
+            limite: Cantidad máxima de resultados
+        Returns:
+            List[Tuple[int, float]]: Pares (id, puntaje) de mayor a menor
+                puntaje; los empates se ordenan por id
+        """
+        normalizada = normalizar_busqueda(consulta)
+        terminos = tokenizar(normalizada)
+        if not terminos or limite <= 0:
+            return []
+        puntajes: Optional[Dict[int, float]] = None
+        for termino in dict.fromkeys(terminos):
+            del_termino = self._puntajes_termino(termino)
+            if puntajes is None:
+                puntajes = del_termino
+            else:
+                puntajes = {
+                    i: p + del_termino[i]
+                    for i, p in puntajes.items()
+                    if i in del_termino
+                }
+            if not puntajes:
+                return []
+        for id_documento in puntajes:
+            if self._nombres[id_documento].startswith(normalizada):
+                puntajes[id_documento] += BONO_PREFIJO_NOMBRE
+        mejores = heapq.nlargest(
+            limite, puntajes.items(), key=lambda par: (par[1], -par[0])
+        )
+        return [(i, round(p, 4)) for i, p in mejores]
+
+    def _puntajes_termino(self, termino: str) -> Dict[int, float]:
+        """Mejor puntaje de un término en cada documento que coincide."""
+        candidatos: Dict[str, float] = {}
+        if termino in self._postings:
+            candidatos[termino] = PUNTAJE_EXACTO
+        if self._vocabulario is None:
+            self._vocabulario = sorted(self._postings)
+        vocabulario = self._vocabulario
+        posicion = bisect_left(vocabulario, termino)
+        while posicion < len(vocabulario):
+            token = vocabulario[posicion]
+            if not token.startswith(termino):
+                break
+            candidatos.setdefault(token, PUNTAJE_PREFIJO)
+            posicion += 1
+        maximo = _distancia_permitida(termino)
+        if maximo and not termino.isdigit():
+            for largo in range(len(termino) - maximo, len(termino) + maximo + 1):
+                for token in self._por_inicial.get((termino[0], largo), ()):
+                    if token in candidatos:
+                        continue
+                    distancia = distancia_edicion(termino, token, maximo)
+                    if distancia <= maximo:
+                        candidatos[token] = PUNTAJE_DISTANCIA[distancia]
+
+        puntajes: Dict[int, float] = {}
+        documentos = self._documentos
+        for token, puntaje in candidatos.items():
+            for id_documento in self._postings[token]:
+                valor = puntaje * documentos[id_documento][token]
+                if valor > puntajes.get(id_documento, 0.0):
+                    puntajes[id_documento] = valor
+        return puntajes
+
+
+def _campos(mueble, nombre: str):
+    """Genera (campo, palabras) para los campos buscables."""
+    yield "nombre", tokenizar(nombre)
+    yield "material", _palabras(getattr(mueble, "material", None))
+    yield "color", _palabras(getattr(mueble, "color", None))
+    yield "tipo", _palabras_tipo(type(mueble).__name__)
+
+
+def _palabras(texto) -> Tuple[str, ...]:
+    """Palabras normalizadas de un texto (con caché si es texto)."""
+    if not isinstance(texto, str):
+        return ()
+    return _palabras_cacheado(texto)
+
+
+@lru_cache(maxsize=4096)
+def _palabras_cacheado(texto: str) -> Tuple[str, ...]:
+    """Palabras de materiales y colores, que se repiten mucho."""
+    return tuple(tokenizar(normalizar_busqueda(texto)))
+
+
+@lru_cache(maxsize=None)
+def _palabras_tipo(tipo: str) -> Tuple[str, ...]:
+    """Palabras de un tipo ("SofaCama" -> sofacama, sofa, cama)."""
+    return tuple(tokenizar(normalizar_busqueda(tipo + " " + _CAMEL.sub(" ", tipo))))
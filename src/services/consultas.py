@@ -0,0 +1,410 @@
+"""
+Consultas por varios criterios sobre el inventario.
+Un planificador arranca por el índice más selectivo, intersecta sus ids
+con los demás índices y recién al final evalúa, sobre los muebles que
+quedan, los criterios que no tienen índice.
+"""
+
+from typing import Callable, List, Optional, Tuple
+
+INFINITO = float("inf")
+
+
+class _Fuente:
+    """
+    Ids que cumplen un criterio indexado.
+    Sabe cuántos son sin listarlos y responde la pertenencia de un id en
+    O(1), así los criterios que no inician el plan no se materializan.
+    """
+
+    __slots__ = ("estimado", "_listar", "_contiene")
+
+    def __init__(
+        self,
+        estimado: int,
+        listar: Callable[[], List[int]],
+        contiene: Callable[[int], bool],
+    ):
+        """
+        Constructor de la fuente.
+
+        Args:
+            estimado: Cantidad de ids del criterio
+            listar: Función que retorna la lista de ids
+            contiene: Función que indica si un id cumple el criterio
+        """
+        self.estimado = estimado
+        self._listar = listar
+        self._contiene = contiene
+
+    def ids(self) -> List[int]:
+        """Retorna los ids del criterio."""
+        return self._listar()
+
+    def contiene(self, id_mueble: int) -> bool:
+        """Indica si el id cumple el criterio."""
+        return self._contiene(id_mueble)
+
+
+class _Criterio:
+    """
+    Criterio de una consulta.
+    Los criterios indexados retornan una fuente en abrir(); el resto se
+    evalúa mueble por mueble con cumple().
+    """
+
+    def __init__(self, descripcion: str):
+        """Constructor con el texto que se muestra en el plan."""
+        self.descripcion = descripcion
+
+    def abrir(self, inventario) -> Optional[_Fuente]:
+        """Retorna la fuente de ids del criterio (None si no tiene índice)."""
+        return None
+
+    def cumple(self, mueble) -> bool:
+        """Indica si el mueble cumple el criterio."""
+        return True
+
+
+class _PorBucket(_Criterio):
+    """Material o color: un bucket de ids del inventario."""
+
+    def __init__(self, indice: str, valor: str):
+        """Constructor para el índice ('material' o 'color') y el texto buscado."""
+        super().__init__(f"{indice} = {valor!r}")
+        self._indice = indice
+        self._valor = valor
+
+    def abrir(self, inventario) -> _Fuente:
+        """Retorna el bucket del valor buscado."""
+        bucket = getattr(inventario, "ids_por_" + self._indice)(self._valor)
+        return _Fuente(len(bucket), lambda: list(bucket), bucket.__contains__)
+
+
+class _PorTipo(_Criterio):
+    """Tipo de mueble, incluidas sus subclases."""
+
+    def __init__(self, clase: type):
+        """Constructor para la clase buscada."""
+        super().__init__(f"tipo {clase.__name__}")
+        self._clase = clase
+
+    def abrir(self, inventario) -> _Fuente:
+        """Retorna la unión (sin copiarla) de los buckets de cada subclase."""
+        buckets = inventario.ids_por_tipo(self._clase)
+
+        def listar() -> List[int]:
+            ids: List[int] = []
+            for bucket in buckets:
+                ids.extend(bucket)
+            return ids
+
+        def contiene(id_mueble: int) -> bool:
+            return any(id_mueble in bucket for bucket in buckets)
+
+        return _Fuente(sum(len(b) for b in buckets), listar, contiene)
+
+
+class _PorPrecio(_Criterio):
+    """Rango inclusivo de precios."""
+
+    def __init__(self, minimo: float, maximo: float):
+        """Constructor para el rango de precios."""
+        super().__init__(f"precio entre {minimo} y {maximo}")
+        self._minimo = minimo
+        self._maximo = maximo
+
+    def abrir(self, inventario) -> _Fuente:
+        """Cuenta el rango por búsqueda binaria; la pertenencia usa el precio del id."""
+        minimo, maximo = self._minimo, self._maximo
+        precio_de = inventario.precio_indexado
+
+        def contiene(id_mueble: int) -> bool:
+            precio = precio_de(id_mueble)
+            return precio is not None and minimo <= precio <= maximo
+
+        return _Fuente(
+            inventario.contar_por_precio(minimo, maximo),
+            lambda: inventario.ids_por_precio(minimo, maximo),
+            contiene,
+        )
+
+
+class _PorNombre(_Criterio):
+    """Texto contenido en el nombre (índice de trigramas)."""
+
+    def __init__(self, texto: str):
+        """Constructor para el texto buscado."""
+        super().__init__(f"nombre contiene {texto!r}")
+        self._texto = texto
+
+    def abrir(self, inventario) -> _Fuente:
+        """Resuelve la búsqueda de trigramas (es la única forma de estimarla)."""
+        ids = inventario.ids_por_nombre(self._texto)
+        conjunto = set(ids)
+        return _Fuente(len(ids), lambda: ids, conjunto.__contains__)
+
+
+class _EnRango(_Criterio):
+    """Valor numérico de un atributo o método dentro de un rango."""
+
+    def __init__(
+        self,
+        atributo: str,
+        minimo: Optional[float],
+        maximo: Optional[float],
+        es_metodo: bool = False,
+    ):
+        """
+        Constructor del criterio.
+
+        Args:
+            atributo: Atributo (o método sin argumentos) a evaluar
+            minimo: Valor mínimo inclusivo (None = sin límite)
+            maximo: Valor máximo inclusivo (None = sin límite)
+            es_metodo: Si True, se llama al atributo para obtener el valor
+        """
+        limites = []
+        if minimo is not None:
+            limites.append(f">= {minimo}")
+        if maximo is not None:
+            limites.append(f"<= {maximo}")
+        nombre = atributo + "()" if es_metodo else atributo
+        super().__init__(f"{nombre} {' y '.join(limites) or 'definido'}")
+        self._atributo = atributo
+        self._minimo = -INFINITO if minimo is None else minimo
+        self._maximo = INFINITO if maximo is None else maximo
+        self._es_metodo = es_metodo
+
+    def cumple(self, mueble) -> bool:
+        """Los muebles sin el atributo no cumplen el criterio."""
+        valor = getattr(mueble, self._atributo, None)
+        if valor is None:
+            return False
+        if self._es_metodo:
+            valor = valor()
+        return self._minimo <= valor <= self._maximo
+
+
+class _ConValor(_Criterio):
+    """Atributo con un valor exacto (ej: tiene_ruedas=True)."""
+
+    def __init__(self, atributo: str, valor):
+        """Constructor para el atributo y el valor esperado."""
+        super().__init__(f"{atributo} = {valor!r}")
+        self._atributo = atributo
+        self._valor = valor
+
+    def cumple(self, mueble) -> bool:
+        """Los muebles sin el atributo no cumplen el criterio."""
+        if not hasattr(mueble, self._atributo):
+            return False
+        return getattr(mueble, self._atributo) == self._valor
+
+
+class _Predicado(_Criterio):
+    """Función arbitraria sobre el mueble."""
+
+    def __init__(self, funcion: Callable[[object], bool], descripcion: str):
+        """Constructor con la función y su descripción para el plan."""
+        super().__init__(descripcion)
+        self._funcion = funcion
+
+    def cumple(self, mueble) -> bool:
+        """Evalúa la función sobre el mueble."""
+        return bool(self._funcion(mueble))
+
+
+class Consulta:
+    """
+    Consulta por varios criterios que se combinan con "y".
+
+    Los métodos de criterio retornan la misma consulta para encadenarlos:
+
+        tienda.consultar().tipo(Silla).material("madera").precio(0, 200)
+
+    Al ejecutar, el planificador:
+    1. Estima cuántos ids cumple cada criterio indexado (tipo, material,
+       color, precio y nombre) sin listarlos: tamaño del bucket o conteo
+       por búsqueda binaria
+    2. Lista solo los ids del criterio más selectivo
+    3. Intersecta esos ids con el resto de los criterios indexados, del más
+       al menos selectivo, preguntando la pertenencia de cada id en O(1)
+    4. Evalúa sobre los muebles que quedan los criterios sin índice
+       (capacidad, área, atributos y predicados)
+
+    Si algún criterio indexado no tiene ids, la consulta termina sin
+    recorrer nada. Sin criterios indexados se recorre todo el inventario.
+    explicar() muestra el plan elegido.
+    """
+
+    def __init__(self, inventario):
+        """
+        Constructor de la consulta vacía.
+
+        Args:
+            inventario: Inventario sobre el que se consulta
+        """
+        self._inventario = inventario
+        self._criterios: List[_Criterio] = []
+
+    def tipo(self, clase: type) -> "Consulta":
+        """Muebles del tipo indicado o de sus subclases."""
+        return self._agregar(_PorTipo(clase))
+
+    def material(self, material: str) -> "Consulta":
+        """Muebles del material indicado (sin distinguir mayúsculas)."""
+        return self._agregar(_PorBucket("material", material))
+
+    def color(self, color: str) -> "Consulta":
+        """Muebles del color indicado (sin distinguir mayúsculas)."""
+        return self._agregar(_PorBucket("color", color))
+
+    def precio(self, minimo: float = 0, maximo: float = INFINITO) -> "Consulta":
+        """Muebles con precio en el rango inclusivo."""
+        return self._agregar(_PorPrecio(max(minimo, 0), maximo))
+
+    def nombre(self, texto: str) -> "Consulta":
+        """Muebles cuyo nombre contiene el texto (sin distinguir mayúsculas)."""
+        return self._agregar(_PorNombre(texto))
+
+    def capacidad(
+        self, minimo: Optional[int] = None, maximo: Optional[int] = None
+    ) -> "Consulta":
+        """Muebles con capacidad de personas en el rango (asientos y mesas)."""
+        return self._agregar(_EnRango("capacidad_personas", minimo, maximo))
+
+    def area(
+        self, minimo: Optional[float] = None, maximo: Optional[float] = None
+    ) -> "Consulta":
+        """Superficies con área (cm²) en el rango."""
+        return self._agregar(_EnRango("calcular_area", minimo, maximo, True))
+
+    def con(self, **atributos) -> "Consulta":
+        """
+        Muebles con los atributos indicados (ej: con(tiene_ruedas=True)).
+        Los muebles que no tienen el atributo no cumplen el criterio.
+        """
+        for atributo, valor in atributos.items():
+            self._agregar(_ConValor(atributo, valor))
+        return self
+
+    def donde(
+        self, funcion: Callable[[object], bool], descripcion: str = "predicado"
+    ) -> "Consulta":
+        """Muebles para los que la función retorna True."""
+        return self._agregar(_Predicado(funcion, descripcion))
+
+    def plan(self) -> List[dict]:
+        """
+        Calcula el plan sin ejecutarlo.
+
+        Returns:
+            List[dict]: Pasos en orden de ejecución, con la operación
+                ("inicio", "intersección", "recorrido" o "filtro"), el
+                criterio y los ids estimados (None en los filtros)
+        """
+        indexados, residuales = self._planificar()
+        pasos = []
+        if not indexados:
+            pasos.append(
+                {
+                    "operacion": "recorrido",
+                    "criterio": "todo el inventario",
+                    "estimado": len(self._inventario),
+                }
+            )
+        for posicion, (criterio, fuente) in enumerate(indexados):
+            pasos.append(
+                {
+                    "operacion": "inicio" if posicion == 0 else "intersección",
+                    "criterio": criterio.descripcion,
+                    "estimado": fuente.estimado,
+                }
+            )
+        for criterio in residuales:
+            pasos.append(
+                {
+                    "operacion": "filtro",
+                    "criterio": criterio.descripcion,
+                    "estimado": None,
+                }
+            )
+        return pasos
+
+    def explicar(self) -> str:
+        """
+        Describe el plan elegido (para depuración).
+
+        Returns:
+            str: Un paso por línea con su estimación de ids
+        """
+        lineas = [f"Plan de consulta ({len(self._criterios)} criterios):"]
+        for numero, paso in enumerate(self.plan(), 1):
+            linea = f"  {numero}. {paso['operacion']}: {paso['criterio']}"
+            if paso["estimado"] is not None:
+                linea += f" (~{paso['estimado']} ids)"
+            lineas.append(linea)
+        return "\n".join(lineas)
+
+    def ejecutar(self) -> List:
+        """
+        Ejecuta la consulta.
+
+        Returns:
+            List: Muebles que cumplen todos los criterios, en orden de ingreso
+        """
+        return self._filtrar(*self._planificar())
+
+    def contar(self) -> int:
+        """Cuenta los resultados (sin resolver muebles si no hay filtros)."""
+        indexados, residuales = self._planificar()
+        if not residuales:
+            return len(self._ids(indexados))
+        return len(self._filtrar(indexados, residuales))
+
+    def _agregar(self, criterio: _Criterio) -> "Consulta":
+        """Agrega un criterio y retorna la consulta."""
+        self._criterios.append(criterio)
+        return self
+
+    def _planificar(
+        self,
+    ) -> Tuple[List[Tuple[_Criterio, _Fuente]], List[_Criterio]]:
+        """Separa los criterios y ordena los indexados por selectividad."""
+        indexados = []
+        residuales = []
+        for criterio in self._criterios:
+            fuente = criterio.abrir(self._inventario)
+            if fuente is None:
+                residuales.append(criterio)
+            else:
+                indexados.append((criterio, fuente))
+        indexados.sort(key=lambda par: par[1].estimado)
+        return indexados, residuales
+
+    def _ids(self, indexados: List[Tuple[_Criterio, _Fuente]]) -> List[int]:
+        """Intersecta las fuentes empezando por la más chica."""
+        if not indexados:
+            return self._inventario.ids()
+        if indexados[0][1].estimado == 0:
+            return []
+        ids = indexados[0][1].ids()
+        for _, fuente in indexados[1:]:
+            if not ids:
+                break
+            contiene = fuente.contiene
+            ids = [i for i in ids if contiene(i)]
+        return sorted(ids)
+
+    def _filtrar(
+        self, indexados: List[Tuple[_Criterio, _Fuente]], residuales: List[_Criterio]
+    ) -> List:
+        """Resuelve los ids del plan y aplica los criterios sin índice."""
+        obtener = self._inventario.obtener
+        muebles = []
+        for id_mueble in self._ids(indexados):
+            mueble = obtener(id_mueble)
+            if all(criterio.cumple(mueble) for criterio in residuales):
+                muebles.append(mueble)
+        return muebles
@@ -0,0 +1,392 @@
+"""
+Motor de descuentos por reglas.
+Las reglas filtran por tipo (incluidas sus subclases), material, banda de
+precio y ventana de fechas. Se compilan en una tabla por clase concreta,
+así el descuento de un mueble se resuelve con dos búsquedas en
+diccionarios y una búsqueda binaria sobre pocos cortes de precio.
+"""
+
+import importlib
+import math
+import time
+import unicodedata
+from bisect import bisect_right
+from typing import Callable, Dict, List, Optional, Tuple
+
+from models import registro
+from models.vocabulario import MATERIALES
+
+# Categorías abstractas a las que también se puede aplicar un descuento
+_CATEGORIAS: Dict[str, str] = {
+    "Asiento": "models.categorias.asientos",
+    "Superficie": "models.categorias.superficies",
+    "Almacenamiento": "models.categorias.almacenamiento",
+}
+
+# Tramos de una clase sin reglas: ningún corte y descuento cero
+_SIN_DESCUENTO: Tuple[tuple, tuple] = ((), (0.0,))
+
+
+class ReglaDescuento:
+    """
+    Regla de descuento inmutable.
+
+    Todas las condiciones son opcionales; una regla sin condiciones aplica a
+    todos los muebles. La banda de precio se evalúa sobre el precio de
+    lista y es semiabierta: precio_min <= precio < precio_max. La ventana
+    de fechas también: desde <= momento < hasta.
+    """
+
+    __slots__ = (
+        "fraccion",
+        "tipo",
+        "material",
+        "clave_material",
+        "precio_min",
+        "precio_max",
+        "desde",
+        "hasta",
+    )
+
+    def __init__(
+        self,
+        fraccion: float,
+        tipo: Optional[type] = None,
+        material: Optional[str] = None,
+        precio_min: float = 0,
+        precio_max: float = math.inf,
+        desde: Optional[float] = None,
+        hasta: Optional[float] = None,
+    ):
+        """
+        Constructor de la regla.
+
+        Args:
+            fraccion: Descuento a aplicar (0-1, mayor a 0)
+            tipo: Clase a la que aplica, con sus subclases (None = todas)
+            material: Material al que aplica, sin distinguir mayúsculas
+            precio_min: Precio de lista mínimo (inclusivo)
+            precio_max: Precio de lista máximo (exclusivo)
+            desde: Marca de tiempo de inicio (inclusiva, None = sin límite)
+            hasta: Marca de tiempo de fin (exclusiva, None = sin límite)
+        Raises:
+            ValueError: Si la fracción, la banda o la ventana no son válidas
+        """
+        if not 0 < fraccion <= 1:
+            raise ValueError("El descuento debe ser una fracción entre 0 y 1")
+        if not precio_min < precio_max:
+            raise ValueError("La banda de precio está vacía")
+        if desde is not None and hasta is not None and not desde < hasta:
+            raise ValueError("La ventana de fechas está vacía")
+        self.fraccion = fraccion
+        self.tipo = tipo
+        self.material = material
+        self.clave_material = MATERIALES.clave_de(material) if material else None
+        self.precio_min = precio_min
+        self.precio_max = precio_max
+        self.desde = desde
+        self.hasta = hasta
+
+    @property
+    def solo_por_tipo(self) -> bool:
+        """Verifica si la regla solo filtra por tipo (como aplicar_descuento)."""
+        return (
+            self.tipo is not None
+            and self.clave_material is None
+            and self.precio_min <= 0
+            and self.precio_max == math.inf
+            and self.desde is None
+            and self.hasta is None
+        )
+
+    def aplica_a(self, clase: type) -> bool:
+        """Verifica si la regla puede aplicar a los muebles de una clase."""
+        return self.tipo is None or issubclass(clase, self.tipo)
+
+    def vigente(self, momento: float) -> bool:
+        """Verifica si la regla está vigente en un momento."""
+        return (self.desde is None or self.desde <= momento) and (
+            self.hasta is None or momento < self.hasta
+        )
+
+    def __repr__(self) -> str:
+        """Representación técnica de la regla."""
+        condiciones = [f"{self.fraccion * 100:g}%"]
+        if self.tipo is not None:
+            condiciones.append(f"tipo={self.tipo.__name__}")
+        if self.material:
+            condiciones.append(f"material={self.material!r}")
+        if self.precio_min > 0 or self.precio_max != math.inf:
+            condiciones.append(f"precio=[{self.precio_min:g}, {self.precio_max:g})")
+        if self.desde is not None or self.hasta is not None:
+            condiciones.append(f"vigencia=[{self.desde}, {self.hasta})")
+        return f"ReglaDescuento({', '.join(condiciones)})"
+
+
+class MotorDescuentos:
+    """
+    Conjunto de reglas de descuento compiladas por clase concreta.
+
+    La tabla de una clase se arma la primera vez que se pide un descuento
+    para esa clase, con las reglas vigentes que le aplican: un juego de
+    tramos de precio por cada material mencionado por alguna regla y uno
+    general. Si varias reglas aplican a un mueble gana el mayor descuento
+    (no se acumulan).
+
+    Al agregar o quitar una regla, o cuando una regla entra o sale de su
+    ventana de fechas, solo se descartan las tablas de las clases a las que
+    aplica, y se avisa a los observadores con las reglas que cambiaron para
+    que reprecien solo esas particiones.
+    """
+
+    def __init__(self):
+        """Constructor del motor sin reglas."""
+        self._reglas: Dict[int, ReglaDescuento] = {}
+        self._siguiente_id = 1
+        self._activas: List[ReglaDescuento] = []
+        self._tablas: Dict[type, Dict[Optional[int], tuple]] = {}
+        # Intervalo [inicio, fin) en el que las reglas vigentes no cambian
+        self._inicio = math.inf
+        self._fin = -math.inf
+        self._observadores: List[Callable[[List[ReglaDescuento]], None]] = []
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de reglas (vigentes o no)."""
+        return len(self._reglas)
+
+    def reglas(self) -> List[Tuple[int, ReglaDescuento]]:
+        """Retorna los pares (id, regla) en orden de alta."""
+        return list(self._reglas.items())
+
+    def agregar(self, regla: ReglaDescuento) -> int:
+        """
+        Agrega una regla.
+
+        Args:
+            regla: Regla a agregar
+        Returns:
+            int: Id de la regla (para quitarla)
+        """
+        id_regla = self._siguiente_id
+        self._siguiente_id += 1
+        self._reglas[id_regla] = regla
+        self._recalcular_vigentes(time.time())
+        return id_regla
+
+    def quitar(self, id_regla: int) -> bool:
+        """
+        Quita una regla.
+
+        Returns:
+            bool: True si la regla existía
+        """
+        if self._reglas.pop(id_regla, None) is None:
+            return False
+        self._recalcular_vigentes(time.time())
+        return True
+
+    def fijar_por_tipo(self, tipo: type, fraccion: float) -> int:
+        """
+        Reemplaza el descuento simple de un tipo (como un diccionario
+        tipo -> descuento). Las demás reglas del tipo no cambian.
+
+        Args:
+            tipo: Clase a la que aplica (con sus subclases)
+            fraccion: Descuento (0-1)
+        Returns:
+            int: Id de la regla nueva
+        """
+        regla = ReglaDescuento(fraccion, tipo)
+        for id_regla, anterior in list(self._reglas.items()):
+            if anterior.solo_por_tipo and anterior.tipo is tipo:
+                del self._reglas[id_regla]
+        return self.agregar(regla)
+
+    def descuentos_por_tipo(self) -> Dict[str, float]:
+        """
+        Retorna los descuentos simples por tipo (nombre de clase -> fracción),
+        el formato de las estadísticas y el reporte de la tienda.
+        """
+        descuentos: Dict[str, float] = {}
+        for regla in self._reglas.values():
+            if regla.solo_por_tipo:
+                nombre = regla.tipo.__name__
+                descuentos[nombre] = max(descuentos.get(nombre, 0), regla.fraccion)
+        return descuentos
+
+    def agregar_observador(
+        self, observador: Callable[[List[ReglaDescuento]], None]
+    ) -> None:
+        """
+        Registra una función que recibe las reglas que cambiaron (agregadas,
+        quitadas o que entraron o salieron de su ventana de fechas).
+        """
+        self._observadores.append(observador)
+
+    def descuento(
+        self,
+        mueble,
+        precio: Optional[float] = None,
+        momento: Optional[float] = None,
+    ) -> float:
+        """
+        Obtiene el descuento efectivo de un mueble.
+
+        Args:
+            mueble: Mueble a consultar
+            precio: Precio de lista ya calculado (opcional)
+            momento: Marca de tiempo (None = ahora)
+        Returns:
+            float: Fracción de descuento (0 si no aplica ninguna regla)
+        """
+        if precio is None:
+            precio = mueble.calcular_precio()
+        return self.descuento_de(type(mueble), _clave_material(mueble), precio, momento)
+
+    def descuento_de(
+        self,
+        clase: type,
+        clave_material: Optional[int],
+        precio: float,
+        momento: Optional[float] = None,
+    ) -> float:
+        """
+        Obtiene el descuento para una clase, clave de material y precio.
+
+        Args:
+            clase: Clase concreta del mueble
+            clave_material: Clave de MATERIALES (None si no tiene)
+            precio: Precio de lista
+            momento: Marca de tiempo (None = ahora)
+        Returns:
+            float: Fracción de descuento
+        """
+        if not self._reglas:
+            return 0.0
+        self.sincronizar(momento)
+        tabla = self._tablas.get(clase)
+        if tabla is None:
+            tabla = self._tablas[clase] = self._compilar(clase)
+        cortes, valores = tabla.get(clave_material) or tabla[None]
+        if not cortes:
+            return valores[0]
+        return valores[bisect_right(cortes, precio)]
+
+    def sincronizar(self, momento: Optional[float] = None) -> None:
+        """
+        Actualiza las reglas vigentes si alguna entró o salió de su ventana
+        desde la última consulta (y avisa a los observadores). Las
+        consultas de descuento lo hacen solas; quien guarde precios con
+        descuento lo llama antes de leerlos.
+
+        Args:
+            momento: Marca de tiempo (None = ahora)
+        """
+        if momento is None:
+            momento = time.time()
+        if not self._inicio <= momento < self._fin:
+            self._recalcular_vigentes(momento)
+
+    def _recalcular_vigentes(self, momento: float) -> None:
+        """
+        Recalcula las reglas vigentes y el intervalo en el que no cambian.
+        Descarta las tablas de las clases afectadas y avisa los cambios.
+        """
+        reglas = list(self._reglas.values())
+        activas = [regla for regla in reglas if regla.vigente(momento)]
+        limites = [
+            limite
+            for regla in reglas
+            for limite in (regla.desde, regla.hasta)
+            if limite is not None
+        ]
+        self._inicio = max((x for x in limites if x <= momento), default=-math.inf)
+        self._fin = min((x for x in limites if x > momento), default=math.inf)
+        anteriores = {id(regla) for regla in self._activas}
+        nuevas = {id(regla) for regla in activas}
+        cambiadas = [r for r in activas if id(r) not in anteriores] + [
+            r for r in self._activas if id(r) not in nuevas
+        ]
+        self._activas = activas
+        if not cambiadas:
+            return
+        for clase in list(self._tablas):
+            if any(regla.aplica_a(clase) for regla in cambiadas):
+                del self._tablas[clase]
+        for observador in list(self._observadores):
+            observador(cambiadas)
+
+    def _compilar(self, clase: type) -> Dict[Optional[int], tuple]:
+        """Arma la tabla de tramos de una clase (ver MotorDescuentos)."""
+        reglas = [regla for regla in self._activas if regla.aplica_a(clase)]
+        if not reglas:
+            return {None: _SIN_DESCUENTO}
+        generales = [regla for regla in reglas if regla.clave_material is None]
+        tabla = {None: _tramos(generales)}
+        for clave in {regla.clave_material for regla in reglas} - {None}:
+            tabla[clave] = _tramos(
+                [regla for regla in reglas if regla.clave_material in (None, clave)]
+            )
+        return tabla
+
+
+def resolver_categoria(categoria: str) -> Optional[type]:
+    """
+    Obtiene la clase de una categoría escrita por el usuario.
+    No distingue mayúsculas, acentos, espacios ni guiones, y acepta el
+    plural ("sillas", "sillones", "Sofá-camas", "asientos").
+
+    Args:
+        categoria: Nombre de la clase concreta o de la categoría
+    Returns:
+        Optional[type]: La clase, o None si no se reconoce
+    """
+    nombres = {nombre.lower(): nombre for nombre in registro.nombres()}
+    nombres.update({nombre.lower(): nombre for nombre in _CATEGORIAS})
+    texto = unicodedata.normalize("NFKD", categoria.lower())
+    texto = "".join(c for c in texto if c.isalnum() and not unicodedata.combining(c))
+    for candidato in (texto, texto[:-2] if texto.endswith("es") else None, texto[:-1]):
+        nombre = nombres.get(candidato)
+        if nombre is None:
+            continue
+        if nombre in _CATEGORIAS:
+            return getattr(importlib.import_module(_CATEGORIAS[nombre]), nombre)
+        return registro.obtener(nombre)
+    return None
+
+
+def _tramos(reglas: List[ReglaDescuento]) -> tuple:
+    """
+    Convierte reglas en tramos de precio: cortes ordenados y el mayor
+    descuento de cada tramo (uno más que cortes).
+    """
+    if not reglas:
+        return _SIN_DESCUENTO
+    cortes = sorted(
+        (
+            {regla.precio_min for regla in reglas}
+            | {regla.precio_max for regla in reglas}
+        )
+        - {math.inf, -math.inf}
+    )
+    limites = [-math.inf] + cortes + [math.inf]
+    valores = tuple(
+        max(
+            (
+                regla.fraccion
+                for regla in reglas
+                if regla.precio_min <= inicio and fin <= regla.precio_max
+            ),
+            default=0.0,
+        )
+        for inicio, fin in zip(limites, limites[1:])
+    )
+    return tuple(cortes), valores
+
+
+def _clave_material(mueble) -> Optional[int]:
+    """Clave de material de un mueble (también para clases sin herencia)."""
+    try:
+        return mueble.clave_material
+    except AttributeError:
+        return MATERIALES.clave_de(getattr(mueble, "material", None))
@@ -0,0 +1,191 @@
+"""
+Agregados del inventario mantenidos de forma incremental.
+Evitan recorrer todo el inventario cada vez que se piden estadísticas.
+"""
+
+import math
+from typing import Dict, Iterable, Optional
+
+
+def precio_valido(precio) -> bool:
+    """
+    Verifica que el precio sea un número finito mayor a 0.
+    Solo esos precios se pueden convertir a centavos con a_centavos().
+    """
+    try:
+        return math.isfinite(precio) and precio > 0
+    except (TypeError, OverflowError):
+        return False
+
+
+def a_centavos(precio: float) -> int:
+    """
+    Convierte un precio a centavos enteros.
+    Sumar enteros evita el error acumulado de sumar y restar floats.
+    """
+    return int(round(precio * 100))
+
+
+class EstadisticasInventario:
+    """
+    Acumuladores del inventario actualizados en cada alta, baja o cambio.
+
+    Mantiene:
+    - Valor total (en centavos)
+    - Total de unidades
+    - Cantidad de muebles por tipo concreto
+    - Cantidad de muebles por material (normalizado)
+    - Suma de precios por tipo (en centavos)
+    - Valor total con descuentos (en centavos), solo mientras haya reglas
+      de descuento; si no, coincide con el valor total
+
+    Todas las lecturas son O(1) respecto al tamaño del inventario.
+    """
+
+    def __init__(self):
+        """Constructor con los acumuladores en cero."""
+        self._valor_centavos = 0
+        self._unidades = 0
+        self._por_tipo: Dict[str, int] = {}
+        self._por_material: Dict[str, int] = {}
+        self._valor_por_tipo: Dict[str, int] = {}
+        self._valor_efectivo_centavos: Optional[int] = None
+
+    @property
+    def valor_total(self) -> float:
+        """Valor total del inventario a precio de lista."""
+        return self._valor_centavos / 100
+
+    @property
+    def valor_efectivo(self) -> float:
+        """Valor total del inventario con los descuentos vigentes."""
+        if self._valor_efectivo_centavos is None:
+            return self.valor_total
+        return self._valor_efectivo_centavos / 100
+
+    @property
+    def total_unidades(self) -> int:
+        """Cantidad de unidades en inventario (suma de los conteos por tipo)."""
+        return self._unidades
+
+    @property
+    def por_tipo(self) -> Dict[str, int]:
+        """Copia del conteo de muebles por tipo."""
+        return dict(self._por_tipo)
+
+    @property
+    def por_material(self) -> Dict[str, int]:
+        """Copia del conteo de muebles por material."""
+        return dict(self._por_material)
+
+    @property
+    def valor_por_tipo(self) -> Dict[str, float]:
+        """Suma de precios por tipo."""
+        return {tipo: c / 100 for tipo, c in self._valor_por_tipo.items()}
+
+    def sumar_tipo(self, tipo: str, cantidad: int = 1) -> None:
+        """Ajusta el conteo de un tipo (cantidad negativa para restar)."""
+        self._unidades += cantidad
+        _ajustar(self._por_tipo, tipo, cantidad)
+
+    def sumar_material(self, material: str, cantidad: int = 1) -> None:
+        """Ajusta el conteo de un material (cantidad negativa para restar)."""
+        if material:
+            _ajustar(self._por_material, material, cantidad)
+
+    def sumar_precio(self, tipo: str, precio: float, cantidad: int = 1) -> None:
+        """Ajusta el valor total y el valor del tipo con un precio."""
+        centavos = a_centavos(precio) * cantidad
+        self._valor_centavos += centavos
+        _ajustar(self._valor_por_tipo, tipo, centavos)
+
+    def sumar_precios(
+        self,
+        tipo: str,
+        precios: Iterable[float],
+        unidades: Optional[Iterable[int]] = None,
+    ) -> None:
+        """
+        Suma muchos precios de un mismo tipo con un solo ajuste.
+        Con unidades, cada precio se multiplica por su cantidad.
+        """
+        if unidades is None:
+            centavos = sum(a_centavos(precio) for precio in precios)
+        else:
+            centavos = sum(
+                a_centavos(precio) * cantidad
+                for precio, cantidad in zip(precios, unidades)
+            )
+        self._valor_centavos += centavos
+        _ajustar(self._valor_por_tipo, tipo, centavos)
+
+    def iniciar_valor_efectivo(self) -> None:
+        """Empieza a acumular el valor con descuentos desde cero."""
+        self._valor_efectivo_centavos = 0
+
+    def descartar_valor_efectivo(self) -> None:
+        """Deja de acumular el valor con descuentos (vuelve a ser el de lista)."""
+        self._valor_efectivo_centavos = None
+
+    def sumar_precios_efectivos(
+        self, precios: Iterable[float], unidades: Iterable[int]
+    ) -> None:
+        """
+        Ajusta el valor con descuentos con precios por sus unidades
+        (unidades negativas para restar). Requiere iniciar_valor_efectivo().
+        """
+        self._valor_efectivo_centavos += sum(
+            a_centavos(precio) * cantidad for precio, cantidad in zip(precios, unidades)
+        )
+
+    def estado(self) -> tuple:
+        """
+        Acumuladores a precio de lista, para guardarlos y restaurarlos
+        sin recorrer el inventario (el valor con descuentos no se incluye).
+        """
+        return (
+            self._valor_centavos,
+            self._unidades,
+            dict(self._por_tipo),
+            dict(self._por_material),
+            dict(self._valor_por_tipo),
+        )
+
+    def restaurar(self, estado: tuple) -> None:
+        """Reemplaza los acumuladores a precio de lista (ver estado())."""
+        valor, unidades, por_tipo, por_material, valor_por_tipo = estado
+        self._valor_centavos = valor
+        self._unidades = unidades
+        self._por_tipo = dict(por_tipo)
+        self._por_material = dict(por_material)
+        self._valor_por_tipo = dict(valor_por_tipo)
+
+    def comparar(self, otras: "EstadisticasInventario") -> Dict[str, tuple]:
+        """
+        Compara estos acumuladores con otros (ej: una recomputación completa).
+
+        Returns:
+            Dict[str, tuple]: Campos distintos con sus pares de valores
+        """
+        diferencias = {}
+        for campo in (
+            "_valor_centavos",
+            "_unidades",
+            "_por_tipo",
+            "_por_material",
+            "_valor_por_tipo",
+            "_valor_efectivo_centavos",
+        ):
+            propio, ajeno = getattr(self, campo), getattr(otras, campo)
+            if propio != ajeno:
+                diferencias[campo.lstrip("_")] = (propio, ajeno)
+        return diferencias
+
+
+def _ajustar(contador: Dict[str, int], clave: str, cantidad: int) -> None:
+    """Suma una cantidad a un contador y elimina la clave si queda en cero."""
+    valor = contador.get(clave, 0) + cantidad
+    if valor:
+        contador[clave] = valor
+    else:
+        contador.pop(clave, None)
@@ -0,0 +1,388 @@
+"""
+Exportación del inventario y del historial de ventas para análisis.
+Escribe filas de esquema fijo en CSV o en un formato binario columnar
+simple, de a bloques: ni el inventario ni el historial se copian enteros
+en memoria.
+
+Formato columnar (little endian):
+    MAGIA, versión (H), cantidad de columnas (H) y por columna su tipo
+    (1 byte: q entero, d real, b booleano, s texto) y su nombre (H + UTF-8).
+    Después, grupos de filas: cantidad de filas (I; 0 = fin) y por cada
+    columna su largo en bytes (I) seguido de una marca de nulos (B), la
+    máscara de presentes (1 byte por fila, solo si hay nulos) y los valores:
+    un arreglo de ancho fijo, o para textos los desplazamientos (I, filas+1)
+    y los bytes UTF-8 concatenados.
+"""
+
+import csv
+import struct
+import sys
+from array import array
+from itertools import accumulate, islice
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+FORMATOS = ("csv", "columnar")
+
+MAGIA = b"MUEBCOL\x00"
+VERSION = 1
+
+# Filas por bloque de escritura (y por grupo del formato columnar)
+TAMAÑO_BLOQUE = 50_000
+
+# Columnas: (nombre, tipo). Los campos de una categoría quedan vacíos en
+# los muebles de otra.
+COLUMNAS_INVENTARIO: Tuple[Tuple[str, type], ...] = (
+    ("id", int),
+    ("tipo", str),
+    ("categoria", str),
+    ("nombre", str),
+    ("material", str),
+    ("color", str),
+    ("precio_base", float),
+    ("precio_final", float),
+    ("unidades", int),
+    ("capacidad_personas", int),
+    ("tiene_respaldo", bool),
+    ("material_tapizado", str),
+    ("largo", float),
+    ("ancho", float),
+    ("altura", float),
+    ("num_compartimentos", int),
+    ("capacidad_litros", float),
+)
+
+COLUMNAS_VENTAS: Tuple[Tuple[str, type], ...] = (
+    ("fecha", str),
+    ("marca_tiempo", float),
+    ("mueble", str),
+    ("cliente", str),
+    ("precio_original", float),
+    ("descuento", float),
+    ("precio_final", float),
+    ("cantidad", int),
+    ("total", float),
+)
+
+# Columnas que se leen del mueble por nombre (vacías si no las tiene)
+_CAMPOS_CATEGORIA = (
+    "capacidad_personas",
+    "tiene_respaldo",
+    "material_tapizado",
+    "largo",
+    "ancho",
+    "altura",
+    "num_compartimentos",
+    "capacidad_litros",
+)
+
+_TIPOS = {int: b"q", float: b"d", bool: b"b", str: b"s"}
+_TIPOS_ARREGLO = {b"q": "q", b"d": "d", b"b": "b"}
+_VACIOS = {b"q": 0, b"d": 0.0, b"b": False, b"s": ""}
+_H = struct.Struct("<H")
+_I = struct.Struct("<I")
+_COLUMNA = struct.Struct("<cH")
+_NULOS = struct.Struct("<B")
+
+
+class ArchivoColumnarInvalido(ValueError):
+    """Error al leer un archivo que no tiene el formato columnar."""
+
+
+def filas_inventario(tienda) -> Iterator[tuple]:
+    """
+    Genera una fila por mueble del inventario, en orden de ingreso.
+    El precio final es el indexado por el inventario (no se recalcula).
+
+    Args:
+        tienda: TiendaMuebles a exportar
+    Returns:
+        Iterator[tuple]: Filas con los valores de COLUMNAS_INVENTARIO
+    """
+    # Las categorías se importan al exportar, no al arrancar la tienda
+    from models.categorias.almacenamiento import Almacenamiento
+    from models.categorias.asientos import Asiento
+    from models.categorias.superficies import Superficie
+
+    categorias = (
+        (Asiento, "asiento"),
+        (Superficie, "superficie"),
+        (Almacenamiento, "almacenamiento"),
+    )
+    inventario = tienda._inventario
+    for id_mueble in inventario.ids():
+        mueble = inventario.obtener(id_mueble)
+        if mueble is None:
+            continue
+        categoria = None
+        for clase, nombre in categorias:
+            if isinstance(mueble, clase):
+                categoria = nombre
+                break
+        yield (
+            id_mueble,
+            type(mueble).__name__,
+            categoria,
+            getattr(mueble, "nombre", None),
+            getattr(mueble, "material", None),
+            getattr(mueble, "color", None),
+            getattr(mueble, "precio_base", None),
+            inventario.precio_indexado(id_mueble),
+            inventario.unidades(id_mueble),
+        ) + tuple(getattr(mueble, campo, None) for campo in _CAMPOS_CATEGORIA)
+
+
+def filas_ventas(
+    tienda, desde: Optional[float] = None, hasta: Optional[float] = None
+) -> Iterator[tuple]:
+    """
+    Genera una fila por venta (con sus unidades), en orden cronológico.
+    Las ventas volcadas a disco se leen a medida que se escriben.
+
+    Args:
+        tienda: TiendaMuebles a exportar
+        desde: Marca de tiempo mínima (None = sin límite)
+        hasta: Marca de tiempo máxima (None = sin límite)
+    Returns:
+        Iterator[tuple]: Filas con los valores de COLUMNAS_VENTAS (el
+            descuento en porcentaje, como en los comprobantes)
+    """
+    for venta in tienda._ventas_realizadas.entre(desde, hasta):
+        yield (
+            venta.fecha,
+            venta.marca_tiempo,
+            venta.mueble,
+            venta.cliente,
+            venta.precio_original,
+            venta.descuento * 100,
+            venta.precio_final,
+            venta.cantidad,
+            venta.total,
+        )
+
+
+def exportar(
+    filas: Iterable[tuple],
+    columnas: Tuple[Tuple[str, type], ...],
+    archivo,
+    formato: str = "csv",
+    tamaño_bloque: int = TAMAÑO_BLOQUE,
+) -> int:
+    """
+    Escribe filas de a bloques.
+
+    Args:
+        filas: Filas con un valor por columna (None = vacío)
+        columnas: Pares (nombre, tipo) de las columnas
+        archivo: Archivo abierto: de texto (newline="") para CSV o binario
+            para el formato columnar
+        formato: 'csv' o 'columnar'
+        tamaño_bloque: Filas por bloque
+    Returns:
+        int: Cantidad de filas escritas
+    Raises:
+        ValueError: Si el formato no es soportado
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato no soportado: {formato}")
+    bloques = _bloques(filas, max(tamaño_bloque, 1))
+    if formato == "csv":
+        return _escribir_csv(bloques, columnas, archivo)
+    return _escribir_columnar(bloques, columnas, archivo)
+
+
+def exportar_inventario(
+    tienda, archivo, formato: str = "csv", tamaño_bloque: int = TAMAÑO_BLOQUE
+) -> int:
+    """
+    Exporta el inventario (ver exportar y COLUMNAS_INVENTARIO).
+
+    Returns:
+        int: Cantidad de muebles exportados
+    """
+    return exportar(
+        filas_inventario(tienda), COLUMNAS_INVENTARIO, archivo, formato, tamaño_bloque
+    )
+
+
+def exportar_ventas(
+    tienda,
+    archivo,
+    formato: str = "csv",
+    desde: Optional[float] = None,
+    hasta: Optional[float] = None,
+    tamaño_bloque: int = TAMAÑO_BLOQUE,
+) -> int:
+    """
+    Exporta el historial de ventas (ver exportar y COLUMNAS_VENTAS).
+
+    Returns:
+        int: Cantidad de ventas exportadas
+    """
+    return exportar(
+        filas_ventas(tienda, desde, hasta),
+        COLUMNAS_VENTAS,
+        archivo,
+        formato,
+        tamaño_bloque,
+    )
+
+
+def abrir(ruta: str, formato: str = "csv"):
+    """
+    Abre el archivo de destino en el modo que usa el formato.
+
+    Raises:
+        ValueError: Si el formato no es soportado
+    """
+    if formato == "csv":
+        return open(ruta, "w", encoding="utf-8", newline="")
+    if formato == "columnar":
+        return open(ruta, "wb")
+    raise ValueError(f"Formato no soportado: {formato}")
+
+
+def leer_columnar(
+    archivo: BinaryIO, columnas: Optional[Iterable[str]] = None
+) -> Iterator[Dict[str, list]]:
+    """
+    Lee un archivo columnar de a un grupo de filas.
+
+    Args:
+        archivo: Archivo binario abierto
+        columnas: Nombres de las columnas a leer (None = todas); las demás
+            se saltean sin decodificarlas
+    Returns:
+        Iterator[Dict[str, list]]: Por grupo, nombre de columna -> valores
+            (None en los nulos)
+    Raises:
+        ArchivoColumnarInvalido: Si el archivo no tiene el formato esperado
+    """
+    if archivo.read(len(MAGIA)) != MAGIA:
+        raise ArchivoColumnarInvalido("El archivo no es un archivo columnar")
+    (version,) = _H.unpack(_leer(archivo, _H.size))
+    if version != VERSION:
+        raise ArchivoColumnarInvalido(f"Versión no soportada: {version}")
+    (cantidad,) = _H.unpack(_leer(archivo, _H.size))
+    esquema = []
+    for _ in range(cantidad):
+        tipo, largo = _COLUMNA.unpack(_leer(archivo, _COLUMNA.size))
+        esquema.append((_leer(archivo, largo).decode("utf-8"), tipo))
+    pedidas = None if columnas is None else set(columnas)
+    while True:
+        (filas,) = _I.unpack(_leer(archivo, _I.size))
+        if filas == 0:
+            return
+        grupo = {}
+        for nombre, tipo in esquema:
+            (largo,) = _I.unpack(_leer(archivo, _I.size))
+            if pedidas is not None and nombre not in pedidas:
+                archivo.seek(largo, 1)
+                continue
+            grupo[nombre] = _decodificar(_leer(archivo, largo), tipo, filas)
+        yield grupo
+
+
+def _bloques(filas: Iterable[tuple], tamaño: int) -> Iterator[List[tuple]]:
+    """Agrupa las filas en listas de hasta tamaño filas."""
+    iterador = iter(filas)
+    while True:
+        bloque = list(islice(iterador, tamaño))
+        if not bloque:
+            return
+        yield bloque
+
+
+def _escribir_csv(bloques, columnas, archivo: TextIO) -> int:
+    """Escribe el encabezado y cada bloque con writerows."""
+    escritor = csv.writer(archivo)
+    escritor.writerow([nombre for nombre, _ in columnas])
+    total = 0
+    for bloque in bloques:
+        escritor.writerows(bloque)
+        total += len(bloque)
+    return total
+
+
+def _escribir_columnar(bloques, columnas, archivo: BinaryIO) -> int:
+    """Escribe el esquema y un grupo de filas por bloque."""
+    tipos = [_TIPOS[tipo] for _, tipo in columnas]
+    partes = [MAGIA, _H.pack(VERSION), _H.pack(len(columnas))]
+    for (nombre, _), tipo in zip(columnas, tipos):
+        codificado = nombre.encode("utf-8")
+        partes.append(_COLUMNA.pack(tipo, len(codificado)) + codificado)
+    archivo.write(b"".join(partes))
+    total = 0
+    for bloque in bloques:
+        partes = [_I.pack(len(bloque))]
+        for valores, tipo in zip(zip(*bloque), tipos):
+            columna = _codificar(valores, tipo)
+            partes.append(_I.pack(len(columna)))
+            partes.append(columna)
+        archivo.write(b"".join(partes))
+        total += len(bloque)
+    archivo.write(_I.pack(0))
+    return total
+
+
+def _codificar(valores: tuple, tipo: bytes) -> bytes:
+    """Codifica los valores de una columna de un grupo."""
+    mascara = b""
+    if any(valor is None for valor in valores):
+        mascara = bytes(valor is not None for valor in valores)
+        vacio = _VACIOS[tipo]
+        valores = [vacio if valor is None else valor for valor in valores]
+    if tipo == b"s":
+        textos = [str(valor).encode("utf-8") for valor in valores]
+        desplazamientos = array("I", [0])
+        desplazamientos.extend(accumulate(len(texto) for texto in textos))
+        cuerpo = _bytes_le(desplazamientos) + b"".join(textos)
+    else:
+        cuerpo = _bytes_le(array(_TIPOS_ARREGLO[tipo], valores))
+    return _NULOS.pack(bool(mascara)) + mascara + cuerpo
+
+
+def _decodificar(datos: bytes, tipo: bytes, filas: int) -> list:
+    """Decodifica los valores de una columna de un grupo."""
+    (con_nulos,) = _NULOS.unpack_from(datos)
+    posicion = _NULOS.size
+    mascara = None
+    if con_nulos:
+        mascara = datos[posicion : posicion + filas]
+        posicion += filas
+    if tipo == b"s":
+        desplazamientos = _arreglo_le("I", datos[posicion : posicion + 4 * (filas + 1)])
+        textos = datos[posicion + 4 * (filas + 1) :]
+        valores = [
+            textos[inicio:fin].decode("utf-8")
+            for inicio, fin in zip(desplazamientos, desplazamientos[1:])
+        ]
+    else:
+        valores = _arreglo_le(_TIPOS_ARREGLO[tipo], datos[posicion:]).tolist()
+        if tipo == b"b":
+            valores = [bool(valor) for valor in valores]
+    if mascara is not None:
+        valores = [v if presente else None for v, presente in zip(valores, mascara)]
+    return valores
+
+
+def _bytes_le(arreglo: array) -> bytes:
+    """Bytes del arreglo en little endian."""
+    if sys.byteorder == "big":
+        arreglo.byteswap()
+    return arreglo.tobytes()
+
+
+def _arreglo_le(codigo: str, datos: bytes) -> array:
+    """Arreglo a partir de bytes en little endian."""
+    arreglo = array(codigo, datos)
+    if sys.byteorder == "big":
+        arreglo.byteswap()
+    return arreglo
+
+
+def _leer(archivo: BinaryIO, largo: int) -> bytes:
+    """Lee exactamente largo bytes."""
+    datos = archivo.read(largo)
+    if len(datos) < largo:
+        raise ArchivoColumnarInvalido("Archivo columnar incompleto")
+    return datos
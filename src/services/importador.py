@@ -0,0 +1,346 @@
+"""
+Importación del catálogo desde archivos CSV o JSON Lines.
+Cada fila indica el tipo de mueble en la columna 'tipo' y los argumentos
+del constructor en el resto de las columnas. Las filas se leen de a una y
+se agregan a la tienda en lotes, así la memoria no depende del tamaño del
+archivo.
+"""
+
+import csv
+import gc
+import json
+import math
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, TextIO
+
+from models import registro
+from services.buscador import normalizar_busqueda
+from services.estadisticas import precio_valido
+
+FORMATOS = ("csv", "jsonl")
+
+# Muebles que se agregan juntos a la tienda
+TAMAÑO_LOTE = 50_000
+
+# Rechazos que se devuelven en el resultado (el resto va solo al archivo)
+MAXIMO_RECHAZOS_INFORMADOS = 100
+
+# Claves con las que el lector marca una línea que no se pudo interpretar
+_ERROR = "_error"
+_LINEA = "_linea"
+
+_VERDADEROS = {"1", "true", "si", "sí", "s", "yes", "y", "verdadero"}
+_FALSOS = {"0", "false", "no", "n", "falso", ""}
+
+
+class FilaInvalida(ValueError):
+    """Error en una fila del archivo importado."""
+
+
+def leer_filas(archivo: TextIO, formato: str = "csv") -> Iterator[Dict]:
+    """
+    Lee las filas de un archivo de a una.
+
+    Args:
+        archivo: Archivo de texto abierto
+        formato: 'csv' (con encabezado) o 'jsonl' (un objeto por línea)
+    Returns:
+        Iterator[Dict]: Filas como diccionarios columna -> valor
+    Raises:
+        ValueError: Si el formato no es soportado
+    """
+    if formato == "csv":
+        return iter(csv.DictReader(archivo))
+    if formato == "jsonl":
+        return _leer_jsonl(archivo)
+    raise ValueError(f"Formato no soportado: {formato}")
+
+
+class _Fabrica:
+    """
+    Crea muebles de un tipo a partir de filas.
+
+    Guarda el conversor de cada parámetro del constructor según su tipo
+    anotado, así cada fila solo convierte sus valores y llama al
+    constructor. Los constructores asignan los atributos sin validarlos;
+    por eso cada valor de la fila que corresponde a una propiedad con
+    setter se vuelve a asignar a través de él. Cualquier error al convertir
+    los valores o al crear el mueble se informa como FilaInvalida, así una
+    fila mal formada no interrumpe la importación.
+    """
+
+    __slots__ = ("_conversores", "_con_setter", "clase")
+
+    def __init__(self, clase: type):
+        """
+        Constructor de la fábrica.
+
+        Args:
+            clase: Clase concreta de los muebles a crear
+        """
+        self.clase = clase
+        constructor = clase.__init__
+        codigo = constructor.__code__
+        anotaciones = constructor.__annotations__
+        self._conversores: Dict[str, Callable] = {}
+        for nombre in codigo.co_varnames[1 : codigo.co_argcount]:
+            anotacion = anotaciones.get(nombre)
+            self._conversores[nombre] = _CONVERSORES.get(anotacion, _a_texto)
+        self._con_setter = frozenset(
+            nombre
+            for nombre in self._conversores
+            if isinstance(getattr(clase, nombre, None), property)
+            and getattr(clase, nombre).fset is not None
+        )
+
+    def __call__(self, fila: Dict):
+        """
+        Crea el mueble con los valores de la fila (se ignora la columna 'tipo').
+
+        Raises:
+            FilaInvalida: Si una columna o un valor no son válidos
+        """
+        argumentos = {}
+        conversores = self._conversores
+        for columna, valor in fila.items():
+            if valor is None or valor == "" or columna == "tipo":
+                continue
+            conversor = conversores.get(columna)
+            if conversor is None:
+                raise FilaInvalida(
+                    f"Columna desconocida para {self.clase.__name__}: {columna}"
+                )
+            try:
+                argumentos[columna] = conversor(valor)
+            except Exception:
+                raise FilaInvalida(
+                    f"Valor inválido para {columna}: {valor!r}"
+                ) from None
+        try:
+            mueble = self.clase(**argumentos)
+            for columna in self._con_setter.intersection(argumentos):
+                setattr(mueble, columna, argumentos[columna])
+        except Exception as e:
+            raise FilaInvalida(str(e) or type(e).__name__) from e
+        return mueble
+
+
+def fabrica(tipo) -> _Fabrica:
+    """
+    Obtiene la fábrica de muebles de un tipo.
+    Las fábricas se guardan por nombre de tipo: las filas de un mismo tipo
+    no vuelven a resolver la clase ni a leer su constructor.
+
+    Args:
+        tipo: Nombre del tipo (ver resolver_tipo)
+    Returns:
+        Fábrica que crea muebles a partir del resto de la fila
+    Raises:
+        FilaInvalida: Si el tipo no existe
+    """
+    if not isinstance(tipo, str):
+        raise FilaInvalida(f"Tipo de mueble desconocido: {tipo!r}")
+    return _fabrica(tipo)
+
+
+def crear_mueble(fila: Dict):
+    """
+    Crea el mueble que describe una fila.
+
+    Los valores de texto se convierten según las anotaciones del
+    constructor (bool, int, float) y las celdas vacías usan el valor por
+    defecto. Cada valor indicado se asigna además a través del setter de
+    su propiedad (si la tiene), que es el que lo valida.
+
+    Args:
+        fila: Columna -> valor; 'tipo' indica la clase
+    Returns:
+        Mueble creado
+    Raises:
+        FilaInvalida: Si el tipo, una columna o un valor no son válidos
+    """
+    if _ERROR in fila:
+        raise FilaInvalida(fila[_ERROR])
+    return fabrica(fila.get("tipo"))(fila)
+
+
+def resolver_tipo(tipo: str) -> type:
+    """
+    Obtiene la clase concreta de un nombre de tipo.
+
+    Args:
+        tipo: Nombre del tipo (sin distinguir mayúsculas, acentos ni guiones)
+    Returns:
+        type: Clase del mueble
+    Raises:
+        FilaInvalida: Si el tipo no existe
+    """
+    clave = _clave_tipo(tipo)
+    for nombre in registro.nombres():
+        if nombre.lower() == clave:
+            return registro.obtener(nombre)
+    raise FilaInvalida(f"Tipo de mueble desconocido: {tipo!r}")
+
+
+def importar(
+    archivo: TextIO,
+    tienda,
+    formato: str = "csv",
+    rechazos: Optional[TextIO] = None,
+    tamaño_lote: int = TAMAÑO_LOTE,
+) -> Dict:
+    """
+    Importa las filas de un archivo al inventario de la tienda.
+
+    Cada fila se valida al crear el mueble (setters de sus propiedades) y su
+    precio debe ser mayor a 0. Los muebles válidos se agregan en lotes de
+    tamaño_lote, y los rechazos se escriben en el archivo de rechazos en
+    lugar de acumularse: la memoria usada no crece con el archivo.
+
+    Args:
+        archivo: Archivo de texto abierto
+        tienda: TiendaMuebles destino
+        formato: 'csv' o 'jsonl'
+        rechazos: Archivo donde escribir cada fila rechazada como una línea
+            JSON con su número, el error y los datos originales (opcional)
+        tamaño_lote: Muebles por lote
+    Returns:
+        Dict: Cantidad importada, total de rechazos y los primeros
+            MAXIMO_RECHAZOS_INFORMADOS rechazos (fila y error)
+    """
+    # Crear muchos objetos dispara recolecciones del GC que no liberan
+    # nada; se suspende durante la importación.
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        return _importar(archivo, tienda, formato, rechazos, max(tamaño_lote, 1))
+    finally:
+        if gc_activo:
+            gc.enable()
+
+
+def _importar(archivo, tienda, formato, rechazos, tamaño_lote) -> Dict:
+    """Lee, valida y agrega las filas (ver importar)."""
+    importados = 0
+    total_rechazados = 0
+    informados: List[Dict] = []
+    muebles: List = []
+    precios: List[float] = []
+    for numero, fila in enumerate(leer_filas(archivo, formato), 1):
+        try:
+            mueble = crear_mueble(fila)
+            precio = _validar_precio(mueble)
+        except FilaInvalida as e:
+            total_rechazados += 1
+            if len(informados) < MAXIMO_RECHAZOS_INFORMADOS:
+                informados.append({"fila": numero, "error": str(e)})
+            if rechazos is not None:
+                datos = fila.get(_LINEA, fila) if _ERROR in fila else fila
+                rechazo = {"fila": numero, "error": str(e), "datos": datos}
+                rechazos.write(json.dumps(rechazo, ensure_ascii=False) + "\n")
+            continue
+        muebles.append(mueble)
+        precios.append(precio)
+        if len(muebles) >= tamaño_lote:
+            importados += len(tienda.agregar_lote(muebles, precios))
+            muebles, precios = [], []
+    if muebles:
+        importados += len(tienda.agregar_lote(muebles, precios))
+    return {
+        "importados": importados,
+        "total_rechazados": total_rechazados,
+        "rechazados": informados,
+    }
+
+
+def _validar_precio(mueble) -> float:
+    """Calcula el precio del mueble y verifica que sea finito y mayor a 0."""
+    try:
+        precio = mueble.calcular_precio()
+    except Exception as e:
+        raise FilaInvalida(f"Error al calcular precio del mueble: {e}") from e
+    if not precio_valido(precio):
+        raise FilaInvalida("El mueble debe tener un precio válido mayor a 0")
+    return precio
+
+
+def _leer_jsonl(archivo: TextIO) -> Iterator[Dict]:
+    """Genera un diccionario por línea no vacía."""
+    for numero, linea in enumerate(archivo, 1):
+        if not linea.strip():
+            continue
+        try:
+            fila = json.loads(linea)
+        except json.JSONDecodeError as e:
+            yield {
+                _ERROR: f"JSON inválido en la línea {numero}: {e.msg}",
+                _LINEA: linea.rstrip("\n"),
+            }
+            continue
+        if not isinstance(fila, dict):
+            yield {
+                _ERROR: f"La línea {numero} no es un objeto JSON",
+                _LINEA: linea.rstrip("\n"),
+            }
+            continue
+        yield fila
+
+
+def _clave_tipo(tipo) -> str:
+    """Clave de un tipo ("Sofá-Cama" y "sofa cama" -> "sofacama")."""
+    return "".join(c for c in normalizar_busqueda(tipo) if c.isalnum())
+
+
+@lru_cache(maxsize=256)
+def _fabrica(tipo: str) -> _Fabrica:
+    """Fábrica por nombre de tipo tal como aparece en el archivo."""
+    return _Fabrica(resolver_tipo(tipo))
+
+
+def _a_texto(valor) -> str:
+    """Texto sin espacios en los extremos; otros valores son inválidos."""
+    if not isinstance(valor, str):
+        raise ValueError(valor)
+    return valor.strip()
+
+
+def _a_bool(valor):
+    """Booleano a partir de 'sí', 'no', 'true', '0', 0, 1, etc."""
+    if isinstance(valor, bool):
+        return valor
+    if isinstance(valor, int) and valor in (0, 1):
+        return bool(valor)
+    if not isinstance(valor, str):
+        raise ValueError(valor)
+    texto = valor.strip().lower()
+    if texto in _VERDADEROS:
+        return True
+    if texto in _FALSOS:
+        return False
+    raise ValueError(valor)
+
+
+def _a_entero(valor):
+    """Entero a partir de un texto o un número sin parte decimal."""
+    if isinstance(valor, int) and not isinstance(valor, bool):
+        return valor
+    if not isinstance(valor, (str, float)):
+        raise ValueError(valor)
+    numero = float(valor)
+    if not numero.is_integer():
+        raise ValueError(valor)
+    return int(numero)
+
+
+def _a_real(valor) -> float:
+    """Número real finito a partir de un texto o de un número."""
+    if isinstance(valor, bool) or not isinstance(valor, (str, int, float)):
+        raise ValueError(valor)
+    numero = float(valor)
+    if not math.isfinite(numero):
+        raise ValueError(valor)
+    return numero
+
+
+# Tipo anotado en el constructor -> conversor de celdas (texto por defecto)
+_CONVERSORES: Dict[type, Callable] = {bool: _a_bool, int: _a_entero, float: _a_real}
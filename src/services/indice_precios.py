@@ -0,0 +1,311 @@
+"""
+Índice ordenado de precios para consultas por rango.
+Guarda las claves (precio, id) en bloques ordenados de tamaño acotado, así
+altas y bajas mueven solo un bloque y no toda la lista.
+"""
+
+import math
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Tamaño objetivo de cada bloque; un bloque se divide al superar el doble
+_CARGA = 512
+
+# Hasta esta cantidad (o una octava parte del índice) conviene insertar o
+# quitar de a uno que reconstruir los bloques
+_MAXIMO_QUITAR_INDIVIDUAL = 16
+
+
+class IndicePrecios:
+    """
+    Mantiene los ids de los muebles ordenados por precio (y por id entre
+    precios iguales).
+
+    Las claves se reparten en bloques ordenados con listas paralelas de
+    precios e ids, y se guarda la clave máxima de cada bloque. Ubicar una
+    clave cuesta dos búsquedas binarias (el bloque y la posición dentro de
+    él), e insertar o quitar desplaza a lo sumo un bloque: O(log n + B).
+    Las consultas por rango cuestan O(log n + k) más la suma de los largos
+    de los bloques intermedios al contar. Dentro de un bloque los precios
+    van en una lista aparte de los ids para que bisect compare floats
+    directamente; los empates de precio se resuelven con bisect sobre los
+    ids del tramo.
+    """
+
+    def __init__(self):
+        """Constructor del índice vacío."""
+        self._precios: List[List[float]] = []
+        self._ids: List[List[int]] = []
+        self._maximos: List[Tuple[float, int]] = []
+        self._precio_de: Dict[int, float] = {}
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de ids indexados."""
+        return len(self._precio_de)
+
+    def __contains__(self, id_mueble: int) -> bool:
+        """Verifica si el id está indexado."""
+        return id_mueble in self._precio_de
+
+    def precio_de(self, id_mueble: int) -> Optional[float]:
+        """Retorna el precio indexado del id (o None si no está)."""
+        return self._precio_de.get(id_mueble)
+
+    def items(self) -> Iterator[Tuple[int, float]]:
+        """Itera los pares (id, precio) indexados, sin orden de precio."""
+        return iter(self._precio_de.items())
+
+    def insertar(self, id_mueble: int, precio: float) -> None:
+        """
+        Indexa un id con su precio. Si ya estaba, actualiza su posición.
+
+        Args:
+            id_mueble: Id del mueble
+            precio: Precio a indexar
+        """
+        if id_mueble in self._precio_de:
+            self.quitar(id_mueble)
+        self._precio_de[id_mueble] = precio
+        if not self._maximos:
+            self._precios.append([precio])
+            self._ids.append([id_mueble])
+            self._maximos.append((precio, id_mueble))
+            return
+        bloque = self._bloque(precio, id_mueble)
+        precios = self._precios[bloque]
+        ids = self._ids[bloque]
+        posicion = _posicion(precios, ids, precio, id_mueble)
+        precios.insert(posicion, precio)
+        ids.insert(posicion, id_mueble)
+        if posicion == len(ids) - 1:
+            self._maximos[bloque] = (precio, id_mueble)
+        if len(ids) > 2 * _CARGA:
+            self._dividir(bloque)
+
+    def insertar_varios(self, pares: Iterable[Tuple[int, float]]) -> None:
+        """
+        Indexa muchos pares (id, precio) ordenando una sola vez.
+        El resultado es el mismo que llamar a insertar() con cada par.
+
+        Args:
+            pares: Pares (id, precio); los ids ya indexados se reemplazan
+        """
+        pares = list(pares)
+        if len(pares) <= self._maximo_individual():
+            for id_mueble, precio in pares:
+                self.insertar(id_mueble, precio)
+            return
+        self._precio_de.update(pares)
+        self._reconstruir()
+
+    def quitar(self, id_mueble: int) -> bool:
+        """
+        Quita un id del índice.
+
+        Returns:
+            bool: True si el id estaba indexado
+        """
+        precio = self._precio_de.pop(id_mueble, None)
+        if precio is None:
+            return False
+        bloque = self._bloque(precio, id_mueble)
+        precios = self._precios[bloque]
+        ids = self._ids[bloque]
+        posicion = _posicion(precios, ids, precio, id_mueble)
+        del precios[posicion]
+        del ids[posicion]
+        if not ids:
+            del self._precios[bloque]
+            del self._ids[bloque]
+            del self._maximos[bloque]
+        elif posicion == len(ids):
+            self._maximos[bloque] = (precios[-1], ids[-1])
+        return True
+
+    def quitar_varios(self, ids: Iterable[int]) -> int:
+        """
+        Quita muchos ids reconstruyendo los bloques una sola vez.
+        Evita las búsquedas y desplazamientos de quitar() uno por uno.
+
+        Args:
+            ids: Ids a quitar (los no indexados se ignoran)
+        Returns:
+            int: Cantidad de ids quitados
+        """
+        quitar = {i for i in ids if i in self._precio_de}
+        if len(quitar) <= self._maximo_individual():
+            for id_mueble in quitar:
+                self.quitar(id_mueble)
+            return len(quitar)
+        for id_mueble in quitar:
+            del self._precio_de[id_mueble]
+        self._reconstruir()
+        return len(quitar)
+
+    def contar(self, precio_min: float = 0, precio_max: float = float("inf")) -> int:
+        """Cuenta los ids en el rango inclusivo."""
+        (bloque, inicio), (bloque_fin, fin) = self._limites(precio_min, precio_max)
+        if bloque >= bloque_fin:
+            return max(fin - inicio, 0) if bloque == bloque_fin else 0
+        return sum(map(len, self._ids[bloque:bloque_fin])) - inicio + fin
+
+    def rango(
+        self,
+        precio_min: float = 0,
+        precio_max: float = float("inf"),
+        desde: int = 0,
+        limite: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Retorna los ids en el rango inclusivo, del más barato al más caro.
+
+        Args:
+            precio_min: Precio mínimo (inclusivo)
+            precio_max: Precio máximo (inclusivo)
+            desde: Cantidad de resultados a saltar (para paginar)
+            limite: Cantidad máxima de resultados (None = todos)
+        Returns:
+            List[int]: Ids ordenados por precio
+        """
+        resultado: List[int] = []
+        for tramo in self._tramos(precio_min, precio_max):
+            if desde >= len(tramo):
+                desde -= len(tramo)
+                continue
+            resultado.extend(tramo[desde:] if desde else tramo)
+            desde = 0
+            if limite is not None and len(resultado) >= limite:
+                del resultado[limite:]
+                break
+        return resultado
+
+    def iterar(
+        self, precio_min: float = 0, precio_max: float = float("inf")
+    ) -> Iterator[int]:
+        """
+        Genera los ids del rango del más barato al más caro, de a un bloque.
+        El índice no debe modificarse mientras se consume el generador.
+        """
+        for tramo in self._tramos(precio_min, precio_max):
+            yield from tramo
+
+    def bloques(self) -> Iterator[Tuple[List[int], List[float]]]:
+        """
+        Genera los bloques (ids, precios) del más barato al más caro, para
+        guardar el índice y rearmarlo con extender().
+        El índice no debe modificarse mientras se consume el generador.
+        """
+        return zip(self._ids, self._precios)
+
+    def extender(self, ids: List[int], precios: List[float]) -> None:
+        """
+        Agrega al final claves ya ordenadas por (precio, id), todas mayores
+        que las indexadas, sin volver a ordenar. No se verifica el orden
+        dentro del tramo (lo garantiza quien lo guardó con bloques()).
+
+        Args:
+            ids: Ids del tramo, en orden
+            precios: Precio de cada id
+        Raises:
+            ValueError: Si los largos difieren, algún id ya está indexado o
+                el tramo no va después de las claves indexadas
+        """
+        if len(ids) != len(precios):
+            raise ValueError("ids y precios deben tener el mismo largo")
+        if not ids:
+            return
+        if self._maximos and (precios[0], ids[0]) <= self._maximos[-1]:
+            raise ValueError("El tramo no va después de las claves indexadas")
+        if not self._precio_de.keys().isdisjoint(ids):
+            raise ValueError("El tramo tiene ids ya indexados")
+        self._precio_de.update(zip(ids, precios))
+        for inicio in range(0, len(ids), _CARGA):
+            self._precios.append(precios[inicio : inicio + _CARGA])
+            self._ids.append(ids[inicio : inicio + _CARGA])
+            self._maximos.append((self._precios[-1][-1], self._ids[-1][-1]))
+
+    def _maximo_individual(self) -> int:
+        """Cantidad hasta la que se inserta o quita de a uno."""
+        return max(_MAXIMO_QUITAR_INDIVIDUAL, len(self._precio_de) // 8)
+
+    def _bloque(self, precio: float, id_mueble: int) -> int:
+        """Índice del bloque donde está (o va) la clave (precio, id)."""
+        bloque = bisect_left(self._maximos, (precio, id_mueble))
+        return min(bloque, len(self._maximos) - 1)
+
+    def _limites(
+        self, precio_min: float, precio_max: float
+    ) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """
+        Calcula (bloque, posición) del primer id del rango inclusivo y del
+        primero que queda fuera.
+        """
+        maximos = self._maximos
+        bloque = bisect_left(maximos, (precio_min, -math.inf))
+        inicio = (
+            bisect_left(self._precios[bloque], precio_min)
+            if bloque < len(maximos)
+            else 0
+        )
+        bloque_fin = bisect_right(maximos, (precio_max, math.inf))
+        fin = (
+            bisect_right(self._precios[bloque_fin], precio_max)
+            if bloque_fin < len(maximos)
+            else 0
+        )
+        return (bloque, inicio), (bloque_fin, fin)
+
+    def _tramos(self, precio_min: float, precio_max: float) -> Iterator[List[int]]:
+        """Genera los tramos de ids de cada bloque dentro del rango."""
+        (bloque, inicio), (bloque_fin, fin) = self._limites(precio_min, precio_max)
+        ids = self._ids
+        if bloque == bloque_fin:
+            if inicio < fin:
+                yield ids[bloque][inicio:fin]
+            return
+        if bloque >= bloque_fin:
+            return
+        yield ids[bloque][inicio:] if inicio else ids[bloque]
+        for numero in range(bloque + 1, bloque_fin):
+            yield ids[numero]
+        if fin:
+            yield ids[bloque_fin][:fin]
+
+    def _dividir(self, bloque: int) -> None:
+        """Parte un bloque demasiado grande en dos mitades."""
+        precios = self._precios[bloque]
+        ids = self._ids[bloque]
+        mitad = len(ids) // 2
+        self._precios[bloque : bloque + 1] = [precios[:mitad], precios[mitad:]]
+        self._ids[bloque : bloque + 1] = [ids[:mitad], ids[mitad:]]
+        self._maximos[bloque : bloque + 1] = [
+            (precios[mitad - 1], ids[mitad - 1]),
+            (precios[-1], ids[-1]),
+        ]
+
+    def _reconstruir(self) -> None:
+        """Rearma todos los bloques desde _precio_de, ordenando una vez."""
+        precio_de = self._precio_de
+        # Ordenar por id y luego (de forma estable) por precio equivale a
+        # ordenar por (precio, id) comparando solo floats
+        ids = sorted(precio_de)
+        ids.sort(key=precio_de.__getitem__)
+        precios = [precio_de[i] for i in ids]
+        self._precios = [
+            precios[inicio : inicio + _CARGA] for inicio in range(0, len(ids), _CARGA)
+        ]
+        self._ids = [
+            ids[inicio : inicio + _CARGA] for inicio in range(0, len(ids), _CARGA)
+        ]
+        self._maximos = [
+            (precios[-1], ids[-1]) for precios, ids in zip(self._precios, self._ids)
+        ]
+
+
+def _posicion(
+    precios: List[float], ids: List[int], precio: float, id_mueble: int
+) -> int:
+    """Posición de la clave (precio, id) dentro de un bloque."""
+    inicio = bisect_left(precios, precio)
+    fin = bisect_right(precios, precio, inicio)
+    return bisect_left(ids, id_mueble, inicio, fin)
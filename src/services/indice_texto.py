@@ -0,0 +1,114 @@
+"""
+Índice invertido de trigramas para búsquedas por subcadena.
+Permite encontrar los textos que contienen una consulta sin recorrer
+todos los textos indexados.
+"""
+
+from typing import Dict, List, Set
+
+# Con esta cantidad de candidatos ya conviene verificar la subcadena
+_CANDIDATOS_SUFICIENTES = 64
+
+
+def trigramas(texto: str) -> Set[str]:
+    """
+    Retorna el conjunto de subcadenas de tres caracteres del texto.
+
+    Args:
+        texto: Texto ya normalizado
+    Returns:
+        Set[str]: Trigramas (vacío si el texto tiene menos de 3 caracteres)
+    """
+    return {texto[i : i + 3] for i in range(len(texto) - 2)}
+
+
+class IndiceTrigramas:
+    """
+    Índice de subcadenas sin distinguir mayúsculas.
+
+    Para cada trigrama se guarda el conjunto de ids cuyo texto lo contiene.
+    Una consulta de tres o más caracteres intersecta los conjuntos de sus
+    trigramas (del más chico al más grande) y verifica la subcadena solo en
+    los candidatos, de modo que el costo depende de cuántos textos comparten
+    los trigramas de la consulta y no del total indexado.
+    Las consultas de uno o dos caracteres no tienen trigramas y recorren los
+    textos indexados.
+    """
+
+    def __init__(self):
+        """Constructor del índice vacío."""
+        self._textos: Dict[int, str] = {}
+        self._postings: Dict[str, Set[int]] = {}
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de ids indexados."""
+        return len(self._textos)
+
+    def agregar(self, id_texto: int, texto) -> None:
+        """
+        Indexa (o reindexa) el texto de un id.
+
+        Args:
+            id_texto: Identificador del texto
+            texto: Texto a indexar (los valores no textuales se indexan vacíos)
+        """
+        if id_texto in self._textos:
+            self.quitar(id_texto)
+        normalizado = texto.lower() if isinstance(texto, str) else ""
+        self._textos[id_texto] = normalizado
+        for trigrama in trigramas(normalizado):
+            self._postings.setdefault(trigrama, set()).add(id_texto)
+
+    def quitar(self, id_texto: int) -> bool:
+        """
+        Quita un id del índice.
+
+        Returns:
+            bool: True si el id estaba indexado
+        """
+        normalizado = self._textos.pop(id_texto, None)
+        if normalizado is None:
+            return False
+        for trigrama in trigramas(normalizado):
+            ids = self._postings[trigrama]
+            ids.discard(id_texto)
+            if not ids:
+                del self._postings[trigrama]
+        return True
+
+    def buscar(self, consulta: str) -> List[int]:
+        """
+        Busca los ids cuyo texto contiene la consulta (sin distinguir mayúsculas).
+
+        Args:
+            consulta: Texto a buscar (se ignoran los espacios extremos)
+        Returns:
+            List[int]: Ids que coinciden, en orden ascendente
+        """
+        consulta = consulta.lower().strip()
+        if not consulta:
+            return []
+        textos = self._textos
+        grupos = trigramas(consulta)
+        if not grupos:
+            return sorted(i for i, texto in textos.items() if consulta in texto)
+        postings = []
+        for trigrama in grupos:
+            ids = self._postings.get(trigrama)
+            if not ids:
+                return []
+            postings.append(ids)
+        # Intersección en C de los conjuntos más chicos primero; la
+        # verificación final descarta los trigramas en otro orden.
+        postings.sort(key=len)
+        candidatos = postings[0]
+        for ids in postings[1:]:
+            if len(candidatos) <= _CANDIDATOS_SUFICIENTES:
+                break
+            candidatos = candidatos & ids
+        if len(consulta) == 3:
+            # Una consulta de tres letras es su único trigrama: no hace falta
+            # verificar (con más letras, un único trigrama repetido como
+            # "aaaa" también aparece en textos que no la contienen)
+            return sorted(candidatos)
+        return sorted(i for i in candidatos if consulta in textos[i])
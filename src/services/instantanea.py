@@ -0,0 +1,649 @@
+"""
+Instantánea binaria de la tienda en disco.
+Guarda inventario, comedores, descuentos y totales de ventas en un archivo
+versionado que se escribe y se lee por bloques, sin reconstruir los
+muebles a través de sus constructores.
+
+Desde la versión 5 el inventario se guarda por columnas (ids, números de
+objeto, códigos de material y color, ids por tipo, material y color, el
+índice de precios ya ordenado y los agregados). Cada bloque se vuelca en
+los índices del inventario a medida que se lee, y los muebles se crean
+recién cuando se piden (ver Inventario.restaurar_bloque); las
+definiciones de los objetos de un bloque se decodifican la primera vez
+que se crea uno de ellos.
+"""
+
+import gc
+import importlib
+import marshal
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from models.composicion.comedor import Comedor
+from models.especificacion import (
+    EspecificacionMueble,
+    Unidad,
+    clase_unidad,
+    restaurar_unidad,
+)
+from models.mueble import Mueble
+from models.vocabulario import COLORES, MATERIALES
+from services.descuentos import MotorDescuentos, ReglaDescuento, resolver_categoria
+
+MAGIA = b"MUEBLES\x00"
+VERSION = 5
+# Versiones que se pueden leer (la 1 no guardaba los ids del inventario, la
+# 2 no guardaba las unidades, la 3 no admitía unidades con especificación
+# compartida y la 4 guardaba el inventario por filas de objetos)
+VERSIONES_LEGIBLES = (1, 2, 3, 4, 5)
+
+# Cabecera de cada bloque: etiqueta (1 byte) y largo del contenido
+_BLOQUE = struct.Struct("<cI")
+_VERSION = struct.Struct("<H")
+
+_INVENTARIO = b"I"
+_PRECIOS = b"P"
+_ESTADISTICAS = b"E"
+_COMEDORES = b"C"
+_TIENDA = b"T"
+_FIN = b"F"
+
+# Filas de inventario (y de precios) por bloque
+TAMAÑO_BLOQUE = 10000
+
+
+class InstantaneaInvalida(ValueError):
+    """Error al leer un archivo que no es una instantánea válida."""
+
+
+class _Escritor:
+    """
+    Serializa referencias a objetos por número: la primera vez que aparece
+    un objeto se agrega su definición (clase + estado) al bloque en curso, y
+    su número es la posición de esa definición en todo el archivo. Así un
+    mueble que está en el inventario y en un comedor sigue siendo el mismo
+    objeto al cargar. Una Unidad se define con su estado propio y el número
+    del prototipo de su especificación, que se define una vez.
+    """
+
+    def __init__(self, archivo):
+        """Constructor sobre un archivo binario abierto para escritura."""
+        self._archivo = archivo
+        self._objetos: Dict[int, int] = {}
+        # Número en la instantánea de origen -> número en este archivo
+        self._previos: Dict[int, int] = {}
+        self._cantidad = 0
+        self._clases: Dict[type, int] = {}
+        self._clases_nuevas: List[tuple] = []
+        self._definiciones: List[tuple] = []
+
+    def referencia(self, objeto) -> int:
+        """Retorna el número del objeto, definiéndolo si es nuevo."""
+        numero = self._objetos.get(id(objeto))
+        if numero is not None:
+            return numero
+        if isinstance(objeto, Unidad):
+            especificacion = objeto.especificacion
+            # El prototipo se numera antes que la unidad
+            prototipo = self.referencia(especificacion._prototipo)
+            estado = tuple(
+                getattr(objeto, campo) for campo in especificacion.clase._campos_unidad
+            )
+            definicion = (self._indice_clase(especificacion.clase), estado, prototipo)
+        else:
+            definicion = (self._indice_clase(type(objeto)), _estado(objeto))
+        numero = self._objetos[id(objeto)] = self._definir(definicion)
+        return numero
+
+    def referencia_previa(
+        self, lector: "_Lector", numero: int, definicion: Optional[tuple] = None
+    ) -> int:
+        """
+        Retorna el número de un objeto de la instantánea de origen que
+        todavía no se creó, copiando su definición (sin crearlo). Se puede
+        pasar la definición si ya se leyó.
+        """
+        nuevo = self._previos.get(numero)
+        if nuevo is not None:
+            return nuevo
+        objeto = lector.creado(numero)
+        if objeto is not None:
+            return self.referencia(objeto)
+        if definicion is None:
+            definicion = lector.definicion(numero)
+        clase = self._indice_clase(lector.clase(definicion[0]))
+        if len(definicion) == 3:
+            prototipo = self.referencia_previa(lector, definicion[2])
+            definicion = (clase, definicion[1], prototipo)
+        else:
+            definicion = (clase, definicion[1])
+        nuevo = self._previos[numero] = self._definir(definicion)
+        return nuevo
+
+    def fila(self, inventario, id_mueble: int) -> tuple:
+        """
+        Retorna (número, índice de clase, es unidad) del mueble de un id,
+        sin crearlo si está pendiente de la instantánea de origen. Para
+        las unidades la clase es la del modelo.
+        """
+        pendiente = inventario.pendiente(id_mueble)
+        if pendiente is not None:
+            lector, numero = pendiente
+            if lector.creado(numero) is None:
+                definicion = lector.definicion(numero)
+                return (
+                    self.referencia_previa(lector, numero, definicion),
+                    self._indice_clase(lector.clase(definicion[0])),
+                    len(definicion) == 3,
+                )
+        mueble = inventario.obtener(id_mueble)
+        numero = self.referencia(mueble)
+        if isinstance(mueble, Unidad):
+            return numero, self._indice_clase(mueble.especificacion.clase), True
+        return numero, self._indice_clase(type(mueble)), False
+
+    def _definir(self, definicion: tuple) -> int:
+        """Agrega una definición al bloque en curso y retorna su número."""
+        self._definiciones.append(definicion)
+        self._cantidad += 1
+        return self._cantidad - 1
+
+    def _indice_clase(self, clase: type) -> int:
+        """Retorna el número de la clase, declarándola si es nueva."""
+        indice_clase = self._clases.get(clase)
+        if indice_clase is None:
+            indice_clase = self._clases[clase] = len(self._clases)
+            self._clases_nuevas.append((clase.__module__, clase.__qualname__))
+        return indice_clase
+
+    def bloque(self, etiqueta: bytes, datos) -> None:
+        """
+        Escribe un bloque con las clases y definiciones nuevas y sus datos.
+        Las definiciones van serializadas aparte, con su cantidad, para
+        decodificarlas solo si se crea alguno de sus objetos.
+        """
+        definiciones = (
+            len(self._definiciones),
+            marshal.dumps(self._definiciones, 4) if self._definiciones else b"",
+        )
+        contenido = marshal.dumps((self._clases_nuevas, definiciones, datos), 4)
+        self._clases_nuevas = []
+        self._definiciones = []
+        self._archivo.write(_BLOQUE.pack(etiqueta, len(contenido)))
+        self._archivo.write(contenido)
+
+
+class _Lector:
+    """
+    Contraparte de _Escritor: crea los objetos de sus definiciones cuando se
+    los pide (crear) y resuelve las referencias de las versiones anteriores
+    a la 5, que definían los objetos dentro de cada fila (objeto).
+    """
+
+    def __init__(self):
+        """Constructor sin objetos, definiciones ni clases conocidas."""
+        self._objetos: Dict[int, object] = {}
+        # Definiciones de cada bloque (serializadas hasta que se usa una) y
+        # el número de la primera de cada uno
+        self._definiciones: List = []
+        self._primeras: List[int] = []
+        self._cantidad = 0
+        self._clases: List[type] = []
+
+    def agregar_clases(self, clases: List[tuple]) -> None:
+        """Importa las clases declaradas por un bloque."""
+        for modulo, nombre in clases:
+            if modulo != "models" and not modulo.startswith("models."):
+                raise InstantaneaInvalida(f"Clase no permitida: {modulo}.{nombre}")
+            self._clases.append(getattr(importlib.import_module(modulo), nombre))
+
+    def agregar_definiciones(self, definiciones: Tuple[int, bytes]) -> None:
+        """
+        Agrega las definiciones de objetos de un bloque, (cantidad, datos
+        serializados), sin decodificarlas ni crear los objetos.
+        """
+        cantidad, datos = definiciones
+        if cantidad:
+            self._definiciones.append(datos)
+            self._primeras.append(self._cantidad)
+            self._cantidad += cantidad
+
+    def clase(self, indice: int) -> type:
+        """Retorna una clase declarada."""
+        return self._clases[indice]
+
+    def definicion(self, numero: int) -> tuple:
+        """Retorna la definición de un objeto que todavía no se creó."""
+        definiciones, posicion = self._ubicar(numero)
+        return definiciones[posicion]
+
+    def creado(self, numero: int):
+        """Retorna el objeto del número si ya se creó (o None)."""
+        return self._objetos.get(numero)
+
+    def crear(self, numero: int):
+        """Retorna el objeto de un número, creándolo la primera vez."""
+        objeto = self._objetos.get(numero)
+        if objeto is not None:
+            return objeto
+        definiciones, posicion = self._ubicar(numero)
+        definicion = definiciones[posicion]
+        if len(definicion) == 3:
+            prototipo = self.crear(definicion[2])
+            objeto = restaurar_unidad(
+                EspecificacionMueble.desde_mueble(prototipo), definicion[1]
+            )
+        else:
+            clase = self._clases[definicion[0]]
+            objeto = clase.__new__(clase)
+            _restaurar(objeto, definicion[1])
+        self._objetos[numero] = objeto
+        # Desde ahora el objeto reemplaza a su definición (también al guardar)
+        definiciones[posicion] = None
+        return objeto
+
+    def _ubicar(self, numero: int) -> Tuple[list, int]:
+        """
+        Lista de definiciones del bloque de un número (decodificándola la
+        primera vez) y la posición del número en ella.
+        """
+        bloque = bisect_right(self._primeras, numero) - 1
+        definiciones = self._definiciones[bloque]
+        if isinstance(definiciones, bytes):
+            definiciones = self._definiciones[bloque] = marshal.loads(definiciones)
+        return definiciones, numero - self._primeras[bloque]
+
+    def objeto(self, referencia):
+        """Retorna el objeto de una referencia por filas, creándolo si es nuevo."""
+        if isinstance(referencia, int):
+            return self._objetos[referencia]
+        if len(referencia) == 3:
+            prototipo = self.objeto(referencia[2])
+            objeto = restaurar_unidad(
+                EspecificacionMueble.desde_mueble(prototipo), referencia[1]
+            )
+        else:
+            indice_clase, estado = referencia
+            clase = self._clases[indice_clase]
+            objeto = clase.__new__(clase)
+            _restaurar(objeto, estado)
+        self._objetos[len(self._objetos)] = objeto
+        return objeto
+
+
+def guardar(tienda, ruta: str, tamaño_bloque: int = TAMAÑO_BLOQUE) -> int:
+    """
+    Guarda la tienda en una instantánea.
+    Los muebles que siguen pendientes de una instantánea cargada se copian
+    sin crearlos.
+
+    Args:
+        tienda: TiendaMuebles a guardar
+        ruta: Archivo de destino (se sobrescribe)
+        tamaño_bloque: Filas de inventario (y de precios) por bloque
+
+    Returns:
+        int: Cantidad de muebles (ids) de inventario guardados
+    """
+    inventario = tienda._inventario
+    with open(ruta, "wb") as archivo:
+        archivo.write(MAGIA + _VERSION.pack(VERSION))
+        escritor = _Escritor(archivo)
+        ids = inventario.ids()
+        # Primer id de cada objeto que está en varios ids -> todos sus ids
+        compartidos = {
+            ids_objeto[0]: ids_objeto for ids_objeto in inventario.ids_compartidos()
+        }
+        for inicio in range(0, len(ids), tamaño_bloque):
+            escritor.bloque(
+                _INVENTARIO,
+                _columnas_inventario(
+                    escritor,
+                    inventario,
+                    ids[inicio : inicio + tamaño_bloque],
+                    compartidos,
+                ),
+            )
+        tramo_ids: List[int] = []
+        tramo_precios: List[float] = []
+        for ids_bloque, precios_bloque in inventario.bloques_por_precio():
+            tramo_ids.extend(ids_bloque)
+            tramo_precios.extend(precios_bloque)
+            if len(tramo_ids) >= tamaño_bloque:
+                escritor.bloque(_PRECIOS, _columnas_precios(tramo_ids, tramo_precios))
+                tramo_ids, tramo_precios = [], []
+        if tramo_ids:
+            escritor.bloque(_PRECIOS, _columnas_precios(tramo_ids, tramo_precios))
+        escritor.bloque(_ESTADISTICAS, inventario.estadisticas.estado())
+        comedores = []
+        en_inventario: Dict[int, int] = {}
+        for comedor in tienda._comedores:
+            numeros = []
+            for mueble in (comedor.mesa, *comedor.sillas):
+                numero = escritor.referencia(mueble)
+                id_mueble = inventario.id_de(mueble)
+                if id_mueble is not None:
+                    en_inventario[numero] = id_mueble
+                numeros.append(numero)
+            comedores.append((comedor.nombre, numeros[0], numeros[1:]))
+        escritor.bloque(
+            _COMEDORES, {"comedores": comedores, "en_inventario": en_inventario}
+        )
+        escritor.bloque(
+            _TIENDA,
+            {
+                "nombre": tienda.nombre,
+                "reglas": [
+                    (
+                        regla.fraccion,
+                        (regla.tipo.__module__, regla.tipo.__qualname__)
+                        if regla.tipo is not None
+                        else None,
+                        regla.material,
+                        regla.precio_min,
+                        regla.precio_max,
+                        regla.desde,
+                        regla.hasta,
+                    )
+                    for _, regla in tienda._descuentos.reglas()
+                ],
+                "ventas_realizadas": tienda._contar_ventas(),
+                "total_muebles_vendidos": tienda._total_muebles_vendidos,
+                "valor_total_ventas": tienda._valor_total_ventas,
+            },
+        )
+        escritor.bloque(_FIN, None)
+    return len(ids)
+
+
+def _columnas_inventario(
+    escritor: _Escritor, inventario, ids: List[int], compartidos: Dict[int, List[int]]
+) -> dict:
+    """
+    Arma las columnas de un bloque de inventario. Las claves de material y
+    color se guardan como códigos de una tabla de textos del bloque, porque
+    las claves solo valen dentro del proceso que las asignó; el tipo de
+    cada fila, como código de la lista de tipos del bloque.
+    """
+    objetos = []
+    tipos: Dict[tuple, int] = {}
+    codigos_tipo = []
+    por_tipo: Dict[int, List[int]] = {}
+    tablas = ({}, {})
+    codigos = ([], [])
+    por_clave = ({}, {})
+    unidades = {}
+    copias = {}
+    for id_mueble in ids:
+        numero, indice_clase, es_unidad = escritor.fila(inventario, id_mueble)
+        objetos.append(numero)
+        tipo = tipos.setdefault((indice_clase, es_unidad), len(tipos))
+        codigos_tipo.append(tipo)
+        por_tipo.setdefault(tipo, []).append(id_mueble)
+        for tabla, columna, buckets, clave in zip(
+            tablas, codigos, por_clave, inventario.claves(id_mueble)
+        ):
+            codigo = tabla.setdefault(clave, len(tabla))
+            columna.append(codigo)
+            if clave is not None:
+                buckets.setdefault(codigo, []).append(id_mueble)
+        cantidad = inventario.unidades(id_mueble)
+        if cantidad != 1:
+            unidades[id_mueble] = cantidad
+        ids_copias = compartidos.get(id_mueble)
+        if ids_copias is not None:
+            copias[numero] = ids_copias
+    return {
+        "ids": _a_bytes("q", ids),
+        "objetos": _a_bytes("q", objetos),
+        "materiales": [MATERIALES.normalizado(c) or None for c in tablas[0]],
+        "codigos_material": _a_bytes("q", codigos[0]),
+        "colores": [COLORES.normalizado(c) or None for c in tablas[1]],
+        "codigos_color": _a_bytes("q", codigos[1]),
+        "tipos": list(tipos),
+        "codigos_tipo": _a_bytes("q", codigos_tipo),
+        "por_tipo": [(c, _a_bytes("q", i)) for c, i in por_tipo.items()],
+        "por_material": [(c, _a_bytes("q", i)) for c, i in por_clave[0].items()],
+        "por_color": [(c, _a_bytes("q", i)) for c, i in por_clave[1].items()],
+        "unidades": unidades,
+        "copias": copias,
+    }
+
+
+def _columnas_precios(ids: List[int], precios: List[float]) -> dict:
+    """Arma las columnas de un tramo del índice de precios."""
+    return {"ids": _a_bytes("q", ids), "precios": _a_bytes("d", precios)}
+
+
+def cargar(ruta: str, tienda):
+    """
+    Carga una instantánea confiable.
+
+    Los muebles se crean sin llamar a sus constructores ni setters, y sus
+    precios e ids se toman del archivo. En la versión 5 los índices se
+    restauran por columnas y cada mueble se crea recién cuando se lo pide.
+    Solo deben cargarse archivos generados por guardar(): el contenido no
+    se vuelve a validar.
+
+    Args:
+        ruta: Archivo a leer
+        tienda: TiendaMuebles vacía a completar
+
+    Returns:
+        TiendaMuebles: Tienda con el contenido de la instantánea
+    Raises:
+        InstantaneaInvalida: Si el archivo no tiene el formato esperado
+    """
+    # Los índices crean millones de entradas, que disparan muchas
+    # recolecciones del GC que no liberan nada; se suspende durante la carga.
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        return _cargar(ruta, tienda)
+    finally:
+        if gc_activo:
+            gc.enable()
+
+
+def _cargar(ruta: str, tienda):
+    """Lee los bloques de la instantánea y los vuelca en la tienda."""
+    lector = _Lector()
+    inventario = tienda._inventario
+    with open(ruta, "rb") as archivo:
+        if archivo.read(len(MAGIA)) != MAGIA:
+            raise InstantaneaInvalida("El archivo no es una instantánea de la tienda")
+        (version,) = _VERSION.unpack(archivo.read(_VERSION.size))
+        if version not in VERSIONES_LEGIBLES:
+            raise InstantaneaInvalida(f"Versión de instantánea no soportada: {version}")
+        por_columnas = version >= 5
+        while True:
+            cabecera = archivo.read(_BLOQUE.size)
+            if len(cabecera) < _BLOQUE.size:
+                raise InstantaneaInvalida("Instantánea incompleta")
+            etiqueta, largo = _BLOQUE.unpack(cabecera)
+            contenido = marshal.loads(archivo.read(largo))
+            lector.agregar_clases(contenido[0])
+            if por_columnas:
+                lector.agregar_definiciones(contenido[1])
+            datos = contenido[-1]
+            if etiqueta == _FIN:
+                break
+            if etiqueta == _INVENTARIO:
+                if por_columnas:
+                    _restaurar_inventario(datos, lector, inventario)
+                else:
+                    _agregar_filas(datos, lector, inventario)
+            elif etiqueta == _PRECIOS:
+                inventario.restaurar_precios(
+                    _columna("q", datos["ids"]).tolist(),
+                    _columna("d", datos["precios"]).tolist(),
+                )
+            elif etiqueta == _ESTADISTICAS:
+                inventario.restaurar_estadisticas(datos)
+            elif etiqueta == _COMEDORES:
+                if por_columnas:
+                    _restaurar_comedores(datos, lector, tienda)
+                else:
+                    for nombre, mesa, sillas in datos:
+                        tienda._comedores.append(
+                            Comedor(
+                                nombre,
+                                lector.objeto(mesa),
+                                [lector.objeto(silla) for silla in sillas],
+                            )
+                        )
+            elif etiqueta == _TIENDA:
+                tienda._nombre = datos["nombre"]
+                _cargar_descuentos(datos, tienda._descuentos)
+                # Sin el libro de ventas (o con uno vacío) el conteo sale de
+                # la instantánea, igual que los demás acumulados
+                if not len(tienda._ventas_realizadas):
+                    tienda._ventas_previas = datos.get("ventas_realizadas", 0)
+                tienda._total_muebles_vendidos = datos["total_muebles_vendidos"]
+                tienda._valor_total_ventas = datos["valor_total_ventas"]
+    return tienda
+
+
+def _restaurar_inventario(datos: dict, lector: _Lector, inventario) -> None:
+    """
+    Vuelca un bloque de columnas de inventario (versión 5). Las columnas
+    quedan en sus arreglos, sin convertirlas a listas.
+    """
+    materiales = [MATERIALES.clave_de(texto) for texto in datos["materiales"]]
+    colores = [COLORES.clave_de(texto) for texto in datos["colores"]]
+    tipos = [
+        clase_unidad(lector.clase(indice)) if es_unidad else lector.clase(indice)
+        for indice, es_unidad in datos["tipos"]
+    ]
+    inventario.restaurar_bloque(
+        lector,
+        _columna("q", datos["ids"]),
+        _columna("q", datos["objetos"]),
+        _Codificada(_columna("q", datos["codigos_tipo"]), tipos),
+        _Codificada(_columna("q", datos["codigos_material"]), materiales),
+        _Codificada(_columna("q", datos["codigos_color"]), colores),
+        {tipos[c]: _columna("q", ids) for c, ids in datos["por_tipo"]},
+        {materiales[c]: _columna("q", ids) for c, ids in datos["por_material"]},
+        {colores[c]: _columna("q", ids) for c, ids in datos["por_color"]},
+        datos["unidades"],
+        datos["copias"],
+    )
+
+
+class _Codificada:
+    """Columna de valores guardada como códigos de una tabla, sin expandir."""
+
+    __slots__ = ("_codigos", "_tabla")
+
+    def __init__(self, codigos: Sequence[int], tabla: list):
+        """Constructor sobre los códigos de cada fila y la tabla de valores."""
+        self._codigos = codigos
+        self._tabla = tabla
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de filas."""
+        return len(self._codigos)
+
+    def __getitem__(self, posicion: int):
+        """Retorna el valor de una fila."""
+        return self._tabla[self._codigos[posicion]]
+
+
+def _agregar_filas(filas: list, lector: _Lector, inventario) -> None:
+    """Agrega un bloque de filas de objetos (versiones 1 a 4)."""
+    objeto = lector.objeto
+    inventario.agregar_lote(
+        [objeto(fila[0]) for fila in filas],
+        [fila[1] for fila in filas],
+        [fila[2] if len(fila) > 2 else None for fila in filas],
+        [fila[3] if len(fila) > 3 else 1 for fila in filas],
+    )
+
+
+def _restaurar_comedores(datos: dict, lector: _Lector, tienda) -> None:
+    """
+    Restaura los comedores (versión 5). Sus muebles del inventario se piden
+    al inventario, así quedan creados y registrados en él.
+    """
+    inventario = tienda._inventario
+    en_inventario = datos["en_inventario"]
+
+    def mueble(numero: int):
+        id_mueble = en_inventario.get(numero)
+        if id_mueble is None:
+            return lector.crear(numero)
+        return inventario.obtener(id_mueble)
+
+    for nombre, mesa, sillas in datos["comedores"]:
+        tienda._comedores.append(
+            Comedor(nombre, mueble(mesa), [mueble(silla) for silla in sillas])
+        )
+
+
+def _cargar_descuentos(filas: dict, motor: MotorDescuentos) -> None:
+    """Restaura las reglas de descuento (o los descuentos por nombre de clase
+    de las instantáneas anteriores a las reglas)."""
+    if "reglas" not in filas:
+        for nombre, fraccion in filas["descuentos"].items():
+            # Los nombres se guardaban tal como los escribía el usuario
+            # (ej: 'Sofacama'); los que no corresponden a ninguna clase
+            # nunca aplicaban y se descartan.
+            clase = resolver_categoria(nombre)
+            if clase is not None:
+                motor.fijar_por_tipo(clase, fraccion)
+        return
+    for fraccion, tipo, material, minimo, maximo, desde, hasta in filas["reglas"]:
+        clase = None
+        if tipo is not None:
+            modulo, nombre = tipo
+            if modulo != "models" and not modulo.startswith("models."):
+                raise InstantaneaInvalida(f"Clase no permitida: {modulo}.{nombre}")
+            clase = getattr(importlib.import_module(modulo), nombre)
+        motor.agregar(
+            ReglaDescuento(fraccion, clase, material, minimo, maximo, desde, hasta)
+        )
+
+
+def _estado(objeto):
+    """Estado serializable de un mueble (o de una clase simple con slots)."""
+    if isinstance(objeto, Mueble):
+        return objeto.__getstate__()
+    return tuple(getattr(objeto, campo) for campo in _campos(type(objeto)))
+
+
+def _restaurar(objeto, estado) -> None:
+    """Asigna el estado a un objeto creado con __new__."""
+    if isinstance(objeto, Mueble):
+        objeto.__setstate__(estado)
+        return
+    for campo, valor in zip(_campos(type(objeto)), estado):
+        setattr(objeto, campo, valor)
+
+
+def _campos(clase: type) -> tuple:
+    """Slots de una clase que no hereda de Mueble, de la base a la hija."""
+    return tuple(
+        campo
+        for base in reversed(clase.__mro__)
+        for campo in base.__dict__.get("__slots__", ())
+    )
+
+
+def _a_bytes(tipo: str, valores) -> bytes:
+    """Columna de números como bytes little-endian (ver array)."""
+    columna = array(tipo, valores)
+    if sys.byteorder == "big":
+        columna.byteswap()
+    return columna.tobytes()
+
+
+def _columna(tipo: str, datos: bytes) -> array:
+    """Arreglo de números de una columna guardada con _a_bytes."""
+    columna = array(tipo)
+    columna.frombytes(datos)
+    if sys.byteorder == "big":
+        columna.byteswap()
+    return columna
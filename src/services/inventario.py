@@ -0,0 +1,1152 @@
+"""
+Almacén indexado para el inventario de la tienda.
+Reemplaza la lista plana de muebles por una colección con identificadores
+estables e índices hash, de forma que las búsquedas y las ventas no
+necesiten recorrer todo el inventario.
+"""
+
+import gc
+import math
+import time
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from itertools import repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from models.vocabulario import COLORES, MATERIALES, Vocabulario, normalizar_texto
+from services.buscador import MotorBusqueda
+from services.descuentos import MotorDescuentos, ReglaDescuento
+from services.estadisticas import EstadisticasInventario
+from services.indice_precios import IndicePrecios
+from services.indice_texto import IndiceTrigramas
+
+__all__ = ["Inventario", "normalizar_texto"]
+
+
+class Inventario:
+    """
+    Colección de muebles con índice principal por id e índices secundarios.
+
+    Cada mueble recibe un id entero estable al ingresar. Además del índice
+    principal (id -> mueble) se mantienen índices por material, color y tipo
+    concreto, un índice de trigramas sobre el nombre, un motor de búsqueda
+    por relevancia y un índice ordenado por precio. Los índices secundarios se
+    guardan como diccionarios id -> None, que conservan el orden de inserción
+    y permiten altas y bajas en O(1). Material y color se indexan por la
+    clave entera de su vocabulario, así una consulta normaliza un solo texto
+    (el buscado) y el resto son comparaciones de enteros. Los muebles
+    agregados en lote se indexan por texto (trigramas y motor de búsqueda)
+    recién en la primera búsqueda de texto, como ocurre al cargar un
+    catálogo grande.
+
+    Cada id es un producto (SKU) con una cantidad de unidades: un mismo
+    objeto representa todas las unidades idénticas, que comparten los
+    índices y el precio. Los agregados cuentan unidades, las ventas
+    descuentan unidades y el id se quita al quedar sin ninguna.
+
+    Con un motor de descuentos (usar_descuentos) se mantiene además una
+    columna de precios con descuento, con su propio índice ordenado y su
+    valor total. Mientras el motor no tiene reglas esa columna no existe y
+    las consultas con descuento usan los precios de lista. Cuando cambian
+    las reglas solo se reprecian los ids de las clases afectadas.
+
+    Los muebles de la jerarquía Mueble avisan sus cambios mediante
+    observadores; para las clases que no heredan de Mueble se debe llamar
+    a actualizar() después de modificar sus atributos.
+
+    Al restaurar una instantánea (restaurar_bloque) los índices se arman
+    por columnas y cada mueble se crea recién cuando se lo pide: hasta
+    entonces su id figura en _muebles con None, y su número de objeto, su
+    clase y sus claves se leen de las columnas del bloque. Los ids del
+    bloque se agregan a los índices por tipo, material y color recién
+    cuando se usa alguno de ellos. Recorrer todo el inventario o buscar por
+    texto crea los muebles que falten.
+    """
+
+    def __init__(self):
+        """Constructor del inventario vacío."""
+        self._muebles: Dict[int, "object"] = {}
+        self._ids_por_objeto: Dict[int, List[int]] = {}
+        self._siguiente_id = 1
+        # Unidades de los ids con más de una (el resto tiene una sola)
+        self._unidades: Dict[int, int] = {}
+        self._claves: Dict[int, tuple] = {}
+        self._por_material: Dict[int, Dict[int, None]] = {}
+        self._por_color: Dict[int, Dict[int, None]] = {}
+        self._por_tipo: Dict[type, Dict[int, None]] = {}
+        self._precios = IndicePrecios()
+        self._nombres = IndiceTrigramas()
+        self._buscador = MotorBusqueda()
+        # Ids todavía sin indexar en _nombres y _buscador
+        self._textos_pendientes: Dict[int, None] = {}
+        self._estadisticas = EstadisticasInventario()
+        self._descuentos: Optional[MotorDescuentos] = None
+        # Precios con descuento (None mientras no hay reglas de descuento)
+        self._efectivos: Optional[IndicePrecios] = None
+        # Bloques restaurados (ids, objetos, clases, materiales, colores)
+        # con ids cuyo mueble todavía no se creó, y el primer id de cada uno
+        self._origen = None
+        self._restaurados: List[tuple] = []
+        self._primeros_restaurados: List[int] = []
+        self._ultimo_restaurado: Optional[tuple] = None
+        self._cantidad_pendientes = 0
+        # Número de objeto -> ids que lo comparten (solo si son varios)
+        self._copias_pendientes: Dict[int, List[int]] = {}
+        # Ids por tipo, material y color de los bloques restaurados, todavía
+        # sin agregar a _por_tipo, _por_material y _por_color
+        self._buckets_restaurados: List[tuple] = []
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de muebles en inventario."""
+        return len(self._muebles)
+
+    def __iter__(self) -> Iterator:
+        """Itera los muebles en orden de ingreso."""
+        return iter(self.listar())
+
+    def __contains__(self, mueble) -> bool:
+        """Verifica en O(1) si el objeto está en inventario."""
+        return id(mueble) in self._ids_por_objeto
+
+    def listar(self) -> List:
+        """Retorna una lista con los muebles en orden de ingreso."""
+        self._crear_pendientes()
+        return list(self._muebles.values())
+
+    def items(self) -> Iterator:
+        """Itera los pares (id, mueble) en orden de ingreso."""
+        self._crear_pendientes()
+        return iter(list(self._muebles.items()))
+
+    def precio_indexado(self, id_mueble: int) -> Optional[float]:
+        """Retorna el precio indexado de un id (None si no tiene precio)."""
+        return self._precios.precio_de(id_mueble)
+
+    def obtener(self, id_mueble: int):
+        """
+        Obtiene un mueble por su id.
+
+        Args:
+            id_mueble: Identificador asignado al ingresar
+
+        Returns:
+            El mueble o None si no existe
+        """
+        mueble = self._muebles.get(id_mueble)
+        if mueble is None and id_mueble in self._muebles:
+            return self._crear(id_mueble)
+        return mueble
+
+    def id_de(self, mueble) -> Optional[int]:
+        """
+        Obtiene el id del mueble (el primero si se agregó varias veces).
+
+        Returns:
+            Optional[int]: Id del mueble o None si no está en inventario
+        """
+        ids = self._ids_por_objeto.get(id(mueble))
+        return ids[0] if ids else None
+
+    def agregar(self, mueble, precio: Optional[float] = None, unidades: int = 1) -> int:
+        """
+        Agrega un mueble al inventario y lo indexa.
+        Como en agregar_lote, los textos se indexan en la primera búsqueda
+        por nombre o relevancia.
+
+        Args:
+            mueble: Mueble a agregar
+            precio: Precio ya calculado (opcional, evita recalcularlo)
+            unidades: Unidades idénticas que representa el mueble
+
+        Returns:
+            int: Id asignado al mueble
+        Raises:
+            ValueError: Si las unidades no son un entero mayor a 0
+        """
+        id_mueble = self._registrar(mueble, unidades=_validar_unidades(unidades))
+        self._indexar_precio(id_mueble, mueble, precio)
+        return id_mueble
+
+    def agregar_lote(
+        self,
+        muebles: Iterable,
+        precios: Optional[Iterable[float]] = None,
+        ids_fijos: Optional[Iterable[int]] = None,
+        unidades: Optional[Iterable[int]] = None,
+    ) -> List[int]:
+        """
+        Agrega muchos muebles ordenando el índice de precios una sola vez.
+        Los textos se indexan en la primera búsqueda por nombre o relevancia,
+        y el GC se suspende mientras se crean las entradas de los índices.
+
+        Args:
+            muebles: Muebles a agregar
+            precios: Precios ya calculados, en el mismo orden (opcional)
+            ids_fijos: Ids a usar en lugar de asignar nuevos, en el mismo
+                orden (al restaurar una instantánea). No deben estar en uso.
+            unidades: Unidades de cada mueble, en el mismo orden (opcional,
+                una por mueble)
+
+        Returns:
+            List[int]: Ids asignados, en el orden de los muebles
+        Raises:
+            ValueError: Si alguna cantidad de unidades no es mayor a 0
+        """
+        # Las entradas nuevas disparan recolecciones del GC que no liberan
+        # nada (ver importador.importar)
+        gc_activo = gc.isenabled()
+        gc.disable()
+        try:
+            return self._agregar_lote(muebles, precios, ids_fijos, unidades)
+        finally:
+            if gc_activo:
+                gc.enable()
+
+    def _agregar_lote(self, muebles, precios, ids_fijos, unidades) -> List[int]:
+        """Registra e indexa el lote (ver agregar_lote)."""
+        muebles = list(muebles)
+        if precios is None:
+            precios = [_precio_o_none(mueble) for mueble in muebles]
+        if ids_fijos is None:
+            ids_fijos = [None] * len(muebles)
+        if unidades is None:
+            unidades = [1] * len(muebles)
+        else:
+            unidades = [_validar_unidades(cantidad) for cantidad in unidades]
+        ids = []
+        pares = []
+        precios_por_tipo: Dict[str, tuple] = {}
+        for mueble, precio, id_fijo, cantidad in zip(
+            muebles, precios, ids_fijos, unidades
+        ):
+            id_mueble = self._registrar(
+                mueble,
+                contar=False,
+                id_mueble=id_fijo,
+                unidades=cantidad,
+            )
+            ids.append(id_mueble)
+            if precio is not None and math.isfinite(precio):
+                pares.append((id_mueble, precio))
+                lista, cantidades = precios_por_tipo.setdefault(
+                    type(mueble).__name__, ([], [])
+                )
+                lista.append(precio)
+                cantidades.append(cantidad)
+        self._precios.insertar_varios(pares)
+        if self._efectivos is not None:
+            self._indexar_efectivos(pares)
+
+        # Los agregados se ajustan una vez por tipo y material, no por mueble
+        estadisticas = self._estadisticas
+        por_tipo: Counter = Counter()
+        por_material: Counter = Counter()
+        for id_mueble, mueble, cantidad in zip(ids, muebles, unidades):
+            por_tipo[type(mueble).__name__] += cantidad
+            por_material[self._claves[id_mueble][0]] += cantidad
+        for tipo, cantidad in por_tipo.items():
+            estadisticas.sumar_tipo(tipo, cantidad)
+        for clave, cantidad in por_material.items():
+            if clave is not None:
+                estadisticas.sumar_material(MATERIALES.normalizado(clave), cantidad)
+        for tipo, (lista, cantidades) in precios_por_tipo.items():
+            estadisticas.sumar_precios(tipo, lista, cantidades)
+        return ids
+
+    # Restauración por columnas (ver services.instantanea). Los métodos de
+    # lectura no crean los muebles pendientes.
+
+    def restaurar_bloque(
+        self,
+        origen,
+        ids: Sequence[int],
+        objetos: Sequence[int],
+        clases: Sequence[type],
+        materiales: Sequence[Optional[int]],
+        colores: Sequence[Optional[int]],
+        tipos: Dict[type, Sequence[int]],
+        por_material: Dict[int, Sequence[int]],
+        por_color: Dict[int, Sequence[int]],
+        unidades: Dict[int, int],
+        copias: Dict[int, List[int]],
+    ) -> None:
+        """
+        Agrega un bloque de ids ya indexados sin crear sus muebles.
+        Solo se agregan los ids (una operación por bloque, no por id); las
+        columnas y los ids por tipo, material y color se guardan tal cual y
+        se vuelcan en sus índices la primera vez que se usa uno. El mueble
+        de cada id se crea con origen.crear(numero) la primera vez que se
+        lo pide. Los precios y los agregados se restauran aparte
+        (restaurar_precios y restaurar_estadisticas).
+
+        Args:
+            origen: Objeto con un método crear(numero) que retorna el mueble
+                de un número de objeto (siempre el mismo objeto por número);
+                debe ser el mismo en todos los bloques
+            ids: Ids del bloque en orden ascendente, mayores que los ids
+                existentes
+            objetos: Número de objeto de cada id, en el mismo orden
+            clases: Clase de cada id
+            materiales: Clave de material de cada id
+            colores: Clave de color de cada id
+            tipos: Clase -> ids del bloque de esa clase
+            por_material: Clave de material -> ids del bloque
+            por_color: Clave de color -> ids del bloque
+            unidades: Unidades de los ids que tienen más de una
+            copias: Número de objeto -> todos sus ids, solo para los objetos
+                que están en más de un id
+        Raises:
+            ValueError: Si algún id no es mayor que los existentes o el
+                origen es otro
+        """
+        if not ids:
+            return
+        if self._origen is not None and origen is not self._origen:
+            raise ValueError("Los bloques restaurados deben tener el mismo origen")
+        if ids[0] < self._siguiente_id:
+            raise ValueError("Los ids del bloque deben ser mayores que los existentes")
+        self._origen = origen
+        self._restaurados.append((ids, objetos, clases, materiales, colores))
+        self._primeros_restaurados.append(ids[0])
+        self._cantidad_pendientes += len(ids)
+        self._muebles.update(zip(ids, repeat(None)))
+        self._buckets_restaurados.append((tipos, por_material, por_color))
+        self._unidades.update(unidades)
+        self._copias_pendientes.update(copias)
+        self._siguiente_id = ids[-1] + 1
+
+    def restaurar_precios(self, ids: List[int], precios: List[float]) -> None:
+        """
+        Agrega al índice de precios un tramo ya ordenado por (precio, id),
+        posterior a los indexados (ver bloques_por_precio). No ajusta los
+        agregados; los precios con descuento se calculan si hay reglas.
+        """
+        self._precios.extender(ids, precios)
+        if self._efectivos is not None:
+            self._indexar_efectivos(list(zip(ids, precios)))
+
+    def restaurar_estadisticas(self, estado: tuple) -> None:
+        """Reemplaza los agregados a precio de lista (ver EstadisticasInventario.estado)."""
+        self._estadisticas.restaurar(estado)
+
+    def pendiente(self, id_mueble: int) -> Optional[Tuple[object, int]]:
+        """Retorna (origen, número de objeto) si el mueble del id no se creó."""
+        if id_mueble not in self._muebles or self._muebles[id_mueble] is not None:
+            return None
+        bloque, posicion = self._restaurado(id_mueble)
+        return self._origen, bloque[1][posicion]
+
+    def claves(self, id_mueble: int) -> Tuple[Optional[int], Optional[int]]:
+        """Retorna las claves de vocabulario (material, color) indexadas del id."""
+        claves = self._claves.get(id_mueble)
+        if claves is None:
+            bloque, posicion = self._restaurado(id_mueble)
+            claves = (bloque[3][posicion], bloque[4][posicion])
+        return claves
+
+    def ids_compartidos(self) -> List[List[int]]:
+        """
+        Retorna los ids de cada objeto que está en más de un id (creado o
+        pendiente), en orden ascendente.
+        """
+        compartidos = [sorted(ids) for ids in self._copias_pendientes.values()]
+        compartidos.extend(
+            sorted(ids) for ids in self._ids_por_objeto.values() if len(ids) > 1
+        )
+        return compartidos
+
+    def bloques_por_precio(self) -> Iterator[Tuple[List[int], List[float]]]:
+        """
+        Genera tramos (ids, precios) del índice de precios, del más barato
+        al más caro. El inventario no debe modificarse mientras se consumen.
+        """
+        return self._precios.bloques()
+
+    def quitar(self, mueble) -> Optional[int]:
+        """
+        Quita un mueble del inventario en O(1).
+
+        Args:
+            mueble: Mueble a quitar
+
+        Returns:
+            Optional[int]: Id del mueble quitado o None si no estaba
+        """
+        ids = self._ids_por_objeto.get(id(mueble))
+        if not ids:
+            return None
+        return self._quitar_id(ids[0])
+
+    def quitar_lote(self, muebles: Iterable) -> List[int]:
+        """
+        Retira una unidad por cada aparición de un objeto, actualizando el
+        índice de precios una sola vez para los ids que quedan sin unidades.
+        Los objetos que no están (o ya no les quedan unidades) se ignoran.
+
+        Primero se cuentan las unidades a retirar de cada id y después se
+        aplican: los agregados se ajustan una vez por tipo y material (como
+        en agregar_lote), no por unidad.
+
+        Args:
+            muebles: Muebles a retirar
+
+        Returns:
+            List[int]: Id del que se retiró cada unidad, en el orden de los
+                muebles
+        """
+        unidades = self._unidades
+        ids_por_objeto = self._ids_por_objeto
+        retirados = []
+        # Id -> unidades a retirar, en orden de primera aparición
+        pedidos: Dict[int, int] = {}
+        for mueble in muebles:
+            for id_mueble in ids_por_objeto.get(id(mueble), ()):
+                pedido = pedidos.get(id_mueble, 0)
+                if pedido < unidades.get(id_mueble, 1):
+                    pedidos[id_mueble] = pedido + 1
+                    retirados.append(id_mueble)
+                    break
+
+        por_tipo: Dict[str, int] = {}
+        por_material: Dict[Optional[int], int] = {}
+        precios_por_tipo: Dict[str, tuple] = {}
+        efectivos: Tuple[List[float], List[int]] = ([], [])
+        efectivo_de = self._efectivos.precio_de if self._efectivos is not None else None
+        precio_de = self._precios.precio_de
+        quitados = []
+        for id_mueble, cantidad in pedidos.items():
+            tipo = self._tipo_de(id_mueble).__name__
+            por_tipo[tipo] = por_tipo.get(tipo, 0) - cantidad
+            material = self._claves[id_mueble][0]
+            por_material[material] = por_material.get(material, 0) - cantidad
+            precio = precio_de(id_mueble)
+            if precio is not None:
+                lista, cantidades = precios_por_tipo.setdefault(tipo, ([], []))
+                lista.append(precio)
+                cantidades.append(-cantidad)
+            if efectivo_de is not None:
+                efectivo = efectivo_de(id_mueble)
+                if efectivo is not None:
+                    efectivos[0].append(efectivo)
+                    efectivos[1].append(-cantidad)
+            restantes = unidades.get(id_mueble, 1) - cantidad
+            if restantes == 0:
+                quitados.append(self._quitar_id(id_mueble, contar=False))
+            elif restantes == 1:
+                del unidades[id_mueble]
+            else:
+                unidades[id_mueble] = restantes
+
+        estadisticas = self._estadisticas
+        for tipo, cantidad in por_tipo.items():
+            estadisticas.sumar_tipo(tipo, cantidad)
+        for clave, cantidad in por_material.items():
+            if clave is not None:
+                estadisticas.sumar_material(MATERIALES.normalizado(clave), cantidad)
+        for tipo, (lista, cantidades) in precios_por_tipo.items():
+            estadisticas.sumar_precios(tipo, lista, cantidades)
+        self._precios.quitar_varios(quitados)
+        if self._efectivos is not None:
+            estadisticas.sumar_precios_efectivos(*efectivos)
+            self._efectivos.quitar_varios(quitados)
+        return retirados
+
+    def copias(self, mueble) -> int:
+        """Retorna cuántas veces (ids distintos) está el objeto en inventario."""
+        return len(self._ids_por_objeto.get(id(mueble), ()))
+
+    def unidades(self, id_mueble: int) -> int:
+        """Retorna las unidades de un id (0 si no existe)."""
+        if id_mueble not in self._muebles:
+            return 0
+        return self._unidades.get(id_mueble, 1)
+
+    def existencias(self, mueble) -> int:
+        """Retorna las unidades disponibles del objeto sumando todos sus ids."""
+        unidades = self._unidades
+        ids = self._ids_por_objeto.get(id(mueble), ())
+        if len(ids) == 1:
+            return unidades.get(ids[0], 1)
+        return sum(unidades.get(id_mueble, 1) for id_mueble in ids)
+
+    def reponer(self, id_mueble: int, cantidad: int) -> int:
+        """
+        Suma unidades a un id existente.
+
+        Args:
+            id_mueble: Id del producto
+            cantidad: Unidades a sumar (mayor a 0)
+
+        Returns:
+            int: Unidades del id después de reponer
+        Raises:
+            KeyError: Si el id no existe
+            ValueError: Si la cantidad no es un entero mayor a 0
+        """
+        if id_mueble not in self._muebles:
+            raise KeyError(id_mueble)
+        unidades = self._unidades.get(id_mueble, 1) + _validar_unidades(cantidad)
+        self._fijar_unidades(id_mueble, unidades)
+        return unidades
+
+    def retirar(self, mueble, cantidad: int = 1) -> List[int]:
+        """
+        Retira unidades del objeto, empezando por su primer id. Los ids que
+        quedan sin unidades se quitan del inventario.
+
+        Args:
+            mueble: Mueble del que se retiran unidades
+            cantidad: Unidades a retirar (mayor a 0)
+
+        Returns:
+            List[int]: Ids de los que se retiraron unidades
+        Raises:
+            ValueError: Si la cantidad no es válida o supera las existencias
+                (en ese caso no se retira nada)
+        """
+        cantidad = _validar_unidades(cantidad)
+        if cantidad > self.existencias(mueble):
+            raise ValueError(
+                f"Existencias insuficientes: se pidieron {cantidad} unidades"
+            )
+        retirados = []
+        for id_mueble in list(self._ids_por_objeto[id(mueble)]):
+            unidades = self._unidades.get(id_mueble, 1)
+            retirados.append(id_mueble)
+            if unidades > cantidad:
+                self._fijar_unidades(id_mueble, unidades - cantidad)
+                break
+            self._quitar_id(id_mueble)
+            cantidad -= unidades
+            if not cantidad:
+                break
+        return retirados
+
+    def quitar_por_id(self, id_mueble: int):
+        """
+        Quita un mueble usando su id.
+
+        Returns:
+            El mueble quitado o None si el id no existe
+        """
+        mueble = self.obtener(id_mueble)
+        if mueble is None:
+            return None
+        self._quitar_id(id_mueble)
+        return mueble
+
+    def actualizar(self, mueble) -> None:
+        """
+        Reindexa un mueble después de modificar sus atributos.
+
+        Args:
+            mueble: Mueble modificado
+        """
+        for id_mueble in self._ids_por_objeto.get(id(mueble), []):
+            self._desindexar(id_mueble)
+            self._indexar(id_mueble, mueble)
+        self._indexar_textos(mueble)
+        self._actualizar_precio(mueble)
+
+    def usar_descuentos(self, motor: MotorDescuentos) -> None:
+        """
+        Mantiene los precios con descuento de un motor, repreciando solo las
+        clases afectadas cada vez que cambian sus reglas.
+
+        Args:
+            motor: Motor de descuentos de la tienda
+        """
+        self._descuentos = motor
+        motor.agregar_observador(self._al_cambiar_descuentos)
+        self._al_cambiar_descuentos([])
+
+    def precio_efectivo(self, id_mueble: int) -> Optional[float]:
+        """Retorna el precio con descuento de un id (None si no tiene precio)."""
+        return self._indice_efectivo().precio_de(id_mueble)
+
+    @property
+    def estadisticas(self) -> EstadisticasInventario:
+        """
+        Agregados del inventario mantenidos de forma incremental (con el
+        valor a los descuentos vigentes ahora).
+        """
+        if self._descuentos is not None:
+            self._descuentos.sincronizar()
+        return self._estadisticas
+
+    def recalcular_estadisticas(self) -> EstadisticasInventario:
+        """
+        Recalcula los agregados recorriendo todo el inventario.
+        Se usa para verificar los acumuladores incrementales.
+
+        Returns:
+            EstadisticasInventario: Agregados calculados desde cero
+        """
+        estadisticas = EstadisticasInventario()
+        if self._efectivos is not None:
+            estadisticas.iniciar_valor_efectivo()
+        for id_mueble, mueble in self.items():
+            tipo = type(mueble).__name__
+            unidades = self._unidades.get(id_mueble, 1)
+            material = _clave(mueble, "material", MATERIALES)
+            estadisticas.sumar_tipo(tipo, unidades)
+            estadisticas.sumar_material(MATERIALES.normalizado(material), unidades)
+            try:
+                precio = mueble.calcular_precio()
+            except Exception:
+                continue
+            estadisticas.sumar_precio(tipo, precio, unidades)
+            if self._efectivos is not None:
+                estadisticas.sumar_precios_efectivos(
+                    [self._con_descuento(type(mueble), material, precio)], [unidades]
+                )
+        return estadisticas
+
+    def por_material(self, material: str) -> List:
+        """Retorna los muebles del material indicado (sin distinguir mayúsculas)."""
+        return self._resolver(self.ids_por_material(material))
+
+    def por_color(self, color: str) -> List:
+        """Retorna los muebles del color indicado (sin distinguir mayúsculas)."""
+        return self._resolver(self.ids_por_color(color))
+
+    def por_nombre(self, texto: str) -> List:
+        """
+        Retorna los muebles cuyo nombre contiene el texto, en orden de ingreso.
+        No distingue mayúsculas; usa el índice de trigramas.
+        """
+        return self._muebles_de(self.ids_por_nombre(texto))
+
+    def buscar(self, consulta: str, limite: int = 10) -> List[tuple]:
+        """
+        Búsqueda por relevancia en nombre, material, color y tipo.
+
+        Args:
+            consulta: Texto libre (se ignoran acentos y mayúsculas)
+            limite: Cantidad máxima de resultados
+
+        Returns:
+            List[tuple]: Pares (mueble, puntaje) de mayor a menor relevancia
+        """
+        return [
+            (self._mueble(i), puntaje)
+            for i, puntaje in self._indices_texto()[1].buscar(consulta, limite)
+        ]
+
+    def por_tipo(self, tipo_clase: type) -> List:
+        """
+        Retorna los muebles que son instancia del tipo indicado.
+        Incluye las subclases (ej: SofaCama al pedir Sofa).
+        """
+        ids = []
+        for bucket in self.ids_por_tipo(tipo_clase):
+            ids.extend(bucket)
+        return self._muebles_de(sorted(ids))
+
+    def por_precio(
+        self, precio_min: float = 0, precio_max: float = float("inf")
+    ) -> List:
+        """
+        Retorna los muebles con precio en el rango inclusivo, en orden de ingreso.
+        Los muebles cuyo precio no se pudo calcular no se incluyen.
+        """
+        return self._muebles_de(sorted(self._precios.rango(precio_min, precio_max)))
+
+    def por_precio_efectivo(
+        self, precio_min: float = 0, precio_max: float = float("inf")
+    ) -> List:
+        """
+        Retorna los muebles con precio con descuento en el rango inclusivo,
+        en orden de ingreso.
+        """
+        return self._muebles_de(
+            sorted(self._indice_efectivo().rango(precio_min, precio_max))
+        )
+
+    def iterar_por_precio(
+        self, precio_min: float = 0, precio_max: float = float("inf")
+    ) -> Iterator:
+        """Genera los muebles del rango del más barato al más caro."""
+        for id_mueble in self._precios.iterar(precio_min, precio_max):
+            yield self._mueble(id_mueble)
+
+    def pagina_por_precio(
+        self,
+        precio_min: float = 0,
+        precio_max: float = float("inf"),
+        desde: int = 0,
+        limite: int = 20,
+    ) -> List:
+        """Retorna un tramo de los muebles del rango ordenados por precio."""
+        ids = self._precios.rango(precio_min, precio_max, desde, limite)
+        return self._muebles_de(ids)
+
+    def contar_por_precio(
+        self, precio_min: float = 0, precio_max: float = float("inf")
+    ) -> int:
+        """Cuenta los muebles del rango sin materializarlos."""
+        return self._precios.contar(precio_min, precio_max)
+
+    def contar_por_precio_efectivo(
+        self, precio_min: float = 0, precio_max: float = float("inf")
+    ) -> int:
+        """Cuenta los muebles del rango de precios con descuento."""
+        return self._indice_efectivo().contar(precio_min, precio_max)
+
+    # Acceso a los índices por id (para el planificador de consultas).
+    # Los buckets retornados son los del índice: no deben modificarse.
+
+    def ids(self) -> List[int]:
+        """Retorna todos los ids en orden de ingreso."""
+        return list(self._muebles)
+
+    def ids_por_material(self, material: str) -> Dict[int, None]:
+        """Retorna el bucket de ids del material (vacío si no hay ninguno)."""
+        if self._buckets_restaurados:
+            self._completar_indices()
+        return self._por_material.get(MATERIALES.buscar_clave(material), {})
+
+    def ids_por_color(self, color: str) -> Dict[int, None]:
+        """Retorna el bucket de ids del color (vacío si no hay ninguno)."""
+        if self._buckets_restaurados:
+            self._completar_indices()
+        return self._por_color.get(COLORES.buscar_clave(color), {})
+
+    def ids_por_tipo(self, tipo_clase: type) -> List[Dict[int, None]]:
+        """Retorna los buckets de ids del tipo y de sus subclases."""
+        if self._buckets_restaurados:
+            self._completar_indices()
+        return [
+            bucket
+            for clase, bucket in self._por_tipo.items()
+            if issubclass(clase, tipo_clase)
+        ]
+
+    def ids_por_nombre(self, texto: str) -> List[int]:
+        """Retorna los ids cuyo nombre contiene el texto, en orden ascendente."""
+        return self._indices_texto()[0].buscar(texto)
+
+    def ids_por_precio(
+        self, precio_min: float = 0, precio_max: float = float("inf")
+    ) -> List[int]:
+        """Retorna los ids del rango de precios, del más barato al más caro."""
+        return self._precios.rango(precio_min, precio_max)
+
+    def ids_por_precio_efectivo(
+        self, precio_min: float = 0, precio_max: float = float("inf")
+    ) -> List[int]:
+        """Retorna los ids del rango de precios con descuento, del más barato
+        al más caro."""
+        return self._indice_efectivo().rango(precio_min, precio_max)
+
+    def _resolver(self, bucket: Dict[int, None]) -> List:
+        """Convierte un bucket de ids en la lista de muebles en orden de ingreso."""
+        return self._muebles_de(sorted(bucket))
+
+    def _mueble(self, id_mueble: int):
+        """Mueble de un id existente, creándolo si está pendiente."""
+        mueble = self._muebles[id_mueble]
+        return mueble if mueble is not None else self._crear(id_mueble)
+
+    def _muebles_de(self, ids: Iterable[int]) -> List:
+        """Muebles de ids existentes, en el mismo orden."""
+        if self._cantidad_pendientes:
+            return [self._mueble(i) for i in ids]
+        muebles = self._muebles
+        return [muebles[i] for i in ids]
+
+    def _tipo_de(self, id_mueble: int) -> type:
+        """Clase del mueble de un id, sin crearlo si está pendiente."""
+        mueble = self._muebles[id_mueble]
+        if mueble is not None:
+            return type(mueble)
+        bloque, posicion = self._restaurado(id_mueble)
+        return bloque[2][posicion]
+
+    def _completar_indices(self) -> None:
+        """
+        Agrega los ids de los bloques restaurados a los índices por tipo,
+        material y color.
+        """
+        restaurados, self._buckets_restaurados = self._buckets_restaurados, []
+        for buckets in restaurados:
+            for indice, ids_por_clave in zip(
+                (self._por_tipo, self._por_material, self._por_color), buckets
+            ):
+                for clave, ids in ids_por_clave.items():
+                    bucket = indice.get(clave)
+                    if bucket is None:
+                        indice[clave] = dict.fromkeys(ids)
+                    else:
+                        bucket.update(zip(ids, repeat(None)))
+
+    def _restaurado(self, id_mueble: int) -> Tuple[tuple, int]:
+        """Bloque restaurado que contiene un id, y la posición del id en él."""
+        bloque = self._ultimo_restaurado
+        # Los recorridos piden ids consecutivos: casi siempre es el mismo bloque
+        if bloque is None or not bloque[0][0] <= id_mueble <= bloque[0][-1]:
+            numero = bisect_right(self._primeros_restaurados, id_mueble) - 1
+            bloque = self._ultimo_restaurado = self._restaurados[numero]
+        return bloque, bisect_left(bloque[0], id_mueble)
+
+    def _crear(self, id_mueble: int, bloque: Optional[tuple] = None, posicion: int = 0):
+        """
+        Crea el mueble pendiente de un id, lo asigna a todos los ids que lo
+        comparten y le registra el observador. Se puede pasar el bloque
+        restaurado del id y su posición si ya se conocen.
+        """
+        if bloque is None:
+            bloque, posicion = self._restaurado(id_mueble)
+        numero = bloque[1][posicion]
+        mueble = self._origen.crear(numero)
+        ids = self._copias_pendientes.pop(numero, None)
+        if ids is None:
+            ids = [id_mueble]
+            self._claves[id_mueble] = (bloque[3][posicion], bloque[4][posicion])
+        else:
+            for id_copia in ids:
+                self._claves[id_copia] = self.claves(id_copia)
+        for id_copia in ids:
+            self._muebles[id_copia] = mueble
+            self._textos_pendientes[id_copia] = None
+        self._cantidad_pendientes -= len(ids)
+        if not self._cantidad_pendientes:
+            self._origen = None
+            self._restaurados = []
+            self._primeros_restaurados = []
+            self._ultimo_restaurado = None
+        registrados = self._ids_por_objeto.get(id(mueble))
+        if registrados:
+            # Agregado otra vez después de cargar: los ids restaurados van antes
+            registrados[:0] = ids
+            return mueble
+        self._ids_por_objeto[id(mueble)] = ids
+        agregar_observador = getattr(mueble, "agregar_observador", None)
+        if callable(agregar_observador):
+            agregar_observador(self._al_cambiar)
+        return mueble
+
+    def _crear_pendientes(self) -> None:
+        """Crea todos los muebles pendientes (antes de recorrer el inventario)."""
+        if not self._cantidad_pendientes:
+            return
+        # Como en agregar_lote, crear muchos objetos dispara recolecciones
+        # del GC que no liberan nada
+        gc_activo = gc.isenabled()
+        gc.disable()
+        try:
+            muebles = self._muebles
+            for bloque in list(self._restaurados):
+                for posicion, id_mueble in enumerate(bloque[0]):
+                    if muebles.get(id_mueble, False) is None:
+                        self._crear(id_mueble, bloque, posicion)
+        finally:
+            if gc_activo:
+                gc.enable()
+
+    def _registrar(
+        self,
+        mueble,
+        contar: bool = True,
+        id_mueble: Optional[int] = None,
+        unidades: int = 1,
+    ) -> int:
+        """
+        Asigna un id al mueble (o usa el indicado) y lo agrega a los índices
+        (salvo precios y textos: el id queda pendiente de indexar por texto
+        hasta la primera búsqueda). Con contar=False no se tocan los
+        agregados (agregar_lote los ajusta).
+        """
+        if id_mueble is None:
+            id_mueble = self._siguiente_id
+        elif id_mueble in self._muebles:
+            raise ValueError(f"El id {id_mueble} ya está en uso")
+        self._siguiente_id = max(self._siguiente_id, id_mueble + 1)
+        self._muebles[id_mueble] = mueble
+        if unidades != 1:
+            self._unidades[id_mueble] = unidades
+        ids = self._ids_por_objeto.setdefault(id(mueble), [])
+        if not ids:
+            agregar_observador = getattr(mueble, "agregar_observador", None)
+            if callable(agregar_observador):
+                agregar_observador(self._al_cambiar)
+        ids.append(id_mueble)
+        self._indexar(id_mueble, mueble, contar)
+        self._textos_pendientes[id_mueble] = None
+        return id_mueble
+
+    def _quitar_id(self, id_mueble: int, contar: bool = True) -> int:
+        """
+        Elimina un id de todos los índices.
+        Con contar=False no se tocan los agregados y el id queda en los
+        índices de precios (quitar_lote ajusta ambos después).
+        """
+        mueble = self._mueble(id_mueble)
+        del self._muebles[id_mueble]
+        ids = self._ids_por_objeto[id(mueble)]
+        ids.remove(id_mueble)
+        if not ids:
+            del self._ids_por_objeto[id(mueble)]
+            quitar_observador = getattr(mueble, "quitar_observador", None)
+            if callable(quitar_observador):
+                quitar_observador(self._al_cambiar)
+        self._desindexar(id_mueble, contar)
+        if id_mueble in self._textos_pendientes:
+            del self._textos_pendientes[id_mueble]
+        else:
+            self._nombres.quitar(id_mueble)
+            self._buscador.quitar(id_mueble)
+        if contar:
+            self._fijar_precio(id_mueble, mueble, None)
+            self._estadisticas.sumar_tipo(
+                type(mueble).__name__, -self._unidades.get(id_mueble, 1)
+            )
+        self._unidades.pop(id_mueble, None)
+        bucket = self._por_tipo[type(mueble)]
+        del bucket[id_mueble]
+        if not bucket:
+            del self._por_tipo[type(mueble)]
+        return id_mueble
+
+    def _indexar(self, id_mueble: int, mueble, contar: bool = True) -> None:
+        """Agrega el id a los índices secundarios (y a los agregados)."""
+        if self._buckets_restaurados:
+            self._completar_indices()
+        material = _clave(mueble, "material", MATERIALES)
+        color = _clave(mueble, "color", COLORES)
+        unidades = self._unidades.get(id_mueble, 1)
+        self._claves[id_mueble] = (material, color)
+        if material is not None:
+            self._por_material.setdefault(material, {})[id_mueble] = None
+            if contar:
+                self._estadisticas.sumar_material(
+                    MATERIALES.normalizado(material), unidades
+                )
+        if color is not None:
+            self._por_color.setdefault(color, {})[id_mueble] = None
+        if id_mueble not in self._por_tipo.setdefault(type(mueble), {}):
+            self._por_tipo[type(mueble)][id_mueble] = None
+            if contar:
+                self._estadisticas.sumar_tipo(type(mueble).__name__, unidades)
+
+    def _indexar_textos(self, mueble) -> None:
+        """Reindexa el nombre y los textos buscables de todas las copias."""
+        for id_mueble in self._ids_por_objeto.get(id(mueble), []):
+            if id_mueble in self._textos_pendientes:
+                continue
+            self._nombres.agregar(id_mueble, getattr(mueble, "nombre", None))
+            self._buscador.agregar(id_mueble, mueble)
+
+    def _indices_texto(self) -> tuple:
+        """
+        Retorna (_nombres, _buscador) después de indexar los ids pendientes.
+        """
+        self._crear_pendientes()
+        if self._textos_pendientes:
+            for id_mueble in self._textos_pendientes:
+                mueble = self._mueble(id_mueble)
+                self._nombres.agregar(id_mueble, getattr(mueble, "nombre", None))
+                self._buscador.agregar(id_mueble, mueble)
+            self._textos_pendientes.clear()
+        return self._nombres, self._buscador
+
+    def _indexar_precio(self, id_mueble: int, mueble, precio=None) -> None:
+        """
+        Indexa el precio del mueble; si no se puede calcular o no es finito,
+        lo omite.
+        """
+        if precio is None:
+            precio = _precio_o_none(mueble)
+        elif not math.isfinite(precio):
+            precio = None
+        self._fijar_precio(id_mueble, mueble, precio)
+
+    def _actualizar_precio(self, mueble) -> None:
+        """Recalcula el precio indexado de todas las copias del mueble."""
+        ids = self._ids_por_objeto.get(id(mueble), [])
+        if not ids:
+            return
+        precio = _precio_o_none(mueble)
+        for id_mueble in ids:
+            self._fijar_precio(id_mueble, mueble, precio)
+
+    def _fijar_precio(self, id_mueble: int, mueble, precio) -> None:
+        """
+        Reemplaza el precio indexado de un id y ajusta los agregados.
+        Un precio None quita el id del índice de precios.
+        """
+        tipo = type(mueble).__name__
+        unidades = self._unidades.get(id_mueble, 1)
+        anterior = self._precios.precio_de(id_mueble)
+        if anterior is not None:
+            self._estadisticas.sumar_precio(tipo, anterior, -unidades)
+        if precio is None:
+            self._precios.quitar(id_mueble)
+        else:
+            self._precios.insertar(id_mueble, precio)
+            self._estadisticas.sumar_precio(tipo, precio, unidades)
+        if self._efectivos is None:
+            return
+        if precio is None:
+            efectivo = self._efectivos.precio_de(id_mueble)
+            if efectivo is not None:
+                self._efectivos.quitar(id_mueble)
+                self._estadisticas.sumar_precios_efectivos([efectivo], [-unidades])
+        else:
+            self._indexar_efectivos([(id_mueble, precio)])
+
+    def _fijar_unidades(self, id_mueble: int, unidades: int) -> None:
+        """Cambia las unidades de un id (mayor a 0) y ajusta los agregados."""
+        diferencia = unidades - self._unidades.get(id_mueble, 1)
+        tipo = self._tipo_de(id_mueble).__name__
+        self._estadisticas.sumar_tipo(tipo, diferencia)
+        self._estadisticas.sumar_material(
+            MATERIALES.normalizado(self.claves(id_mueble)[0]), diferencia
+        )
+        precio = self._precios.precio_de(id_mueble)
+        if precio is not None:
+            self._estadisticas.sumar_precio(tipo, precio, diferencia)
+        if self._efectivos is not None:
+            efectivo = self._efectivos.precio_de(id_mueble)
+            if efectivo is not None:
+                self._estadisticas.sumar_precios_efectivos([efectivo], [diferencia])
+        if unidades == 1:
+            self._unidades.pop(id_mueble, None)
+        else:
+            self._unidades[id_mueble] = unidades
+
+    def _desindexar(self, id_mueble: int, contar: bool = True) -> None:
+        """Quita el id de los índices de material y color (y de los agregados)."""
+        if self._buckets_restaurados:
+            self._completar_indices()
+        material, color = self._claves.pop(id_mueble)
+        for indice, clave in ((self._por_material, material), (self._por_color, color)):
+            bucket = indice.get(clave)
+            if bucket is not None:
+                bucket.pop(id_mueble, None)
+                if not bucket:
+                    del indice[clave]
+        if contar:
+            self._estadisticas.sumar_material(
+                MATERIALES.normalizado(material), -self._unidades.get(id_mueble, 1)
+            )
+
+    def _indice_efectivo(self) -> IndicePrecios:
+        """Índice de precios con descuento vigentes (el de lista si no hay reglas)."""
+        if self._descuentos is not None:
+            self._descuentos.sincronizar()
+        return self._efectivos if self._efectivos is not None else self._precios
+
+    def _con_descuento(
+        self,
+        clase: type,
+        clave_material: Optional[int],
+        precio: float,
+        momento: Optional[float] = None,
+    ) -> float:
+        """Precio final de venta (redondeado como en realizar_venta)."""
+        descuento = self._descuentos.descuento_de(
+            clase, clave_material, precio, momento
+        )
+        return round(precio * (1 - descuento), 2)
+
+    def _indexar_efectivos(self, pares: List[Tuple[int, float]]) -> None:
+        """
+        Indexa (o reemplaza) los precios con descuento de muchos pares
+        (id, precio de lista), ordenando el índice una sola vez.
+        """
+        # Un único momento para todos: las reglas vigentes no cambian a mitad
+        # del recorrido (sincronizar puede volver a llamar a este método)
+        momento = time.time()
+        self._descuentos.sincronizar(momento)
+        efectivos = self._efectivos
+        anteriores = []
+        unidades_anteriores = []
+        nuevos = []
+        unidades = []
+        for id_mueble, precio in pares:
+            cantidad = self._unidades.get(id_mueble, 1)
+            anterior = efectivos.precio_de(id_mueble)
+            if anterior is not None:
+                anteriores.append(anterior)
+                unidades_anteriores.append(-cantidad)
+            efectivo = self._con_descuento(
+                self._tipo_de(id_mueble),
+                self.claves(id_mueble)[0],
+                precio,
+                momento,
+            )
+            nuevos.append((id_mueble, efectivo))
+            unidades.append(cantidad)
+        efectivos.insertar_varios(nuevos)
+        self._estadisticas.sumar_precios_efectivos(anteriores, unidades_anteriores)
+        self._estadisticas.sumar_precios_efectivos(
+            [efectivo for _, efectivo in nuevos], unidades
+        )
+
+    def _al_cambiar_descuentos(self, reglas: List[ReglaDescuento]) -> None:
+        """
+        Observador del motor de descuentos: reprecia los ids de las clases a
+        las que aplican las reglas que cambiaron. La columna con descuento se
+        crea con la primera regla y se descarta al no quedar ninguna.
+        """
+        if not self._descuentos:
+            self._efectivos = None
+            self._estadisticas.descartar_valor_efectivo()
+            return
+        if self._efectivos is None:
+            self._efectivos = IndicePrecios()
+            self._estadisticas.iniciar_valor_efectivo()
+            self._indexar_efectivos(list(self._precios.items()))
+            return
+        precio_de = self._precios.precio_de
+        pares = []
+        if self._buckets_restaurados:
+            self._completar_indices()
+        for clase, bucket in self._por_tipo.items():
+            if any(regla.aplica_a(clase) for regla in reglas):
+                for id_mueble in bucket:
+                    precio = precio_de(id_mueble)
+                    if precio is not None:
+                        pares.append((id_mueble, precio))
+        self._indexar_efectivos(pares)
+
+    def _al_cambiar(self, mueble, campo: str) -> None:
+        """Observador registrado en cada mueble para mantener los índices."""
+        if campo in ("material", "color"):
+            self.actualizar(mueble)
+        elif campo == "nombre":
+            self._indexar_textos(mueble)
+        else:
+            self._actualizar_precio(mueble)
+
+
+def _clave(mueble, atributo: str, vocabulario: Vocabulario) -> Optional[int]:
+    """
+    Obtiene la clave de vocabulario de un atributo del mueble.
+    Los muebles de la jerarquía ya la guardan; para las clases que no
+    heredan de Mueble se registra el texto del atributo.
+    """
+    try:
+        return getattr(mueble, "clave_" + atributo)
+    except AttributeError:
+        return vocabulario.clave_de(getattr(mueble, atributo, None))
+
+
+def _validar_unidades(unidades) -> int:
+    """Retorna las unidades si son un entero mayor a 0; si no, ValueError."""
+    if isinstance(unidades, bool) or not isinstance(unidades, int) or unidades < 1:
+        raise ValueError(f"Las unidades deben ser un entero mayor a 0: {unidades!r}")
+    return unidades
+
+
+def _precio_o_none(mueble) -> Optional[float]:
+    """
+    Calcula el precio del mueble o retorna None si falla.
+    Un precio no finito tampoco se indexa (no tiene valor en centavos).
+    """
+    try:
+        precio = mueble.calcular_precio()
+        return precio if math.isfinite(precio) else None
+    except Exception:
+        return None
@@ -0,0 +1,300 @@
+"""
+Motor de precios columnar y vectorizado con NumPy.
+Reproduce en lote los cálculos de calcular_precio de la jerarquía de muebles
+para revalorizar todo el catálogo sin recorrer objeto por objeto.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from models.vocabulario import normalizar_texto
+
+# Código de tipo por nombre de clase concreta (-1 = tipo no soportado)
+TIPOS = (
+    "Silla",
+    "Mesa",
+    "Sofa",
+    "SofaCama",
+    "Cama",
+    "Armario",
+    "Escritorio",
+    "Cajonera",
+    "Sillon",
+)
+_CODIGO_TIPO = {nombre: codigo for codigo, nombre in enumerate(TIPOS)}
+OTRO = -1
+
+_TAPIZADOS = {"cuero": 1, "tela": 2}
+_TAMAÑOS = {"matrimonial": 1, "queen": 2, "king": 3}
+_MECANISMOS = {"hidraulico": 1, "electrico": 2}
+
+# Columnas booleanas: nombre de columna -> atributo del mueble
+_BANDERAS = {
+    "tiene_respaldo": "tiene_respaldo",
+    "altura_regulable": "altura_regulable",
+    "tiene_ruedas": "tiene_ruedas",
+    "tiene_brazos": "tiene_brazos",
+    "es_modular": "es_modular",
+    "incluye_cojines": "incluye_cojines",
+    "incluye_colchon": "incluye_colchon",
+    "tiene_cabecera": "tiene_cabecera",
+    "tiene_espejos": "tiene_espejos",
+    "tiene_cajones": "tiene_cajones",
+    "tiene_iluminacion": "tiene_iluminacion",
+    "es_reclinable": "es_reclinable",
+    "tiene_reposapies": "tiene_reposapiés",
+}
+
+
+def redondear(valores: np.ndarray, decimales: int = 2) -> np.ndarray:
+    """
+    Redondea como round() de Python, elemento a elemento.
+
+    np.round multiplica por 10**decimales antes de redondear, lo que puede
+    desviarse un centavo de round() en valores justo en la mitad. Esos
+    casos (muy pocos) se corrigen con round() sobre el valor original.
+    """
+    escala = 10.0**decimales
+    escalados = valores * escala
+    resultado = np.round(escalados) / escala
+    fraccion = np.abs(escalados - np.floor(escalados) - 0.5)
+    dudosos = np.flatnonzero(fraccion < 1e-6)
+    for i in dudosos:
+        resultado[i] = round(float(valores[i]), decimales)
+    return resultado
+
+
+class MotorPrecios:
+    """
+    Representación columnar del catálogo para calcular precios en lote.
+
+    Cada atributo que interviene en algún precio se guarda como un arreglo
+    NumPy (precio base, entradas del factor de comodidad, área, capacidad,
+    banderas, etc.). Los precios se calculan por tipo con operaciones
+    vectorizadas que siguen el mismo orden de operaciones que los métodos
+    calcular_precio, de modo que los resultados coinciden al centavo.
+
+    Los muebles de clases no soportadas conservan el precio calculado por
+    el propio objeto al construir el motor.
+    """
+
+    def __init__(self, columnas: Dict[str, np.ndarray]):
+        """
+        Constructor a partir de columnas ya armadas.
+
+        Args:
+            columnas: Diccionario nombre -> arreglo (ver desde_muebles)
+        """
+        self._columnas = columnas
+        self._tamaño = len(columnas["tipo"])
+
+    @classmethod
+    def desde_muebles(cls, muebles: List) -> "MotorPrecios":
+        """
+        Construye el motor extrayendo las columnas de una lista de muebles.
+
+        Args:
+            muebles: Muebles a representar (en el orden de las filas)
+        Returns:
+            MotorPrecios: Motor con una fila por mueble
+        """
+        n = len(muebles)
+        tipo = np.full(n, OTRO, dtype=np.int8)
+        precio_base = np.zeros(n)
+        capacidad = np.zeros(n)
+        tapizado = np.zeros(n, dtype=np.int8)
+        largo = np.zeros(n)
+        ancho = np.zeros(n)
+        forma_especial = np.zeros(n, dtype=bool)
+        tamaño = np.zeros(n, dtype=np.int8)
+        mecanismo = np.zeros(n, dtype=np.int8)
+        num_puertas = np.zeros(n)
+        num_cajones = np.zeros(n)
+        precio_fijo = np.zeros(n)
+        banderas = {nombre: np.zeros(n, dtype=bool) for nombre in _BANDERAS}
+
+        for i, mueble in enumerate(muebles):
+            codigo = _CODIGO_TIPO.get(type(mueble).__name__, OTRO)
+            tipo[i] = codigo
+            if codigo == OTRO:
+                precio_fijo[i] = mueble.calcular_precio()
+                continue
+            precio_base[i] = mueble.precio_base
+            capacidad[i] = getattr(mueble, "capacidad_personas", 0) or 0
+            material_tapizado = getattr(mueble, "material_tapizado", None)
+            if material_tapizado:
+                tapizado[i] = _TAPIZADOS.get(normalizar_texto(material_tapizado), 3)
+            largo[i] = getattr(mueble, "largo", 0) or 0
+            ancho[i] = getattr(mueble, "ancho", 0) or 0
+            forma_especial[i] = getattr(mueble, "forma", "rectangular") != "rectangular"
+            tamaño[i] = _TAMAÑOS.get(getattr(mueble, "tamaño", None), 0)
+            mecanismo[i] = _MECANISMOS.get(
+                getattr(mueble, "mecanismo_conversion", None), 0
+            )
+            num_puertas[i] = getattr(mueble, "num_puertas", 0) or 0
+            num_cajones[i] = getattr(mueble, "num_cajones", 0) or 0
+            for nombre, atributo in _BANDERAS.items():
+                banderas[nombre][i] = bool(getattr(mueble, atributo, False))
+
+        columnas = {
+            "tipo": tipo,
+            "precio_base": precio_base,
+            "capacidad": capacidad,
+            "tapizado": tapizado,
+            "largo": largo,
+            "ancho": ancho,
+            "forma_especial": forma_especial,
+            "tamaño": tamaño,
+            "mecanismo": mecanismo,
+            "num_puertas": num_puertas,
+            "num_cajones": num_cajones,
+            "precio_fijo": precio_fijo,
+        }
+        columnas.update(banderas)
+        return cls(columnas)
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de filas del motor."""
+        return self._tamaño
+
+    def columna(self, nombre: str) -> np.ndarray:
+        """
+        Retorna una columna (la referencia, no una copia).
+        Modificarla afecta los próximos cálculos.
+        """
+        return self._columnas[nombre]
+
+    def mascara_tipo(self, nombre_tipo: str) -> np.ndarray:
+        """Retorna la máscara booleana de las filas del tipo indicado."""
+        return self._columnas["tipo"] == _CODIGO_TIPO.get(nombre_tipo, OTRO)
+
+    def ajustar_precio_base(
+        self, factor: float, tipo: Optional[str] = None, decimales: int = 2
+    ) -> None:
+        """
+        Multiplica el precio base de todas las filas (o de un tipo) por un factor.
+
+        Args:
+            factor: Multiplicador (ej: 1.1 para subir 10%)
+            tipo: Nombre de la clase a ajustar (None = todas)
+            decimales: Decimales a los que se redondea el nuevo precio base
+        """
+        precio_base = self._columnas["precio_base"]
+        mascara = slice(None) if tipo is None else self.mascara_tipo(tipo)
+        precio_base[mascara] = redondear(precio_base[mascara] * factor, decimales)
+
+    def calcular_precios(self) -> np.ndarray:
+        """
+        Calcula el precio final de todas las filas.
+
+        Returns:
+            np.ndarray: Precios en el mismo orden que las filas
+        """
+        c = self._columnas
+        tipo = c["tipo"]
+        precios = c["precio_fijo"].copy()
+
+        m = tipo == _CODIGO_TIPO["Silla"]
+        if m.any():
+            precio = c["precio_base"][m] * self._factor_comodidad(m)
+            precio += np.where(c["altura_regulable"][m], 30.0, 0.0)
+            precio += np.where(c["tiene_ruedas"][m], 20.0, 0.0)
+            precios[m] = redondear(precio)
+
+        m = tipo == _CODIGO_TIPO["Mesa"]
+        if m.any():
+            area = c["largo"][m] * c["ancho"][m]
+            precio = c["precio_base"][m] * (1.0 + (area / 10000) * 0.05)
+            precio += np.where(c["forma_especial"][m], 50.0, 0.0)
+            capacidad = c["capacidad"][m]
+            precio += np.where(capacidad > 6, 100.0, np.where(capacidad > 4, 50.0, 0.0))
+            precios[m] = redondear(precio)
+
+        for nombre in ("Sofa", "SofaCama"):
+            m = tipo == _CODIGO_TIPO[nombre]
+            if not m.any():
+                continue
+            precio = c["precio_base"][m] * self._factor_comodidad(m)
+            precio += np.where(c["tiene_brazos"][m], 150.0, 0.0)
+            precio += np.where(c["es_modular"][m], 200.0, 0.0)
+            precio += np.where(c["incluye_cojines"][m], 50.0, 0.0)
+            precio = redondear(precio)
+            if nombre == "SofaCama":
+                precio += np.choose(c["tamaño"][m], (0.0, 300.0, 500.0, 700.0))
+                precio += np.where(c["incluye_colchon"][m], 250.0, 0.0)
+                precio += np.choose(c["mecanismo"][m], (0.0, 150.0, 300.0))
+                precio = redondear(precio)
+            precios[m] = precio
+
+        m = tipo == _CODIGO_TIPO["Cama"]
+        if m.any():
+            precio = c["precio_base"][m] + np.choose(
+                c["tamaño"][m], (0.0, 200.0, 400.0, 600.0)
+            )
+            precio += np.where(c["incluye_colchon"][m], 300.0, 0.0)
+            precio += np.where(c["tiene_cabecera"][m], 100.0, 0.0)
+            precios[m] = redondear(precio)
+
+        m = tipo == _CODIGO_TIPO["Armario"]
+        if m.any():
+            precio = c["precio_base"][m] + c["num_puertas"][m] * 50
+            precio += c["num_cajones"][m] * 30
+            precio += np.where(c["tiene_espejos"][m], 100.0, 0.0)
+            precios[m] = np.rint(precio)
+
+        m = tipo == _CODIGO_TIPO["Cajonera"]
+        if m.any():
+            precio = c["precio_base"][m] + c["num_cajones"][m] * 20
+            precio += np.where(c["tiene_ruedas"][m], 30.0, 0.0)
+            precios[m] = np.rint(precio)
+
+        m = tipo == _CODIGO_TIPO["Escritorio"]
+        if m.any():
+            precio = c["precio_base"][m] + np.where(
+                c["tiene_cajones"][m], c["num_cajones"][m] * 25, 0.0
+            )
+            precio += np.where(c["largo"][m] > 1.5, 50.0, 0.0)
+            precio += np.where(c["tiene_iluminacion"][m], 40.0, 0.0)
+            precio += np.where(c["forma_especial"][m], 30.0, 0.0)
+            precios[m] = np.rint(precio)
+
+        m = tipo == _CODIGO_TIPO["Sillon"]
+        if m.any():
+            precio = c["precio_base"][m] + np.where(c["tapizado"][m] > 0, 200.0, 0.0)
+            precio += np.where(c["tiene_brazos"][m], 100.0, 0.0)
+            precio += np.where(c["es_reclinable"][m], 250.0, 0.0)
+            precio += np.where(c["tiene_reposapies"][m], 80.0, 0.0)
+            precios[m] = np.rint(precio)
+
+        return precios
+
+    def calcular_precios_con_descuento(
+        self, descuentos: Dict[str, float], precios: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Aplica descuentos por clase concreta (fracción 0-1). Equivale a
+        realizar_venta solo con descuentos simples por clase concreta (sin
+        subclases ni reglas por material, precio o fecha).
+
+        Args:
+            descuentos: Diccionario nombre de clase -> fracción de descuento
+            precios: Precios ya calculados (opcional)
+        Returns:
+            np.ndarray: Precios finales redondeados a dos decimales
+        """
+        if precios is None:
+            precios = self.calcular_precios()
+        fraccion = np.zeros(self._tamaño)
+        for nombre_tipo, descuento in descuentos.items():
+            fraccion[self.mascara_tipo(nombre_tipo)] = descuento
+        return redondear(precios * (1 - fraccion))
+
+    def _factor_comodidad(self, m: np.ndarray) -> np.ndarray:
+        """Versión vectorizada de Asiento.calcular_factor_comodidad."""
+        c = self._columnas
+        factor = 1.0 + np.where(c["tiene_respaldo"][m], 0.1, 0.0)
+        tapizado = c["tapizado"][m]
+        factor += np.where(tapizado == 1, 0.2, np.where(tapizado == 2, 0.1, 0.0))
+        factor += (c["capacidad"][m] - 1) * 0.05
+        return factor
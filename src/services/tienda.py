@@ -3,11 +3,19 @@ Servicio de la tienda que maneja la lógica de negocio.
 Esta clase implementa el patrón de servicio para separar la lógica de negocio de la UI.
 """
 
-from typing import List, Dict
+import math
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional
 
 # Corrección de imports para ejecución directa
 from models.mueble import Mueble
 from models.composicion.comedor import Comedor
+from services import exportador, instantanea
+from services.consultas import Consulta
+from services.descuentos import MotorDescuentos, ReglaDescuento, resolver_categoria
+from services.estadisticas import precio_valido
+from services.inventario import Inventario
+from services.ventas import RegistroVentas, Venta
 # TODO: Importar las clases necesarias
 
 
@@ -15,36 +23,29 @@ class TiendaMuebles:
     def obtener_estadisticas(self) -> dict:
         """
         Retorna estadísticas básicas y acumulativas de la tienda para la UI.
+        Los agregados del inventario se mantienen de forma incremental, por
+        lo que la lectura no recorre el inventario. En modo debug se
+        verifican contra una recomputación completa.
         Returns:
             dict: Diccionario con estadísticas
         """
+        if getattr(self, "_modo_debug", False):
+            self._verificar_estadisticas()
         try:
-            total_muebles = len(self._inventario)
-            total_comedores = len(self._comedores)
-            valor_inventario = 0
-            for mueble in self._inventario:
-                try:
-                    valor_inventario += mueble.calcular_precio()
-                except Exception:
-                    pass
-            tipos_muebles = {}
-            for mueble in self._inventario:
-                tipo = type(mueble).__name__
-                tipos_muebles[tipo] = tipos_muebles.get(tipo, 0) + 1
-            ventas_realizadas = (
-                len(self._ventas_realizadas)
-                if hasattr(self, "_ventas_realizadas")
-                else 0
-            )
+            agregados = self._inventario.estadisticas
+            ventas_realizadas = self._contar_ventas()
             # Acumulativos
             total_muebles_vendidos = getattr(self, "_total_muebles_vendidos", 0)
             valor_total_ventas = getattr(self, "_valor_total_ventas", 0.0)
             return {
-                "total_muebles": total_muebles,
-                "total_comedores": total_comedores,
-                "valor_inventario": valor_inventario,
-                "tipos_muebles": tipos_muebles,
-                "descuentos_activos": self._descuentos_activos.copy(),
+                "total_muebles": agregados.total_unidades,
+                "total_comedores": len(self._comedores),
+                "valor_inventario": agregados.valor_total,
+                "valor_inventario_con_descuentos": agregados.valor_efectivo,
+                "tipos_muebles": agregados.por_tipo,
+                "muebles_por_material": agregados.por_material,
+                "valor_por_tipo": agregados.valor_por_tipo,
+                "descuentos_activos": self._descuentos.descuentos_por_tipo(),
                 "ventas_realizadas": ventas_realizadas,
                 "total_muebles_vendidos": total_muebles_vendidos,
                 "valor_total_ventas": valor_total_ventas,
@@ -54,7 +55,10 @@ class TiendaMuebles:
                 "total_muebles": 0,
                 "total_comedores": 0,
                 "valor_inventario": 0.0,
+                "valor_inventario_con_descuentos": 0.0,
                 "tipos_muebles": {},
+                "muebles_por_material": {},
+                "valor_por_tipo": {},
                 "descuentos_activos": {},
                 "ventas_realizadas": 0,
                 "total_muebles_vendidos": 0,
@@ -63,51 +67,34 @@ class TiendaMuebles:
 
     def estadisticas(self) -> dict:
         """
-        Retorna estadísticas básicas y acumulativas de la tienda para la UI.
+        Alias de obtener_estadisticas, conservado por compatibilidad.
         Returns:
             dict: Diccionario con estadísticas
         """
-        try:
-            total_muebles = len(self._inventario)
-            total_comedores = len(self._comedores)
-            valor_inventario = 0
-            for mueble in self._inventario:
-                try:
-                    valor_inventario += mueble.calcular_precio()
-                except Exception:
-                    pass
-            tipos_muebles = {}
-            for mueble in self._inventario:
-                tipo = type(mueble).__name__
-                tipos_muebles[tipo] = tipos_muebles.get(tipo, 0) + 1
-            ventas_realizadas = (
-                len(self._ventas_realizadas)
-                if hasattr(self, "_ventas_realizadas")
-                else 0
+        return self.obtener_estadisticas()
+
+    def _contar_ventas(self) -> int:
+        """
+        Cantidad de ventas realizadas: las del libro más las de una
+        instantánea cargada sin su libro (ver instantanea.cargar).
+        """
+        return len(self._ventas_realizadas) + self._ventas_previas
+
+    def _verificar_estadisticas(self) -> None:
+        """
+        Compara los agregados incrementales con una recomputación completa.
+        Solo se usa en modo debug porque recorre todo el inventario.
+
+        Raises:
+            AssertionError: Si algún agregado no coincide
+        """
+        diferencias = self._inventario.estadisticas.comparar(
+            self._inventario.recalcular_estadisticas()
+        )
+        if diferencias:
+            raise AssertionError(
+                f"Estadísticas incrementales inconsistentes: {diferencias}"
             )
-            total_muebles_vendidos = getattr(self, "_total_muebles_vendidos", 0)
-            valor_total_ventas = getattr(self, "_valor_total_ventas", 0.0)
-            return {
-                "total_muebles": total_muebles,
-                "total_comedores": total_comedores,
-                "valor_inventario": valor_inventario,
-                "tipos_muebles": tipos_muebles,
-                "descuentos_activos": self._descuentos_activos.copy(),
-                "ventas_realizadas": ventas_realizadas,
-                "total_muebles_vendidos": total_muebles_vendidos,
-                "valor_total_ventas": valor_total_ventas,
-            }
-        except Exception:
-            return {
-                "total_muebles": 0,
-                "total_comedores": 0,
-                "valor_inventario": 0.0,
-                "tipos_muebles": {},
-                "descuentos_activos": {},
-                "ventas_realizadas": 0,
-                "total_muebles_vendidos": 0,
-                "valor_total_ventas": 0.0,
-            }
 
     """
     Clase que maneja toda la lógica de negocio de la tienda de muebles.
@@ -124,19 +111,34 @@ class TiendaMuebles:
     - Composición: Contiene colecciones de muebles
     """
 
-    def __init__(self, nombre_tienda: str = "Mueblería OOP"):
+    def __init__(
+        self,
+        nombre_tienda: str = "Mueblería OOP",
+        modo_debug: bool = False,
+        registro_ventas: Optional[RegistroVentas] = None,
+    ):
         """
         Constructor de la tienda.
 
         Args:
             nombre_tienda: Nombre de la tienda
+            modo_debug: Si True, verifica las estadísticas incrementales
+                contra una recomputación completa en cada lectura
+            registro_ventas: Libro de ventas a usar (None = uno nuevo que
+                vuelca a un archivo temporal)
         """
         self._nombre = nombre_tienda
-        self._inventario: List[Mueble] = []
+        self._modo_debug = modo_debug
+        self._inventario = Inventario()
         self._comedores: List[Comedor] = []
-        self._ventas_realizadas: List[Dict] = []
-        self._descuentos_activos: Dict[str, float] = {}
+        self._ventas_realizadas = (
+            registro_ventas if registro_ventas is not None else RegistroVentas()
+        )
+        self._descuentos = MotorDescuentos()
+        self._inventario.usar_descuentos(self._descuentos)
         # Campos acumulativos
+        # Ventas de una instantánea cargada sin su libro de ventas
+        self._ventas_previas: int = 0
         self._total_muebles_vendidos: int = 0
         self._valor_total_ventas: float = 0.0
         pass
@@ -146,29 +148,161 @@ class TiendaMuebles:
         """Getter para el nombre de la tienda."""
         return self._nombre
 
+    @property
+    def ventas_fuera_del_libro(self) -> int:
+        """
+        Ventas contadas por una instantánea cargada sin su libro de ventas
+        (no se pueden recorrer ni exportar).
+        """
+        return self._ventas_previas
+
+    def obtener_mueble_por_id(self, id_mueble: int) -> "Mueble":
+        """
+        Obtiene un mueble del inventario por su id estable.
+
+        Args:
+            id_mueble: Id asignado al agregar el mueble
+        Returns:
+            Mueble: El mueble o None si no existe
+        """
+        return self._inventario.obtener(id_mueble)
+
+    def obtener_id_mueble(self, mueble: "Mueble") -> int:
+        """
+        Obtiene el id estable de un mueble en inventario.
+
+        Args:
+            mueble: Mueble a consultar
+        Returns:
+            int: Id del mueble o None si no está en inventario
+        """
+        return self._inventario.id_de(mueble)
+
+    def listar_inventario(self) -> List["Mueble"]:
+        """
+        Retorna los muebles del inventario en orden de ingreso.
+
+        Returns:
+            List[Mueble]: Copia de la lista de muebles
+        """
+        return self._inventario.listar()
+
     # @property
     # def total_muebles(self) -> int:
     #     """Retorna el total de muebles en inventario."""
     #     return len(self._inventario)
 
-    def agregar_mueble(self, mueble: "Mueble") -> str:
+    def agregar_mueble(self, mueble: "Mueble", unidades: int = 1) -> str:
         """
         Agrega un mueble al inventario de la tienda.
         Args:
             mueble: Objeto mueble a agregar
+            unidades: Unidades idénticas que representa (un solo objeto
+                para todo el stock de un producto)
         Returns:
             str: Mensaje de confirmación
         """
         if mueble is None:
             return "Error: El mueble no puede ser None"
+        if isinstance(unidades, bool) or not isinstance(unidades, int) or unidades < 1:
+            return "Error: Las unidades deben ser un entero mayor a 0"
         try:
             precio = mueble.calcular_precio()
-            if precio <= 0:
-                return "Error: El mueble debe tener un precio válido mayor a 0"
         except Exception as e:
             return f"Error al calcular precio del mueble: {str(e)}"
-        self._inventario.append(mueble)
-        return f"Mueble {getattr(mueble, 'nombre', str(mueble))} agregado exitosamente al inventario"
+        if not precio_valido(precio):
+            return "Error: El mueble debe tener un precio válido mayor a 0"
+        self._inventario.agregar(mueble, precio, unidades)
+        nombre = mueble.nombre if hasattr(mueble, "nombre") else str(mueble)
+        return f"Mueble {nombre} agregado exitosamente al inventario"
+
+    def reponer_mueble(self, mueble: "Mueble", unidades: int) -> str:
+        """
+        Suma unidades al stock de un mueble que ya está en inventario.
+        Args:
+            mueble: Mueble en inventario
+            unidades: Unidades a sumar
+        Returns:
+            str: Mensaje de confirmación o error
+        """
+        id_mueble = self._inventario.id_de(mueble)
+        if id_mueble is None:
+            return "Error: El mueble no está en inventario"
+        try:
+            self._inventario.reponer(id_mueble, unidades)
+        except ValueError as e:
+            return f"Error: {str(e)}"
+        return (
+            f"Stock de {getattr(mueble, 'nombre', str(mueble))}: "
+            f"{self._inventario.existencias(mueble)} unidades"
+        )
+
+    def existencias(self, mueble: "Mueble") -> int:
+        """
+        Retorna las unidades disponibles de un mueble.
+        Args:
+            mueble: Mueble a consultar
+        Returns:
+            int: Unidades en inventario (0 si no está)
+        """
+        return self._inventario.existencias(mueble)
+
+    def agregar_muebles(
+        self, muebles: Iterable["Mueble"], precios: Optional[Iterable[float]] = None
+    ) -> Dict:
+        """
+        Agrega muchos muebles validando sus precios en una sola pasada.
+        Los índices y agregados se actualizan una vez al final, y en lugar de
+        un mensaje por mueble se retorna un resumen.
+
+        Args:
+            muebles: Muebles a agregar
+            precios: Precios ya calculados, en el mismo orden (opcional; por
+                ejemplo un arreglo de MotorPrecios.calcular_precios()). Se
+                validan de forma vectorizada con NumPy.
+        Returns:
+            Dict: Cantidad agregada, valor agregado y rechazos (índice en
+                muebles y error)
+        Raises:
+            ValueError: Si la cantidad de precios no coincide con la de muebles
+        """
+        muebles = list(muebles)
+        if precios is None:
+            validos, lista_precios, rechazados = _validar_precios(muebles)
+        else:
+            validos, lista_precios, rechazados = _validar_precios_dados(
+                muebles, precios
+            )
+        self._inventario.agregar_lote(validos, lista_precios)
+        return {
+            "agregados": len(validos),
+            "valor_agregado": sum(lista_precios),
+            "rechazados": rechazados,
+        }
+
+    def agregar_lote(self, muebles: List["Mueble"], precios: List[float]) -> List[int]:
+        """
+        Agrega muchos muebles cuyos precios ya fueron calculados y validados.
+        Los índices y agregados se actualizan una vez para todo el lote.
+
+        Args:
+            muebles: Muebles a agregar
+            precios: Precio de cada mueble (mayor a 0), en el mismo orden
+        Returns:
+            List[int]: Ids asignados, en el orden de los muebles
+        """
+        return self._inventario.agregar_lote(muebles, precios)
+
+    def actualizar_mueble(self, mueble: "Mueble") -> None:
+        """
+        Reindexa un mueble cuyos atributos fueron modificados directamente.
+        Los muebles de la jerarquía Mueble se reindexan solos a través de sus
+        setters; este método es necesario para las clases sin setters.
+
+        Args:
+            mueble: Mueble modificado
+        """
+        self._inventario.actualizar(mueble)
 
     def agregar_comedor(self, comedor: "Comedor") -> str:
         """
@@ -188,6 +322,7 @@ class TiendaMuebles:
     def buscar_muebles_por_nombre(self, nombre: str) -> List["Mueble"]:
         """
         Busca muebles por nombre (búsqueda parcial, case-insensitive).
+        Usa el índice de trigramas del inventario.
         Args:
             nombre: Nombre o parte del nombre a buscar
         Returns:
@@ -195,15 +330,28 @@ class TiendaMuebles:
         """
         if not nombre or not nombre.strip():
             return []
-        nombre_lower = nombre.lower().strip()
-        resultados = []
-        for mueble in self._inventario:
-            if nombre_lower in mueble.nombre.lower():
-                resultados.append(mueble)
-        return resultados
+        return self._inventario.por_nombre(nombre)
+
+    def buscar(self, consulta: str, limite: int = 10) -> List["Mueble"]:
+        """
+        Busca muebles por relevancia en nombre, material, color y tipo.
+        No distingue acentos ni mayúsculas y tolera errores de tipeo.
+
+        Args:
+            consulta: Texto libre (ej: "sillon cuero")
+            limite: Cantidad máxima de resultados
+        Returns:
+            List[Mueble]: Los muebles más relevantes, de mayor a menor
+        """
+        if not consulta or not consulta.strip():
+            return []
+        return [mueble for mueble, _ in self._inventario.buscar(consulta, limite)]
 
     def filtrar_por_precio(
-        self, precio_min: float = 0, precio_max: float = float("inf")
+        self,
+        precio_min: float = 0,
+        precio_max: float = float("inf"),
+        con_descuentos: bool = False,
     ) -> List["Mueble"]:
         """
         Filtra muebles por rango de precios.
@@ -211,20 +359,65 @@ class TiendaMuebles:
         Args:
             precio_min: Precio mínimo (inclusivo)
             precio_max: Precio máximo (inclusivo)
+            con_descuentos: Si es True, filtra por el precio de venta con los
+                descuentos vigentes en lugar del precio de lista
         Returns:
             List[Mueble]: Lista de muebles en el rango de precios
         """
         if precio_min < 0:
             precio_min = 0
-        resultados = []
-        for mueble in self._inventario:
-            try:
-                precio = mueble.calcular_precio()
-                if precio_min <= precio <= precio_max:
-                    resultados.append(mueble)
-            except Exception:
-                continue  # Saltar muebles con errores de precio
-        return resultados
+        if con_descuentos:
+            return self._inventario.por_precio_efectivo(precio_min, precio_max)
+        return self._inventario.por_precio(precio_min, precio_max)
+
+    def iterar_por_precio(
+        self, precio_min: float = 0, precio_max: float = float("inf")
+    ) -> Iterator["Mueble"]:
+        """
+        Recorre los muebles de un rango de precios del más barato al más caro,
+        sin construir la lista completa de resultados.
+
+        Args:
+            precio_min: Precio mínimo (inclusivo)
+            precio_max: Precio máximo (inclusivo)
+        Returns:
+            Iterator[Mueble]: Generador de muebles ordenados por precio
+        """
+        return self._inventario.iterar_por_precio(max(precio_min, 0), precio_max)
+
+    def filtrar_por_precio_paginado(
+        self,
+        precio_min: float = 0,
+        precio_max: float = float("inf"),
+        pagina: int = 1,
+        tamaño_pagina: int = 20,
+    ) -> Dict:
+        """
+        Filtra muebles por rango de precios devolviendo una página ordenada
+        del más barato al más caro.
+
+        Args:
+            precio_min: Precio mínimo (inclusivo)
+            precio_max: Precio máximo (inclusivo)
+            pagina: Número de página (desde 1)
+            tamaño_pagina: Cantidad de muebles por página
+        Returns:
+            Dict: Muebles de la página y datos de paginación
+        """
+        precio_min = max(precio_min, 0)
+        pagina = max(pagina, 1)
+        tamaño_pagina = max(tamaño_pagina, 1)
+        total = self._inventario.contar_por_precio(precio_min, precio_max)
+        muebles = self._inventario.pagina_por_precio(
+            precio_min, precio_max, (pagina - 1) * tamaño_pagina, tamaño_pagina
+        )
+        return {
+            "muebles": muebles,
+            "pagina": pagina,
+            "tamaño_pagina": tamaño_pagina,
+            "total": total,
+            "total_paginas": (total + tamaño_pagina - 1) // tamaño_pagina,
+        }
 
     def filtrar_por_material(self, material: str) -> List["Mueble"]:
         """
@@ -237,19 +430,7 @@ class TiendaMuebles:
         """
         if not material or not material.strip():
             return []
-        material_lower = material.lower().strip()
-        resultados = []
-        for mueble in self._inventario:
-            try:
-                if (
-                    hasattr(mueble, "material")
-                    and mueble.material
-                    and mueble.material.lower().strip() == material_lower
-                ):
-                    resultados.append(mueble)
-            except Exception:
-                continue
-        return resultados
+        return self._inventario.por_material(material)
 
     def obtener_muebles_por_tipo(self, tipo_clase: type) -> List["Mueble"]:
         """
@@ -261,13 +442,20 @@ class TiendaMuebles:
         Returns:
             List[Mueble]: Lista de muebles del tipo especificado
         """
-        # TODO: Implementar filtro por tipo
-        # resultados = []
-        # for mueble in self._inventario:
-        #     if isinstance(mueble, tipo_clase):
-        #         resultados.append(mueble)
-        # return resultados
-        pass
+        return self._inventario.por_tipo(tipo_clase)
+
+    def consultar(self) -> Consulta:
+        """
+        Crea una consulta por varios criterios sobre el inventario.
+
+        Ejemplo:
+            tienda.consultar().tipo(Silla).color("negro").con(tiene_ruedas=True)
+
+        Returns:
+            Consulta: Consulta vacía; sus criterios se encadenan y se
+                resuelve con ejecutar() (explicar() muestra el plan)
+        """
+        return Consulta(self._inventario)
 
     def calcular_valor_inventario(self) -> float:
         """
@@ -276,92 +464,302 @@ class TiendaMuebles:
         Returns:
             float: Valor total de todos los muebles en inventario
         """
-        # TODO: Implementar cálculo de valor total
-        # valor_total = 0
-        # for mueble in self._inventario:
-        #     try:
-        #         valor_total += mueble.calcular_precio()
-        #     except Exception:
-        #         continue  # Saltar muebles con errores
-
-        # for comedor in self._comedores:
-        #     try:
-        #         valor_total += comedor.calcular_precio_total()
-        #     except Exception:
-        #         continue
-
-        # return round(valor_total, 2)
-        pass
+        valor_total = self._inventario.estadisticas.valor_total
+        for comedor in self._comedores:
+            try:
+                valor_total += comedor.calcular_precio_total()
+            except Exception:
+                continue
+        return round(valor_total, 2)
 
     def aplicar_descuento(self, categoria: str, porcentaje: float) -> str:
         """
-        Aplica un descuento a una categoría de muebles.
+        Aplica un descuento a una categoría de muebles (y a sus subclases:
+        el descuento de sofás también aplica a los sofá-camas). Reemplaza el
+        descuento anterior de la misma categoría.
 
         Args:
-            categoria: Nombre de la categoría (ej: "sillas", "mesas")
+            categoria: Nombre de la categoría (ej: "sillas", "mesas",
+                "asientos"; ver descuentos.resolver_categoria)
             porcentaje: Porcentaje de descuento (0-100)
         Returns:
             str: Mensaje de confirmación
         """
         if not 0 < porcentaje <= 100:
             return "Error: El porcentaje debe estar entre 1 y 100"
-        categoria_lower = categoria.lower().strip()
-        # Normalizar nombres de clase (Silla, Mesa, etc.)
-        # El sistema usa el nombre de la clase, por ejemplo 'Silla', 'Mesa', etc.
-        # Si el usuario ingresa 'sillas', 'mesas', etc., quitamos la 's' final si existe
-        if categoria_lower.endswith("s"):
-            categoria_lower = categoria_lower[:-1]
-        # Capitalizar para coincidir con el nombre de clase
-        categoria_clase = categoria_lower.capitalize()
-        self._descuentos_activos[categoria_clase] = porcentaje / 100
-        return (
-            f"Descuento del {porcentaje}% aplicado a la categoría '{categoria_clase}'"
+        clase = resolver_categoria(categoria)
+        if clase is None:
+            return f"Error: Categoría desconocida '{categoria}'"
+        self._descuentos.fijar_por_tipo(clase, porcentaje / 100)
+        return f"Descuento del {porcentaje}% aplicado a la categoría '{clase.__name__}'"
+
+    def agregar_regla_descuento(
+        self,
+        porcentaje: float,
+        categoria: Optional[str] = None,
+        material: Optional[str] = None,
+        precio_min: float = 0,
+        precio_max: float = float("inf"),
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> int:
+        """
+        Agrega una regla de descuento con condiciones combinadas. Si varias
+        reglas aplican a un mueble se usa el mayor descuento.
+
+        Args:
+            porcentaje: Porcentaje de descuento (0-100)
+            categoria: Categoría a la que aplica, con sus subclases
+                (None = todas)
+            material: Material al que aplica (None = todos)
+            precio_min: Precio de lista mínimo (inclusivo)
+            precio_max: Precio de lista máximo (exclusivo)
+            desde: Inicio de la vigencia (inclusivo, None = sin límite)
+            hasta: Fin de la vigencia (exclusivo, None = sin límite)
+        Returns:
+            int: Id de la regla
+        Raises:
+            ValueError: Si la categoría es desconocida o las condiciones no
+                son válidas
+        """
+        tipo = None
+        if categoria is not None:
+            tipo = resolver_categoria(categoria)
+            if tipo is None:
+                raise ValueError(f"Categoría desconocida '{categoria}'")
+        return self._descuentos.agregar(
+            ReglaDescuento(
+                porcentaje / 100,
+                tipo,
+                material,
+                precio_min,
+                precio_max,
+                desde.timestamp() if desde is not None else None,
+                hasta.timestamp() if hasta is not None else None,
+            )
         )
 
+    def quitar_regla_descuento(self, id_regla: int) -> bool:
+        """
+        Quita una regla de descuento.
+
+        Args:
+            id_regla: Id retornado por agregar_regla_descuento
+        Returns:
+            bool: True si la regla existía
+        """
+        return self._descuentos.quitar(id_regla)
+
     def realizar_venta(
-        self, mueble: "Mueble", cliente: str = "Cliente Anónimo"
+        self, mueble: "Mueble", cliente: str = "Cliente Anónimo", cantidad: int = 1
     ) -> Dict:
         """
         Procesa la venta de un mueble.
+        El precio se calcula una vez y se registra una sola venta con la
+        cantidad de unidades.
         Args:
             mueble: Mueble a vender
             cliente: Nombre del cliente
+            cantidad: Unidades a vender
         Returns:
-            Dict: Información de la venta realizada o error
+            Dict: Información de la venta realizada (precios por unidad;
+                con cantidad > 1 se agregan 'cantidad' y 'total') o error
         """
         if mueble not in self._inventario:
             return {"error": "El mueble no está disponible en inventario"}
+        if isinstance(cantidad, bool) or not isinstance(cantidad, int) or cantidad < 1:
+            return {"error": "La cantidad debe ser un entero mayor a 0"}
+        if cantidad > self._inventario.existencias(mueble):
+            return {
+                "error": "No hay unidades suficientes en inventario",
+                "disponibles": self._inventario.existencias(mueble),
+            }
         try:
             precio_original = mueble.calcular_precio()
-            descuento_aplicado = 0
-            # Use the class name as key, matching how discounts are registered
-            tipo_mueble = type(mueble).__name__
-            if self._descuentos_activos and tipo_mueble in self._descuentos_activos:
-                descuento_aplicado = self._descuentos_activos[tipo_mueble]
+            marca_tiempo = datetime.now().timestamp()
+            descuento_aplicado = self._descuentos.descuento(
+                mueble, precio_original, marca_tiempo
+            )
             precio_final = precio_original * (1 - descuento_aplicado)
-            from datetime import datetime
-
             # Ensure mueble.nombre is always a string
             nombre_mueble = getattr(mueble, "nombre", None)
             if not nombre_mueble:
-                nombre_mueble = tipo_mueble
-            venta = {
-                "mueble": nombre_mueble,
-                "cliente": cliente,
-                "precio_original": precio_original,
-                "descuento": descuento_aplicado * 100,
-                "precio_final": round(precio_final, 2),
-                "fecha": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            }
-            self._ventas_realizadas.append(venta)
-            self._inventario.remove(mueble)
+                nombre_mueble = type(mueble).__name__
+            venta = self._ventas_realizadas.registrar(
+                nombre_mueble,
+                cliente,
+                precio_original,
+                descuento_aplicado,
+                round(precio_final, 2),
+                marca_tiempo,
+                cantidad,
+            )
+            self._inventario.retirar(mueble, cantidad)
             # Acumulativos
-            self._total_muebles_vendidos += 1
-            self._valor_total_ventas += venta["precio_final"]
-            return venta
+            self._total_muebles_vendidos += cantidad
+            self._valor_total_ventas += venta.total
+            return venta.a_dict()
         except Exception as e:
             return {"error": f"Error al procesar la venta: {str(e)}"}
 
+    def realizar_ventas_lote(
+        self, items: Iterable["Mueble"], cliente: str = "Cliente Anónimo"
+    ) -> Dict:
+        """
+        Procesa la venta de varios muebles en una sola operación.
+
+        La venta es todo o nada: primero se validan todas las líneas
+        (disponibilidad, contando las repeticiones del mismo objeto contra
+        sus unidades, y precio) y solo si todas son válidas se quitan del inventario en una
+        única pasada. El descuento de cada línea se resuelve en las tablas
+        compiladas del motor de descuentos.
+
+        Args:
+            items: Muebles a vender (un objeto repetido vende varias unidades)
+            cliente: Nombre del cliente
+        Returns:
+            Dict: Comprobante único del lote o error (sin cambios en inventario)
+        """
+        items = list(items)
+        if not items:
+            return {"error": "El lote no contiene muebles"}
+
+        pedidos: Dict[int, int] = {}
+        no_disponibles = []
+        for mueble in items:
+            clave = id(mueble)
+            pedidos[clave] = pedidos.get(clave, 0) + 1
+            if pedidos[clave] > self._inventario.existencias(mueble):
+                no_disponibles.append(mueble)
+        if no_disponibles:
+            return {
+                "error": "Hay muebles del lote que no están disponibles en inventario",
+                "no_disponibles": no_disponibles,
+            }
+
+        descuentos = self._descuentos
+        marca_tiempo = datetime.now().timestamp()
+        lineas = []
+        try:
+            for mueble in items:
+                precio_original = mueble.calcular_precio()
+                descuento = descuentos.descuento(mueble, precio_original, marca_tiempo)
+                lineas.append(
+                    (
+                        getattr(mueble, "nombre", None) or type(mueble).__name__,
+                        precio_original,
+                        descuento,
+                        round(precio_original * (1 - descuento), 2),
+                    )
+                )
+        except Exception as e:
+            return {"error": f"Error al procesar la venta: {str(e)}"}
+
+        self._inventario.quitar_lote(items)
+        lineas = [
+            venta.a_dict()
+            for venta in self._ventas_realizadas.registrar_varios(
+                lineas, cliente, marca_tiempo
+            )
+        ]
+        subtotal = round(sum(linea["precio_original"] for linea in lineas), 2)
+        total = round(sum(linea["precio_final"] for linea in lineas), 2)
+        self._total_muebles_vendidos += len(lineas)
+        self._valor_total_ventas += total
+        return {
+            "cliente": cliente,
+            "fecha": lineas[0]["fecha"],
+            "cantidad": len(lineas),
+            "lineas": lineas,
+            "subtotal": subtotal,
+            "descuento_total": round(subtotal - total, 2),
+            "total": total,
+        }
+
+    def obtener_ventas(
+        self, desde: Optional[datetime] = None, hasta: Optional[datetime] = None
+    ) -> Iterator[Venta]:
+        """
+        Recorre las ventas realizadas, opcionalmente en un rango de fechas.
+        Las ventas volcadas a disco se leen a medida que se consumen.
+
+        Args:
+            desde: Fecha mínima (inclusiva, None = sin límite)
+            hasta: Fecha máxima (inclusiva, None = sin límite)
+        Returns:
+            Iterator[Venta]: Ventas en orden cronológico
+        """
+        return self._ventas_realizadas.entre(
+            desde.timestamp() if desde is not None else None,
+            hasta.timestamp() if hasta is not None else None,
+        )
+
+    def exportar_inventario(self, ruta: str, formato: str = "csv") -> int:
+        """
+        Exporta el inventario en filas de esquema fijo para análisis.
+
+        Args:
+            ruta: Archivo de destino (se sobrescribe)
+            formato: 'csv' o 'columnar'
+        Returns:
+            int: Cantidad de muebles exportados
+        """
+        with exportador.abrir(ruta, formato) as archivo:
+            return exportador.exportar_inventario(self, archivo, formato)
+
+    def exportar_ventas(
+        self,
+        ruta: str,
+        formato: str = "csv",
+        desde: Optional[datetime] = None,
+        hasta: Optional[datetime] = None,
+    ) -> int:
+        """
+        Exporta el historial de ventas, leyendo de disco a medida que escribe.
+
+        Args:
+            ruta: Archivo de destino (se sobrescribe)
+            formato: 'csv' o 'columnar'
+            desde: Fecha mínima (inclusiva, None = sin límite)
+            hasta: Fecha máxima (inclusiva, None = sin límite)
+        Returns:
+            int: Cantidad de ventas exportadas
+        """
+        with exportador.abrir(ruta, formato) as archivo:
+            return exportador.exportar_ventas(
+                self,
+                archivo,
+                formato,
+                desde.timestamp() if desde is not None else None,
+                hasta.timestamp() if hasta is not None else None,
+            )
+
+    def guardar_instantanea(self, ruta: str) -> int:
+        """
+        Guarda inventario, comedores, descuentos y totales de ventas en un
+        archivo binario (ver services.instantanea).
+
+        Args:
+            ruta: Archivo de destino
+        Returns:
+            int: Cantidad de muebles guardados
+        """
+        return instantanea.guardar(self, ruta)
+
+    @classmethod
+    def desde_instantanea(cls, ruta: str, **kwargs) -> "TiendaMuebles":
+        """
+        Crea una tienda a partir de una instantánea confiable.
+        Los muebles no pasan por sus constructores ni se recalculan precios.
+
+        Args:
+            ruta: Archivo generado por guardar_instantanea
+            **kwargs: Argumentos para el constructor de la tienda
+        Returns:
+            TiendaMuebles: Tienda cargada
+        """
+        return instantanea.cargar(ruta, cls(**kwargs))
+
     def _contar_tipos_muebles(self) -> Dict[str, int]:
         """
         Cuenta cuántos muebles hay de cada tipo.
@@ -370,13 +768,7 @@ class TiendaMuebles:
         Returns:
             Dict[str, int]: Diccionario con el conteo por tipo
         """
-        # TODO: Implementar conteo por tipos
-        # conteo = {}
-        # for mueble in self._inventario:
-        #     tipo = type(mueble).__name__
-        #     conteo[tipo] = conteo.get(tipo, 0) + 1
-        # return conteo
-        pass
+        return self._inventario.estadisticas.por_tipo
 
     def generar_reporte_inventario(self) -> str:
         """
@@ -391,7 +783,8 @@ class TiendaMuebles:
         reporte = f"=== REPORTE DE INVENTARIO - {nombre_tienda} ===\n\n"
         reporte += f"Total de muebles: {estadisticas.get('total_muebles', 0)}\n"
         reporte += f"Total de comedores: {estadisticas.get('total_comedores', 0)}\n"
-        reporte += f"Valor total del inventario: ${estadisticas.get('valor_inventario', 0):.2f}\n\n"
+        reporte += f"Valor total del inventario: ${estadisticas.get('valor_inventario', 0):.2f}\n"
+        reporte += f"Valor con descuentos: ${estadisticas.get('valor_inventario_con_descuentos', 0):.2f}\n\n"
         reporte += "DISTRIBUCIÓN POR TIPOS:\n"
         tipos = estadisticas.get("tipos_muebles", {}) or {}
         for tipo, cantidad in tipos.items():
@@ -402,3 +795,81 @@ class TiendaMuebles:
             for categoria, descuento in descuentos.items():
                 reporte += f"- {categoria}: {descuento * 100:.1f}%\n"
         return reporte
+
+
+_SIN_MUEBLE = "El mueble no puede ser None"
+_PRECIO_INVALIDO = "El mueble debe tener un precio válido mayor a 0"
+
+
+def _validar_precios(muebles: List["Mueble"]) -> tuple:
+    """
+    Calcula el precio de cada mueble y separa los válidos de los rechazados.
+
+    Returns:
+        tuple: (muebles válidos, sus precios, rechazos con índice y error)
+    """
+    validos = []
+    precios = []
+    rechazados = []
+    for indice, mueble in enumerate(muebles):
+        if mueble is None:
+            rechazados.append({"indice": indice, "error": _SIN_MUEBLE})
+            continue
+        try:
+            precio = mueble.calcular_precio()
+        except Exception as e:
+            error = f"Error al calcular precio del mueble: {e}"
+            rechazados.append({"indice": indice, "error": error})
+            continue
+        if not precio_valido(precio):
+            rechazados.append({"indice": indice, "error": _PRECIO_INVALIDO})
+            continue
+        validos.append(mueble)
+        precios.append(precio)
+    return validos, precios, rechazados
+
+
+def _validar_precios_dados(muebles: List["Mueble"], precios) -> tuple:
+    """
+    Valida con NumPy precios ya calculados (finitos y mayores a 0).
+
+    Returns:
+        tuple: (muebles válidos, sus precios, rechazos con índice y error)
+    Raises:
+        ValueError: Si la cantidad de precios no coincide con la de muebles
+    """
+    # NumPy se importa solo aquí para no demorar el arranque
+    import numpy as np
+
+    if not isinstance(precios, np.ndarray):
+        precios = list(precios)
+    try:
+        arreglo = np.asarray(precios, dtype=float)
+    except (TypeError, ValueError, OverflowError):
+        # Un valor no convertible (o un entero enorme) se rechaza como NaN
+        arreglo = np.array([_real_o_nan(p) for p in precios], dtype=float)
+    if arreglo.shape != (len(muebles),):
+        raise ValueError(
+            f"Se esperaban {len(muebles)} precios y se recibieron {arreglo.size}"
+        )
+    mascara = np.isfinite(arreglo) & (arreglo > 0)
+    mascara &= np.fromiter((m is not None for m in muebles), bool, len(muebles))
+    rechazados = [
+        {
+            "indice": int(indice),
+            "error": _SIN_MUEBLE if muebles[indice] is None else _PRECIO_INVALIDO,
+        }
+        for indice in np.flatnonzero(~mascara)
+    ]
+    validos = muebles
+    if rechazados:
+        validos = [m for m, valido in zip(muebles, mascara.tolist()) if valido]
+    return validos, arreglo[mascara].tolist(), rechazados
+
+
+def _real_o_nan(precio) -> float:
+    """Convierte el precio a float, o retorna NaN si no se puede."""
+    try:
+        return float(precio)
+    except (TypeError, ValueError, OverflowError):
+        return math.nan
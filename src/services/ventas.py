@@ -0,0 +1,424 @@
+"""
+Registro de ventas de solo agregado.
+Guarda cada venta (un mueble, una o más unidades) como un registro compacto
+de esquema fijo y, al superar
+un umbral en memoria, vuelca los registros a un archivo binario que solo
+crece. El historial se recorre y consulta por fechas sin cargarlo entero.
+"""
+
+import math
+import os
+import struct
+import time
+import weakref
+from bisect import bisect_left
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# Firma al inicio de los archivos con la cantidad en cada registro; los
+# archivos sin firma (una unidad por registro) se convierten al abrirlos.
+_FIRMA = b"VENTAS\x00\x02"
+
+# Cabecera de cada registro en disco: marca de tiempo, precio original,
+# descuento (fracción), precio final (por unidad), cantidad y largo en bytes
+# de mueble y cliente.
+_CABECERA = struct.Struct("<ddddIII")
+
+# Cabecera de los archivos sin firma (sin cantidad)
+_CABECERA_ANTERIOR = struct.Struct("<ddddII")
+
+# Último segundo formateado: las ventas de un mismo segundo (un lote, o un
+# historial recorrido en orden) comparten el texto
+_ultima_fecha: Tuple[Optional[int], str] = (None, "")
+
+
+def _formatear_fecha(marca_tiempo: float) -> str:
+    """Formatea una marca de tiempo, reutilizando el último resultado."""
+    global _ultima_fecha
+    segundo = math.floor(marca_tiempo)
+    if _ultima_fecha[0] != segundo:
+        texto = datetime.fromtimestamp(segundo).isoformat(" ", "seconds")
+        _ultima_fecha = (segundo, texto)
+    return _ultima_fecha[1]
+
+
+class Venta:
+    """
+    Registro inmutable de una venta: un mueble y sus unidades vendidas.
+
+    Usa __slots__ y guarda la fecha como marca de tiempo numérica; el
+    formato de texto se arma solo al pedirlo.
+    """
+
+    __slots__ = (
+        "marca_tiempo",
+        "mueble",
+        "cliente",
+        "precio_original",
+        "descuento",
+        "precio_final",
+        "cantidad",
+    )
+
+    def __init__(
+        self,
+        marca_tiempo: float,
+        mueble: str,
+        cliente: str,
+        precio_original: float,
+        descuento: float,
+        precio_final: float,
+        cantidad: int = 1,
+    ):
+        """
+        Constructor del registro.
+
+        Args:
+            marca_tiempo: Segundos desde epoch (time.time())
+            mueble: Nombre del mueble vendido
+            cliente: Nombre del cliente
+            precio_original: Precio antes del descuento
+            descuento: Fracción de descuento aplicada (0-1)
+            precio_final: Precio cobrado por unidad
+            cantidad: Unidades vendidas
+        """
+        self.marca_tiempo = marca_tiempo
+        self.mueble = mueble
+        self.cliente = cliente
+        self.precio_original = precio_original
+        self.descuento = descuento
+        self.precio_final = precio_final
+        self.cantidad = cantidad
+
+    @property
+    def total(self) -> float:
+        """Importe cobrado por todas las unidades."""
+        return round(self.precio_final * self.cantidad, 2)
+
+    @property
+    def fecha(self) -> str:
+        """Fecha de la venta con el formato usado en los comprobantes."""
+        return _formatear_fecha(self.marca_tiempo)
+
+    def a_dict(self) -> dict:
+        """
+        Convierte el registro al diccionario que devuelve realizar_venta.
+
+        Returns:
+            dict: Datos de la venta con el descuento en porcentaje (precios
+                por unidad; con cantidad > 1 se agregan 'cantidad' y 'total')
+        """
+        datos = {
+            "mueble": self.mueble,
+            "cliente": self.cliente,
+            "precio_original": self.precio_original,
+            "descuento": self.descuento * 100,
+            "precio_final": self.precio_final,
+            "fecha": self.fecha,
+        }
+        if self.cantidad > 1:
+            datos["cantidad"] = self.cantidad
+            datos["total"] = self.total
+        return datos
+
+    def empaquetar(self) -> bytes:
+        """Serializa el registro en el formato binario del archivo."""
+        mueble = self.mueble.encode("utf-8")
+        cliente = self.cliente.encode("utf-8")
+        return (
+            _CABECERA.pack(
+                self.marca_tiempo,
+                self.precio_original,
+                self.descuento,
+                self.precio_final,
+                self.cantidad,
+                len(mueble),
+                len(cliente),
+            )
+            + mueble
+            + cliente
+        )
+
+    def __repr__(self) -> str:
+        """Representación técnica del registro."""
+        return (
+            f"Venta(mueble='{self.mueble}', cliente='{self.cliente}', "
+            f"precio_final={self.precio_final}, cantidad={self.cantidad}, "
+            f"fecha='{self.fecha}')"
+        )
+
+
+class RegistroVentas:
+    """
+    Libro de ventas de solo agregado con volcado a disco.
+
+    Las ventas nuevas se acumulan en memoria; al llegar a limite_memoria se
+    escriben al final del archivo y se liberan. Por cada bloque volcado se
+    guarda un índice disperso (marca de tiempo inicial, posición en el
+    archivo), de modo que una consulta por fechas salta directamente al
+    primer bloque relevante y lee de a un registro.
+
+    Las marcas de tiempo nunca retroceden (si el reloj lo hace, se repite
+    la última), lo que mantiene el archivo ordenado por fecha. La cantidad
+    de ventas cuenta registros, no unidades.
+    """
+
+    def __init__(self, ruta: Optional[str] = None, limite_memoria: int = 10000):
+        """
+        Constructor del registro vacío.
+
+        Args:
+            ruta: Archivo donde volcar las ventas (None = archivo temporal
+                creado en el primer volcado y borrado al cerrar o al
+                liberar el registro). Si ya
+                existe, se continúa el historial que contiene.
+            limite_memoria: Cantidad de ventas en memoria antes de volcar
+        """
+        if limite_memoria < 1:
+            raise ValueError("El límite en memoria debe ser mayor a 0")
+        self._ruta = ruta
+        self._limite = limite_memoria
+        self._pendientes: List[Venta] = []
+        self._en_disco = 0
+        self._tamaño_archivo = 0
+        self._bloques: List[Tuple[float, int]] = []
+        self._ultima_marca = 0.0
+        self._borrar_temporal = None
+        if ruta is not None and os.path.exists(ruta):
+            self._cargar_existente()
+
+    def __len__(self) -> int:
+        """Retorna la cantidad total de ventas registradas."""
+        return self._en_disco + len(self._pendientes)
+
+    def __iter__(self) -> Iterator[Venta]:
+        """Recorre todas las ventas en orden cronológico."""
+        return self.entre()
+
+    @property
+    def ruta(self) -> Optional[str]:
+        """Archivo de volcado (None si todavía no se volcó nada)."""
+        return self._ruta
+
+    @property
+    def en_disco(self) -> int:
+        """Cantidad de ventas ya volcadas al archivo."""
+        return self._en_disco
+
+    def registrar(
+        self,
+        mueble: str,
+        cliente: str,
+        precio_original: float,
+        descuento: float,
+        precio_final: float,
+        marca_tiempo: Optional[float] = None,
+        cantidad: int = 1,
+    ) -> Venta:
+        """
+        Agrega una venta al registro.
+
+        Args:
+            mueble: Nombre del mueble vendido
+            cliente: Nombre del cliente
+            precio_original: Precio antes del descuento
+            descuento: Fracción de descuento (0-1)
+            precio_final: Precio cobrado por unidad
+            marca_tiempo: Momento de la venta (None = ahora)
+            cantidad: Unidades vendidas
+        Returns:
+            Venta: Registro creado
+        Raises:
+            ValueError: Si la cantidad no es un entero mayor a 0
+        """
+        if isinstance(cantidad, bool) or not isinstance(cantidad, int) or cantidad < 1:
+            raise ValueError("La cantidad debe ser un entero mayor a 0")
+        if marca_tiempo is None:
+            marca_tiempo = time.time()
+        marca_tiempo = max(marca_tiempo, self._ultima_marca)
+        self._ultima_marca = marca_tiempo
+        venta = Venta(
+            marca_tiempo,
+            str(mueble),
+            str(cliente),
+            float(precio_original),
+            float(descuento),
+            float(precio_final),
+            cantidad,
+        )
+        self._pendientes.append(venta)
+        if len(self._pendientes) >= self._limite:
+            self.volcar()
+        return venta
+
+    def registrar_varios(
+        self,
+        lineas: Iterable[Tuple[str, float, float, float]],
+        cliente: str,
+        marca_tiempo: Optional[float] = None,
+    ) -> List[Venta]:
+        """
+        Agrega de una vez las ventas de un lote, con un mismo cliente y una
+        misma marca de tiempo (una unidad por línea).
+
+        Args:
+            lineas: Tuplas (mueble, precio original, descuento, precio final)
+            cliente: Nombre del cliente
+            marca_tiempo: Momento del lote (None = ahora)
+        Returns:
+            List[Venta]: Registros creados, en el orden de las líneas
+        """
+        if marca_tiempo is None:
+            marca_tiempo = time.time()
+        marca_tiempo = max(marca_tiempo, self._ultima_marca)
+        self._ultima_marca = marca_tiempo
+        cliente = str(cliente)
+        ventas = [
+            Venta(
+                marca_tiempo,
+                str(mueble),
+                cliente,
+                float(original),
+                float(descuento),
+                float(final),
+            )
+            for mueble, original, descuento, final in lineas
+        ]
+        self._pendientes.extend(ventas)
+        if len(self._pendientes) >= self._limite:
+            self.volcar()
+        return ventas
+
+    def volcar(self) -> None:
+        """Escribe las ventas en memoria al final del archivo."""
+        if not self._pendientes:
+            return
+        if self._ruta is None:
+            # tempfile se importa recién aquí: cuesta varios ms al arrancar
+            # y solo se usa en el primer volcado sin ruta
+            import tempfile
+
+            descriptor, self._ruta = tempfile.mkstemp(prefix="ventas_", suffix=".bin")
+            os.close(descriptor)
+            self._borrar_temporal = weakref.finalize(self, _borrar, self._ruta)
+        datos = b"".join(venta.empaquetar() for venta in self._pendientes)
+        with open(self._ruta, "ab") as archivo:
+            if self._tamaño_archivo == 0:
+                archivo.write(_FIRMA)
+                self._tamaño_archivo = len(_FIRMA)
+            archivo.write(datos)
+        self._bloques.append((self._pendientes[0].marca_tiempo, self._tamaño_archivo))
+        self._tamaño_archivo += len(datos)
+        self._en_disco += len(self._pendientes)
+        self._pendientes = []
+
+    def entre(
+        self, desde: Optional[float] = None, hasta: Optional[float] = None
+    ) -> Iterator[Venta]:
+        """
+        Genera las ventas con marca de tiempo en el rango inclusivo.
+
+        Args:
+            desde: Marca de tiempo mínima (None = sin límite)
+            hasta: Marca de tiempo máxima (None = sin límite)
+        Returns:
+            Iterator[Venta]: Ventas en orden cronológico
+        """
+        if self._bloques:
+            yield from self._leer_disco(desde, hasta)
+        for venta in self._pendientes:
+            if hasta is not None and venta.marca_tiempo > hasta:
+                return
+            if desde is None or venta.marca_tiempo >= desde:
+                yield venta
+
+    def cerrar(self) -> None:
+        """
+        Borra el archivo de volcado si es temporal.
+        El registro no debe usarse después de cerrarlo.
+        """
+        if self._borrar_temporal is not None:
+            self._borrar_temporal()
+
+    def _cargar_existente(self) -> None:
+        """Reconstruye el conteo y el índice disperso de un archivo previo."""
+        self._tamaño_archivo = os.path.getsize(self._ruta)
+        if self._tamaño_archivo == 0:
+            return
+        with open(self._ruta, "rb") as archivo:
+            firma = archivo.read(len(_FIRMA))
+        if firma != _FIRMA:
+            self._convertir_anterior()
+        for inicio, venta in self._recorrer_archivo(len(_FIRMA)):
+            if self._en_disco % self._limite == 0:
+                self._bloques.append((venta.marca_tiempo, inicio))
+            self._en_disco += 1
+            self._ultima_marca = venta.marca_tiempo
+
+    def _convertir_anterior(self) -> None:
+        """
+        Reescribe un archivo sin firma (una unidad por registro) en el
+        formato actual, reemplazándolo al terminar.
+        """
+        temporal = self._ruta + ".tmp"
+        with open(self._ruta, "rb") as origen, open(temporal, "wb") as destino:
+            destino.write(_FIRMA)
+            datos = origen.read(_CABECERA_ANTERIOR.size)
+            while datos:
+                marca, original, descuento, final, largo_m, largo_c = (
+                    _CABECERA_ANTERIOR.unpack(datos)
+                )
+                destino.write(
+                    _CABECERA.pack(
+                        marca, original, descuento, final, 1, largo_m, largo_c
+                    )
+                )
+                destino.write(origen.read(largo_m + largo_c))
+                datos = origen.read(_CABECERA_ANTERIOR.size)
+        os.replace(temporal, self._ruta)
+        self._tamaño_archivo = os.path.getsize(self._ruta)
+
+    def _leer_disco(
+        self, desde: Optional[float], hasta: Optional[float]
+    ) -> Iterator[Venta]:
+        """Lee del archivo desde el primer bloque que puede contener 'desde'."""
+        posicion = len(_FIRMA)
+        if desde is not None:
+            # Varios bloques pueden empezar con la misma marca (ventas en lote):
+            # se arranca en el anterior al primero con marca >= desde.
+            marcas = [marca for marca, _ in self._bloques]
+            bloque = max(bisect_left(marcas, desde) - 1, 0)
+            posicion = self._bloques[bloque][1]
+        for _, venta in self._recorrer_archivo(posicion):
+            if hasta is not None and venta.marca_tiempo > hasta:
+                return
+            if desde is None or venta.marca_tiempo >= desde:
+                yield venta
+
+    def _recorrer_archivo(self, posicion: int) -> Iterator[Tuple[int, Venta]]:
+        """Genera (posición, venta) leyendo el archivo de a un registro."""
+        fin = self._tamaño_archivo
+        with open(self._ruta, "rb") as archivo:
+            archivo.seek(posicion)
+            while posicion < fin:
+                marca, original, descuento, final, cantidad, largo_m, largo_c = (
+                    _CABECERA.unpack(archivo.read(_CABECERA.size))
+                )
+                textos = archivo.read(largo_m + largo_c)
+                venta = Venta(
+                    marca,
+                    textos[:largo_m].decode("utf-8"),
+                    textos[largo_m:].decode("utf-8"),
+                    original,
+                    descuento,
+                    final,
+                    cantidad,
+                )
+                yield posicion, venta
+                posicion += _CABECERA.size + largo_m + largo_c
+
+
+def _borrar(ruta: str) -> None:
+    """Borra un archivo si todavía existe."""
+    if os.path.exists(ruta):
+        os.remove(ruta)
@@ -0,0 +1,82 @@
+"""
+Medición de la latencia de las acciones del menú durante la sesión.
+"""
+
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+# Muestras guardadas por acción (las más viejas se descartan)
+MAXIMO_MUESTRAS = 1000
+
+
+class RegistroLatencias:
+    """
+    Guarda la duración de cada acción y calcula percentiles.
+
+    Los percentiles usan el método del rango más cercano sobre las últimas
+    MAXIMO_MUESTRAS mediciones de cada acción.
+    """
+
+    def __init__(self, maximo_muestras: int = MAXIMO_MUESTRAS):
+        """
+        Constructor del registro vacío.
+
+        Args:
+            maximo_muestras: Mediciones guardadas por acción
+        """
+        self._maximo = max(maximo_muestras, 1)
+        self._muestras: Dict[str, Deque[float]] = {}
+
+    def registrar(self, accion: str, segundos: float) -> None:
+        """
+        Agrega una medición.
+
+        Args:
+            accion: Nombre de la acción medida
+            segundos: Duración en segundos
+        """
+        muestras = self._muestras.get(accion)
+        if muestras is None:
+            muestras = self._muestras[accion] = deque(maxlen=self._maximo)
+        muestras.append(segundos)
+
+    def acciones(self) -> List[str]:
+        """Retorna las acciones medidas, en orden de primera medición."""
+        return list(self._muestras)
+
+    def percentil(self, porcentaje: float, accion: Optional[str] = None) -> float:
+        """
+        Calcula un percentil de las duraciones.
+
+        Args:
+            porcentaje: Percentil a calcular (0-100)
+            accion: Acción a considerar (None = todas las de la sesión)
+        Returns:
+            float: Duración en segundos (0.0 si no hay mediciones)
+        """
+        muestras = sorted(self._seleccionar(accion))
+        if not muestras:
+            return 0.0
+        rango = -(-porcentaje * len(muestras) // 100)
+        return muestras[min(max(int(rango), 1), len(muestras)) - 1]
+
+    def resumen(self, accion: Optional[str] = None) -> dict:
+        """
+        Resume las mediciones de una acción o de toda la sesión.
+
+        Returns:
+            dict: Cantidad de mediciones, última, p50 y p95 (en segundos)
+        """
+        muestras = self._seleccionar(accion)
+        return {
+            "mediciones": len(muestras),
+            "ultima": muestras[-1] if muestras else 0.0,
+            "p50": self.percentil(50, accion),
+            "p95": self.percentil(95, accion),
+        }
+
+    def _seleccionar(self, accion: Optional[str]) -> List[float]:
+        """Mediciones de la acción, o todas si accion es None."""
+        if accion is not None:
+            return list(self._muestras.get(accion, ()))
+        return [s for muestras in self._muestras.values() for s in muestras]
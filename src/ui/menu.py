@@ -3,7 +3,9 @@ Interfaz de usuario usando Rich para crear un menú interactivo y atractivo.
 """
 
 import time
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as TiempoAgotado
+from typing import Callable, List, Optional
 
 from rich.console import Console
 from rich.panel import Panel
@@ -14,6 +16,20 @@ from rich.text import Text
 # Corrección de imports para ejecución directa
 from models.mueble import Mueble
 from services.tienda import TiendaMuebles
+from ui.latencias import RegistroLatencias
+from ui.paginacion import CAMPOS_FILA, TAMAÑO_PAGINA, CacheFilas, Paginador
+
+# Segundos de trabajo antes de mostrar el indicador de espera
+UMBRAL_INDICADOR = 0.15
+
+# Encabezado y estilo de cada campo de las tablas de muebles
+_COLUMNAS = {
+    "nombre": ("Nombre", "magenta"),
+    "tipo": ("Tipo", "green"),
+    "material": ("Material", "yellow"),
+    "color": ("Color", "blue"),
+    "precio": ("Precio", "red"),
+}
 
 
 class MenuTienda:
@@ -33,66 +49,64 @@ class MenuTienda:
     - Composición: Usa una instancia de TiendaMuebles para las operaciones
     """
 
-    def __init__(self, tienda: "TiendaMuebles"):
+    def __init__(self, tienda: "TiendaMuebles", mostrar_latencias: bool = False):
         """
         Constructor del menú.
 
         Args:
             tienda: Instancia de TiendaMuebles para las operaciones
+            mostrar_latencias: Si True, muestra después de cada acción un pie
+                con su duración y los percentiles p50/p95 de la sesión
         """
         # Inicializar atributos
         self.tienda = tienda
         self.console = Console()
         self.running = True
+        self.mostrar_latencias = mostrar_latencias
+        # Filas ya formateadas, compartidas por todas las tablas de muebles
+        self._filas = CacheFilas()
+        self._latencias = RegistroLatencias()
+        self._ultima_accion: Optional[str] = None
+        self._ejecutor: Optional[ThreadPoolExecutor] = None
 
     def mostrar_catalogo_completo(self):
-        """Muestra todos los muebles disponibles en una tabla."""
+        """Muestra todos los muebles disponibles en una tabla paginada."""
 
-        # Implementar visualización del catálogo
-        muebles = self.tienda._inventario  # Acceso directo para el ejemplo
+        muebles = self._trabajar(
+            "catálogo", "Cargando catálogo...", self.tienda.listar_inventario
+        )
 
         if not muebles:
             self.console.print("[yellow]No hay muebles en el inventario.[/yellow]")
             return
 
-        table = Table(title="📋 Catálogo de Muebles")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Nombre", style="magenta")
-        table.add_column("Tipo", style="green")
-        table.add_column("Material", style="yellow")
-        table.add_column("Color", style="blue")
-        table.add_column("Precio", style="red", justify="right")
-
-        for i, mueble in enumerate(muebles, 1):
-            try:
-                precio = f"${mueble.calcular_precio():.2f}"
-                tipo = type(mueble).__name__
-                table.add_row(
-                    str(i), mueble.nombre, tipo, mueble.material, mueble.color, precio
-                )
-            except Exception:
-                table.add_row(str(i), mueble.nombre, "Error", "-", "-", "Error")
-
-        self.console.print(table)
+        self._mostrar_paginado(
+            muebles,
+            ("nombre", "tipo", "material", "color", "precio"),
+            titulo="📋 Catálogo de Muebles",
+            columna_numero="ID",
+        )
 
     def buscar_muebles_interactivo(self):
         """Interfaz interactiva para buscar muebles."""
 
         termino_busqueda = Prompt.ask(
-            "[green]Ingresa el nombre o parte del nombre a buscar[/green]"
+            "[green]Ingresa qué buscar (nombre, material, color o tipo)[/green]"
         )
 
         if not termino_busqueda.strip():
             self.console.print("[red]Término de búsqueda vacío.[/red]")
             return
 
-        with self.console.status("[bold green]Buscando muebles..."):
-            time.sleep(0.5)  # Simular tiempo de búsqueda
-            resultados = self.tienda.buscar_muebles_por_nombre(termino_busqueda)
+        resultados = self._trabajar(
+            "búsqueda",
+            "Buscando muebles...",
+            lambda: self.tienda.buscar(termino_busqueda, limite=20),
+        )
 
         if not resultados:
             self.console.print(
-                f"[yellow]No se encontraron muebles que contengan '{termino_busqueda}'.[/yellow]"
+                f"[yellow]No se encontraron muebles para '{termino_busqueda}'.[/yellow]"
             )
             return
 
@@ -121,9 +135,11 @@ class MenuTienda:
             )
             return
 
-        with self.console.status("[bold green]Filtrando muebles..."):
-            time.sleep(0.3)
-            resultados = self.tienda.filtrar_por_precio(precio_min, precio_max)
+        resultados = self._trabajar(
+            "filtro por precio",
+            "Filtrando muebles...",
+            lambda: self.tienda.filtrar_por_precio(precio_min, precio_max),
+        )
 
         if not resultados:
             self.console.print(
@@ -147,9 +163,11 @@ class MenuTienda:
             self.console.print("[red]Material no puede estar vacío.[/red]")
             return
 
-        with self.console.status(f"[bold green]Buscando muebles de {material}..."):
-            time.sleep(0.3)
-            resultados = self.tienda.filtrar_por_material(material)
+        resultados = self._trabajar(
+            "filtro por material",
+            f"Buscando muebles de {material}...",
+            lambda: self.tienda.filtrar_por_material(material),
+        )
 
         if not resultados:
             self.console.print(
@@ -177,7 +195,9 @@ class MenuTienda:
     def realizar_venta_interactiva(self):
         """Interfaz interactiva para realizar ventas."""
 
-        muebles = self.tienda._inventario
+        muebles = self._trabajar(
+            "listado de venta", "Cargando inventario...", self.tienda.listar_inventario
+        )
 
         if not muebles:
             self.console.print("[red]No hay muebles disponibles para venta.[/red]")
@@ -187,10 +207,9 @@ class MenuTienda:
         self._mostrar_lista_muebles(muebles, numerada=True)
 
         try:
-            indice = IntPrompt.ask(
-                "Número del mueble",
-                choices=[str(i) for i in range(1, len(muebles) + 1)],
-            )
+            indice = IntPrompt.ask(f"Número del mueble (1-{len(muebles)})")
+            if not 1 <= indice <= len(muebles):
+                raise IndexError(indice)
 
             mueble_seleccionado = muebles[indice - 1]
 
@@ -205,7 +224,11 @@ class MenuTienda:
 
             cliente = Prompt.ask("Nombre del cliente", default="Cliente Anónimo")
 
-            resultado = self.tienda.realizar_venta(mueble_seleccionado, cliente)
+            resultado = self._trabajar(
+                "registro de venta",
+                "Registrando venta...",
+                lambda: self.tienda.realizar_venta(mueble_seleccionado, cliente),
+            )
 
             if "error" in resultado:
                 self.console.print(f"[red]Error: {resultado['error']}[/red]")
@@ -218,11 +241,13 @@ class MenuTienda:
     def mostrar_estadisticas(self):
         """Muestra las estadísticas de la tienda."""
 
-        with self.console.status("[bold green]Calculando estadísticas..."):
-            time.sleep(0.5)
-            stats = self.tienda.obtener_estadisticas()
-            if not isinstance(stats, dict):
-                stats = {}
+        stats = self._trabajar(
+            "estadísticas",
+            "Calculando estadísticas...",
+            self.tienda.obtener_estadisticas,
+        )
+        if not isinstance(stats, dict):
+            stats = {}
         table = Table(title="📊 Estadísticas de la Tienda")
         table.add_column("Métrica", style="cyan", no_wrap=True)
         table.add_column("Valor", style="magenta", justify="right")
@@ -231,6 +256,10 @@ class MenuTienda:
         table.add_row(
             "Valor del inventario", f"${stats.get('valor_inventario', 0):.2f}"
         )
+        table.add_row(
+            "Valor con descuentos",
+            f"${stats.get('valor_inventario_con_descuentos', 0):.2f}",
+        )
         table.add_row("Ventas realizadas", str(stats.get("ventas_realizadas", 0)))
         table.add_row("Descuentos activos", str(stats.get("descuentos_activos", {})))
         # Estadísticas acumulativas
@@ -252,9 +281,9 @@ class MenuTienda:
     def generar_reporte_interactivo(self):
         """Genera y muestra el reporte de inventario."""
 
-        with self.console.status("[bold green]Generando reporte..."):
-            time.sleep(1)  # Simular tiempo de generación
-            reporte = self.tienda.generar_reporte_inventario()
+        reporte = self._trabajar(
+            "reporte", "Generando reporte...", self.tienda.generar_reporte_inventario
+        )
 
         panel = Panel(
             reporte,
@@ -307,49 +336,151 @@ class MenuTienda:
                 choices=[str(i) for i in range(1, 51)],
             )
 
-            resultado = self.tienda.aplicar_descuento(categoria, porcentaje)
+            resultado = self._trabajar(
+                "descuento",
+                "Aplicando descuento...",
+                lambda: self.tienda.aplicar_descuento(categoria, porcentaje),
+            )
             self.console.print(f"[green]{resultado}[/green]")
 
         except (ValueError, IndexError):
             self.console.print("[red]Selección inválida.[/red]")
 
+    def _trabajar(self, accion: str, mensaje: str, funcion: Callable):
+        """
+        Ejecuta el trabajo de una acción y mide su duración.
+        El indicador de espera solo aparece si el trabajo supera
+        UMBRAL_INDICADOR, así las acciones rápidas no parpadean.
+
+        Args:
+            accion: Nombre de la acción para las mediciones
+            mensaje: Texto del indicador de espera
+            funcion: Trabajo a ejecutar (sin argumentos)
+        Returns:
+            El resultado de funcion
+        """
+        if self._ejecutor is None:
+            self._ejecutor = ThreadPoolExecutor(max_workers=1)
+        inicio = time.perf_counter()
+        try:
+            futuro = self._ejecutor.submit(funcion)
+            try:
+                return futuro.result(timeout=UMBRAL_INDICADOR)
+            except TiempoAgotado:
+                with self.console.status(f"[bold green]{mensaje}"):
+                    return futuro.result()
+        finally:
+            self._latencias.registrar(accion, time.perf_counter() - inicio)
+            self._ultima_accion = accion
+
+    def _mostrar_pie_latencias(self):
+        """Muestra la duración de la última acción y los percentiles de la sesión."""
+        accion = self._ultima_accion
+        if accion is None:
+            return
+        ultima = self._latencias.resumen(accion)
+        sesion = self._latencias.resumen()
+        self.console.print(
+            f"[dim]⏱ {accion}: {_ms(ultima['ultima'])} "
+            f"(p50 {_ms(ultima['p50'])}, p95 {_ms(ultima['p95'])}, "
+            f"n={ultima['mediciones']}) · sesión: p50 {_ms(sesion['p50'])}, "
+            f"p95 {_ms(sesion['p95'])}, n={sesion['mediciones']}[/dim]"
+        )
+
     def _mostrar_lista_muebles(self, muebles: List["Mueble"], numerada: bool = False):
         """
-        Muestra una lista de muebles en formato tabla.
+        Muestra una lista de muebles en formato tabla, por páginas.
         Método auxiliar privado.
 
         Args:
             muebles: Lista de muebles a mostrar
             numerada: Si incluir números para selección
         """
+        self._mostrar_paginado(
+            muebles,
+            ("nombre", "tipo", "material", "precio"),
+            columna_numero="#" if numerada else None,
+        )
 
-        table = Table()
-
-        if numerada:
-            table.add_column("#", style="cyan", no_wrap=True)
-
-        table.add_column("Nombre", style="magenta")
-        table.add_column("Tipo", style="green")
-        table.add_column("Material", style="yellow")
-        table.add_column("Precio", style="red", justify="right")
-
-        for i, mueble in enumerate(muebles, 1):
-            try:
-                precio = f"${mueble.calcular_precio():.2f}"
-                tipo = type(mueble).__name__
-
-                row_data = [mueble.nombre, tipo, mueble.material, precio]
-                if numerada:
-                    row_data.insert(0, str(i))
+    def _mostrar_paginado(
+        self,
+        muebles: List["Mueble"],
+        columnas: tuple,
+        titulo: Optional[str] = None,
+        columna_numero: Optional[str] = None,
+    ):
+        """
+        Muestra los muebles de a una página y permite navegar entre páginas.
+        Solo se formatean (y se calcula el precio de) las filas visibles.
 
-                table.add_row(*row_data)
-            except Exception:
-                row_data = [mueble.nombre, "Error", mueble.material, "Error"]
-                if numerada:
-                    row_data.insert(0, str(i))
-                table.add_row(*row_data)
+        Args:
+            muebles: Lista de muebles a mostrar
+            columnas: Campos de CAMPOS_FILA a mostrar, en orden
+            titulo: Título de la tabla
+            columna_numero: Encabezado de la columna de posición (None = sin ella)
+        """
+        paginador = Paginador(len(muebles), TAMAÑO_PAGINA)
+        while True:
+            self.console.print(
+                self._tabla_pagina(muebles, paginador, columnas, titulo, columna_numero)
+            )
+            if paginador.total_paginas == 1:
+                return
+            accion = (
+                Prompt.ask(
+                    "[cyan][s]iguiente, [a]nterior, número de página "
+                    "o Enter para terminar[/cyan]",
+                    default="",
+                    show_default=False,
+                )
+                .strip()
+                .lower()
+            )
+            if not accion:
+                return
+            if accion == "s":
+                paginador.siguiente()
+            elif accion == "a":
+                paginador.anterior()
+            elif accion.isdigit():
+                paginador.ir_a(int(accion))
+            else:
+                self.console.print("[red]Opción inválida.[/red]")
+
+    def _tabla_pagina(
+        self,
+        muebles: List["Mueble"],
+        paginador: Paginador,
+        columnas: tuple,
+        titulo: Optional[str],
+        columna_numero: Optional[str],
+    ) -> Table:
+        """Arma la tabla de la página actual usando el caché de filas."""
+        table = Table(title=titulo)
+        if paginador.total_paginas > 1:
+            table.caption = (
+                f"Página {paginador.pagina} de {paginador.total_paginas} "
+                f"({paginador.total} muebles)"
+            )
+        if columna_numero:
+            table.add_column(columna_numero, style="cyan", no_wrap=True)
+        posiciones = [CAMPOS_FILA.index(campo) for campo in columnas]
+        for campo in columnas:
+            encabezado, estilo = _COLUMNAS[campo]
+            table.add_column(
+                encabezado,
+                style=estilo,
+                justify="right" if campo == "precio" else "left",
+            )
 
-        self.console.print(table)
+        inicio, fin = paginador.rango()
+        for posicion in range(inicio, fin):
+            fila = self._filas.fila(muebles[posicion])
+            valores = [fila[i] for i in posiciones]
+            if columna_numero:
+                valores.insert(0, str(posicion + 1))
+            table.add_row(*valores)
+        return table
 
     def _mostrar_comprobante_venta(self, venta: dict):
         """
@@ -413,6 +544,10 @@ class MenuTienda:
                 elif opcion == 9:
                     self.aplicar_descuentos_interactivo()
 
+                if self.mostrar_latencias:
+                    self._mostrar_pie_latencias()
+                self._ultima_accion = None
+
                 if self.running:
                     input("\nPresiona Enter para continuar...")
                     self.console.clear()
@@ -424,6 +559,10 @@ class MenuTienda:
                 self.console.print(f"[red]Error inesperado: {str(e)}[/red]")
                 input("Presiona Enter para continuar...")
 
+        if self._ejecutor is not None:
+            self._ejecutor.shutdown(wait=False)
+            self._ejecutor = None
+
     def mostrar_banner(self):
         """Muestra el banner de bienvenida de la tienda."""
 
@@ -485,3 +624,8 @@ class MenuTienda:
         except ValueError:
             self.console.print("[red]Opción inválida. Intenta de nuevo.[/red]")
             return self.mostrar_menu_principal()
+
+
+def _ms(segundos: float) -> str:
+    """Formatea una duración en milisegundos."""
+    return f"{segundos * 1000:.1f} ms"
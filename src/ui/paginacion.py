@@ -0,0 +1,136 @@
+"""
+Soporte para mostrar listas largas de muebles por páginas.
+Solo se calculan precios y textos de las filas visibles, y las filas ya
+formateadas se reutilizan mientras el mueble no cambie.
+"""
+
+from collections import OrderedDict
+from typing import Tuple
+
+# Campos de cada fila formateada, en orden
+CAMPOS_FILA = ("nombre", "tipo", "material", "color", "precio")
+
+TAMAÑO_PAGINA = 20
+
+
+class Paginador:
+    """
+    Posición dentro de una lista paginada.
+
+    Las páginas se numeran desde 1; moverse fuera del rango deja la
+    página en el extremo más cercano.
+    """
+
+    def __init__(self, total: int, tamaño_pagina: int = TAMAÑO_PAGINA):
+        """
+        Constructor del paginador en la primera página.
+
+        Args:
+            total: Cantidad de elementos de la lista
+            tamaño_pagina: Elementos por página
+        """
+        self.total = max(total, 0)
+        self.tamaño_pagina = max(tamaño_pagina, 1)
+        self.pagina = 1
+
+    @property
+    def total_paginas(self) -> int:
+        """Cantidad de páginas (al menos 1, aunque la lista esté vacía)."""
+        return max((self.total + self.tamaño_pagina - 1) // self.tamaño_pagina, 1)
+
+    def ir_a(self, pagina: int) -> int:
+        """Salta a una página y retorna la página resultante."""
+        self.pagina = min(max(pagina, 1), self.total_paginas)
+        return self.pagina
+
+    def siguiente(self) -> int:
+        """Avanza una página (si no es la última)."""
+        return self.ir_a(self.pagina + 1)
+
+    def anterior(self) -> int:
+        """Retrocede una página (si no es la primera)."""
+        return self.ir_a(self.pagina - 1)
+
+    def rango(self) -> Tuple[int, int]:
+        """Retorna las posiciones [inicio, fin) de la página actual."""
+        inicio = (self.pagina - 1) * self.tamaño_pagina
+        return inicio, min(inicio + self.tamaño_pagina, self.total)
+
+
+class CacheFilas:
+    """
+    Caché LRU de filas formateadas por objeto.
+
+    Cada fila se arma una vez (incluido el precio) y se invalida cuando el
+    mueble avisa un cambio a sus observadores. Los objetos que no heredan
+    de Mueble no avisan sus cambios, así que se formatean siempre.
+    Al descartar una fila por capacidad se quita también el observador.
+    """
+
+    def __init__(self, capacidad: int = 1000):
+        """
+        Constructor del caché vacío.
+
+        Args:
+            capacidad: Cantidad máxima de filas guardadas
+        """
+        self._capacidad = max(capacidad, 1)
+        # id(mueble) -> (mueble, fila): guardar el objeto evita que su id
+        # se reutilice mientras la fila está en el caché
+        self._filas: "OrderedDict[int, tuple]" = OrderedDict()
+        # Un único método ligado, para poder quitarlo de los observadores
+        self._observador = self._al_cambiar
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de filas guardadas."""
+        return len(self._filas)
+
+    def fila(self, mueble) -> Tuple[str, ...]:
+        """
+        Retorna la fila formateada del mueble (ver CAMPOS_FILA).
+
+        Args:
+            mueble: Mueble a formatear
+        Returns:
+            Tuple[str, ...]: Textos de la fila
+        """
+        entrada = self._filas.get(id(mueble))
+        if entrada is not None:
+            self._filas.move_to_end(id(mueble))
+            return entrada[1]
+        fila = formatear_fila(mueble)
+        agregar_observador = getattr(mueble, "agregar_observador", None)
+        if callable(agregar_observador):
+            agregar_observador(self._observador)
+            self._filas[id(mueble)] = (mueble, fila)
+            if len(self._filas) > self._capacidad:
+                _, (descartado, _) = self._filas.popitem(last=False)
+                descartado.quitar_observador(self._observador)
+        return fila
+
+    def limpiar(self) -> None:
+        """Descarta todas las filas y sus observadores."""
+        for mueble, _ in self._filas.values():
+            mueble.quitar_observador(self._observador)
+        self._filas.clear()
+
+    def _al_cambiar(self, mueble, campo: str) -> None:
+        """Observador: descarta la fila del mueble modificado."""
+        if self._filas.pop(id(mueble), None) is not None:
+            mueble.quitar_observador(self._observador)
+
+
+def formatear_fila(mueble) -> Tuple[str, ...]:
+    """
+    Formatea los campos de CAMPOS_FILA de un mueble.
+    Si el precio no se puede calcular, tipo y precio se muestran como error.
+    """
+    nombre = str(getattr(mueble, "nombre", "-"))
+    material = str(getattr(mueble, "material", "-"))
+    color = str(getattr(mueble, "color", "-"))
+    try:
+        precio = f"${mueble.calcular_precio():.2f}"
+        tipo = type(mueble).__name__
+    except Exception:
+        return (nombre, "Error", material, color, "Error")
+    return (nombre, tipo, material, color, precio)
@@ -6,6 +6,7 @@ Verifica:
 - Métodos para agregar/quitar sillas
 - Cálculo de precio total
 - Validaciones de capacidad
+- Precios guardados e invalidados por composición y cambios de componentes
 """
 
 import pytest
@@ -183,3 +184,64 @@ def test_comedor_con_mocks():
     assert precio_total == 700.0
     mesa_mock.calcular_precio.assert_called_once()
     assert silla_mock.calcular_precio.call_count == 2
+
+
+class TestComedorPreciosGuardados:
+    """Tests para los precios guardados del comedor."""
+
+    def test_resumen_y_descripcion_no_recalculan(self):
+        """Verifica que cada componente se precia una sola vez."""
+        mesa_mock = Mock()
+        mesa_mock.calcular_precio.return_value = 500.0
+        silla_mock = Mock()
+        silla_mock.calcular_precio.return_value = 100.0
+        for mock in (mesa_mock, silla_mock):
+            mock.obtener_descripcion.return_value = "Mueble"
+        comedor = Comedor("Comedor Mock", mesa_mock, [silla_mock] * 4)
+        resumen = comedor.obtener_resumen()
+        comedor.obtener_descripcion_completa()
+        comedor.calcular_precio_total()
+        assert resumen["precio_sillas"] == 400.0
+        assert resumen["precio_total"] == 855.0
+        mesa_mock.calcular_precio.assert_called_once()
+        assert silla_mock.calcular_precio.call_count == 4
+
+    def test_agregar_y_quitar_silla_invalidan(self, mesa_comedor, silla_simple):
+        """Verifica que cambiar la composición recalcula el total."""
+        comedor = Comedor("Comedor Test", mesa_comedor)
+        precio_mesa = comedor.calcular_precio_total()
+        comedor.agregar_silla(silla_simple)
+        assert comedor.obtener_resumen()["precio_sillas"] == (
+            silla_simple.calcular_precio()
+        )
+        comedor.quitar_silla()
+        assert comedor.calcular_precio_total() == precio_mesa
+
+    def test_cambio_de_componente_invalida(self, mesa_comedor, silla_simple):
+        """Verifica que un cambio de precio en un componente se refleja."""
+        comedor = Comedor("Comedor Test", mesa_comedor, [silla_simple])
+        comedor.calcular_precio_total()
+        silla_simple.precio_base += 100
+        mesa_comedor.precio_base += 50
+        assert comedor.calcular_precio_total() == round(
+            mesa_comedor.calcular_precio() + silla_simple.calcular_precio(), 2
+        )
+
+    def test_silla_quitada_deja_de_observarse(self, mesa_comedor, silla_simple):
+        """Verifica que una silla quitada ya no invalida el comedor."""
+        comedor = Comedor("Comedor Test", mesa_comedor, [silla_simple])
+        comedor.quitar_silla()
+        totales = comedor._calcular_totales()
+        silla_simple.precio_base += 100
+        assert comedor._totales is totales
+
+    def test_invalidar_precios(self):
+        """Verifica la invalidación manual para componentes sin observadores."""
+        mesa = Mock(spec=["calcular_precio"])
+        mesa.calcular_precio.return_value = 500.0
+        comedor = Comedor("Comedor Mock", mesa)
+        assert comedor.calcular_precio_total() == 500.0
+        mesa.calcular_precio.return_value = 450.0
+        assert comedor.calcular_precio_total() == 500.0
+        comedor.invalidar_precios()
+        assert comedor.calcular_precio_total() == 450.0
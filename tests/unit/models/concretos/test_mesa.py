@@ -99,3 +99,10 @@ def test_mesa_diferentes_configuraciones(forma, capacidad_personas):
         capacidad_personas,
     )
     assert mesa.capacidad_personas == capacidad_personas
+
+
+def test_cambio_de_dimensiones_invalida_precio(mesa_comedor):
+    """Verifica que modificar el largo recalcula el precio cacheado."""
+    precio_inicial = mesa_comedor.calcular_precio()
+    mesa_comedor.largo = 240
+    assert mesa_comedor.calcular_precio() > precio_inicial
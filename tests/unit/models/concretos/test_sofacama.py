@@ -101,3 +101,15 @@ def test_sofacama_diferentes_configuraciones(capacidad_personas, tamaño_cama):
     )
     assert sofacama.capacidad_personas == capacidad_personas
     assert sofacama.tamaño_cama == tamaño_cama
+
+
+def test_cache_no_mezcla_precio_de_sofa(sofacama_estandar):
+    """Verifica que el precio parcial de Sofa no queda cacheado como el del sofá-cama."""
+    from models.concretos.sofa import Sofa
+
+    precio_sofa = Sofa.calcular_precio(sofacama_estandar)
+    precio_total = sofacama_estandar.calcular_precio()
+    assert precio_total > precio_sofa
+    assert sofacama_estandar.calcular_precio() == precio_total
+    sofacama_estandar.capacidad_personas = 4
+    assert sofacama_estandar.calcular_precio() > precio_total
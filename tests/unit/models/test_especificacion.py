@@ -0,0 +1,138 @@
+"""
+Pruebas unitarias para las especificaciones compartidas (flyweight).
+
+Verifica:
+- Caché de especificaciones por argumentos y por atributos
+- Unidades que se comportan como muebles de la clase especificada
+- Atributos compartidos de solo lectura y estado propio por unidad
+- Serialización y uso en el inventario de la tienda
+"""
+
+import pickle
+import sys
+
+import pytest
+from models.categorias.asientos import Asiento
+from models.composicion.comedor import Comedor
+from models.concretos.cama import Cama
+from models.concretos.silla import Silla
+from models.concretos.sofacama import SofaCama
+from models.especificacion import (
+    EspecificacionMueble,
+    Unidad,
+    crear_unidades,
+    especificacion,
+)
+from services.tienda import TiendaMuebles
+
+
+@pytest.fixture
+def sillas():
+    """Fixture con tres unidades de un modelo de silla."""
+    return crear_unidades(Silla, 3, "Silla Pino", "Pino", "Rojo", 50)
+
+
+class TestCacheEspecificaciones:
+    """Tests para la obtención de especificaciones compartidas."""
+
+    def test_mismos_argumentos(self):
+        """Verifica que los mismos argumentos dan la misma especificación."""
+        primera = especificacion(Silla, "Silla", "Pino", "Rojo", 50)
+        assert especificacion(Silla, "Silla", "Pino", "Rojo", 50) is primera
+        assert especificacion(Silla, "Silla", "Pino", "Azul", 50) is not primera
+
+    def test_mismos_atributos(self):
+        """Verifica que argumentos equivalentes comparten la especificación."""
+        posicional = especificacion(Silla, "Silla", "Roble", "Gris", 80)
+        por_nombre = especificacion(
+            Silla, nombre="Silla", material="Roble", color="Gris", precio_base=80
+        )
+        assert por_nombre is posicional
+
+    def test_desde_mueble_copia(self, silla_simple):
+        """Verifica que modificar el mueble original no afecta la especificación."""
+        espec = EspecificacionMueble.desde_mueble(silla_simple)
+        precio = espec.precio
+        silla_simple.precio_base = 500
+        assert espec.precio == precio
+        assert espec.atributos["_precio_base"] == 50
+        assert EspecificacionMueble.desde_mueble(silla_simple) is not espec
+
+    def test_solo_muebles(self, armario_basico):
+        """Verifica el error con clases fuera de la jerarquía Mueble."""
+        with pytest.raises(TypeError):
+            EspecificacionMueble.desde_mueble(armario_basico)
+
+
+class TestUnidad:
+    """Tests para el comportamiento de las unidades."""
+
+    def test_se_comporta_como_la_clase(self, sillas):
+        """Verifica tipo, isinstance, precio y descripción."""
+        silla = Silla("Silla Pino", "Pino", "Rojo", 50)
+        unidad = sillas[0]
+        assert type(unidad).__name__ == "Silla"
+        assert isinstance(unidad, Silla) and isinstance(unidad, Asiento)
+        assert unidad.calcular_precio() == silla.calcular_precio()
+        assert unidad.obtener_descripcion() == silla.obtener_descripcion()
+        assert str(unidad) == str(silla)
+
+    def test_comparten_especificacion(self, sillas):
+        """Verifica que las unidades son distintas pero comparten el modelo."""
+        assert sillas[0] is not sillas[1]
+        assert sillas[0].especificacion is sillas[1].especificacion
+        assert sys.getsizeof(sillas[0]) < sys.getsizeof(Silla("S", "Pino", "Rojo", 1))
+
+    def test_atributos_de_solo_lectura(self, sillas):
+        """Verifica que no se pueden modificar los atributos compartidos."""
+        with pytest.raises(AttributeError):
+            sillas[0].nombre = "Otra"
+        with pytest.raises(AttributeError):
+            sillas[0].color = "Azul"
+        assert sillas[1].nombre == "Silla Pino"
+
+    def test_estado_propio(self):
+        """Verifica que el modo del sofá-cama es de cada unidad."""
+        primera, segunda = crear_unidades(SofaCama, 2, "SC", "Tela", "Gris", 900)
+        primera.convertir_a_cama()
+        assert primera.modo_actual == "cama"
+        assert segunda.modo_actual == "sofa"
+        assert isinstance(primera, Cama)
+        assert (
+            primera.calcular_precio()
+            == SofaCama("SC", "Tela", "Gris", 900).calcular_precio()
+        )
+
+    def test_pickle(self):
+        """Verifica que se conserva el estado propio y la especificación."""
+        (unidad,) = crear_unidades(SofaCama, 1, "SC", "Tela", "Gris", 900)
+        unidad.convertir_a_cama()
+        copia = pickle.loads(pickle.dumps(unidad))
+        assert isinstance(copia, Unidad)
+        assert copia.modo_actual == "cama"
+        assert copia.especificacion is unidad.especificacion
+
+
+class TestUnidadesEnTienda:
+    """Tests para unidades en el inventario y en comedores."""
+
+    def test_inventario(self, sillas, silla_simple):
+        """Verifica índices, agregados y venta de unidades."""
+        tienda = TiendaMuebles(modo_debug=True)
+        tienda.agregar_muebles(sillas + [silla_simple])
+        assert tienda.obtener_estadisticas()["tipos_muebles"] == {"Silla": 4}
+        assert tienda.obtener_muebles_por_tipo(Silla)[:3] == sillas
+        assert tienda.filtrar_por_material("pino") == sillas
+        tienda.aplicar_descuento("sillas", 10)
+        venta = tienda.realizar_venta(sillas[0])
+        assert venta["descuento"] == pytest.approx(10)
+        assert tienda.obtener_estadisticas()["total_muebles"] == 3
+
+    def test_comedor(self, mesa_comedor):
+        """Verifica el precio de un comedor con sillas que son unidades."""
+        sillas = crear_unidades(Silla, 4, "Silla Comedor", "Madera", "Roble", 100)
+        comedor = Comedor("Comedor", mesa_comedor, sillas)
+        esperado = (
+            mesa_comedor.calcular_precio() + 4 * sillas[0].calcular_precio()
+        ) * 0.95
+        assert comedor.calcular_precio_total() == round(esperado, 2)
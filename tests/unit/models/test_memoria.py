@@ -0,0 +1,44 @@
+"""
+Pruebas de la representación compacta (__slots__) de los muebles.
+
+Verifica:
+- Que ninguna clase concreta crea un __dict__ por instancia
+- Que la herencia múltiple de SofaCama conserva la relación con Cama
+"""
+
+import pytest
+from models.concretos.cama import Cama
+from models.concretos.sofa import Sofa
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    [
+        "armario_basico",
+        "cajonera_pequena",
+        "silla_simple",
+        "sillon_individual",
+        "sofa_tres_puestos",
+        "mesa_comedor",
+        "escritorio_basico",
+        "cama_king",
+        "sofacama_estandar",
+    ],
+)
+def test_instancia_sin_dict(request, fixture):
+    """Test parametrizado: las instancias no tienen __dict__."""
+    mueble = request.getfixturevalue(fixture)
+    assert not hasattr(mueble, "__dict__")
+
+
+def test_atributo_desconocido_lanza_error(silla_simple):
+    """Verifica que no se pueden agregar atributos fuera de los slots."""
+    with pytest.raises(AttributeError):
+        silla_simple.atributo_inventado = 1
+
+
+def test_sofacama_es_sofa_y_cama(sofacama_estandar):
+    """Verifica que SofaCama sigue siendo instancia de Sofa y de Cama."""
+    assert isinstance(sofacama_estandar, Sofa)
+    assert isinstance(sofacama_estandar, Cama)
+    assert sofacama_estandar.incluye_colchon is True
@@ -9,7 +9,7 @@ Verifica que:
 """
 
 import pytest
-from models.mueble import Mueble
+from models.mueble import Mueble, precio_cacheado
 
 
 class MuebleConcreto(Mueble):
@@ -22,6 +22,17 @@ class MuebleConcreto(Mueble):
         return f"Mueble: {self.nombre}"
 
 
+class MuebleConCache(MuebleConcreto):
+    """Clase concreta con precio cacheado que cuenta los cálculos reales."""
+
+    calculos = 0
+
+    @precio_cacheado
+    def calcular_precio(self) -> float:
+        MuebleConCache.calculos += 1
+        return self.precio_base * 2
+
+
 class TestMuebleInstanciacion:
     """Grupo de tests para verificar la instanciación de Mueble."""
 
@@ -236,3 +247,72 @@ def test_mueble_con_diferentes_valores(nombre, material, color, precio):
     assert mueble.material == material
     assert mueble.color == color
     assert mueble.precio_base == precio
+
+
+class TestMuebleObservadores:
+    """Grupo de tests para la notificación de cambios a observadores."""
+
+    def test_setter_notifica_al_observador(self):
+        """Verifica que un setter avisa el campo modificado."""
+        mueble = MuebleConcreto("Mesa", "Madera", "Café", 150.0)
+        cambios = []
+        mueble.agregar_observador(lambda m, campo: cambios.append((m, campo)))
+        mueble.material = "Metal"
+        mueble.precio_base = 200.0
+        assert cambios == [(mueble, "material"), (mueble, "precio_base")]
+
+    def test_quitar_observador(self):
+        """Verifica que un observador quitado ya no recibe avisos."""
+        mueble = MuebleConcreto("Mesa", "Madera", "Café", 150.0)
+        cambios = []
+
+        def observador(m, campo):
+            cambios.append(campo)
+
+        mueble.agregar_observador(observador)
+        mueble.quitar_observador(observador)
+        mueble.color = "Rojo"
+        assert cambios == []
+
+    def test_setter_invalido_no_notifica(self):
+        """Verifica que un valor inválido no genera aviso."""
+        mueble = MuebleConcreto("Mesa", "Madera", "Café", 150.0)
+        cambios = []
+        mueble.agregar_observador(lambda m, campo: cambios.append(campo))
+        with pytest.raises(ValueError):
+            mueble.nombre = ""
+        assert cambios == []
+
+
+class TestMuebleCachePrecio:
+    """Grupo de tests para el caché de calcular_precio."""
+
+    def test_segunda_llamada_usa_cache(self):
+        """Verifica que el precio se calcula una sola vez."""
+        Mueble.reiniciar_estadisticas_cache_precio()
+        MuebleConCache.calculos = 0
+        mueble = MuebleConCache("Mesa", "Madera", "Café", 100.0)
+        assert mueble.calcular_precio() == 200.0
+        assert mueble.calcular_precio() == 200.0
+        assert MuebleConCache.calculos == 1
+        stats = Mueble.estadisticas_cache_precio()
+        assert stats["aciertos"] == 1
+        assert stats["fallos"] == 1
+        assert stats["tasa_aciertos"] == 0.5
+
+    def test_setter_invalida_cache(self):
+        """Verifica que un setter obliga a recalcular el precio."""
+        mueble = MuebleConCache("Mesa", "Madera", "Café", 100.0)
+        mueble.calcular_precio()
+        mueble.precio_base = 150.0
+        assert mueble.calcular_precio() == 300.0
+
+    def test_reiniciar_estadisticas(self):
+        """Verifica que los contadores vuelven a cero."""
+        MuebleConCache("Mesa", "Madera", "Café", 100.0).calcular_precio()
+        Mueble.reiniciar_estadisticas_cache_precio()
+        assert Mueble.estadisticas_cache_precio() == {
+            "aciertos": 0,
+            "fallos": 0,
+            "tasa_aciertos": 0.0,
+        }
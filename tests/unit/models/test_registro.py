@@ -0,0 +1,79 @@
+"""
+Pruebas unitarias para el registro perezoso de clases concretas.
+
+Verifica:
+- Obtención de clases por nombre y error por nombres desconocidos
+- Acceso perezoso desde el paquete models.concretos
+- Arranque sin cargar rich, la interfaz ni los modelos concretos
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import models.concretos
+from models import registro
+from models.concretos.silla import Silla
+
+SRC = os.path.join(os.path.dirname(__file__), "..", "..", "..", "src")
+
+
+def modulos_cargados(codigo):
+    """Ejecuta código en un intérprete nuevo y retorna los módulos cargados."""
+    resultado = subprocess.run(
+        [sys.executable, "-c", codigo + "\nimport sys; print('\\n'.join(sys.modules))"],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(resultado.stdout.split())
+
+
+class TestRegistro:
+    """Tests para la obtención de clases."""
+
+    def test_obtener(self):
+        """Verifica que obtener retorna la clase del módulo."""
+        assert registro.obtener("Silla") is Silla
+        assert "Silla" in registro.cargadas()
+
+    def test_nombres(self):
+        """Verifica que se listan las nueve clases concretas."""
+        assert len(registro.nombres()) == 9
+        assert "SofaCama" in registro.nombres()
+
+    def test_nombre_desconocido(self):
+        """Verifica el error por un nombre no registrado."""
+        with pytest.raises(KeyError):
+            registro.obtener("Banqueta")
+
+    def test_atributo_del_paquete(self):
+        """Verifica el acceso perezoso desde models.concretos."""
+        assert models.concretos.Silla is Silla
+        with pytest.raises(AttributeError):
+            models.concretos.Banqueta
+
+
+class TestArranque:
+    """Tests para los módulos que carga cada punto de entrada."""
+
+    def test_cli_no_carga_interfaz(self):
+        """Verifica que la CLI no carga rich, la interfaz ni los modelos."""
+        cargados = modulos_cargados("import cli")
+        assert not {"rich", "ui", "models.concretos.silla"} & cargados
+
+    def test_main_no_carga_tienda(self):
+        """Verifica que importar main no carga la tienda ni el menú."""
+        cargados = modulos_cargados("import main")
+        assert not {"rich", "ui.menu", "services.tienda"} & cargados
+
+    def test_carga_a_demanda(self):
+        """Verifica que se importa solo el módulo de la clase pedida."""
+        cargados = modulos_cargados(
+            "from models import registro; registro.obtener('Mesa')"
+        )
+        assert "models.concretos.mesa" in cargados
+        assert "models.concretos.silla" not in cargados
@@ -0,0 +1,72 @@
+"""
+Pruebas unitarias para los vocabularios internados.
+
+Verifica:
+- Códigos estables por grafía y claves compartidas por valor normalizado
+- Consultas sin registro de valores nuevos
+- Integración con Mueble y Asiento (se muestra la grafía original)
+"""
+
+import pytest
+from models.concretos.silla import Silla
+from models.vocabulario import MATERIALES, TAPIZADOS, Vocabulario
+
+
+class TestVocabulario:
+    """Tests para el registro de códigos."""
+
+    def test_misma_grafia_mismo_codigo(self):
+        """Verifica que una grafía se registra una sola vez."""
+        vocabulario = Vocabulario("prueba")
+        assert vocabulario.codigo("Madera") == vocabulario.codigo("Madera")
+        assert len(vocabulario) == 1
+
+    def test_grafias_distintas_comparten_clave(self):
+        """Verifica que las variantes de un texto comparten la clave."""
+        vocabulario = Vocabulario("prueba")
+        codigo_a = vocabulario.codigo("Madera")
+        codigo_b = vocabulario.codigo("  MADERA ")
+        assert codigo_a != codigo_b
+        assert vocabulario.clave(codigo_a) == vocabulario.clave(codigo_b)
+        assert vocabulario.texto(codigo_b) == "  MADERA "
+        assert vocabulario.normalizado(vocabulario.clave(codigo_a)) == "madera"
+
+    def test_none_y_vacio(self):
+        """Verifica que None se conserva y un texto vacío no tiene clave."""
+        vocabulario = Vocabulario("prueba")
+        assert vocabulario.codigo(None) is None
+        assert vocabulario.texto(None) is None
+        assert vocabulario.clave_de("   ") is None
+        assert vocabulario.normalizado(None) == ""
+
+    def test_buscar_clave_no_registra(self):
+        """Verifica que buscar un valor nuevo no lo agrega al registro."""
+        vocabulario = Vocabulario("prueba")
+        clave = vocabulario.clave_de("Metal")
+        assert vocabulario.buscar_clave(" metal") == clave
+        assert vocabulario.buscar_clave("Oro") is None
+        assert len(vocabulario) == 1
+
+
+class TestVocabularioEnMuebles:
+    """Tests para el uso de los vocabularios en la jerarquía."""
+
+    def test_muebles_guardan_codigos(self, silla_simple):
+        """Verifica que el mueble guarda un código y muestra el texto."""
+        assert isinstance(silla_simple._material, int)
+        assert silla_simple.material == "Plástico"
+        assert silla_simple.clave_material == MATERIALES.buscar_clave("plástico")
+
+    def test_setter_conserva_grafia(self, silla_simple):
+        """Verifica que el setter conserva la grafía ingresada."""
+        silla_simple.material = "  ROBLE "
+        assert silla_simple.material == "ROBLE"
+        assert silla_simple.clave_material == MATERIALES.buscar_clave("roble")
+
+    def test_tapizado_por_clave(self):
+        """Verifica que el factor de comodidad compara claves de tapizado."""
+        silla = Silla("Silla", "Madera", "Negro", 100.0, material_tapizado="CUERO")
+        assert silla.material_tapizado == "CUERO"
+        assert isinstance(silla._material_tapizado, int)
+        assert silla.calcular_factor_comodidad() == pytest.approx(1.3)
+        assert TAPIZADOS.buscar_clave("cuero") is not None
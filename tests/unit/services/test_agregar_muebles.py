@@ -0,0 +1,104 @@
+"""
+Pruebas unitarias para la carga en lote de TiendaMuebles.
+
+Verifica:
+- Resumen con cantidad agregada, valor y rechazos por índice
+- Validación de precios ya calculados (lista o arreglo NumPy)
+- Mismo estado de inventario y estadísticas que agregar_mueble
+- Rechazo de precios no finitos sin dejar rastro en el inventario
+"""
+
+import numpy as np
+import pytest
+from models.concretos.silla import Silla
+from services.motor_precios import MotorPrecios
+from services.tienda import TiendaMuebles
+
+
+class TestAgregarMuebles:
+    """Tests para agregar_muebles."""
+
+    def test_resumen(self, silla_simple, mesa_comedor, mock_mueble):
+        """Verifica el resumen y que los rechazos no entran al inventario."""
+        mock_mueble.calcular_precio.side_effect = RuntimeError("sin precio")
+        tienda = TiendaMuebles(modo_debug=True)
+        resumen = tienda.agregar_muebles(
+            [silla_simple, None, mesa_comedor, mock_mueble]
+        )
+        assert resumen["agregados"] == 2
+        assert resumen["valor_agregado"] == (
+            silla_simple.calcular_precio() + mesa_comedor.calcular_precio()
+        )
+        assert [r["indice"] for r in resumen["rechazados"]] == [1, 3]
+        assert "sin precio" in resumen["rechazados"][1]["error"]
+        assert tienda.listar_inventario() == [silla_simple, mesa_comedor]
+        assert tienda.obtener_estadisticas()["total_muebles"] == 2
+
+    def test_mismo_estado_que_uno_por_uno(self, silla_simple, mesa_comedor, cama_king):
+        """Verifica que el lote deja los mismos índices y agregados."""
+        muebles = [silla_simple, mesa_comedor, cama_king]
+        individual = TiendaMuebles()
+        for mueble in muebles:
+            individual.agregar_mueble(mueble)
+        lote = TiendaMuebles(modo_debug=True)
+        lote.agregar_muebles(muebles)
+        assert lote.obtener_estadisticas() == individual.obtener_estadisticas()
+        assert lote.filtrar_por_precio(0, 500) == individual.filtrar_por_precio(0, 500)
+        assert lote.buscar("mesa") == individual.buscar("mesa")
+
+    def test_precios_del_motor(self, silla_simple, mesa_comedor):
+        """Verifica la validación vectorizada de precios de MotorPrecios."""
+        muebles = [silla_simple, mesa_comedor]
+        precios = MotorPrecios.desde_muebles(muebles).calcular_precios()
+        tienda = TiendaMuebles(modo_debug=True)
+        resumen = tienda.agregar_muebles(muebles, precios)
+        assert resumen["agregados"] == 2
+        assert resumen["rechazados"] == []
+        assert tienda.obtener_estadisticas()["valor_inventario"] == pytest.approx(
+            float(precios.sum())
+        )
+
+    def test_precios_invalidos(self):
+        """Verifica el rechazo de precios no positivos o no finitos."""
+        sillas = [Silla(f"Silla {i}", "Pino", "Rojo", 10) for i in range(4)]
+        tienda = TiendaMuebles()
+        resumen = tienda.agregar_muebles(sillas, [10.0, 0.0, np.nan, -5.0])
+        assert resumen["agregados"] == 1
+        assert [r["indice"] for r in resumen["rechazados"]] == [1, 2, 3]
+        assert tienda.listar_inventario() == sillas[:1]
+
+    def test_cantidad_de_precios_distinta(self, silla_simple):
+        """Verifica el error si faltan precios."""
+        with pytest.raises(ValueError):
+            TiendaMuebles().agregar_muebles([silla_simple], [])
+
+
+class TestPreciosNoFinitos:
+    """Tests para precios NaN o infinitos en cada vía de alta."""
+
+    @pytest.mark.parametrize("precio", [float("nan"), float("inf"), -float("inf")])
+    def test_agregar_mueble(self, mock_mueble, precio):
+        """Verifica que agregar_mueble rechaza el precio antes de registrar."""
+        mock_mueble.calcular_precio.return_value = precio
+        tienda = TiendaMuebles()
+        assert tienda.agregar_mueble(mock_mueble).startswith("Error")
+        assert tienda.listar_inventario() == []
+        estadisticas = tienda.obtener_estadisticas()
+        assert estadisticas["total_muebles"] == 0
+        assert estadisticas["valor_inventario"] == 0
+
+    def test_agregar_muebles_calculados(self, silla_simple, mock_mueble):
+        """Verifica el rechazo de un precio calculado infinito."""
+        mock_mueble.calcular_precio.return_value = float("inf")
+        tienda = TiendaMuebles()
+        resumen = tienda.agregar_muebles([mock_mueble, silla_simple])
+        assert [r["indice"] for r in resumen["rechazados"]] == [0]
+        assert tienda.listar_inventario() == [silla_simple]
+
+    def test_agregar_muebles_dados_no_convertibles(self):
+        """Verifica que un entero enorme o un texto se rechazan por fila."""
+        sillas = [Silla(f"Silla {i}", "Pino", "Rojo", 10) for i in range(3)]
+        tienda = TiendaMuebles()
+        resumen = tienda.agregar_muebles(sillas, (p for p in [10**400, "x", 10.0]))
+        assert [r["indice"] for r in resumen["rechazados"]] == [0, 1]
+        assert tienda.listar_inventario() == sillas[2:]
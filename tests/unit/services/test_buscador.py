@@ -0,0 +1,133 @@
+"""
+Pruebas unitarias para el motor de búsqueda MotorBusqueda.
+
+Verifica:
+- Normalización de acentos y distancia de edición
+- Puntajes exacto, por prefijo y con errores de tipeo
+- Búsqueda en nombre, material, color y tipo con top-k
+- Integración con Inventario y TiendaMuebles
+"""
+
+import pytest
+from services.buscador import (
+    MotorBusqueda,
+    distancia_edicion,
+    normalizar_busqueda,
+    tokenizar,
+)
+from services.inventario import Inventario
+from services.tienda import TiendaMuebles
+
+
+@pytest.fixture
+def motor(silla_simple, sillon_individual, sofa_tres_puestos, cama_king, mesa_comedor):
+    """Fixture con un motor que indexa cinco muebles (ids 1 a 5)."""
+    m = MotorBusqueda()
+    for i, mueble in enumerate(
+        (silla_simple, sillon_individual, sofa_tres_puestos, cama_king, mesa_comedor), 1
+    ):
+        m.agregar(i, mueble)
+    return m
+
+
+class TestNormalizacion:
+    """Tests para las funciones auxiliares."""
+
+    def test_normalizar_busqueda(self):
+        """Verifica que se quitan acentos, mayúsculas y espacios extra."""
+        assert normalizar_busqueda("  Sillón   TAMAÑO ") == "sillon tamano"
+        assert normalizar_busqueda(None) == ""
+
+    def test_tokenizar(self):
+        """Verifica la división en palabras."""
+        assert tokenizar("sofa-cama de 3 plazas") == [
+            "sofa",
+            "cama",
+            "de",
+            "3",
+            "plazas",
+        ]
+
+    @pytest.mark.parametrize(
+        "a,b,esperado",
+        [
+            ("silla", "silla", 0),
+            ("slla", "silla", 1),
+            ("slila", "silla", 1),
+            ("mesa", "cama", 3),
+        ],
+    )
+    def test_distancia_edicion(self, a, b, esperado):
+        """Verifica la distancia con inserciones, borrados y transposiciones."""
+        assert distancia_edicion(a, b, 2) == esperado
+
+    def test_distancia_acotada(self):
+        """Verifica que se corta al superar el máximo."""
+        assert distancia_edicion("armario", "escritorio", 1) == 2
+
+
+class TestMotorBusqueda:
+    """Tests para las búsquedas del motor."""
+
+    def test_sin_acentos(self, motor):
+        """Verifica que 'sillon' encuentra el sillón por nombre y tipo."""
+        ids = [i for i, _ in motor.buscar("sillon")]
+        assert ids[0] == 2
+
+    def test_exacto_supera_a_prefijo(self, motor):
+        """Verifica que la coincidencia exacta puntúa más que el prefijo."""
+        resultados = dict(motor.buscar("silla"))
+        assert resultados[1] > resultados.get(2, 0)
+
+    def test_error_de_tipeo(self, motor):
+        """Verifica que se toleran errores de tipeo."""
+        assert motor.buscar("slla")[0][0] == 1
+
+    def test_todos_los_terminos(self, motor):
+        """Verifica que un documento debe coincidir con todos los términos."""
+        assert [i for i, _ in motor.buscar("cama king")] == [4]
+        assert motor.buscar("cama inexistente") == []
+
+    def test_busca_en_material_y_tipo(self, motor, mesa_comedor):
+        """Verifica la búsqueda por material y por tipo."""
+        material = normalizar_busqueda(mesa_comedor.material)
+        assert 5 in [i for i, _ in motor.buscar(material)]
+        assert [i for i, _ in motor.buscar("mesa")][0] == 5
+
+    def test_limite_y_orden(self, motor):
+        """Verifica el top-k ordenado por puntaje y luego por id."""
+        resultados = motor.buscar("s", limite=2)
+        assert len(resultados) == 2
+        assert resultados[0][1] >= resultados[1][1]
+        assert motor.buscar("silla", limite=0) == []
+        assert motor.buscar("   ") == []
+
+    def test_quitar(self, motor):
+        """Verifica que un documento quitado ya no aparece."""
+        assert motor.quitar(1) is True
+        assert motor.quitar(1) is False
+        assert 1 not in [i for i, _ in motor.buscar("silla")]
+        assert len(motor) == 4
+
+
+class TestBusquedaIntegrada:
+    """Tests para el motor dentro del inventario y la tienda."""
+
+    def test_inventario_sigue_cambios(self, silla_simple, sillon_individual):
+        """Verifica que renombrar y cambiar material reindexa la búsqueda."""
+        inv = Inventario()
+        inv.agregar(silla_simple)
+        inv.agregar(sillon_individual)
+        silla_simple.nombre = "Banqueta Alta"
+        silla_simple.material = "Nogal"
+        assert inv.buscar("banqueta nogal")[0][0] is silla_simple
+        inv.quitar(silla_simple)
+        assert inv.buscar("banqueta") == []
+
+    def test_tienda_buscar(self, sillon_individual, silla_simple):
+        """Verifica la búsqueda expuesta por la tienda."""
+        tienda = TiendaMuebles()
+        tienda.agregar_mueble(silla_simple)
+        tienda.agregar_mueble(sillon_individual)
+        assert tienda.buscar("SILLÓN")[0] is sillon_individual
+        assert tienda.buscar("  ") == []
@@ -0,0 +1,151 @@
+"""
+Pruebas unitarias para las consultas por varios criterios.
+
+Verifica:
+- Combinación de criterios indexados y sin índice
+- Equivalencia con los filtros de a un criterio
+- Elección del índice más selectivo en el plan
+- Consultas vacías y criterios sin resultados
+"""
+
+import pytest
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sofa import Sofa
+from services.tienda import TiendaMuebles
+
+
+@pytest.fixture
+def tienda(
+    silla_simple,
+    silla_oficina,
+    sillon_individual,
+    sofa_tres_puestos,
+    sofacama_estandar,
+    mesa_comedor,
+    mesa_extensible,
+    cajonera_pequena,
+    armario_basico,
+):
+    """Fixture con una tienda con varios tipos, materiales y precios."""
+    t = TiendaMuebles("Tienda Consultas")
+    for mueble in (
+        silla_simple,
+        silla_oficina,
+        sillon_individual,
+        sofa_tres_puestos,
+        sofacama_estandar,
+        mesa_comedor,
+        mesa_extensible,
+        cajonera_pequena,
+        armario_basico,
+    ):
+        t.agregar_mueble(mueble)
+    return t
+
+
+class TestConsultaResultados:
+    """Tests para los resultados de las consultas."""
+
+    def test_tipo_y_material(self, tienda, mesa_comedor, mesa_extensible):
+        """Verifica la intersección de tipo y material."""
+        resultado = tienda.consultar().tipo(Mesa).material("MADERA").ejecutar()
+        assert resultado == [mesa_comedor, mesa_extensible]
+
+    def test_tipo_incluye_subclases(self, tienda, sofa_tres_puestos, sofacama_estandar):
+        """Verifica que el tipo incluye subclases, como al filtrar por tipo."""
+        resultado = tienda.consultar().tipo(Sofa).ejecutar()
+        assert resultado == [sofa_tres_puestos, sofacama_estandar]
+
+    def test_color_y_bandera(self, tienda, silla_oficina):
+        """Verifica un criterio indexado combinado con un atributo."""
+        consulta = tienda.consultar().color("negro").con(tiene_ruedas=True)
+        assert consulta.ejecutar() == [silla_oficina]
+
+    def test_bandera_excluye_muebles_sin_atributo(self, tienda, sillon_individual):
+        """Verifica que los muebles sin el atributo no cumplen la bandera."""
+        resultado = tienda.consultar().con(es_reclinable=False).ejecutar()
+        assert resultado == [sillon_individual]
+
+    def test_capacidad(self, tienda, sofa_tres_puestos, mesa_comedor, mesa_extensible):
+        """Verifica el rango de capacidad sobre asientos y mesas."""
+        resultado = tienda.consultar().capacidad(minimo=3).ejecutar()
+        assert resultado == [sofa_tres_puestos, mesa_comedor, mesa_extensible]
+
+    def test_area(self, tienda, mesa_comedor):
+        """Verifica el rango de área de las superficies."""
+        resultado = tienda.consultar().area(minimo=15000).ejecutar()
+        assert resultado == [mesa_comedor]
+
+    def test_precio_igual_al_filtro(self, tienda):
+        """Verifica que el rango de precios coincide con filtrar_por_precio."""
+        consulta = tienda.consultar().precio(100, 700)
+        assert consulta.ejecutar() == tienda.filtrar_por_precio(100, 700)
+
+    def test_nombre_y_precio(self, tienda, silla_oficina):
+        """Verifica el índice de nombres combinado con el de precios."""
+        precio = silla_oficina.calcular_precio()
+        consulta = tienda.consultar().nombre("silla").precio(precio, precio)
+        assert consulta.ejecutar() == [silla_oficina]
+
+    def test_predicado(self, tienda, cajonera_pequena):
+        """Verifica un predicado arbitrario."""
+        consulta = tienda.consultar().donde(lambda m: m.nombre.endswith("Mini"))
+        assert consulta.ejecutar() == [cajonera_pequena]
+
+    def test_sin_criterios(self, tienda):
+        """Verifica que una consulta vacía retorna todo el inventario."""
+        assert tienda.consultar().ejecutar() == tienda.listar_inventario()
+
+    def test_sin_coincidencias(self, tienda):
+        """Verifica un criterio indexado sin ids."""
+        consulta = tienda.consultar().tipo(Silla).material("vidrio")
+        assert consulta.ejecutar() == []
+        assert consulta.contar() == 0
+
+    def test_contar(self, tienda):
+        """Verifica el conteo con y sin filtros residuales."""
+        assert tienda.consultar().tipo(Silla).contar() == 2
+        assert tienda.consultar().tipo(Silla).con(tiene_ruedas=True).contar() == 1
+
+    def test_refleja_cambios(self, tienda, mesa_comedor):
+        """Verifica que la consulta usa los índices actualizados."""
+        consulta = tienda.consultar().tipo(Mesa).material("vidrio")
+        mesa_comedor.material = "Vidrio"
+        assert consulta.ejecutar() == [mesa_comedor]
+
+
+class TestConsultaPlan:
+    """Tests para el plan elegido."""
+
+    def test_inicia_por_el_mas_selectivo(self, tienda):
+        """Verifica que el plan arranca por el criterio con menos ids."""
+        pasos = tienda.consultar().material("madera").tipo(Mesa).plan()
+        assert [p["operacion"] for p in pasos] == ["inicio", "intersección"]
+        assert pasos[0]["criterio"] == "tipo Mesa"
+        assert pasos[0]["estimado"] == 2
+        assert pasos[1]["estimado"] == 5
+
+    def test_filtros_al_final(self, tienda):
+        """Verifica que los criterios sin índice se aplican al final."""
+        pasos = tienda.consultar().capacidad(minimo=2).color("gris").plan()
+        assert [p["operacion"] for p in pasos] == ["inicio", "filtro"]
+        assert pasos[1]["estimado"] is None
+
+    def test_recorrido_sin_indices(self, tienda):
+        """Verifica el recorrido completo cuando no hay criterios indexados."""
+        pasos = tienda.consultar().con(tiene_ruedas=True).plan()
+        assert pasos[0] == {
+            "operacion": "recorrido",
+            "criterio": "todo el inventario",
+            "estimado": 9,
+        }
+
+    def test_explicar(self, tienda):
+        """Verifica el texto del plan."""
+        texto = tienda.consultar().color("negro").area(maximo=100).explicar()
+        assert texto.splitlines() == [
+            "Plan de consulta (2 criterios):",
+            "  1. inicio: color = 'negro' (~2 ids)",
+            "  2. filtro: calcular_area() <= 100",
+        ]
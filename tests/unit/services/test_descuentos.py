@@ -0,0 +1,227 @@
+"""
+Pruebas unitarias para el motor de descuentos por reglas.
+
+Verifica:
+- Resolución de categorías escritas por el usuario (plurales, acentos)
+- Reglas por tipo con subclases, material, banda de precio y fechas
+- Política de mayor descuento cuando aplican varias reglas
+- Invalidación de las tablas afectadas y aviso a los observadores
+- Integración con TiendaMuebles e ida y vuelta en la instantánea
+- Valor del inventario y filtro por precio con descuentos en la tienda
+"""
+
+from datetime import datetime
+
+import pytest
+from models.categorias.asientos import Asiento
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sillon import Sillon
+from models.concretos.sofa import Sofa
+from models.concretos.sofacama import SofaCama
+from services import instantanea
+from services.descuentos import MotorDescuentos, ReglaDescuento, resolver_categoria
+from services.tienda import TiendaMuebles
+
+
+class TestResolverCategoria:
+    """Tests para la resolución de nombres de categoría."""
+
+    @pytest.mark.parametrize(
+        "texto, clase",
+        [
+            ("sillas", Silla),
+            ("sillones", Sillon),
+            ("Sofá-camas", SofaCama),
+            ("MESA", Mesa),
+            ("asientos", Asiento),
+        ],
+    )
+    def test_nombres(self, texto, clase):
+        """Verifica singular, plural, mayúsculas, acentos y guiones."""
+        assert resolver_categoria(texto) is clase
+
+    def test_desconocida(self):
+        """Verifica que una categoría inexistente retorna None."""
+        assert resolver_categoria("lámparas") is None
+
+
+class TestReglas:
+    """Tests para las condiciones de las reglas."""
+
+    def test_tipo_incluye_subclases(self, sofacama_estandar, silla_simple):
+        """Verifica que un descuento de sofás aplica a los sofá-camas."""
+        motor = MotorDescuentos()
+        motor.agregar(ReglaDescuento(0.2, Sofa))
+        assert motor.descuento(sofacama_estandar) == 0.2
+        assert motor.descuento(silla_simple) == 0.0
+
+    def test_material(self, silla_simple, sillon_individual):
+        """Verifica el filtro por material, sin distinguir mayúsculas."""
+        motor = MotorDescuentos()
+        motor.agregar(ReglaDescuento(0.1, material="madera"))
+        assert motor.descuento(sillon_individual) == 0.1
+        assert motor.descuento(silla_simple) == 0.0
+
+    def test_banda_de_precio(self, silla_simple):
+        """Verifica que la banda es semiabierta sobre el precio de lista."""
+        motor = MotorDescuentos()
+        motor.agregar(ReglaDescuento(0.1, Silla, precio_min=100, precio_max=200))
+        assert motor.descuento(silla_simple, 99.99) == 0.0
+        assert motor.descuento(silla_simple, 100) == 0.1
+        assert motor.descuento(silla_simple, 200) == 0.0
+
+    def test_ventana_de_fechas(self, silla_simple):
+        """Verifica la vigencia en distintos momentos."""
+        motor = MotorDescuentos()
+        motor.agregar(ReglaDescuento(0.3, desde=1000.0, hasta=2000.0))
+        assert motor.descuento(silla_simple, momento=999.0) == 0.0
+        assert motor.descuento(silla_simple, momento=1500.0) == 0.3
+        assert motor.descuento(silla_simple, momento=2000.0) == 0.0
+
+    def test_gana_el_mayor(self, sillon_individual):
+        """Verifica que los descuentos no se acumulan."""
+        motor = MotorDescuentos()
+        motor.agregar(ReglaDescuento(0.1, Asiento))
+        motor.agregar(ReglaDescuento(0.25, material="Madera"))
+        motor.agregar(ReglaDescuento(0.15, Sillon, precio_min=0, precio_max=10))
+        assert motor.descuento(sillon_individual) == 0.25
+
+    @pytest.mark.parametrize(
+        "argumentos",
+        [
+            {"fraccion": 0},
+            {"fraccion": 1.5},
+            {"fraccion": 0.1, "precio_min": 10, "precio_max": 10},
+            {"fraccion": 0.1, "desde": 5.0, "hasta": 1.0},
+        ],
+    )
+    def test_reglas_invalidas(self, argumentos):
+        """Verifica la validación del constructor."""
+        with pytest.raises(ValueError):
+            ReglaDescuento(**argumentos)
+
+
+class TestMotor:
+    """Tests para el alta, baja e invalidación de reglas."""
+
+    def test_fijar_por_tipo_reemplaza(self, silla_simple):
+        """Verifica que fijar_por_tipo reemplaza solo el descuento simple."""
+        motor = MotorDescuentos()
+        motor.agregar(ReglaDescuento(0.05, Silla, material="Plástico"))
+        motor.fijar_por_tipo(Silla, 0.1)
+        motor.fijar_por_tipo(Silla, 0.2)
+        assert len(motor) == 2
+        assert motor.descuentos_por_tipo() == {"Silla": 0.2}
+        assert motor.descuento(silla_simple) == 0.2
+
+    def test_quitar(self, silla_simple):
+        """Verifica que quitar una regla actualiza el descuento."""
+        motor = MotorDescuentos()
+        id_regla = motor.agregar(ReglaDescuento(0.1, Silla))
+        assert motor.descuento(silla_simple) == 0.1
+        assert motor.quitar(id_regla)
+        assert not motor.quitar(id_regla)
+        assert motor.descuento(silla_simple) == 0.0
+
+    def test_invalida_solo_clases_afectadas(self, silla_simple, mesa_comedor):
+        """Verifica que una regla de mesas no descarta la tabla de sillas."""
+        motor = MotorDescuentos()
+        motor.agregar(ReglaDescuento(0.1, Silla))
+        motor.descuento(silla_simple)
+        motor.descuento(mesa_comedor)
+        tabla_silla = motor._tablas[Silla]
+        motor.agregar(ReglaDescuento(0.2, Mesa))
+        assert motor._tablas[Silla] is tabla_silla
+        assert Mesa not in motor._tablas
+        assert motor.descuento(mesa_comedor) == 0.2
+
+    def test_observadores(self, silla_simple):
+        """Verifica el aviso al agregar y al vencer una regla."""
+        motor = MotorDescuentos()
+        avisos = []
+        motor.agregar_observador(avisos.append)
+        regla = ReglaDescuento(0.1, Silla, hasta=datetime.now().timestamp() + 3600)
+        motor.agregar(regla)
+        motor.descuento(silla_simple, momento=datetime.now().timestamp() + 7200)
+        assert avisos == [[regla], [regla]]
+
+
+class TestTienda:
+    """Tests para las reglas de descuento de TiendaMuebles."""
+
+    def test_aplicar_descuento_categoria(self, sofacama_estandar):
+        """Verifica el descuento de una categoría abstracta en una venta."""
+        tienda = TiendaMuebles()
+        tienda.agregar_mueble(sofacama_estandar)
+        mensaje = tienda.aplicar_descuento("asientos", 10)
+        assert "'Asiento'" in mensaje
+        venta = tienda.realizar_venta(sofacama_estandar, "Ana")
+        assert venta["descuento"] == pytest.approx(10)
+
+    def test_categoria_desconocida(self):
+        """Verifica el mensaje de error de aplicar_descuento."""
+        assert TiendaMuebles().aplicar_descuento("lámparas", 10).startswith("Error")
+        with pytest.raises(ValueError):
+            TiendaMuebles().agregar_regla_descuento(10, "lámparas")
+
+    def test_regla_combinada(self, silla_simple, mesa_comedor):
+        """Verifica una regla por material y fechas, y su baja."""
+        tienda = TiendaMuebles()
+        tienda.agregar_muebles([silla_simple, mesa_comedor])
+        id_regla = tienda.agregar_regla_descuento(
+            30, material="Madera", desde=datetime(2000, 1, 1)
+        )
+        comprobante = tienda.realizar_ventas_lote([silla_simple, mesa_comedor], "Ana")
+        assert [linea["descuento"] for linea in comprobante["lineas"]] == [
+            pytest.approx(0),
+            pytest.approx(30),
+        ]
+        assert tienda.quitar_regla_descuento(id_regla)
+
+    def test_instantanea_conserva_reglas(self, tmp_path, silla_simple):
+        """Verifica la ida y vuelta de las reglas en la instantánea."""
+        tienda = TiendaMuebles()
+        tienda.agregar_mueble(silla_simple)
+        tienda.aplicar_descuento("sillas", 10)
+        tienda.agregar_regla_descuento(5, material="Plástico", precio_max=1000)
+        ruta = str(tmp_path / "tienda.snap")
+        tienda.guardar_instantanea(ruta)
+        cargada = TiendaMuebles.desde_instantanea(ruta)
+        assert [repr(r) for _, r in cargada._descuentos.reglas()] == [
+            repr(r) for _, r in tienda._descuentos.reglas()
+        ]
+
+    def test_descuentos_anteriores_a_reglas(self):
+        """Verifica la conversión del diccionario de instantáneas viejas."""
+        motor = MotorDescuentos()
+        instantanea._cargar_descuentos(
+            {"descuentos": {"Silla": 0.1, "Sofacama": 0.2, "Lampara": 0.3}}, motor
+        )
+        assert motor.descuentos_por_tipo() == {"Silla": 0.1, "SofaCama": 0.2}
+
+
+class TestValorConDescuentos:
+    """Tests para el valor y los filtros con descuento de TiendaMuebles."""
+
+    def test_estadisticas_y_filtro(self, silla_simple, mesa_comedor):
+        """Verifica el valor con descuentos y el filtro por precio de venta."""
+        tienda = TiendaMuebles(modo_debug=True)
+        tienda.agregar_mueble(silla_simple, unidades=4)
+        tienda.agregar_mueble(mesa_comedor)
+        precio_silla = silla_simple.calcular_precio()
+        estadisticas = tienda.obtener_estadisticas()
+        assert estadisticas["valor_inventario_con_descuentos"] == pytest.approx(
+            estadisticas["valor_inventario"]
+        )
+        tienda.aplicar_descuento("sillas", 50)
+        estadisticas = tienda.obtener_estadisticas()
+        assert estadisticas["valor_inventario_con_descuentos"] == pytest.approx(
+            estadisticas["valor_inventario"] - 4 * round(precio_silla / 2, 2)
+        )
+        limite = precio_silla * 0.6
+        assert tienda.filtrar_por_precio(0, limite) == []
+        assert tienda.filtrar_por_precio(0, limite, con_descuentos=True) == [
+            silla_simple
+        ]
+        assert "Valor con descuentos" in tienda.generar_reporte_inventario()
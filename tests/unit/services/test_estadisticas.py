@@ -0,0 +1,111 @@
+"""
+Pruebas unitarias para los agregados incrementales del inventario.
+
+Verifica:
+- Conteos por tipo y material
+- Valor total y por tipo en altas, bajas y cambios de precio
+- Comparación contra una recomputación completa
+- Copia del estado de los acumuladores
+"""
+
+import pytest
+from services.estadisticas import EstadisticasInventario, a_centavos
+from services.inventario import Inventario
+
+
+@pytest.fixture
+def inventario(silla_simple, silla_oficina, mesa_comedor, armario_basico):
+    """Fixture con un inventario de cuatro muebles."""
+    inv = Inventario()
+    for mueble in (silla_simple, silla_oficina, mesa_comedor, armario_basico):
+        inv.agregar(mueble)
+    return inv
+
+
+class TestEstadisticasIncrementales:
+    """Tests para los acumuladores mantenidos por Inventario."""
+
+    def test_conteos_iniciales(self, inventario):
+        """Verifica los conteos por tipo y material."""
+        stats = inventario.estadisticas
+        assert stats.por_tipo == {"Silla": 2, "Mesa": 1, "Armario": 1}
+        assert stats.por_material == {
+            "plástico": 1,
+            "cuero sintético": 1,
+            "madera": 2,
+        }
+
+    def test_valor_total_coincide_con_suma(self, inventario):
+        """Verifica que el valor total es la suma de precios."""
+        esperado = sum(m.calcular_precio() for m in inventario)
+        assert inventario.estadisticas.valor_total == pytest.approx(esperado)
+
+    def test_quitar_actualiza_agregados(self, inventario, silla_simple):
+        """Verifica que una baja descuenta el mueble de los agregados."""
+        inventario.quitar(silla_simple)
+        stats = inventario.estadisticas
+        assert stats.por_tipo["Silla"] == 1
+        assert "plástico" not in stats.por_material
+        assert stats.comparar(inventario.recalcular_estadisticas()) == {}
+
+    def test_cambios_de_atributos_mantienen_consistencia(
+        self, inventario, silla_oficina, mesa_comedor
+    ):
+        """Verifica que los setters mantienen los agregados exactos."""
+        silla_oficina.precio_base = 999.99
+        mesa_comedor.material = "Vidrio"
+        mesa_comedor.ancho = 120
+        assert (
+            inventario.estadisticas.comparar(inventario.recalcular_estadisticas()) == {}
+        )
+        assert inventario.estadisticas.por_material["vidrio"] == 1
+
+    def test_comparar_detecta_desfase(self, inventario, armario_basico):
+        """Verifica que un cambio sin reindexar se detecta al comparar."""
+        armario_basico.num_puertas = 5
+        diferencias = inventario.estadisticas.comparar(
+            inventario.recalcular_estadisticas()
+        )
+        assert "valor_centavos" in diferencias
+        inventario.actualizar(armario_basico)
+        assert (
+            inventario.estadisticas.comparar(inventario.recalcular_estadisticas()) == {}
+        )
+
+
+class TestEstadisticasInventario:
+    """Tests para la clase de acumuladores aislada."""
+
+    def test_valor_por_tipo(self):
+        """Verifica la suma de precios por tipo."""
+        stats = EstadisticasInventario()
+        stats.sumar_precio("Silla", 10.10)
+        stats.sumar_precio("Silla", 20.20)
+        stats.sumar_precio("Silla", 10.10, -1)
+        assert stats.valor_por_tipo == {"Silla": 20.2}
+        assert stats.valor_total == 20.2
+
+    def test_contador_en_cero_se_elimina(self):
+        """Verifica que las claves en cero desaparecen."""
+        stats = EstadisticasInventario()
+        stats.sumar_tipo("Mesa")
+        stats.sumar_tipo("Mesa", -1)
+        stats.sumar_material("")
+        assert stats.por_tipo == {}
+        assert stats.por_material == {}
+
+    def test_estado_y_restaurar(self, inventario):
+        """Verifica que restaurar el estado copia los acumuladores."""
+        stats = EstadisticasInventario()
+        stats.restaurar(inventario.estadisticas.estado())
+        assert stats.comparar(inventario.estadisticas) == {}
+        stats.sumar_tipo("Silla")
+        assert "por_tipo" in stats.comparar(inventario.estadisticas)
+
+
+@pytest.mark.parametrize(
+    "precio,centavos", [(0.1, 10), (199.995, 20000), (1234.5, 123450), (3, 300)]
+)
+def test_a_centavos(precio, centavos):
+    """Test parametrizado para la conversión a centavos."""
+    assert a_centavos(precio) == centavos
@@ -0,0 +1,87 @@
+"""
+Pruebas unitarias para el stock por unidades de TiendaMuebles.
+
+Verifica:
+- Alta de un producto con varias unidades y reposición
+- Ventas por cantidad (una línea por unidad, precio calculado una vez)
+- Estadísticas y ventas en lote contando unidades
+"""
+
+import pytest
+from services.tienda import TiendaMuebles
+
+
+@pytest.fixture
+def tienda(silla_simple, mesa_comedor):
+    """Fixture con seis unidades de una silla y una mesa."""
+    t = TiendaMuebles(modo_debug=True)
+    t.agregar_mueble(silla_simple, unidades=6)
+    t.agregar_mueble(mesa_comedor)
+    return t
+
+
+class TestExistencias:
+    """Tests para el alta y la reposición de unidades."""
+
+    def test_estadisticas_cuentan_unidades(self, tienda, silla_simple, mesa_comedor):
+        """Verifica que los totales y el valor multiplican por las unidades."""
+        estadisticas = tienda.obtener_estadisticas()
+        assert estadisticas["total_muebles"] == 7
+        assert estadisticas["tipos_muebles"] == {"Silla": 6, "Mesa": 1}
+        assert tienda.calcular_valor_inventario() == pytest.approx(
+            6 * silla_simple.calcular_precio() + mesa_comedor.calcular_precio()
+        )
+        assert len(tienda.listar_inventario()) == 2
+
+    def test_unidades_invalidas(self, silla_simple):
+        """Verifica el mensaje de error por unidades no positivas."""
+        tienda = TiendaMuebles()
+        assert tienda.agregar_mueble(silla_simple, unidades=0).startswith("Error")
+        assert silla_simple not in tienda.listar_inventario()
+
+    def test_reponer(self, tienda, silla_simple, cama_king):
+        """Verifica la reposición de un mueble en inventario."""
+        assert "10 unidades" in tienda.reponer_mueble(silla_simple, 4)
+        assert tienda.existencias(silla_simple) == 10
+        assert tienda.reponer_mueble(cama_king, 1).startswith("Error")
+        assert tienda.reponer_mueble(silla_simple, -2).startswith("Error")
+
+
+class TestVentaPorCantidad:
+    """Tests para realizar_venta con cantidad."""
+
+    def test_venta_de_varias_unidades(self, tienda, silla_simple):
+        """Verifica el total, la venta registrada y las unidades restantes."""
+        tienda.aplicar_descuento("sillas", 10)
+        venta = tienda.realizar_venta(silla_simple, "Ana", cantidad=4)
+        assert venta["cantidad"] == 4
+        assert venta["total"] == pytest.approx(4 * venta["precio_final"])
+        assert tienda.existencias(silla_simple) == 2
+        estadisticas = tienda.obtener_estadisticas()
+        assert estadisticas["ventas_realizadas"] == 1
+        assert estadisticas["total_muebles_vendidos"] == 4
+        assert [v.cantidad for v in tienda.obtener_ventas()] == [4]
+        assert estadisticas["valor_total_ventas"] == pytest.approx(venta["total"])
+
+    def test_vender_todas_quita_el_producto(self, tienda, silla_simple):
+        """Verifica que al agotar las unidades el mueble deja el inventario."""
+        venta = tienda.realizar_venta(silla_simple, cantidad=6)
+        assert "error" not in venta
+        assert silla_simple not in tienda.listar_inventario()
+        assert tienda.buscar_muebles_por_nombre(silla_simple.nombre) == []
+
+    def test_unidades_insuficientes(self, tienda, silla_simple):
+        """Verifica el error sin cambios en inventario ni ventas."""
+        venta = tienda.realizar_venta(silla_simple, cantidad=7)
+        assert venta["disponibles"] == 6
+        assert tienda.existencias(silla_simple) == 6
+        assert tienda.obtener_estadisticas()["ventas_realizadas"] == 0
+        assert "error" in tienda.realizar_venta(silla_simple, cantidad=0)
+
+    def test_lote_cuenta_unidades(self, tienda, silla_simple, mesa_comedor):
+        """Verifica que el lote valida repeticiones contra las unidades."""
+        lote = tienda.realizar_ventas_lote([silla_simple] * 3 + [mesa_comedor])
+        assert lote["cantidad"] == 4
+        assert tienda.existencias(silla_simple) == 3
+        assert tienda.obtener_estadisticas()["total_muebles"] == 3
+        assert "error" in tienda.realizar_ventas_lote([silla_simple] * 4)
@@ -0,0 +1,121 @@
+"""
+Pruebas unitarias para la exportación de inventario y ventas.
+
+Verifica:
+- Filas de esquema fijo con campos de categoría vacíos cuando no aplican
+- CSV y formato columnar (ida y vuelta, grupos de filas, columnas elegidas)
+- Exportación de ventas volcadas a disco
+"""
+
+import csv
+import io
+
+import pytest
+from services import exportador
+from services.exportador import ArchivoColumnarInvalido
+from services.tienda import TiendaMuebles
+from services.ventas import RegistroVentas
+
+
+@pytest.fixture
+def tienda(silla_simple, mesa_comedor, armario_basico):
+    """Fixture con tres muebles de categorías distintas."""
+    t = TiendaMuebles()
+    t.agregar_muebles([silla_simple, mesa_comedor, armario_basico])
+    return t
+
+
+class TestFilas:
+    """Tests para las filas exportadas."""
+
+    def test_filas_inventario(self, tienda, silla_simple):
+        """Verifica los campos comunes, la categoría y el precio final."""
+        filas = list(exportador.filas_inventario(tienda))
+        columnas = [nombre for nombre, _ in exportador.COLUMNAS_INVENTARIO]
+        silla = dict(zip(columnas, filas[0]))
+        assert len(filas) == 3
+        assert silla["id"] == 1
+        assert silla["categoria"] == "asiento"
+        assert silla["precio_final"] == silla_simple.calcular_precio()
+        assert silla["largo"] is None
+        assert dict(zip(columnas, filas[1]))["categoria"] == "superficie"
+
+    def test_filas_ventas_en_porcentaje(self, tienda, silla_simple):
+        """Verifica que el descuento se exporta en porcentaje."""
+        tienda.aplicar_descuento("sillas", 10)
+        tienda.realizar_venta(silla_simple, "Ana")
+        (fila,) = exportador.filas_ventas(tienda)
+        assert fila[3] == "Ana"
+        assert fila[5] == pytest.approx(10)
+
+    def test_filas_ventas_con_cantidad(self, tienda, silla_simple):
+        """Verifica que una venta de varias unidades es una fila con total."""
+        tienda.agregar_mueble(silla_simple)
+        tienda.realizar_venta(silla_simple, "Ana", cantidad=2)
+        (fila,) = exportador.filas_ventas(tienda)
+        columnas = [nombre for nombre, _ in exportador.COLUMNAS_VENTAS]
+        venta = dict(zip(columnas, fila))
+        assert venta["cantidad"] == 2
+        assert venta["total"] == pytest.approx(2 * venta["precio_final"])
+
+
+class TestCsv:
+    """Tests para la exportación a CSV."""
+
+    def test_inventario(self, tienda):
+        """Verifica el encabezado y las celdas vacías."""
+        archivo = io.StringIO()
+        assert exportador.exportar_inventario(tienda, archivo, tamaño_bloque=2) == 3
+        filas = list(csv.DictReader(io.StringIO(archivo.getvalue())))
+        assert [fila["tipo"] for fila in filas] == ["Silla", "Mesa", "Armario"]
+        assert filas[2]["categoria"] == ""
+
+    def test_formato_desconocido(self, tienda):
+        """Verifica el error de formato no soportado."""
+        with pytest.raises(ValueError):
+            exportador.exportar_inventario(tienda, io.StringIO(), "parquet")
+
+
+class TestColumnar:
+    """Tests para el formato binario columnar."""
+
+    def test_ida_y_vuelta(self, tienda):
+        """Verifica que se leen los mismos valores, en grupos de filas."""
+        archivo = io.BytesIO()
+        exportador.exportar_inventario(tienda, archivo, "columnar", tamaño_bloque=2)
+        archivo.seek(0)
+        grupos = list(exportador.leer_columnar(archivo))
+        assert [len(grupo["id"]) for grupo in grupos] == [2, 1]
+        columnas = [nombre for nombre, _ in exportador.COLUMNAS_INVENTARIO]
+        leidas = [
+            tuple(grupo[nombre][i] for nombre in columnas)
+            for grupo in grupos
+            for i in range(len(grupo["id"]))
+        ]
+        assert leidas == list(exportador.filas_inventario(tienda))
+
+    def test_columnas_elegidas(self, tienda):
+        """Verifica que solo se decodifican las columnas pedidas."""
+        archivo = io.BytesIO()
+        exportador.exportar_inventario(tienda, archivo, "columnar")
+        archivo.seek(0)
+        (grupo,) = exportador.leer_columnar(archivo, ["nombre", "tiene_respaldo"])
+        assert list(grupo) == ["nombre", "tiene_respaldo"]
+        assert grupo["tiene_respaldo"] == [True, None, None]
+
+    def test_ventas_volcadas(self, tmp_path):
+        """Verifica la exportación de ventas leídas del archivo de volcado."""
+        registro = RegistroVentas(str(tmp_path / "ventas.bin"), limite_memoria=2)
+        tienda = TiendaMuebles(registro_ventas=registro)
+        for i in range(5):
+            registro.registrar(f"Mueble {i}", "Ana", 100.0, 0.0, 100.0)
+        ruta = str(tmp_path / "ventas.col")
+        assert tienda.exportar_ventas(ruta, "columnar") == 5
+        with open(ruta, "rb") as archivo:
+            (grupo,) = exportador.leer_columnar(archivo, ["mueble"])
+        assert grupo["mueble"] == [f"Mueble {i}" for i in range(5)]
+
+    def test_archivo_invalido(self):
+        """Verifica el error al leer un archivo que no es columnar."""
+        with pytest.raises(ArchivoColumnarInvalido):
+            list(exportador.leer_columnar(io.BytesIO(b"no es columnar")))
@@ -0,0 +1,261 @@
+"""
+Pruebas unitarias para la importación de catálogos.
+
+Verifica:
+- Creación de muebles por tipo con conversión de valores
+- Rechazo de tipos, columnas y valores inválidos
+- Lectura de CSV y JSON Lines
+- Fábricas por tipo, inserción por lotes y archivo de rechazos
+- Rechazo de números no finitos y de valores con tipos JSON inesperados
+"""
+
+import io
+import json
+
+import pytest
+from models.concretos.silla import Silla
+from models.concretos.sofacama import SofaCama
+from services import importador
+from services.importador import FilaInvalida
+from services.tienda import TiendaMuebles
+
+
+class TestCrearMueble:
+    """Tests para crear_mueble."""
+
+    def test_convierte_valores(self):
+        """Verifica la conversión de textos según el constructor."""
+        silla = importador.crear_mueble(
+            {
+                "tipo": "Silla",
+                "nombre": "Silla Oficina",
+                "material": "Metal",
+                "color": "Negro",
+                "precio_base": "80",
+                "tiene_ruedas": "sí",
+                "material_tapizado": "",
+            }
+        )
+        assert isinstance(silla, Silla)
+        assert silla.tiene_ruedas is True
+        assert silla.precio_base == 80
+
+    def test_tipo_sin_acentos_ni_guiones(self):
+        """Verifica que 'Sofá-Cama' se resuelve a SofaCama."""
+        assert importador.resolver_tipo("Sofá-Cama") is SofaCama
+
+    @pytest.mark.parametrize(
+        "fila",
+        [
+            {"tipo": "lampara", "nombre": "L"},
+            {"tipo": "silla", "nombre": "S", "patas": "4"},
+            {
+                "tipo": "silla",
+                "nombre": "S",
+                "material": "M",
+                "color": "C",
+                "precio_base": "x",
+            },
+            {
+                "tipo": "silla",
+                "nombre": "S",
+                "material": "M",
+                "color": "C",
+                "precio_base": "10",
+                "tiene_ruedas": "quizas",
+            },
+            {
+                "tipo": "silla",
+                "nombre": "",
+                "material": "M",
+                "color": "C",
+                "precio_base": "10",
+            },
+            {
+                "tipo": "silla",
+                "nombre": "   ",
+                "material": "M",
+                "color": "C",
+                "precio_base": "10",
+            },
+            {
+                "tipo": "silla",
+                "nombre": "S",
+                "material": " ",
+                "color": "C",
+                "precio_base": "10",
+            },
+            {
+                "tipo": "mesa",
+                "nombre": "M",
+                "material": "Roble",
+                "color": "C",
+                "precio_base": "10",
+                "largo": "-100",
+            },
+            {
+                "tipo": "silla",
+                "nombre": "S",
+                "material": "M",
+                "color": "C",
+                "precio_base": "-10",
+            },
+        ],
+    )
+    def test_filas_invalidas(self, fila):
+        """Verifica que los errores se informan como FilaInvalida."""
+        with pytest.raises(FilaInvalida):
+            importador.crear_mueble(fila)
+
+
+class TestFabrica:
+    """Tests para las fábricas por tipo."""
+
+    def test_fabrica_reutilizada(self):
+        """Verifica que un mismo nombre de tipo reutiliza la fábrica."""
+        assert importador.fabrica("silla") is importador.fabrica("silla")
+        assert importador.fabrica("Silla").clase is Silla
+
+    def test_tipo_no_textual(self):
+        """Verifica el rechazo de un tipo que no es texto."""
+        with pytest.raises(FilaInvalida):
+            importador.fabrica(["silla"])
+
+
+class TestImportar:
+    """Tests para importar archivos completos."""
+
+    def test_csv(self):
+        """Verifica la importación de un CSV con una fila rechazada."""
+        archivo = io.StringIO(
+            "tipo,nombre,material,color,precio_base\n"
+            "silla,Silla A,Madera,Negro,50\n"
+            "mesa,Mesa B,Madera,Nogal,300\n"
+            "silla,Silla C,Madera,Negro,0\n"
+        )
+        tienda = TiendaMuebles()
+        resultado = importador.importar(archivo, tienda)
+        assert resultado["importados"] == 2
+        assert [r["fila"] for r in resultado["rechazados"]] == [3]
+        assert len(tienda.listar_inventario()) == 2
+
+    def test_jsonl_con_linea_invalida(self):
+        """Verifica que una línea JSON inválida se rechaza sin cortar la lectura."""
+        archivo = io.StringIO(
+            '{"tipo": "cama", "nombre": "Cama", "material": "Pino",'
+            ' "color": "Blanco", "precio_base": 300}\n'
+            "\n"
+            "{no es json\n"
+            "[1, 2]\n"
+        )
+        resultado = importador.importar(archivo, TiendaMuebles(), "jsonl")
+        assert resultado["importados"] == 1
+        assert len(resultado["rechazados"]) == 2
+
+    def test_lotes(self):
+        """Verifica que los muebles se agregan en lotes."""
+        filas = "".join(f"silla,Silla {i},Pino,Rojo,{10 + i}\n" for i in range(5))
+        archivo = io.StringIO("tipo,nombre,material,color,precio_base\n" + filas)
+        tienda = TiendaMuebles()
+        lotes = []
+        agregar_lote = tienda.agregar_lote
+        tienda.agregar_lote = lambda m, p: lotes.append(len(m)) or agregar_lote(m, p)
+        resultado = importador.importar(archivo, tienda, tamaño_lote=2)
+        assert resultado["importados"] == 5
+        assert lotes == [2, 2, 1]
+        assert [m.nombre for m in tienda.listar_inventario()][-1] == "Silla 4"
+        assert len(tienda.filtrar_por_precio(0, 10**6)) == 5
+
+    def test_archivo_de_rechazos(self):
+        """Verifica que cada rechazo se escribe con su fila y sus datos."""
+        archivo = io.StringIO(
+            '{"tipo": "silla", "nombre": "S", "material": "Pino",'
+            ' "color": "Rojo", "precio_base": 30}\n'
+            "{no es json\n"
+            '{"tipo": "lampara", "nombre": "L"}\n'
+        )
+        rechazos = io.StringIO()
+        resultado = importador.importar(archivo, TiendaMuebles(), "jsonl", rechazos)
+        lineas = [json.loads(linea) for linea in rechazos.getvalue().splitlines()]
+        assert resultado["total_rechazados"] == 2
+        assert [linea["fila"] for linea in lineas] == [2, 3]
+        assert lineas[0]["datos"] == "{no es json"
+        assert lineas[1]["datos"] == {"tipo": "lampara", "nombre": "L"}
+
+    def test_setters_rechazan_texto_en_blanco_y_medidas(self):
+        """Verifica que los valores fuera de rango van al archivo de rechazos."""
+        archivo = io.StringIO(
+            "tipo,nombre,material,color,precio_base,largo\n"
+            "mesa,   ,Roble,Nogal,100,120\n"
+            "mesa,Mesa,Roble,Nogal,100,-100\n"
+            "mesa,Mesa,Roble,Nogal,100,120\n"
+        )
+        rechazos = io.StringIO()
+        resultado = importador.importar(archivo, TiendaMuebles(), "csv", rechazos)
+        lineas = [json.loads(linea) for linea in rechazos.getvalue().splitlines()]
+        assert resultado["importados"] == 1
+        assert [linea["fila"] for linea in lineas] == [1, 2]
+        assert "largo" in lineas[1]["error"]
+
+    def test_csv_con_precio_infinito(self):
+        """Verifica que 'inf' se rechaza sin cortar el lote."""
+        archivo = io.StringIO(
+            "tipo,nombre,material,color,precio_base\n"
+            "silla,Silla A,Pino,Rojo,50\n"
+            "silla,Silla B,Pino,Rojo,inf\n"
+            "silla,Silla C,Pino,Rojo,70\n"
+        )
+        tienda = TiendaMuebles()
+        resultado = importador.importar(archivo, tienda)
+        assert resultado["importados"] == 2
+        assert [r["fila"] for r in resultado["rechazados"]] == [2]
+        assert tienda.obtener_estadisticas()["valor_inventario"] == pytest.approx(
+            Silla("A", "Pino", "Rojo", 50).calcular_precio()
+            + Silla("C", "Pino", "Rojo", 70).calcular_precio()
+        )
+
+    @pytest.mark.parametrize(
+        "valores",
+        [
+            {"precio_base": 1e400},
+            {"precio_base": "nan"},
+            {"precio_base": "-Infinity"},
+            {"precio_base": 10**400},
+            {"precio_base": [10]},
+            {"nombre": 5},
+            {"tiene_ruedas": {"si": 1}},
+        ],
+    )
+    def test_jsonl_con_valores_de_otro_tipo(self, valores):
+        """Verifica que números no finitos y tipos inesperados son rechazos."""
+        fila = {
+            "tipo": "silla",
+            "nombre": "S",
+            "material": "Pino",
+            "color": "Rojo",
+            "precio_base": 30,
+        }
+        valida = json.dumps(fila)
+        archivo = io.StringIO(
+            valida + "\n" + json.dumps({**fila, **valores}) + "\n" + valida + "\n"
+        )
+        tienda = TiendaMuebles()
+        resultado = importador.importar(archivo, tienda, "jsonl")
+        assert resultado["importados"] == 2
+        assert [r["fila"] for r in resultado["rechazados"]] == [2]
+        assert tienda.obtener_estadisticas()["valor_inventario"] == pytest.approx(
+            2 * Silla("S", "Pino", "Rojo", 30).calcular_precio()
+        )
+
+    def test_rechazos_informados_acotados(self):
+        """Verifica que el resultado conserva solo los primeros rechazos."""
+        cantidad = importador.MAXIMO_RECHAZOS_INFORMADOS + 5
+        archivo = io.StringIO("tipo,nombre\n" + "lampara,L\n" * cantidad)
+        resultado = importador.importar(archivo, TiendaMuebles())
+        assert resultado["total_rechazados"] == cantidad
+        assert len(resultado["rechazados"]) == importador.MAXIMO_RECHAZOS_INFORMADOS
+
+    def test_formato_desconocido(self):
+        """Verifica el error de formato no soportado."""
+        with pytest.raises(ValueError):
+            importador.leer_filas(io.StringIO(""), "xml")
@@ -0,0 +1,159 @@
+"""
+Pruebas unitarias para el índice ordenado IndicePrecios.
+
+Verifica:
+- Consultas por rango inclusivas y ordenadas
+- Paginación y generador
+- Actualización y remoción de precios
+- División y borrado de bloques con muchos precios iguales
+- Copia por bloques ya ordenados (bloques y extender)
+"""
+
+import pytest
+from services.indice_precios import IndicePrecios
+from services.inventario import Inventario
+
+
+@pytest.fixture
+def indice():
+    """Fixture con un índice de cinco precios (con un empate)."""
+    idx = IndicePrecios()
+    for id_mueble, precio in [
+        (1, 300.0),
+        (2, 100.0),
+        (3, 200.0),
+        (4, 100.0),
+        (5, 500.0),
+    ]:
+        idx.insertar(id_mueble, precio)
+    return idx
+
+
+class TestIndicePreciosRango:
+    """Tests para las consultas por rango."""
+
+    def test_rango_inclusivo_ordenado(self, indice):
+        """Verifica que el rango es inclusivo y va del más barato al más caro."""
+        assert indice.rango(100, 300) == [2, 4, 3, 1]
+
+    def test_rango_vacio(self, indice):
+        """Verifica un rango sin resultados."""
+        assert indice.rango(600, 700) == []
+        assert indice.contar(600, 700) == 0
+
+    def test_paginacion(self, indice):
+        """Verifica los parámetros desde y limite."""
+        assert indice.rango(desde=1, limite=2) == [4, 3]
+        assert indice.rango(desde=10, limite=2) == []
+
+    def test_iterar(self, indice):
+        """Verifica que el generador recorre el rango en orden."""
+        assert list(indice.iterar(150)) == [3, 1, 5]
+
+
+class TestIndicePreciosActualizacion:
+    """Tests para insertar y quitar."""
+
+    def test_reinsertar_actualiza_posicion(self, indice):
+        """Verifica que reinsertar un id lo mueve a su nuevo precio."""
+        indice.insertar(2, 1000.0)
+        assert indice.rango() == [4, 3, 1, 5, 2]
+        assert len(indice) == 5
+
+    def test_quitar_con_empate(self, indice):
+        """Verifica que se quita el id correcto entre precios iguales."""
+        assert indice.quitar(4) is True
+        assert indice.rango(100, 100) == [2]
+        assert indice.quitar(4) is False
+        assert 4 not in indice
+
+    def test_quitar_varios(self, indice):
+        """Verifica la remoción en lote, pocos ids y reconstrucción."""
+        assert indice.quitar_varios([4, 5, 99]) == 2
+        assert indice.rango() == [2, 3, 1]
+        grande = IndicePrecios()
+        for i in range(100):
+            grande.insertar(i, float(i % 10))
+        assert grande.quitar_varios(range(0, 100, 2)) == 50
+        assert len(grande) == 50
+        assert grande.rango(1, 1) == [1, 11, 21, 31, 41, 51, 61, 71, 81, 91]
+        assert grande.contar(0, 0) == 0
+
+
+class TestIndicePreciosBloques:
+    """Tests para índices que ocupan varios bloques."""
+
+    def test_insertar_y_quitar_entre_bloques(self):
+        """Verifica orden, conteo y paginación al dividir y vaciar bloques."""
+        indice = IndicePrecios()
+        for i in reversed(range(3000)):
+            indice.insertar(i, float(i % 3))
+        assert len(indice._maximos) > 2
+        assert indice.contar(1, 1) == 1000
+        assert indice.rango(1, 1, desde=998) == [2995, 2998]
+        assert indice.rango(0, 2, desde=999, limite=2) == [2997, 1]
+        for i in range(0, 3000, 3):
+            assert indice.quitar(i)
+        assert indice.contar() == 2000
+        assert list(indice.iterar(0, 0)) == []
+        assert indice.rango(2, 2, limite=3) == [2, 5, 8]
+
+    def test_lote_igual_a_uno_por_uno(self):
+        """Verifica que la reconstrucción en lote ordena igual que insertar."""
+        pares = [(i, float((i * 7919) % 50)) for i in range(2000)]
+        en_lote = IndicePrecios()
+        en_lote.insertar_varios(pares)
+        de_a_uno = IndicePrecios()
+        for id_mueble, precio in pares:
+            de_a_uno.insertar(id_mueble, precio)
+        assert en_lote.rango() == de_a_uno.rango()
+        assert en_lote.quitar_varios(range(0, 2000, 2)) == 1000
+        assert de_a_uno.quitar_varios(range(0, 2000, 2)) == 1000
+        assert en_lote.rango(10, 20) == de_a_uno.rango(10, 20)
+        assert en_lote.contar(10, 20) == len(de_a_uno.rango(10, 20))
+
+    def test_extender_desde_bloques(self):
+        """Verifica que extender con los bloques de otro índice lo replica."""
+        original = IndicePrecios()
+        original.insertar_varios((i, float(i % 7)) for i in range(1500))
+        copia = IndicePrecios()
+        for ids, precios in original.bloques():
+            copia.extender(ids, precios)
+        assert copia.rango() == original.rango()
+        assert copia.contar(2, 3) == original.contar(2, 3)
+        copia.insertar(5000, 2.5)
+        assert copia.quitar(7)
+        assert 5000 in copia.rango(2, 3)
+
+    @pytest.mark.parametrize(
+        "ids, precios",
+        [([9], [1.0, 2.0]), ([3], [600.0]), ([9], [50.0])],
+    )
+    def test_extender_invalido(self, indice, ids, precios):
+        """Verifica el rechazo de largos distintos, ids repetidos y desorden."""
+        with pytest.raises(ValueError):
+            indice.extender(ids, precios)
+        assert indice.rango() == [2, 4, 3, 1, 5]
+
+
+class TestInventarioPorPrecio:
+    """Tests para la integración del índice con Inventario."""
+
+    def test_setter_de_subclase_reindexa_precio(self, silla_simple, mesa_comedor):
+        """Verifica que un cambio de atributo actualiza el índice de precios."""
+        inv = Inventario()
+        inv.agregar(silla_simple)
+        inv.agregar(mesa_comedor)
+        assert inv.por_precio(0, 100) == [silla_simple]
+        silla_simple.tiene_ruedas = True
+        silla_simple.precio_base = 500
+        assert inv.por_precio(0, 100) == []
+        assert list(inv.iterar_por_precio()) == [mesa_comedor, silla_simple]
+
+    def test_por_precio_conserva_orden_de_ingreso(self, cama_king, silla_simple):
+        """Verifica que el filtro por rango respeta el orden de ingreso."""
+        inv = Inventario()
+        inv.agregar(cama_king)
+        inv.agregar(silla_simple)
+        assert inv.por_precio() == [cama_king, silla_simple]
+        assert inv.pagina_por_precio(limite=1) == [silla_simple]
@@ -0,0 +1,126 @@
+"""
+Pruebas unitarias para el índice de trigramas IndiceTrigramas.
+
+Verifica:
+- Mismos resultados que la búsqueda por subcadena lineal
+- Consultas cortas, vacías y sin coincidencias
+- Reindexado y remoción
+- Integración con Inventario (alta, venta y cambio de nombre)
+"""
+
+import random
+
+import pytest
+from services.indice_texto import IndiceTrigramas, trigramas
+from services.inventario import Inventario
+
+NOMBRES = [
+    "Silla Clásica",
+    "Silla de Oficina Ejecutiva",
+    "Mesa de Comedor Familiar",
+    "Sillón Reclinable de Lujo",
+    "Sofá Modular de 3 Plazas",
+    "Cama King Size",
+]
+
+
+@pytest.fixture
+def indice():
+    """Fixture con un índice de los nombres de ejemplo."""
+    idx = IndiceTrigramas()
+    for i, nombre in enumerate(NOMBRES):
+        idx.agregar(i, nombre)
+    return idx
+
+
+def _lineal(consulta):
+    """Búsqueda de referencia: subcadena sin distinguir mayúsculas."""
+    consulta = consulta.lower().strip()
+    return [i for i, nombre in enumerate(NOMBRES) if consulta in nombre.lower()]
+
+
+class TestIndiceTrigramas:
+    """Tests para las búsquedas del índice."""
+
+    def test_trigramas(self):
+        """Verifica la extracción de trigramas."""
+        assert trigramas("mesa") == {"mes", "esa"}
+        assert trigramas("me") == set()
+
+    @pytest.mark.parametrize(
+        "consulta", ["silla", "SILL", " de ", "de l", "a", "se", "xyz", "ón r"]
+    )
+    def test_igual_a_busqueda_lineal(self, indice, consulta):
+        """Verifica que el índice coincide con la búsqueda lineal."""
+        assert indice.buscar(consulta) == _lineal(consulta)
+
+    def test_trigramas_fuera_de_orden(self, indice):
+        """Verifica que no hay falsos positivos por trigramas sueltos."""
+        assert indice.buscar("sa me") == []
+
+    def test_un_solo_trigrama_repetido(self):
+        """Verifica que 'aaaa' (un único trigrama) no coincide con 'Xaaax'."""
+        indice = IndiceTrigramas()
+        indice.agregar(1, "Xaaax")
+        indice.agregar(2, "Baaaa")
+        assert indice.buscar("aaaa") == [2]
+        assert indice.buscar("aaa") == [1, 2]
+
+    def test_consulta_vacia(self, indice):
+        """Verifica que una consulta vacía no retorna resultados."""
+        assert indice.buscar("   ") == []
+
+    def test_reindexar_y_quitar(self, indice):
+        """Verifica que reindexar reemplaza el texto y quitar lo elimina."""
+        indice.agregar(0, "Banqueta Alta")
+        assert indice.buscar("clásica") == []
+        assert indice.buscar("banqueta") == [0]
+        assert indice.quitar(0) is True
+        assert indice.quitar(0) is False
+        assert indice.buscar("banqueta") == []
+        assert len(indice) == len(NOMBRES) - 1
+
+    def test_aleatorio_contra_lineal(self):
+        """Verifica muchas consultas aleatorias contra la búsqueda lineal."""
+        generador = random.Random(7)
+        letras = "abcdeé "
+        textos = {
+            i: "".join(generador.choice(letras) for _ in range(12)) for i in range(300)
+        }
+        idx = IndiceTrigramas()
+        for i, texto in textos.items():
+            idx.agregar(i, texto)
+        for _ in range(200):
+            consulta = "".join(
+                generador.choice(letras) for _ in range(generador.randint(1, 5))
+            )
+            esperado = [
+                i
+                for i, t in textos.items()
+                if consulta.strip() in t and consulta.strip()
+            ]
+            assert idx.buscar(consulta) == esperado
+
+
+class TestInventarioPorNombre:
+    """Tests para el índice de nombres dentro de Inventario."""
+
+    def test_alta_venta_y_renombre(self, silla_simple, mesa_comedor, armario_basico):
+        """Verifica que el índice sigue altas, bajas y cambios de nombre."""
+        inv = Inventario()
+        for mueble in (silla_simple, mesa_comedor, armario_basico):
+            inv.agregar(mueble)
+        assert inv.por_nombre("ARMARIO") == [armario_basico]
+        silla_simple.nombre = "Banqueta Alta"
+        assert inv.por_nombre("banqueta") == [silla_simple]
+        assert inv.por_nombre("silla") == []
+        inv.quitar(mesa_comedor)
+        assert inv.por_nombre("mesa") == []
+
+    def test_clase_simple_con_actualizar(self, armario_basico):
+        """Verifica que las clases sin setters se reindexan con actualizar()."""
+        inv = Inventario()
+        inv.agregar(armario_basico)
+        armario_basico.nombre = "Ropero Grande"
+        inv.actualizar(armario_basico)
+        assert inv.por_nombre("ropero") == [armario_basico]
@@ -0,0 +1,309 @@
+"""
+Pruebas unitarias para las instantáneas binarias de la tienda.
+
+Verifica:
+- Ida y vuelta de inventario, comedores, descuentos y totales
+- Identidad de objetos compartidos y copias repetidas
+- Unidades con especificación compartida
+- Índices y observadores funcionando después de cargar
+- Muebles creados recién al pedirlos, sin crearlos para consultar o guardar
+- Rechazo de archivos inválidos
+"""
+
+import marshal
+import pickle
+
+import pytest
+from models.composicion.comedor import Comedor
+from models.concretos.armario import Armario
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sofacama import SofaCama
+from models.especificacion import crear_unidades
+from services import instantanea
+from services.instantanea import InstantaneaInvalida
+from services.tienda import TiendaMuebles
+from services.ventas import RegistroVentas
+
+
+@pytest.fixture
+def tienda(
+    silla_simple, mesa_comedor, armario_basico, sillon_individual, sofacama_estandar
+):
+    """Fixture con una tienda variada (incluye clases sin herencia de Mueble)."""
+    t = TiendaMuebles("Tienda Guardada", modo_debug=True)
+    for mueble in (
+        silla_simple,
+        mesa_comedor,
+        armario_basico,
+        sillon_individual,
+        sofacama_estandar,
+        silla_simple,
+    ):
+        t.agregar_mueble(mueble)
+    t.agregar_comedor(Comedor("Comedor", mesa_comedor, [silla_simple]))
+    t.aplicar_descuento("mesas", 15)
+    t.realizar_venta(sofacama_estandar, "Ana")
+    return t
+
+
+@pytest.fixture
+def cargada(tienda, tmp_path):
+    """Fixture con la tienda guardada y vuelta a cargar."""
+    ruta = str(tmp_path / "tienda.snap")
+    assert tienda.guardar_instantanea(ruta) == 5
+    return TiendaMuebles.desde_instantanea(ruta, modo_debug=True)
+
+
+class TestInstantaneaIdaYVuelta:
+    """Tests para guardar y cargar."""
+
+    def test_estadisticas_iguales(self, tienda, cargada):
+        """Verifica que los agregados coinciden (también sin libro de ventas)."""
+        originales = tienda.obtener_estadisticas()
+        cargadas = cargada.obtener_estadisticas()
+        assert cargadas["ventas_realizadas"] == 1
+        assert cargadas == originales
+        assert cargada.nombre == "Tienda Guardada"
+
+    def test_muebles_equivalentes(self, tienda, cargada):
+        """Verifica atributos, textos originales y precios de cada mueble."""
+        for original, copia in zip(
+            tienda.listar_inventario(), cargada.listar_inventario()
+        ):
+            assert type(copia) is type(original)
+            assert copia.nombre == original.nombre
+            assert copia.material == original.material
+            assert copia.calcular_precio() == original.calcular_precio()
+
+    def test_identidad_compartida(self, cargada):
+        """Verifica que el comedor y el inventario comparten objetos."""
+        muebles = cargada.listar_inventario()
+        assert muebles[0] is muebles[-1]
+        comedor = cargada._comedores[0]
+        assert comedor.mesa is muebles[1]
+        assert comedor.sillas[0] is muebles[0]
+
+    def test_observadores_despues_de_cargar(self, cargada):
+        """Verifica que los setters siguen actualizando los índices."""
+        mesa = cargada.obtener_muebles_por_tipo(Mesa)[0]
+        mesa.material = "Vidrio"
+        assert cargada.filtrar_por_material("vidrio") == [mesa]
+
+    def test_conteo_de_ventas_con_y_sin_libro(self, tmp_path, silla_simple):
+        """Verifica que el conteo no se duplica con el libro de ventas."""
+        ruta_ventas = str(tmp_path / "ventas.bin")
+        tienda = TiendaMuebles(registro_ventas=RegistroVentas(ruta_ventas))
+        tienda.agregar_mueble(silla_simple, unidades=3)
+        tienda.realizar_venta(silla_simple, "Ana", cantidad=2)
+        tienda._ventas_realizadas.volcar()
+        ruta = str(tmp_path / "tienda.snap")
+        tienda.guardar_instantanea(ruta)
+        con_libro = TiendaMuebles.desde_instantanea(
+            ruta, registro_ventas=RegistroVentas(ruta_ventas)
+        )
+        sin_libro = TiendaMuebles.desde_instantanea(ruta)
+        for cargada in (con_libro, sin_libro):
+            estadisticas = cargada.obtener_estadisticas()
+            assert estadisticas["ventas_realizadas"] == 1
+            assert estadisticas["total_muebles_vendidos"] == 2
+        sin_libro.guardar_instantanea(ruta)
+        assert (
+            TiendaMuebles.desde_instantanea(ruta).obtener_estadisticas()[
+                "ventas_realizadas"
+            ]
+            == 1
+        )
+
+    def test_conserva_ids(self, tienda, cargada, cama_individual):
+        """Verifica que los ids del inventario no se renumeran al cargar."""
+        ids = [i for i, _ in tienda._inventario.items()]
+        assert ids == [1, 2, 3, 4, 6]
+        assert [i for i, _ in cargada._inventario.items()] == ids
+        cargada.agregar_mueble(cama_individual)
+        assert cargada.obtener_id_mueble(cama_individual) == 7
+
+    def test_conserva_unidades(self, tmp_path, cama_king):
+        """Verifica que se guardan las unidades de cada id."""
+        tienda = TiendaMuebles(modo_debug=True)
+        tienda.agregar_mueble(cama_king, unidades=5)
+        ruta = str(tmp_path / "unidades.snap")
+        tienda.guardar_instantanea(ruta)
+        cargada = TiendaMuebles.desde_instantanea(ruta, modo_debug=True)
+        (cama,) = cargada.listar_inventario()
+        assert cargada.existencias(cama) == 5
+        assert cargada.obtener_estadisticas()["total_muebles"] == 5
+
+    def test_unidades_compartidas(self, tmp_path, mesa_comedor):
+        """Verifica que las unidades vuelven a compartir su especificación."""
+        sofas = crear_unidades(SofaCama, 2, "SC", "Tela", "Gris", 900)
+        sofas[1].convertir_a_cama()
+        tienda = TiendaMuebles(modo_debug=True)
+        tienda.agregar_muebles(sofas)
+        tienda.agregar_comedor(
+            Comedor(
+                "Comedor",
+                mesa_comedor,
+                crear_unidades(Silla, 2, "S", "Pino", "Rojo", 40),
+            )
+        )
+        ruta = str(tmp_path / "unidades.snap")
+        tienda.guardar_instantanea(ruta)
+        cargada = TiendaMuebles.desde_instantanea(ruta, modo_debug=True)
+        primero, segundo = cargada.listar_inventario()
+        assert primero.especificacion is segundo.especificacion
+        assert [primero.modo_actual, segundo.modo_actual] == ["sofa", "cama"]
+        sillas = cargada._comedores[0].sillas
+        assert sillas[0].especificacion is sillas[1].especificacion
+        assert cargada.obtener_estadisticas()["total_muebles"] == 2
+
+    def test_bloques_pequeños(self, tienda, tmp_path):
+        """Verifica la escritura en varios bloques de inventario."""
+        ruta = str(tmp_path / "bloques.snap")
+        instantanea.guardar(tienda, ruta, tamaño_bloque=2)
+        cargada = TiendaMuebles.desde_instantanea(ruta)
+        assert len(cargada.listar_inventario()) == 5
+
+
+class TestInstantaneaPorColumnas:
+    """Tests para los muebles que se crean recién al pedirlos."""
+
+    def test_consultas_sin_crear(self, tienda, tmp_path):
+        """Verifica índices y agregados sin crear los muebles pendientes."""
+        ruta = str(tmp_path / "tienda.snap")
+        tienda.guardar_instantanea(ruta)
+        # Sin modo debug: la verificación de los agregados recorre todo
+        cargada = TiendaMuebles.desde_instantanea(ruta)
+        inventario = cargada._inventario
+        # La mesa y la silla se crearon al armar el comedor
+        assert inventario.pendiente(2) is None
+        assert inventario.pendiente(3) is not None
+        assert cargada.obtener_estadisticas() == tienda.obtener_estadisticas()
+        assert inventario.ids_por_precio() == tienda._inventario.ids_por_precio()
+        assert list(inventario.ids_por_tipo(Armario)[0]) == [3]
+        assert list(inventario.ids_por_material("madera")) == [2, 3, 4]
+        assert inventario.pendiente(3) is not None
+        assert cargada.obtener_mueble_por_id(3).nombre == "Armario Clásico"
+        assert inventario.pendiente(3) is None
+
+    def test_guardar_sin_crear(self, tienda, cargada, tmp_path):
+        """Verifica que volver a guardar copia los pendientes sin crearlos."""
+        ruta = str(tmp_path / "copia.snap")
+        assert cargada.guardar_instantanea(ruta) == 5
+        assert cargada._inventario.pendiente(4) is not None
+        copia = TiendaMuebles.desde_instantanea(ruta, modo_debug=True)
+        assert copia.obtener_estadisticas() == tienda.obtener_estadisticas()
+        muebles = copia.listar_inventario()
+        assert [m.nombre for m in muebles] == [
+            m.nombre for m in tienda.listar_inventario()
+        ]
+        assert muebles[0] is muebles[-1]
+        assert copia._comedores[0].sillas[0] is muebles[0]
+
+    def test_cambios_sobre_pendientes(self, cargada, cama_individual):
+        """Verifica reponer, quitar y agregar con muebles pendientes."""
+        inventario = cargada._inventario
+        inventario.reponer(4, 2)
+        assert cargada.obtener_estadisticas()["total_muebles"] == 7
+        assert inventario.quitar_por_id(3).nombre == "Armario Clásico"
+        assert cargada.obtener_muebles_por_tipo(Armario) == []
+        cargada.agregar_mueble(cama_individual)
+        assert [i for i, _ in inventario.items()] == [1, 2, 4, 6, 7]
+        assert (
+            inventario.estadisticas.comparar(inventario.recalcular_estadisticas()) == {}
+        )
+
+    def test_busqueda_crea_pendientes(self, cargada):
+        """Verifica que la búsqueda por texto indexa los muebles pendientes."""
+        assert cargada.buscar_muebles_por_nombre("Armario") == [
+            cargada.obtener_mueble_por_id(3)
+        ]
+        assert cargada._inventario.pendiente(4) is None
+
+    def test_bloque_con_ids_existentes(self, cargada):
+        """Verifica el rechazo de un bloque con ids ya usados u otro origen."""
+        inventario = cargada._inventario
+        origen, _ = inventario.pendiente(3)
+        with pytest.raises(ValueError):
+            inventario.restaurar_bloque(
+                origen, [5], [0], [Silla], [None], [None], {}, {}, {}, {}, {}
+            )
+        with pytest.raises(ValueError):
+            inventario.restaurar_bloque(
+                object(), [9], [0], [Silla], [None], [None], {}, {}, {}, {}, {}
+            )
+
+
+class TestInstantaneaVersionAnterior:
+    """Tests para instantáneas de la versión 1 (sin ids)."""
+
+    def test_carga_version_1(self, tmp_path, silla_simple):
+        """Verifica que una instantánea sin ids se carga con ids nuevos."""
+        estado = silla_simple.__getstate__()
+        bloques = [
+            (b"I", ([(Silla.__module__, "Silla")], [((0, estado), 55.0)])),
+            (b"C", ([], [])),
+            (
+                b"T",
+                (
+                    [],
+                    {
+                        "nombre": "Vieja",
+                        "descuentos": {},
+                        "total_muebles_vendidos": 0,
+                        "valor_total_ventas": 0.0,
+                    },
+                ),
+            ),
+            (b"F", ([], None)),
+        ]
+        contenido = instantanea.MAGIA + instantanea._VERSION.pack(1)
+        for etiqueta, datos in bloques:
+            cuerpo = marshal.dumps(datos, 4)
+            contenido += instantanea._BLOQUE.pack(etiqueta, len(cuerpo)) + cuerpo
+        ruta = tmp_path / "v1.snap"
+        ruta.write_bytes(contenido)
+        cargada = TiendaMuebles.desde_instantanea(str(ruta))
+        assert cargada.nombre == "Vieja"
+        assert cargada.obtener_mueble_por_id(1).nombre == silla_simple.nombre
+
+
+class TestInstantaneaInvalida:
+    """Tests para archivos que no se pueden cargar."""
+
+    def test_magia_incorrecta(self, tmp_path):
+        """Verifica el rechazo de un archivo ajeno."""
+        ruta = tmp_path / "otro.bin"
+        ruta.write_bytes(b"no es una instantanea")
+        with pytest.raises(InstantaneaInvalida):
+            TiendaMuebles.desde_instantanea(str(ruta))
+
+    def test_incompleta(self, tienda, tmp_path):
+        """Verifica el rechazo de un archivo truncado."""
+        ruta = tmp_path / "truncada.snap"
+        tienda.guardar_instantanea(str(ruta))
+        ruta.write_bytes(ruta.read_bytes()[:12])
+        with pytest.raises(InstantaneaInvalida):
+            TiendaMuebles.desde_instantanea(str(ruta))
+
+    def test_clase_no_permitida(self, tmp_path):
+        """Verifica que no se importan clases fuera del paquete models."""
+        contenido = marshal.dumps(([("os", "system")], []), 4)
+        ruta = tmp_path / "maliciosa.snap"
+        ruta.write_bytes(
+            instantanea.MAGIA
+            + instantanea._VERSION.pack(instantanea.VERSION)
+            + instantanea._BLOQUE.pack(b"I", len(contenido))
+            + contenido
+        )
+        with pytest.raises(InstantaneaInvalida):
+            TiendaMuebles.desde_instantanea(str(ruta))
+
+
+def test_pickle_conserva_textos(sofacama_estandar):
+    """Verifica que el estado serializado guarda textos, no códigos."""
+    estado = sofacama_estandar.__getstate__()
+    assert sofacama_estandar.material in estado
+    copia = pickle.loads(pickle.dumps(sofacama_estandar))
+    assert copia.material == sofacama_estandar.material
+    assert copia.calcular_precio() == sofacama_estandar.calcular_precio()
@@ -0,0 +1,334 @@
+"""
+Pruebas unitarias para el almacén indexado Inventario.
+
+Verifica:
+- Ids estables y acceso por id
+- Índices por material, color y tipo
+- Remoción y reindexado ante cambios de atributos
+- Unidades por id (productos con stock) en agregados y retiros
+- Precios con descuento: índice, valor total y repreciado por clase
+"""
+
+import pytest
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sofa import Sofa
+from models.concretos.sofacama import SofaCama
+from models.vocabulario import MATERIALES
+from services.descuentos import MotorDescuentos, ReglaDescuento
+from services.inventario import Inventario, normalizar_texto
+
+
+@pytest.fixture
+def inventario(silla_simple, mesa_comedor, armario_basico, sofacama_estandar):
+    """Fixture con un inventario de varios tipos de muebles."""
+    inv = Inventario()
+    for mueble in (silla_simple, mesa_comedor, armario_basico, sofacama_estandar):
+        inv.agregar(mueble)
+    return inv
+
+
+class TestInventarioIds:
+    """Tests para los ids estables del inventario."""
+
+    def test_ids_consecutivos_y_obtener(self, inventario, silla_simple):
+        """Verifica que se asignan ids y se puede obtener por id."""
+        id_silla = inventario.id_de(silla_simple)
+        assert id_silla == 1
+        assert inventario.obtener(id_silla) is silla_simple
+
+    def test_contains_y_len(self, inventario, silla_simple, cama_king):
+        """Verifica pertenencia y tamaño."""
+        assert silla_simple in inventario
+        assert cama_king not in inventario
+        assert len(inventario) == 4
+
+    def test_orden_de_ingreso(self, inventario, silla_simple, mesa_comedor):
+        """Verifica que listar respeta el orden de ingreso."""
+        assert inventario.listar()[:2] == [silla_simple, mesa_comedor]
+
+    def test_id_no_se_reutiliza(self, inventario, silla_simple, cama_king):
+        """Verifica que un id quitado no se vuelve a asignar."""
+        inventario.quitar(silla_simple)
+        assert inventario.agregar(cama_king) == 5
+        assert inventario.obtener(1) is None
+
+    def test_ids_fijos(self, inventario, cama_king, cama_individual):
+        """Verifica agregar_lote con ids dados y el rechazo de ids en uso."""
+        assert inventario.agregar_lote([cama_king], ids_fijos=[10]) == [10]
+        assert inventario.agregar(cama_individual) == 11
+        with pytest.raises(ValueError):
+            inventario.agregar_lote([cama_king], ids_fijos=[10])
+
+    def test_lote_indexa_textos_al_buscar(self):
+        """Verifica que los textos de un lote se indexan en la primera búsqueda."""
+        inventario = Inventario()
+        sofa = Sofa("Sofá Nube", "Tela", "Gris", 500)
+        quitado = Sofa("Sofá Roca", "Cuero", "Negro", 700)
+        inventario.agregar_lote([sofa, quitado])
+        inventario.quitar(quitado)
+        sofa.nombre = "Sofá Brisa"
+        assert inventario.por_nombre("brisa") == [sofa]
+        assert inventario.por_nombre("roca") == []
+        assert [m for m, _ in inventario.buscar("sofa")] == [sofa]
+
+    def test_alta_individual_indexa_textos_al_buscar(self):
+        """Verifica que agregar() también difiere los textos a la búsqueda."""
+        inventario = Inventario()
+        sofa = Sofa("Sofá Nube", "Tela", "Gris", 500)
+        inventario.agregar(sofa)
+        assert len(inventario._nombres) == 0
+        sofa.nombre = "Sofá Brisa"
+        assert inventario.por_nombre("brisa") == [sofa]
+        assert inventario.por_nombre("nube") == []
+        otro = Sofa("Sofá Roca", "Cuero", "Negro", 700)
+        inventario.agregar(otro)
+        assert inventario.por_nombre("roca") == [otro]
+
+
+class TestInventarioIndices:
+    """Tests para los índices secundarios."""
+
+    def test_por_material_insensible_a_mayusculas(self, inventario):
+        """Verifica el índice por material."""
+        resultado = inventario.por_material("  MADERA ")
+        assert [m.nombre for m in resultado] == ["Mesa Comedor 6p", "Armario Clásico"]
+
+    def test_por_material_desconocido_no_se_registra(self, inventario):
+        """Verifica que consultar un material nuevo no lo agrega al vocabulario."""
+        cantidad = len(MATERIALES)
+        assert inventario.por_material("Material Inexistente") == []
+        assert len(MATERIALES) == cantidad
+
+    def test_por_color(self, inventario, silla_simple):
+        """Verifica el índice por color."""
+        assert inventario.por_color("negro") == [silla_simple]
+
+    def test_por_tipo_incluye_subclases(self, inventario, sofacama_estandar):
+        """Verifica que el índice por tipo respeta la herencia."""
+        assert inventario.por_tipo(Sofa) == [sofacama_estandar]
+        assert inventario.por_tipo(SofaCama) == [sofacama_estandar]
+
+    def test_reindexa_al_cambiar_material(self, inventario, silla_simple):
+        """Verifica que el setter de material actualiza el índice."""
+        silla_simple.material = "Bambú"
+        assert inventario.por_material("plástico") == []
+        assert inventario.por_material("bambú") == [silla_simple]
+
+    def test_actualizar_clase_sin_observadores(self, inventario, armario_basico):
+        """Verifica el reindexado manual de clases sin setters."""
+        armario_basico.color = "Verde"
+        inventario.actualizar(armario_basico)
+        assert inventario.por_color("verde") == [armario_basico]
+        assert armario_basico not in inventario.por_color("café")
+
+
+class TestInventarioRemocion:
+    """Tests para quitar muebles."""
+
+    def test_quitar_limpia_indices(self, inventario, silla_simple):
+        """Verifica que quitar elimina el mueble de todos los índices."""
+        assert inventario.quitar(silla_simple) == 1
+        assert silla_simple not in inventario
+        assert inventario.por_material("plástico") == []
+        assert inventario.quitar(silla_simple) is None
+
+    def test_quitar_desregistra_observador(self, inventario, silla_simple):
+        """Verifica que un mueble vendido ya no notifica al inventario."""
+        inventario.quitar(silla_simple)
+        silla_simple.material = "Bambú"
+        assert inventario.por_material("bambú") == []
+
+    def test_mismo_objeto_agregado_dos_veces(self, silla_simple):
+        """Verifica que cada copia tiene su id y se quitan de a una."""
+        inv = Inventario()
+        inv.agregar(silla_simple)
+        inv.agregar(silla_simple)
+        assert len(inv.por_material("plástico")) == 2
+        inv.quitar(silla_simple)
+        assert silla_simple in inv
+        assert inv.quitar_por_id(2) is silla_simple
+        assert silla_simple not in inv
+
+    def test_quitar_lote(self, inventario, silla_simple, mesa_comedor, cama_king):
+        """Verifica que quitar_lote limpia índices, precios y agregados."""
+        valor_mesa = mesa_comedor.calcular_precio()
+        valor_antes = inventario.estadisticas.valor_total
+        ids = inventario.quitar_lote([silla_simple, mesa_comedor, cama_king])
+        assert ids == [1, 2]
+        assert silla_simple not in inventario
+        assert inventario.por_precio(0, valor_mesa) == []
+        assert inventario.estadisticas.valor_total == pytest.approx(
+            valor_antes - silla_simple.calcular_precio() - valor_mesa
+        )
+        assert not inventario.estadisticas.comparar(
+            inventario.recalcular_estadisticas()
+        )
+
+
+class TestInventarioUnidades:
+    """Tests para los ids con varias unidades."""
+
+    def test_agregados_por_unidades(self, silla_simple, mesa_comedor):
+        """Verifica que los agregados multiplican por las unidades."""
+        inv = Inventario()
+        inv.agregar(silla_simple, unidades=6)
+        inv.agregar_lote([mesa_comedor], unidades=[2])
+        agregados = inv.estadisticas
+        assert len(inv) == 2
+        assert agregados.total_unidades == 8
+        assert agregados.por_tipo == {"Silla": 6, "Mesa": 2}
+        assert agregados.valor_total == pytest.approx(
+            6 * silla_simple.calcular_precio() + 2 * mesa_comedor.calcular_precio()
+        )
+        assert agregados.comparar(inv.recalcular_estadisticas()) == {}
+
+    def test_retirar_entre_ids(self, silla_simple):
+        """Verifica que retirar consume los ids en orden y quita los vacíos."""
+        inv = Inventario()
+        primero = inv.agregar(silla_simple, unidades=2)
+        segundo = inv.agregar(silla_simple, unidades=3)
+        assert inv.existencias(silla_simple) == 5
+        assert inv.retirar(silla_simple, 3) == [primero, segundo]
+        assert inv.obtener(primero) is None
+        assert inv.unidades(segundo) == 2
+        assert inv.estadisticas.total_unidades == 2
+        assert inv.estadisticas.comparar(inv.recalcular_estadisticas()) == {}
+
+    def test_retirar_sin_existencias(self, silla_simple):
+        """Verifica que no se retira nada si no alcanzan las unidades."""
+        inv = Inventario()
+        inv.agregar(silla_simple, unidades=2)
+        with pytest.raises(ValueError):
+            inv.retirar(silla_simple, 3)
+        assert inv.existencias(silla_simple) == 2
+
+    def test_quitar_lote_descuenta_unidades(self, silla_simple, mesa_comedor):
+        """Verifica que quitar_lote retira una unidad por aparición."""
+        inv = Inventario()
+        id_silla = inv.agregar(silla_simple, unidades=3)
+        inv.agregar(mesa_comedor)
+        inv.quitar_lote([silla_simple, silla_simple, mesa_comedor])
+        assert inv.unidades(id_silla) == 1
+        assert mesa_comedor not in inv
+        assert inv.por_precio() == [silla_simple]
+        assert inv.estadisticas.comparar(inv.recalcular_estadisticas()) == {}
+
+    def test_quitar_lote_entre_copias_y_descuentos(
+        self, silla_simple, mesa_comedor, cama_king
+    ):
+        """Verifica que un lote agota una copia antes de pasar a la siguiente."""
+        inv = Inventario()
+        motor = MotorDescuentos()
+        inv.usar_descuentos(motor)
+        motor.agregar(ReglaDescuento(0.1, Silla))
+        primera = inv.agregar(silla_simple, unidades=2)
+        segunda = inv.agregar(silla_simple, unidades=2)
+        inv.agregar(mesa_comedor)
+        inv.agregar(cama_king)
+        retirados = inv.quitar_lote(
+            [silla_simple, mesa_comedor, silla_simple, silla_simple, cama_king]
+        )
+        assert retirados[:4] == [primera, 3, primera, segunda]
+        assert inv.unidades(primera) == 0
+        assert inv.unidades(segunda) == 1
+        assert inv.por_precio() == [silla_simple]
+        assert inv.estadisticas.comparar(inv.recalcular_estadisticas()) == {}
+
+    def test_reponer_y_cambio_de_precio(self, silla_simple):
+        """Verifica reponer y que un cambio de precio pondera las unidades."""
+        inv = Inventario()
+        id_silla = inv.agregar(silla_simple)
+        assert inv.reponer(id_silla, 4) == 5
+        silla_simple.precio_base = silla_simple.precio_base + 10
+        assert inv.estadisticas.valor_total == pytest.approx(
+            5 * silla_simple.calcular_precio()
+        )
+        with pytest.raises(KeyError):
+            inv.reponer(99, 1)
+
+    @pytest.mark.parametrize("unidades", [0, -1, 1.5, True])
+    def test_unidades_invalidas(self, silla_simple, unidades):
+        """Verifica el rechazo de unidades que no son enteros positivos."""
+        with pytest.raises(ValueError):
+            Inventario().agregar(silla_simple, unidades=unidades)
+
+
+class TestInventarioDescuentos:
+    """Tests para la columna de precios con descuento."""
+
+    @pytest.fixture
+    def motor(self, inventario):
+        """Fixture con un motor de descuentos conectado al inventario."""
+        motor = MotorDescuentos()
+        inventario.usar_descuentos(motor)
+        return motor
+
+    def test_sin_reglas_usa_precio_de_lista(self, inventario, motor, silla_simple):
+        """Verifica que sin reglas no se guarda una columna aparte."""
+        id_silla = inventario.id_de(silla_simple)
+        assert inventario._efectivos is None
+        assert inventario.precio_efectivo(id_silla) == silla_simple.calcular_precio()
+        estadisticas = inventario.estadisticas
+        assert estadisticas.valor_efectivo == estadisticas.valor_total
+
+    def test_valor_y_rango_con_descuento(self, inventario, motor, sofacama_estandar):
+        """Verifica el valor total y el filtro por precio con descuento."""
+        precio = sofacama_estandar.calcular_precio()
+        motor.agregar(ReglaDescuento(0.5, Sofa))
+        estadisticas = inventario.estadisticas
+        assert estadisticas.valor_efectivo == pytest.approx(
+            estadisticas.valor_total - precio / 2, abs=0.01
+        )
+        assert sofacama_estandar in inventario.por_precio_efectivo(0, precio / 2)
+        assert sofacama_estandar not in inventario.por_precio(0, precio / 2)
+        assert inventario.contar_por_precio_efectivo() == len(inventario)
+
+    def test_reprecia_solo_clases_afectadas(
+        self, inventario, motor, mesa_comedor, monkeypatch
+    ):
+        """Verifica que una regla de mesas no reprecia las sillas."""
+        motor.agregar(ReglaDescuento(0.1, Silla))
+        repreciados = []
+        indexar = inventario._indexar_efectivos
+
+        def espiar(pares):
+            repreciados.extend(id_mueble for id_mueble, _ in pares)
+            indexar(pares)
+
+        monkeypatch.setattr(inventario, "_indexar_efectivos", espiar)
+        motor.agregar(ReglaDescuento(0.2, Mesa))
+        id_mesa = inventario.id_de(mesa_comedor)
+        assert repreciados == [id_mesa]
+        assert inventario.precio_efectivo(id_mesa) == round(
+            mesa_comedor.calcular_precio() * 0.8, 2
+        )
+
+    def test_altas_bajas_y_unidades(self, inventario, motor, silla_simple, cama_king):
+        """Verifica los acumuladores incrementales contra una recomputación."""
+        motor.agregar(ReglaDescuento(0.1))
+        inventario.agregar(cama_king, unidades=3)
+        inventario.agregar_lote([silla_simple] * 20)
+        inventario.quitar_lote([silla_simple] * 5)
+        inventario.retirar(cama_king)
+        silla_simple.precio_base = 80
+        assert (
+            inventario.estadisticas.comparar(inventario.recalcular_estadisticas()) == {}
+        )
+
+    def test_quitar_ultima_regla(self, inventario, motor):
+        """Verifica que sin reglas se descarta la columna con descuento."""
+        id_regla = motor.agregar(ReglaDescuento(0.1))
+        motor.quitar(id_regla)
+        estadisticas = inventario.estadisticas
+        assert inventario._efectivos is None
+        assert estadisticas.valor_efectivo == estadisticas.valor_total
+
+
+@pytest.mark.parametrize(
+    "valor,esperado",
+    [("  Madera ", "madera"), ("METAL", "metal"), (None, ""), (3, "")],
+)
+def test_normalizar_texto(valor, esperado):
+    """Test parametrizado para la normalización de claves."""
+    assert normalizar_texto(valor) == esperado
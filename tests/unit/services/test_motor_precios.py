@@ -0,0 +1,186 @@
+"""
+Pruebas unitarias para el motor de precios vectorizado.
+
+Verifica:
+- Paridad al centavo con calcular_precio de cada clase concreta
+- Descuentos por tipo equivalentes a los de realizar_venta
+- Ajuste masivo del precio base
+"""
+
+import random
+
+import numpy as np
+import pytest
+from models.concretos.armario import Armario
+from models.concretos.cajonera import Cajonera
+from models.concretos.cama import Cama
+from models.concretos.escritorio import Escritorio
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sillon import Sillon
+from models.concretos.sofa import Sofa
+from models.concretos.sofacama import SofaCama
+from services.motor_precios import MotorPrecios, redondear
+
+
+def _precio_aleatorio(rnd):
+    return round(rnd.uniform(10, 3000), rnd.choice([0, 1, 2]))
+
+
+def _catalogo_aleatorio(cantidad, semilla=1234):
+    """Genera muebles de todos los tipos con atributos aleatorios."""
+    rnd = random.Random(semilla)
+    tapizados = [None, "cuero", "Tela", "lino", "CUERO"]
+    fabricas = [
+        lambda: Silla(
+            "Silla",
+            "Madera",
+            "Café",
+            _precio_aleatorio(rnd),
+            tiene_respaldo=rnd.random() < 0.5,
+            material_tapizado=rnd.choice(tapizados),
+            altura_regulable=rnd.random() < 0.5,
+            tiene_ruedas=rnd.random() < 0.5,
+        ),
+        lambda: Mesa(
+            "Mesa",
+            "Madera",
+            "Café",
+            _precio_aleatorio(rnd),
+            forma=rnd.choice(["rectangular", "redonda", "ovalada"]),
+            largo=rnd.uniform(50, 300),
+            ancho=rnd.uniform(40, 150),
+            capacidad_personas=rnd.randint(1, 12),
+        ),
+        lambda: Sofa(
+            "Sofa",
+            "Tela",
+            "Gris",
+            _precio_aleatorio(rnd),
+            capacidad_personas=rnd.randint(1, 6),
+            tiene_respaldo=rnd.random() < 0.5,
+            material_tapizado=rnd.choice(tapizados),
+            tiene_brazos=rnd.random() < 0.5,
+            es_modular=rnd.random() < 0.5,
+            incluye_cojines=rnd.random() < 0.5,
+        ),
+        lambda: SofaCama(
+            "SofaCama",
+            "Tela",
+            "Beige",
+            _precio_aleatorio(rnd),
+            capacidad_personas=rnd.randint(1, 5),
+            material_tapizado=rnd.choice(tapizados),
+            tamaño_cama=rnd.choice(["individual", "matrimonial", "queen", "king"]),
+            incluye_colchon=rnd.random() < 0.5,
+            mecanismo_conversion=rnd.choice(["plegable", "hidraulico", "electrico"]),
+        ),
+        lambda: Cama(
+            "Cama",
+            "Madera",
+            "Nogal",
+            _precio_aleatorio(rnd),
+            tamaño=rnd.choice(["individual", "matrimonial", "queen", "king"]),
+            incluye_colchon=rnd.random() < 0.5,
+            tiene_cabecera=rnd.random() < 0.5,
+        ),
+        lambda: Armario(
+            "Armario",
+            "Madera",
+            "Blanco",
+            rnd.randint(100, 2000),
+            num_puertas=rnd.randint(1, 6),
+            num_cajones=rnd.randint(0, 5),
+            tiene_espejos=rnd.random() < 0.5,
+        ),
+        lambda: Escritorio(
+            "Escritorio",
+            "MDF",
+            "Blanco",
+            rnd.randint(100, 2000),
+            forma=rnd.choice(["rectangular", "L"]),
+            tiene_cajones=rnd.random() < 0.5,
+            num_cajones=rnd.randint(0, 5),
+            largo=rnd.uniform(0.8, 2.5),
+            tiene_iluminacion=rnd.random() < 0.5,
+        ),
+        lambda: Cajonera(
+            "Cajonera",
+            "Pino",
+            "Blanco",
+            rnd.randint(50, 800),
+            num_cajones=rnd.randint(1, 8),
+            tiene_ruedas=rnd.random() < 0.5,
+        ),
+        lambda: Sillon(
+            "Sillon",
+            "Cuero",
+            "Marrón",
+            rnd.randint(100, 2000),
+            material_tapizado=rnd.choice(tapizados),
+            tiene_brazos=rnd.random() < 0.5,
+            es_reclinable=rnd.random() < 0.5,
+            tiene_reposapiés=rnd.random() < 0.5,
+        ),
+    ]
+    return [rnd.choice(fabricas)() for _ in range(cantidad)]
+
+
+@pytest.fixture(scope="module")
+def catalogo():
+    """Fixture con un catálogo aleatorio de todos los tipos."""
+    return _catalogo_aleatorio(5000)
+
+
+class TestMotorPreciosParidad:
+    """Tests de paridad con los métodos calcular_precio."""
+
+    def test_precios_coinciden_al_centavo(self, catalogo):
+        """Verifica que el motor reproduce cada precio exactamente."""
+        motor = MotorPrecios.desde_muebles(catalogo)
+        esperados = np.array([m.calcular_precio() for m in catalogo])
+        assert np.array_equal(motor.calcular_precios(), esperados)
+
+    def test_precios_con_descuento(self, catalogo):
+        """Verifica la paridad con el cálculo de descuento de realizar_venta."""
+        descuentos = {"Silla": 0.1, "Mesa": 0.15, "Sofa": 0.2, "Armario": 0.05}
+        motor = MotorPrecios.desde_muebles(catalogo)
+        esperados = [
+            round(m.calcular_precio() * (1 - descuentos.get(type(m).__name__, 0)), 2)
+            for m in catalogo
+        ]
+        assert np.array_equal(
+            motor.calcular_precios_con_descuento(descuentos), np.array(esperados)
+        )
+
+    def test_tipo_no_soportado_usa_precio_del_objeto(self, mock_mueble):
+        """Verifica que los tipos desconocidos conservan su precio."""
+        motor = MotorPrecios.desde_muebles([mock_mueble])
+        assert motor.calcular_precios().tolist() == [100.0]
+
+
+class TestMotorPreciosAjustes:
+    """Tests para la revalorización masiva."""
+
+    def test_ajustar_precio_base_de_un_tipo(self, catalogo):
+        """Verifica que subir el precio base equivale a hacerlo objeto por objeto."""
+        muebles = [m for m in catalogo if isinstance(m, Silla)][:200]
+        motor = MotorPrecios.desde_muebles(muebles)
+        motor.ajustar_precio_base(1.1, tipo="Silla")
+        for silla in muebles:
+            silla.precio_base = round(silla.precio_base * 1.1, 2)
+        esperados = np.array([m.calcular_precio() for m in muebles])
+        assert np.array_equal(motor.calcular_precios(), esperados)
+
+    def test_columna_y_largo(self, silla_simple, mesa_comedor):
+        """Verifica el acceso a columnas y la cantidad de filas."""
+        motor = MotorPrecios.desde_muebles([silla_simple, mesa_comedor])
+        assert len(motor) == 2
+        assert motor.columna("precio_base").tolist() == [50.0, 400.0]
+        assert motor.mascara_tipo("Mesa").tolist() == [False, True]
+
+
+@pytest.mark.parametrize("valor", [1.005, 2.675, 0.125, 10.0049999, 123.455])
+def test_redondear_como_round(valor):
+    """Test parametrizado: redondear coincide con round() en casos límite."""
+    assert redondear(np.array([valor]))[0] == round(valor, 2)
@@ -0,0 +1,153 @@
+"""
+Pruebas unitarias para el libro de ventas RegistroVentas.
+
+Verifica:
+- Registros compactos y conversión al formato de comprobante
+- Volcado a disco y recorrido completo
+- Consultas por rango de fechas y reapertura de un archivo existente
+- Cantidad de unidades por registro y conversión de archivos sin cantidad
+"""
+
+import os
+import struct
+
+import pytest
+from services.ventas import RegistroVentas, Venta
+
+
+@pytest.fixture
+def registro():
+    """Fixture con 25 ventas (una por segundo) y volcado cada 10."""
+    reg = RegistroVentas(limite_memoria=10)
+    for i in range(25):
+        reg.registrar(f"Silla {i}", "Ana", 100.0 + i, 0.1, 90.0 + i, 1000.0 + i)
+    yield reg
+    reg.cerrar()
+
+
+class TestVenta:
+    """Tests para el registro individual."""
+
+    def test_sin_dict(self):
+        """Verifica que el registro es compacto (usa __slots__)."""
+        venta = Venta(0.0, "Mesa", "Luis", 100.0, 0.0, 100.0)
+        assert not hasattr(venta, "__dict__")
+
+    def test_a_dict(self):
+        """Verifica el formato del comprobante."""
+        venta = Venta(0.0, "Mesa", "Luis", 100.0, 0.25, 75.0)
+        datos = venta.a_dict()
+        assert datos["descuento"] == 25.0
+        assert datos["precio_final"] == 75.0
+        assert len(datos["fecha"]) == 19
+        assert "cantidad" not in datos
+
+    def test_a_dict_con_cantidad(self):
+        """Verifica la cantidad y el total de una venta de varias unidades."""
+        datos = Venta(0.0, "Silla", "Luis", 10.0, 0.0, 10.005, 3).a_dict()
+        assert datos["cantidad"] == 3
+        assert datos["total"] == pytest.approx(30.02)
+
+
+class TestRegistroVentas:
+    """Tests para el libro de ventas."""
+
+    def test_volcado_y_conteo(self, registro):
+        """Verifica que se vuelca a disco al llegar al límite."""
+        assert len(registro) == 25
+        assert registro.en_disco == 20
+        assert os.path.exists(registro.ruta)
+
+    def test_recorrido_completo(self, registro):
+        """Verifica que se recorren disco y memoria en orden."""
+        nombres = [venta.mueble for venta in registro]
+        assert nombres == [f"Silla {i}" for i in range(25)]
+
+    def test_rango_de_fechas(self, registro):
+        """Verifica una consulta por rango que cruza disco y memoria."""
+        ventas = list(registro.entre(1008.0, 1021.0))
+        assert [v.precio_original for v in ventas] == [100.0 + i for i in range(8, 22)]
+        assert list(registro.entre(2000.0)) == []
+
+    def test_bloques_con_la_misma_marca(self):
+        """Verifica que no se saltean bloques que empiezan con la misma marca."""
+        reg = RegistroVentas(limite_memoria=2)
+        for i, marca in enumerate([1.0, 5.0, 5.0, 5.0, 5.0, 9.0]):
+            reg.registrar(f"m{i}", "Ana", 10.0, 0.0, 10.0, marca)
+        try:
+            assert [v.mueble for v in reg.entre(5.0)] == [f"m{i}" for i in range(1, 6)]
+        finally:
+            reg.cerrar()
+
+    def test_registrar_varios(self, registro):
+        """Verifica el alta de un lote con una misma marca y el volcado."""
+        ventas = registro.registrar_varios(
+            [("Mesa", 10.0, 0.0, 10.0), ("Silla", 20.0, 0.5, 10.0)], "Eva", 2000.0
+        )
+        assert [v.marca_tiempo for v in ventas] == [2000.0, 2000.0]
+        assert [v.mueble for v in registro.entre(2000.0)] == ["Mesa", "Silla"]
+        assert len(registro) == 27
+        registro.registrar_varios([("Cama", 1.0, 0.0, 1.0)] * 3, "Eva")
+        assert registro.en_disco == 30
+
+    def test_marcas_no_retroceden(self, registro):
+        """Verifica que una marca anterior se ajusta a la última."""
+        venta = registro.registrar("Mesa", "Luis", 10.0, 0.0, 10.0, 5.0)
+        assert venta.marca_tiempo == 1024.0
+
+    def test_cerrar_borra_temporal(self, registro):
+        """Verifica que cerrar elimina el archivo temporal."""
+        ruta = registro.ruta
+        registro.cerrar()
+        assert not os.path.exists(ruta)
+
+    def test_reabrir_archivo(self, tmp_path):
+        """Verifica que un archivo existente se continúa y no se borra."""
+        ruta = str(tmp_path / "ventas.bin")
+        reg = RegistroVentas(ruta, limite_memoria=2)
+        for i in range(5):
+            reg.registrar("Cama", "Eva", 10.0, 0.0, 10.0, float(i))
+        reg.cerrar()
+        reabierto = RegistroVentas(ruta, limite_memoria=2)
+        assert len(reabierto) == 4
+        assert [v.marca_tiempo for v in reabierto.entre(1.0, 2.0)] == [1.0, 2.0]
+        assert (
+            reabierto.registrar("Cama", "Eva", 1.0, 0.0, 1.0, 0.0).marca_tiempo == 3.0
+        )
+
+    def test_limite_invalido(self):
+        """Verifica la validación del límite en memoria."""
+        with pytest.raises(ValueError):
+            RegistroVentas(limite_memoria=0)
+
+    def test_cantidad_en_disco(self, tmp_path):
+        """Verifica que la cantidad se conserva al volcar y reabrir."""
+        ruta = str(tmp_path / "ventas.bin")
+        reg = RegistroVentas(ruta, limite_memoria=1)
+        reg.registrar("Silla", "Ana", 10.0, 0.0, 10.0, 1.0, cantidad=4)
+        reabierto = RegistroVentas(ruta)
+        assert len(reabierto) == 1
+        assert [v.cantidad for v in reabierto] == [4]
+        with pytest.raises(ValueError):
+            reabierto.registrar("Silla", "Ana", 10.0, 0.0, 10.0, cantidad=0)
+
+    def test_convierte_archivo_sin_cantidad(self, tmp_path):
+        """Verifica que un archivo de una unidad por registro se convierte."""
+        ruta = tmp_path / "ventas.bin"
+        cabecera = struct.Struct("<ddddII")
+        ruta.write_bytes(
+            b"".join(
+                cabecera.pack(float(i), 10.0, 0.0, 10.0, 5, 3) + b"SillaAna"
+                for i in range(3)
+            )
+        )
+        reg = RegistroVentas(str(ruta), limite_memoria=2)
+        assert len(reg) == 3
+        assert [(v.mueble, v.cliente, v.cantidad) for v in reg] == [
+            ("Silla", "Ana", 1)
+        ] * 3
+        reg.registrar("Mesa", "Eva", 20.0, 0.0, 20.0, 5.0, cantidad=2)
+        reg.volcar()
+        reabierto = RegistroVentas(str(ruta))
+        assert [v.marca_tiempo for v in reabierto.entre(1.0)] == [1.0, 2.0, 5.0]
+        assert [v.cantidad for v in reabierto] == [1, 1, 1, 2]
@@ -0,0 +1,79 @@
+"""
+Pruebas unitarias para la venta en lote de TiendaMuebles.
+
+Verifica:
+- Comprobante único con descuentos por tipo
+- Validación todo o nada (incluye copias repetidas)
+- Consistencia de inventario y estadísticas después de un lote grande
+"""
+
+import pytest
+from models.concretos.silla import Silla
+from services.tienda import TiendaMuebles
+
+
+@pytest.fixture
+def tienda(silla_simple, mesa_comedor, cama_king):
+    """Fixture con una tienda que tiene tres muebles y descuento en sillas."""
+    t = TiendaMuebles(modo_debug=True)
+    for mueble in (silla_simple, mesa_comedor, cama_king):
+        t.agregar_mueble(mueble)
+    t.aplicar_descuento("sillas", 10)
+    return t
+
+
+class TestVentasLote:
+    """Tests para realizar_ventas_lote."""
+
+    def test_comprobante_del_lote(self, tienda, silla_simple, mesa_comedor):
+        """Verifica el comprobante y que los muebles salen del inventario."""
+        comprobante = tienda.realizar_ventas_lote([silla_simple, mesa_comedor], "Ana")
+        precio_silla = silla_simple.calcular_precio()
+        precio_mesa = mesa_comedor.calcular_precio()
+        assert comprobante["cliente"] == "Ana"
+        assert comprobante["cantidad"] == 2
+        assert comprobante["lineas"][0]["descuento"] == 10
+        assert comprobante["lineas"][1]["descuento"] == 0
+        assert comprobante["total"] == round(
+            round(precio_silla * 0.9, 2) + precio_mesa, 2
+        )
+        assert comprobante["descuento_total"] == round(
+            comprobante["subtotal"] - comprobante["total"], 2
+        )
+        estadisticas = tienda.obtener_estadisticas()
+        assert estadisticas["total_muebles"] == 1
+        assert estadisticas["ventas_realizadas"] == 2
+        assert estadisticas["total_muebles_vendidos"] == 2
+
+    def test_todo_o_nada(self, tienda, silla_simple, sofa_tres_puestos):
+        """Verifica que un mueble no disponible cancela todo el lote."""
+        resultado = tienda.realizar_ventas_lote([silla_simple, sofa_tres_puestos])
+        assert "error" in resultado
+        assert resultado["no_disponibles"] == [sofa_tres_puestos]
+        assert tienda.obtener_estadisticas()["total_muebles"] == 3
+
+    def test_copias_repetidas(self, tienda, silla_simple):
+        """Verifica que se validan las repeticiones contra las copias en stock."""
+        assert "error" in tienda.realizar_ventas_lote([silla_simple, silla_simple])
+        tienda.agregar_mueble(silla_simple)
+        comprobante = tienda.realizar_ventas_lote([silla_simple, silla_simple])
+        assert comprobante["cantidad"] == 2
+        assert tienda.obtener_id_mueble(silla_simple) is None
+
+    def test_lote_vacio(self, tienda):
+        """Verifica el error ante un lote vacío."""
+        assert "error" in tienda.realizar_ventas_lote([])
+
+    def test_lote_grande(self):
+        """Verifica un lote de 10.000 líneas contra las estadísticas."""
+        tienda = TiendaMuebles(modo_debug=True)
+        sillas = [
+            Silla(f"Silla {i}", "Madera", "Negro", 50 + i % 100) for i in range(12000)
+        ]
+        for silla in sillas:
+            tienda.agregar_mueble(silla)
+        comprobante = tienda.realizar_ventas_lote(sillas[::-1][:10000])
+        assert comprobante["cantidad"] == 10000
+        estadisticas = tienda.obtener_estadisticas()
+        assert estadisticas["total_muebles"] == 2000
+        assert tienda.listar_inventario() == sillas[:2000]
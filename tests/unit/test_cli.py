@@ -0,0 +1,199 @@
+"""
+Pruebas unitarias para el modo de línea de comandos.
+
+Verifica:
+- Importación, consulta, venta, estadísticas y reporte
+- Salida JSON y CSV
+- Persistencia entre ejecuciones con una instantánea
+- Libro de ventas junto a la instantánea y exportación de ventas
+"""
+
+import io
+import json
+
+import pytest
+
+import cli
+
+CATALOGO = (
+    "tipo,nombre,material,color,precio_base,tiene_ruedas,capacidad_personas\n"
+    "silla,Silla Oficina,Metal,Negro,80,true,\n"
+    "silla,Silla Cocina,Madera,Blanco,40,false,\n"
+    "mesa,Mesa Grande,Madera,Nogal,300,,6\n"
+)
+
+
+def ejecutar(*argumentos, entrada=""):
+    """Ejecuta la CLI y retorna (código, salida)."""
+    salida = io.StringIO()
+    codigo = cli.main(list(argumentos), io.StringIO(entrada), salida)
+    return codigo, salida.getvalue()
+
+
+@pytest.fixture
+def instantanea(tmp_path):
+    """Fixture con una tienda importada y guardada en una instantánea."""
+    ruta = str(tmp_path / "tienda.snap")
+    codigo, _ = ejecutar("--tienda", ruta, "importar", "-", entrada=CATALOGO)
+    assert codigo == 0
+    return ruta
+
+
+class TestCli:
+    """Tests para los subcomandos."""
+
+    def test_importar(self, tmp_path):
+        """Verifica el resumen de importación desde un archivo."""
+        archivo = tmp_path / "catalogo.csv"
+        archivo.write_text(CATALOGO + "lampara,L,Metal,Negro,10,,\n", encoding="utf-8")
+        codigo, salida = ejecutar("importar", str(archivo))
+        resultado = json.loads(salida)
+        assert codigo == 1
+        assert resultado["importados"] == 3
+        assert resultado["rechazados"][0]["fila"] == 4
+
+    def test_importar_con_rechazos(self, tmp_path):
+        """Verifica que --rechazos escribe las filas rechazadas."""
+        rechazos = tmp_path / "rechazos.jsonl"
+        codigo, salida = ejecutar(
+            "importar",
+            "-",
+            "--rechazos",
+            str(rechazos),
+            entrada=CATALOGO + "lampara,L,Metal,Negro,10,,\n",
+        )
+        (rechazo,) = [json.loads(linea) for linea in rechazos.read_text().splitlines()]
+        assert codigo == 1
+        assert json.loads(salida)["total_rechazados"] == 1
+        assert rechazo["datos"]["tipo"] == "lampara"
+
+    def test_consultar_csv(self, instantanea):
+        """Verifica una consulta combinada con salida CSV."""
+        codigo, salida = ejecutar(
+            "--tienda",
+            instantanea,
+            "--salida",
+            "csv",
+            "consultar",
+            "--tipo",
+            "silla",
+            "--con",
+            "tiene_ruedas=true",
+        )
+        lineas = salida.splitlines()
+        assert codigo == 0
+        assert lineas[0] == "id,tipo,nombre,material,color,precio"
+        assert lineas[1].startswith("1,Silla,Silla Oficina,Metal,Negro,")
+        assert len(lineas) == 2
+
+    def test_explicar(self, instantanea):
+        """Verifica que --explicar emite el plan."""
+        _, salida = ejecutar(
+            "--tienda",
+            instantanea,
+            "consultar",
+            "--material",
+            "madera",
+            "--capacidad-min",
+            "4",
+            "--explicar",
+        )
+        plan = json.loads(salida)
+        assert [p["operacion"] for p in plan] == ["inicio", "filtro"]
+
+    def test_vender_persiste(self, instantanea, tmp_path):
+        """Verifica que la venta se guarda y los ids se conservan."""
+        ventas = str(tmp_path / "ventas.bin")
+        codigo, salida = ejecutar(
+            "--tienda",
+            instantanea,
+            "--ventas",
+            ventas,
+            "vender",
+            "-",
+            entrada="id,cliente\n1,Ana\n",
+        )
+        assert codigo == 0
+        assert json.loads(salida)[0]["cliente"] == "Ana"
+
+        _, salida = ejecutar(
+            "--tienda", instantanea, "--ventas", ventas, "estadisticas"
+        )
+        estadisticas = json.loads(salida)
+        assert estadisticas["total_muebles"] == 2
+        assert estadisticas["ventas_realizadas"] == 1
+
+        _, salida = ejecutar("--tienda", instantanea, "consultar")
+        assert [fila["id"] for fila in json.loads(salida)] == [2, 3]
+
+    def test_vender_id_inexistente(self, instantanea):
+        """Verifica el error por línea y el código de salida."""
+        codigo, salida = ejecutar("--tienda", instantanea, "vender", "--ids", "99")
+        assert codigo == 1
+        assert json.loads(salida) == [{"id": 99, "error": "Id inexistente"}]
+
+    def test_vender_cantidad_insuficiente(self, instantanea):
+        """Verifica que no se vende más de lo que hay en stock."""
+        codigo, salida = ejecutar(
+            "--tienda", instantanea, "vender", "--ids", "1", "--cantidad", "2"
+        )
+        assert codigo == 1
+        assert json.loads(salida)[0]["disponibles"] == 1
+
+    def test_exportar(self, instantanea, tmp_path):
+        """Verifica la exportación del inventario a CSV."""
+        ruta = tmp_path / "inventario.csv"
+        codigo, salida = ejecutar(
+            "--tienda", instantanea, "exportar", "inventario", str(ruta)
+        )
+        assert codigo == 0
+        assert json.loads(salida)["exportados"] == 3
+        assert ruta.read_text(encoding="utf-8").startswith("id,tipo,categoria")
+
+    def test_ventas_sin_opcion_ventas(self, instantanea, tmp_path):
+        """Verifica que sin --ventas el libro se guarda junto a la instantánea."""
+        codigo, _ = ejecutar(
+            "--tienda", instantanea, "vender", "--ids", "1", "2", "--cliente", "Ana"
+        )
+        assert codigo == 0
+        _, salida = ejecutar("--tienda", instantanea, "estadisticas")
+        assert json.loads(salida)["ventas_realizadas"] == 2
+        ruta = tmp_path / "ventas.csv"
+        codigo, salida = ejecutar(
+            "--tienda", instantanea, "exportar", "ventas", str(ruta)
+        )
+        assert codigo == 0
+        assert json.loads(salida)["exportados"] == 2
+        assert ruta.read_text(encoding="utf-8").count("Ana") == 2
+
+    def test_exportar_ventas_fuera_del_libro(self, instantanea, tmp_path):
+        """Verifica el error si la instantánea cuenta ventas de otro libro."""
+        otro_libro = str(tmp_path / "otro.bin")
+        ejecutar(
+            "--tienda", instantanea, "--ventas", otro_libro, "vender", "--ids", "1"
+        )
+        codigo, salida = ejecutar(
+            "--tienda", instantanea, "exportar", "ventas", str(tmp_path / "v.csv")
+        )
+        assert codigo == 1
+        resultado = json.loads(salida)
+        assert resultado["exportados"] == 0
+        assert resultado["ventas_fuera_del_libro"] == 1
+
+    def test_reporte_texto(self, instantanea):
+        """Verifica que el reporte se emite como texto."""
+        _, salida = ejecutar("--tienda", instantanea, "--salida", "csv", "reporte")
+        assert salida.startswith("=== REPORTE DE INVENTARIO")
+
+    def test_catalogo_previo(self, tmp_path):
+        """Verifica --catalogo sin instantánea."""
+        archivo = tmp_path / "catalogo.jsonl"
+        archivo.write_text(
+            '{"tipo": "silla", "nombre": "S", "material": "Pino",'
+            ' "color": "Rojo", "precio_base": 30}\n',
+            encoding="utf-8",
+        )
+        _, salida = ejecutar(
+            "--catalogo", str(archivo), "--salida", "csv", "estadisticas"
+        )
+        assert "total_muebles,1" in salida.splitlines()
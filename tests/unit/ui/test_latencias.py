@@ -0,0 +1,118 @@
+"""
+Pruebas unitarias para la medición de latencias del menú.
+
+Verifica:
+- Percentiles y resumen sin mediciones y con una sola medición
+- Método del rango más cercano para p50 y p95
+- Ventana de las últimas mediciones por acción
+- Resumen de una acción frente al de toda la sesión
+- MenuTienda._trabajar: indicador de espera solo en trabajos lentos
+- Nombres distintos para listar y registrar una venta
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from services.tienda import TiendaMuebles
+from ui import menu as modulo_menu
+from ui.latencias import RegistroLatencias
+from ui.menu import MenuTienda
+
+
+class TestRegistroLatencias:
+    """Tests para RegistroLatencias."""
+
+    def test_sin_mediciones(self):
+        """Verifica que sin mediciones todo vale cero."""
+        registro = RegistroLatencias()
+        assert registro.percentil(50) == 0.0
+        assert registro.resumen("venta") == {
+            "mediciones": 0,
+            "ultima": 0.0,
+            "p50": 0.0,
+            "p95": 0.0,
+        }
+
+    def test_una_medicion(self):
+        """Verifica que con una medición todos los percentiles la repiten."""
+        registro = RegistroLatencias()
+        registro.registrar("catálogo", 0.25)
+        assert registro.percentil(0) == 0.25
+        assert registro.percentil(100) == 0.25
+        assert registro.resumen("catálogo")["p95"] == 0.25
+
+    def test_rango_mas_cercano(self):
+        """Verifica p50 y p95 sobre 20 mediciones desordenadas."""
+        registro = RegistroLatencias()
+        for valor in reversed(range(1, 21)):
+            registro.registrar("búsqueda", float(valor))
+        assert registro.percentil(50) == 10.0
+        assert registro.percentil(95) == 19.0
+        assert registro.percentil(96) == 20.0
+        assert registro.percentil(0) == 1.0
+
+    def test_ventana_de_mediciones(self):
+        """Verifica que solo cuentan las últimas mediciones de cada acción."""
+        registro = RegistroLatencias(maximo_muestras=3)
+        for valor in (100.0, 1.0, 2.0, 3.0):
+            registro.registrar("reporte", valor)
+        resumen = registro.resumen("reporte")
+        assert resumen["mediciones"] == 3
+        assert resumen["ultima"] == 3.0
+        assert registro.percentil(100, "reporte") == 3.0
+
+    def test_resumen_de_sesion(self):
+        """Verifica que sin acción se combinan todas las mediciones."""
+        registro = RegistroLatencias()
+        registro.registrar("catálogo", 1.0)
+        registro.registrar("búsqueda", 3.0)
+        registro.registrar("catálogo", 2.0)
+        assert registro.acciones() == ["catálogo", "búsqueda"]
+        assert registro.resumen()["mediciones"] == 3
+        assert registro.percentil(50) == 2.0
+        assert registro.resumen("búsqueda")["p50"] == 3.0
+
+
+class TestTrabajar:
+    """Tests para la ejecución medida de MenuTienda._trabajar."""
+
+    @pytest.fixture
+    def menu(self):
+        """Menú sobre una tienda vacía con la consola simulada."""
+        menu = MenuTienda(TiendaMuebles())
+        menu.console = MagicMock()
+        yield menu
+        menu._ejecutor.shutdown()
+
+    def test_trabajo_rapido_sin_indicador(self, menu):
+        """Verifica que un trabajo rápido no muestra el indicador y se mide."""
+        assert menu._trabajar("catálogo", "Cargando...", lambda: 42) == 42
+        menu.console.status.assert_not_called()
+        assert menu._latencias.resumen("catálogo")["mediciones"] == 1
+        assert menu._ultima_accion == "catálogo"
+
+    def test_trabajo_lento_con_indicador(self, menu, monkeypatch):
+        """Verifica que un trabajo lento muestra el indicador de espera."""
+        monkeypatch.setattr(modulo_menu, "UMBRAL_INDICADOR", 0.01)
+        resultado = menu._trabajar(
+            "reporte", "Generando...", lambda: time.sleep(0.05) or "listo"
+        )
+        assert resultado == "listo"
+        menu.console.status.assert_called_once_with("[bold green]Generando...")
+        assert menu._latencias.resumen("reporte")["ultima"] >= 0.05
+
+    def test_error_tambien_se_mide(self, menu):
+        """Verifica que un trabajo que falla se mide igual."""
+        with pytest.raises(ZeroDivisionError):
+            menu._trabajar("estadísticas", "Calculando...", lambda: 1 / 0)
+        assert menu._latencias.resumen("estadísticas")["mediciones"] == 1
+
+    def test_pasos_de_venta_separados(self, menu, silla_simple, monkeypatch):
+        """Verifica que listar y registrar la venta se miden por separado."""
+        menu.tienda.agregar_mueble(silla_simple)
+        monkeypatch.setattr(modulo_menu.IntPrompt, "ask", lambda *a, **k: 1)
+        monkeypatch.setattr(modulo_menu.Confirm, "ask", lambda *a, **k: True)
+        monkeypatch.setattr(modulo_menu.Prompt, "ask", lambda *a, **k: "Ana")
+        menu.realizar_venta_interactiva()
+        assert menu._latencias.acciones() == ["listado de venta", "registro de venta"]
@@ -0,0 +1,125 @@
+"""
+Pruebas unitarias para la paginación y el caché de filas de la interfaz.
+
+Verifica:
+- Ajuste del total, del tamaño de página y de la página actual
+- Rango de índices de cada página, incluida la última incompleta
+- Cantidad de páginas de una lista vacía
+- Descarte LRU de filas y baja del observador del mueble descartado
+- Invalidación de la fila cuando el mueble avisa un cambio
+- Objetos que no son muebles: se formatean siempre sin guardarse
+"""
+
+from types import SimpleNamespace
+
+from ui.paginacion import CacheFilas, Paginador, formatear_fila
+
+
+class TestPaginador:
+    """Tests para Paginador."""
+
+    def test_ajusta_valores_invalidos(self):
+        """Verifica que total y tamaño negativos o nulos se ajustan."""
+        paginador = Paginador(-5, tamaño_pagina=0)
+        assert paginador.total == 0
+        assert paginador.tamaño_pagina == 1
+        assert paginador.pagina == 1
+
+    def test_ir_a_fuera_de_rango(self):
+        """Verifica que ir_a, siguiente y anterior no salen de las páginas."""
+        paginador = Paginador(45, tamaño_pagina=20)
+        assert paginador.total_paginas == 3
+        assert paginador.ir_a(10) == 3
+        assert paginador.siguiente() == 3
+        assert paginador.ir_a(-2) == 1
+        assert paginador.anterior() == 1
+
+    def test_rango(self):
+        """Verifica el rango de una página completa y de la última."""
+        paginador = Paginador(45, tamaño_pagina=20)
+        assert paginador.rango() == (0, 20)
+        paginador.siguiente()
+        assert paginador.rango() == (20, 40)
+        paginador.siguiente()
+        assert paginador.rango() == (40, 45)
+
+    def test_lista_vacia(self):
+        """Verifica que una lista vacía tiene una página sin filas."""
+        paginador = Paginador(0)
+        assert paginador.total_paginas == 1
+        assert paginador.rango() == (0, 0)
+        assert paginador.siguiente() == 1
+
+
+class TestCacheFilas:
+    """Tests para CacheFilas."""
+
+    def test_reutiliza_fila(self, silla_simple):
+        """Verifica que la segunda consulta no vuelve a formatear."""
+        cache = CacheFilas()
+        fila = cache.fila(silla_simple)
+        assert fila == formatear_fila(silla_simple)
+        assert cache.fila(silla_simple) is fila
+        assert len(cache) == 1
+
+    def test_descarte_lru_quita_observador(self, silla_simple, mesa_comedor):
+        """Verifica que la fila descartada deja de observar su mueble."""
+        cache = CacheFilas(capacidad=1)
+        cache.fila(silla_simple)
+        assert silla_simple._observadores == [cache._observador]
+        cache.fila(mesa_comedor)
+        assert len(cache) == 1
+        assert silla_simple._observadores == []
+        assert mesa_comedor._observadores == [cache._observador]
+
+    def test_descarte_respeta_uso_reciente(self, silla_simple, mesa_comedor, cama_king):
+        """Verifica que se descarta la fila menos usada recientemente."""
+        cache = CacheFilas(capacidad=2)
+        cache.fila(silla_simple)
+        cache.fila(mesa_comedor)
+        cache.fila(silla_simple)
+        cache.fila(cama_king)
+        assert id(silla_simple) in cache._filas
+        assert id(mesa_comedor) not in cache._filas
+
+    def test_cambio_invalida_fila(self, silla_simple):
+        """Verifica que un cambio del mueble descarta y rearma la fila."""
+        cache = CacheFilas()
+        cache.fila(silla_simple)
+        silla_simple.color = "Verde"
+        assert len(cache) == 0
+        assert silla_simple._observadores == []
+        assert cache.fila(silla_simple)[3] == "Verde"
+
+    def test_limpiar(self, silla_simple, mesa_comedor):
+        """Verifica que limpiar quita todas las filas y observadores."""
+        cache = CacheFilas()
+        cache.fila(silla_simple)
+        cache.fila(mesa_comedor)
+        cache.limpiar()
+        assert len(cache) == 0
+        assert silla_simple._observadores == []
+        assert mesa_comedor._observadores == []
+
+    def test_objeto_sin_observadores_no_se_guarda(self):
+        """Verifica que un objeto que no es Mueble se formatea siempre."""
+        objeto = SimpleNamespace(
+            nombre="Caja", material="Cartón", color="Marrón", calcular_precio=None
+        )
+        cache = CacheFilas()
+        assert cache.fila(objeto) == ("Caja", "Error", "Cartón", "Marrón", "Error")
+        assert len(cache) == 0
+        objeto.calcular_precio = lambda: 12.5
+        assert cache.fila(objeto) == (
+            "Caja",
+            "SimpleNamespace",
+            "Cartón",
+            "Marrón",
+            "$12.50",
+        )
+
+    def test_clase_sin_observadores_no_se_guarda(self, armario_basico):
+        """Verifica que un Armario (no hereda de Mueble) no queda guardado."""
+        cache = CacheFilas()
+        assert cache.fila(armario_basico) == formatear_fila(armario_basico)
+        assert len(cache) == 0